@@ -15,24 +15,51 @@ ORGANIZATION_NAME = "Rugged Science"
 
 
 def run():
+    from app import startup
+
     import locale
     import sys
     import os
     
+    from PySide6.QtCore import QCoreApplication, QTimer
+
+    locale.setlocale(locale.LC_ALL, "")
+
+    QCoreApplication.setOrganizationName(ORGANIZATION_NAME)
+    QCoreApplication.setOrganizationDomain(DOMAIN_NAME)
+    QCoreApplication.setApplicationName(APP_NAME)
+    QCoreApplication.setApplicationVersion(VERSION)
+
+    if "--agent" in sys.argv[1:]:
+        # Reads the hardware for a sampler of another process
+        from app.acquisition.agent import run_agent
+
+        sys.exit(run_agent(sys.argv))
+
+    if "--headless" in sys.argv[1:]:
+        # BurnInTest runs without anybody watching, skip the widgets entirely
+        from app.headless import run_headless
+
+        sys.exit(run_headless(sys.argv))
+
+    if "--fleet" in sys.argv[1:]:
+        from app.fleet import run_fleet
+
+        sys.exit(run_fleet(sys.argv))
+
     from PySide6.QtWidgets import QApplication
 
     from app.widgets.mainwindow import MainWindow
 
-    locale.setlocale(locale.LC_ALL, "")
-
-    QApplication.setOrganizationName(ORGANIZATION_NAME)
-    QApplication.setOrganizationDomain(DOMAIN_NAME)
-    QApplication.setApplicationName(APP_NAME)
-    QApplication.setApplicationVersion(VERSION)
+    startup.mark("imports")
 
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    startup.mark("application")
     
     widget = MainWindow(sys.argv)
+    startup.mark("window")
     widget.show()
+    # Fires once the event loop has handled showing the window
+    QTimer.singleShot(0, startup.finish)
     sys.exit(app.exec())
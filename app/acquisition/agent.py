@@ -0,0 +1,514 @@
+"""
+Reads the PoE hardware in an agent process of its own.
+
+With POE_TESTER_AGENT set, the sampler starts an agent process that creates
+the backends and runs the same sweeps a DeviceReader runs in the sampler
+otherwise. An SDK call that hangs, or holds the GIL for long, then only
+stalls the agent. The agent hands its samples back through a ring of records
+in shared memory, which only the agent writes and only the sampler reads, so
+neither side ever takes a lock: the agent moves the write index past the
+records of a whole sweep once they are written, and the sampler moves the
+read index once it copied them.
+
+Both sides also count a heartbeat in the segment. The sampler kills and
+restarts an agent whose heartbeat stopped for longer than the timeout, and an
+agent exits by itself once the sampler's heartbeat stops, so an agent never
+outlives its application. The window and the BurnInTest session keep running
+meanwhile, only new samples wait for the new agent.
+
+    PoE Tester --agent SEGMENT --device FILE [--backend SPEC] ...
+"""
+
+import argparse
+import collections
+import ctypes
+import enum
+import itertools
+import logging
+import math
+import os
+import subprocess
+import sys
+import time
+import typing
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from app.backends import DEFAULT_BACKEND
+from app.log import EventLog, child_log_file
+from app.models import DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+
+from .controllers import MAX_CONTROLLER_THREADS, DeviceReader
+from .scheduler import DEFAULT_KEEPALIVE_INTERVAL
+from .snapshot import Snapshot
+
+logger = logging.getLogger(__name__)
+events = EventLog(logger)
+
+# Read the hardware in an agent process, set to anything to enable
+DEFAULT_AGENT = bool(os.environ.get("POE_TESTER_AGENT"))
+
+# Samples the ring holds, sweeps that do not fit are dropped
+RING_CAPACITY: int = 8192
+# Most ports an agent reports
+AGENT_MAX_PORTS: int = 256
+# Seconds without a heartbeat before an agent is restarted
+AGENT_TIMEOUT: float = 5.0
+# Seconds an agent may take to open the device before it is restarted
+AGENT_START_TIMEOUT: float = 30.0
+# Seconds without a heartbeat of the sampler before an agent exits
+ORPHAN_TIMEOUT: float = 10.0
+# Seconds to wait for an agent to exit when asked to
+STOP_TIMEOUT: float = 2.0
+# Times an agent is restarted in a row, without a sweep in between, before giving up
+MAX_AGENT_RESTARTS: int = 3
+# Bytes kept of the error an agent failed with
+ERROR_SIZE: int = 200
+# Milliseconds between the sweeps of an agent
+AGENT_INTERVAL: int = 1
+
+
+class AgentState(enum.IntEnum):
+    STARTING = 0
+    RUNNING = 1
+    FAILED = 2
+
+
+class AgentHeader(ctypes.Structure):
+    _fields_ = [
+        ("pid", ctypes.c_int64),
+        ("state", ctypes.c_int32),
+        ("controller_count", ctypes.c_uint32),
+        # Records ever written by the agent and read by the sampler, each
+        # only moved by its own side
+        ("write_index", ctypes.c_uint64),
+        ("read_index", ctypes.c_uint64),
+        ("agent_heartbeat", ctypes.c_uint64),
+        ("sampler_heartbeat", ctypes.c_uint64),
+        # Records of the sweeps that did not fit
+        ("dropped", ctypes.c_uint64),
+        # Set by the sampler to stop the agent
+        ("stop", ctypes.c_uint32),
+        ("all_passed", ctypes.c_uint32),
+        ("verdict_time", ctypes.c_double),
+        ("port_count", ctypes.c_uint32),
+        ("ports", ctypes.c_uint32 * AGENT_MAX_PORTS),
+        # Why the agent failed to start
+        ("error", ctypes.c_char * ERROR_SIZE),
+    ]
+
+
+# Samples are numbered by the sweep they belong to, for the sampler to tell sweeps apart
+RING_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("port", "<u4"),
+        ("sweep", "<u4"),
+        ("voltage", "<f8"),
+        ("power", "<f8"),
+    ]
+)
+HEADER_SIZE: int = ctypes.sizeof(AgentHeader)
+
+
+class SampleRing:
+    """
+    The segment shared by an agent and its sampler: a header and a ring of
+    sample records. With create the segment is created, and removed again on
+    close, otherwise it is the one a sampler created.
+    """
+
+    def __init__(self, name: str, create: bool = False, capacity: int = RING_CAPACITY) -> None:
+        if create:
+            self._mem = shared_memory.SharedMemory(name, True, HEADER_SIZE + capacity * RING_DTYPE.itemsize)
+        else:
+            self._mem = shared_memory.SharedMemory(name, False)
+            if sys.platform != "win32":
+                # The segment belongs to the sampler, it must outlive this process
+                resource_tracker.unregister(self._mem._name, "shared_memory")
+            capacity = (self._mem.size - HEADER_SIZE) // RING_DTYPE.itemsize
+
+        self._owner = create
+        self._capacity = capacity
+        self._header: AgentHeader | None = AgentHeader.from_buffer(self._mem.buf)
+        self._records: np.ndarray | None = np.frombuffer(self._mem.buf, RING_DTYPE, capacity, HEADER_SIZE)
+
+    @property
+    def name(self) -> str:
+        return self._mem.name
+
+    @property
+    def header(self) -> AgentHeader:
+        assert self._header is not None
+        return self._header
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def reset(self) -> None:
+        """Empties the ring and clears the header, for a new agent. Only while no agent runs."""
+        ctypes.memset(ctypes.addressof(self.header), 0, HEADER_SIZE)
+        self.header.verdict_time = math.nan
+
+    def write(self, snapshot: Snapshot, sweep: int) -> bool:
+        """
+        Adds the samples of a sweep. Only the agent writes.
+
+        Returns:
+            bool: False if the sweep did not fit and was dropped.
+        """
+        header, records = self.header, self._records
+        assert records is not None
+        count = len(snapshot)
+        start = header.write_index
+        if start + count - header.read_index > self._capacity:
+            header.dropped += count
+            return False
+
+        batch = np.empty(count, RING_DTYPE)
+        batch["timestamp"] = snapshot.timestamps
+        batch["port"] = snapshot.ports
+        batch["sweep"] = sweep
+        batch["voltage"] = snapshot.voltages
+        batch["power"] = snapshot.powers
+
+        first = start % self._capacity
+        head = min(count, self._capacity - first)
+        records[first : first + head] = batch[:head]
+        records[: count - head] = batch[head:]
+        # Publishes the sweep, the sampler never reads past this index
+        header.write_index = start + count
+        return True
+
+    def read(self) -> np.ndarray:
+        """Copies the samples written since the last read. Only the sampler reads."""
+        header, records = self.header, self._records
+        assert records is not None
+        start, end = header.read_index, header.write_index
+        count = end - start
+        if not count:
+            return np.empty(0, RING_DTYPE)
+
+        first = start % self._capacity
+        head = min(count, self._capacity - first)
+        samples = np.concatenate((records[first : first + head], records[: count - head]))
+        header.read_index = end
+        return samples
+
+    def close(self) -> None:
+        # The views export the buffer, they have to go before the mapping can close
+        self._header = None
+        self._records = None
+        self._mem.close()
+        if self._owner:
+            self._mem.unlink()
+
+
+def split_sweeps(samples: np.ndarray, passing_voltage: float, passing_power: float) -> list[Snapshot]:
+    """Builds a snapshot of every sweep in records read from a ring."""
+    sweeps = samples["sweep"]
+    bounds = [0, *(np.flatnonzero(sweeps[1:] != sweeps[:-1]) + 1).tolist(), len(samples)]
+    snapshots = []
+    for start, end in itertools.pairwise(bounds):
+        sweep = samples[start:end]
+        snapshots.append(
+            Snapshot.from_arrays(
+                sweep["timestamp"], sweep["port"], sweep["voltage"], sweep["power"], passing_voltage, passing_power
+            )
+        )
+    return snapshots
+
+
+_segment_ids = itertools.count()
+
+
+class AgentReader:
+    """
+    Reads the PoE ports of a device through an agent process, in place of a
+    DeviceReader in the sampler.
+
+    The first agent is waited for until it opened the device, so the ports
+    are known like with a DeviceReader. Every sweep hands out the next sweep
+    the agent completed, and checks the agent is still alive. An agent that
+    crashed or stopped responding is restarted without waiting for it, up to
+    max_restarts times in a row, after which sweeps come back empty.
+    """
+
+    def __init__(
+        self,
+        device_file: str,
+        backend: str = DEFAULT_BACKEND,
+        passing_voltage: float = DEFAULT_PASSING_VOLTAGE,
+        passing_power: float = DEFAULT_PASSING_POWER,
+        keepalive_interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        max_threads: int = MAX_CONTROLLER_THREADS,
+        timeout: float = AGENT_TIMEOUT,
+        max_restarts: int = MAX_AGENT_RESTARTS,
+    ) -> None:
+        self._passing_voltage = passing_voltage
+        self._passing_power = passing_power
+        self._timeout = timeout
+        self._max_restarts = max_restarts
+        self._restarts = 0
+        self._failed = False
+        self._args = [
+            "--agent", "",
+            "--device", device_file,
+            "--backend", backend,
+            "--passing-voltage", str(passing_voltage),
+            "--passing-power", str(passing_power),
+            "--keepalive-interval", str(keepalive_interval),
+            "--max-threads", str(max_threads),
+        ]  # fmt: skip
+
+        self._ring = SampleRing(f"poe_agent_{os.getpid()}_{next(_segment_ids)}", create=True)
+        self._args[1] = self._ring.name
+        self._process: subprocess.Popen[bytes] | None = None
+        # Agents killed on a restart that have not exited yet
+        self._killed: list[subprocess.Popen[bytes]] = []
+        self._agent_beat = 0
+        self._beat_time = 0.0
+        self._pending: collections.deque[Snapshot] = collections.deque()
+        self._sample_counts: dict[int, int] = {}
+
+        self._launch()
+        error = self._wait_started()
+        if error is not None:
+            self.close()
+            raise RuntimeError(f"The PoE agent failed: {error}")
+        header = self._ring.header
+        self._ports = list(header.ports[: header.port_count])
+        self._sample_counts = dict.fromkeys(self._ports, 0)
+
+    @property
+    def ports(self) -> list[int]:
+        return self._ports
+
+    @property
+    def controller_count(self) -> int:
+        return self._ring.header.controller_count
+
+    @property
+    def pid(self) -> int:
+        """The process id of the current agent, 0 while none runs."""
+        return self._process.pid if self._process and self._process.poll() is None else 0
+
+    @property
+    def sample_counts(self) -> dict[int, int]:
+        """Samples read from every port."""
+        return dict(self._sample_counts)
+
+    @property
+    def all_passed(self) -> bool:
+        return bool(self._ring.header.all_passed)
+
+    @property
+    def verdict_time(self) -> float | None:
+        """Seconds from the agent's first read until every port had passed, or None."""
+        header = self._ring.header
+        return header.verdict_time if header.all_passed else None
+
+    def sweep(self, now: float) -> Snapshot | None:
+        """
+        Returns the oldest sweep of the agent not handed out yet, or None if
+        there is none.
+        """
+        header = self._ring.header
+        header.sampler_heartbeat += 1
+        if not self._pending:
+            self._receive()
+            self._check_agent()
+        return self._pending.popleft() if self._pending else None
+
+    def close(self) -> None:
+        """Stops the agent and removes the segment."""
+        self._stop_agent()
+        for process in self._killed:
+            try:
+                process.wait(STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                logger.warning("The PoE agent %d did not exit after being killed", process.pid)
+        self._killed.clear()
+        self._ring.close()
+
+    def _receive(self) -> None:
+        samples = self._ring.read()
+        if not len(samples):
+            return
+
+        # The agent made it to a sweep, restarts count again from here
+        self._restarts = 0
+        ports, counts = np.unique(samples["port"], return_counts=True)
+        for port, count in zip(ports.tolist(), counts.tolist()):
+            self._sample_counts[port] = self._sample_counts.get(port, 0) + count
+
+        self._pending.extend(split_sweeps(samples, self._passing_voltage, self._passing_power))
+
+    def _check_agent(self) -> None:
+        self._killed = [process for process in self._killed if process.poll() is None]
+        if self._failed or self._process is None:
+            return
+
+        now = time.monotonic()
+        header = self._ring.header
+        beat = header.agent_heartbeat
+        if beat != self._agent_beat:
+            self._agent_beat = beat
+            self._beat_time = now
+            return
+
+        exit_code = self._process.poll()
+        if exit_code is not None:
+            self._restart(f"exited with {exit_code}")
+            return
+
+        timeout = AGENT_START_TIMEOUT if header.state == AgentState.STARTING else self._timeout
+        if now - self._beat_time > timeout:
+            self._restart(f"stopped responding for {now - self._beat_time:.1f} s")
+
+    def _launch(self) -> None:
+        self._ring.reset()
+        program, args = _agent_command()
+        # The agent rotating the application's log file would lose its records
+        environment = {**os.environ, "POE_TESTER_LOG_FILE": child_log_file("Agent")}
+        self._process = subprocess.Popen([program, *args, *self._args], env=environment)
+        self._agent_beat = 0
+        self._beat_time = time.monotonic()
+        logger.info("Started the PoE agent as process %d", self._process.pid)
+
+    def _wait_started(self) -> str | None:
+        """Waits until the agent opened the device, returns why it did not."""
+        assert self._process is not None
+        deadline = time.monotonic() + AGENT_START_TIMEOUT
+        while self._ring.header.state == AgentState.STARTING:
+            if self._process.poll() is not None or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+
+        if self._ring.header.state == AgentState.RUNNING:
+            return None
+        return self._ring.header.error.decode("utf-8", "replace") or "did not start"
+
+    def _restart(self, reason: str) -> None:
+        self._stop_agent(wait=False)
+        self._pending.clear()
+        if self._restarts >= self._max_restarts:
+            logger.error("The PoE agent %s, giving up after %d restarts", reason, self._restarts)
+            self._failed = True
+            return
+
+        self._restarts += 1
+        events.event("agent_restarted", logging.WARNING, reason=reason, restarts=self._restarts)
+        self._launch()
+
+    def _stop_agent(self, wait: bool = True) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+
+        if wait and process.poll() is None:
+            self._ring.header.stop = 1
+            try:
+                process.wait(STOP_TIMEOUT)
+                return
+            except subprocess.TimeoutExpired:
+                logger.warning("The PoE agent did not stop, killing it")
+        process.kill()
+        if not wait:
+            # An agent stuck in an SDK call may take a while to die, it is
+            # reaped once it did rather than stalling the sampler meanwhile
+            self._killed.append(process)
+            return
+        try:
+            process.wait(STOP_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            logger.warning("The PoE agent %d did not exit after being killed", process.pid)
+
+
+def _agent_command() -> tuple[str, list[str]]:
+    """The program and leading arguments that start this application again."""
+    if getattr(sys, "frozen", False):
+        return sys.executable, []
+    return sys.executable, ["-m", "app"]
+
+
+def parse_args(argv: typing.Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="PoE Tester", description="Reads the PoE ports of a device for a sampler.")
+    parser.add_argument("--agent", required=True, help="Shared memory segment created by the sampler.")
+    parser.add_argument("--device", required=True, help="Device file to read.")
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, help="PoE backend spec.")
+    parser.add_argument("--passing-voltage", type=float, default=DEFAULT_PASSING_VOLTAGE)
+    parser.add_argument("--passing-power", type=float, default=DEFAULT_PASSING_POWER)
+    parser.add_argument("--keepalive-interval", type=float, default=DEFAULT_KEEPALIVE_INTERVAL)
+    parser.add_argument("--max-threads", type=int, default=MAX_CONTROLLER_THREADS)
+    parser.add_argument("--interval", type=int, default=AGENT_INTERVAL, help="Milliseconds between sweeps.")
+    args, _ = parser.parse_known_args(argv[1:])
+    return args
+
+
+def run_agent(argv: list[str]) -> int:
+    """
+    Sweeps a device into the segment of a sampler until the sampler asks the
+    agent to stop or stops beating.
+
+    Returns:
+        int: 0 once stopped, 1 if the device could not be opened.
+    """
+    args = parse_args(argv)
+    ring = SampleRing(args.agent)
+    header = ring.header
+    header.pid = os.getpid()
+
+    try:
+        reader = DeviceReader(
+            args.device,
+            args.backend,
+            args.passing_voltage,
+            args.passing_power,
+            args.keepalive_interval,
+            args.max_threads,
+        )
+    except Exception as error:
+        logger.exception("Failed to open %s", args.device)
+        header.error = str(error).encode("utf-8")[: ERROR_SIZE - 1]
+        header.state = AgentState.FAILED
+        del header
+        ring.close()
+        return 1
+
+    ports = reader.ports[:AGENT_MAX_PORTS]
+    header.ports[: len(ports)] = ports
+    header.port_count = len(ports)
+    header.controller_count = reader.controller_count
+    header.state = AgentState.RUNNING
+
+    sweep = 0
+    sampler_beat = header.sampler_heartbeat
+    sampler_time = time.monotonic()
+    try:
+        while not header.stop:
+            header.agent_heartbeat += 1
+            now = time.monotonic()
+            if header.sampler_heartbeat != sampler_beat:
+                sampler_beat = header.sampler_heartbeat
+                sampler_time = now
+            elif now - sampler_time > ORPHAN_TIMEOUT:
+                logger.warning("The sampler stopped, exiting")
+                break
+
+            snapshot = reader.sweep(now)
+            if snapshot is not None:
+                if not ring.write(snapshot, sweep):
+                    events.event("agent_ring_full", logging.WARNING, dropped=header.dropped)
+                sweep += 1
+                if not header.all_passed and reader.all_passed:
+                    header.verdict_time = typing.cast(float, reader.verdict_time)
+                    header.all_passed = 1
+            time.sleep(args.interval / 1000)
+    finally:
+        reader.close()
+        del header
+        ring.close()
+    return 0
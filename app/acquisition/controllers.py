@@ -0,0 +1,174 @@
+import concurrent.futures
+import logging
+import math
+import tempfile
+import time
+import typing
+
+from app import instrumentation
+from app.backends import DEFAULT_BACKEND, PoeBackend, create_backend
+from app.devices import PoeController, read_poe_controllers, split_device_file
+from app.log import EventLog
+from app.models import DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+
+from .scheduler import DEFAULT_KEEPALIVE_INTERVAL, PortScheduler
+from .snapshot import Sample, Snapshot
+
+logger = logging.getLogger(__name__)
+events = EventLog(logger)
+
+# Most controllers read at the same time
+MAX_CONTROLLER_THREADS: int = 4
+
+
+class _Controller:
+    """A backend set up for one PSE chip, with its own schedule."""
+
+    def __init__(self, backend: PoeBackend, scheduler: PortScheduler, controller: PoeController | None) -> None:
+        self.backend = backend
+        self.scheduler = scheduler
+        self.controller = controller
+
+
+class DeviceReader:
+    """
+    Reads the PoE ports of a device in sweeps.
+
+    A device with a single PoE controller is read on the calling thread. A
+    device with several is split into one backend per controller, and the
+    controllers are swept at the same time on a bounded thread pool. Every
+    controller reads its ports one after the other, so no controller ever
+    sees overlapping transactions, and the samples of all controllers are
+    merged in timestamp order.
+    """
+
+    def __init__(
+        self,
+        device_file: str,
+        backend: str = DEFAULT_BACKEND,
+        passing_voltage: float = DEFAULT_PASSING_VOLTAGE,
+        passing_power: float = DEFAULT_PASSING_POWER,
+        keepalive_interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        max_threads: int = MAX_CONTROLLER_THREADS,
+    ) -> None:
+        self._passing_voltage = passing_voltage
+        self._passing_power = passing_power
+        self._controllers: list[_Controller] = []
+        self._ports: list[int] = []
+        self._pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._split_directory: tempfile.TemporaryDirectory[str] | None = None
+        # Whether every port's voltage was at the threshold when last read, only kept while events are logged
+        self._above: dict[int, bool] = {}
+
+        controllers = read_poe_controllers(device_file)
+        if len(controllers) > 1:
+            self._split_directory = tempfile.TemporaryDirectory(prefix="poe-controllers-")
+            files = split_device_file(device_file, self._split_directory.name)
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, min(len(files), max_threads)), thread_name_prefix="PoeController"
+            )
+        else:
+            files = [(controllers[0] if controllers else None, device_file)]
+
+        for controller, path in files:
+            poe = create_backend(backend)
+            poe.setXmlFile(path)
+            ports = [port for port in poe.getPortList() if port != 255]
+            scheduler = PortScheduler(ports, passing_voltage, passing_power, keepalive_interval)
+            self._controllers.append(_Controller(poe, scheduler, controller))
+            self._ports.extend(ports)
+
+    @property
+    def ports(self) -> list[int]:
+        return self._ports
+
+    @property
+    def controller_count(self) -> int:
+        return len(self._controllers)
+
+    @property
+    def sample_counts(self) -> dict[int, int]:
+        """Samples read from every port."""
+        counts: dict[int, int] = {}
+        for controller in self._controllers:
+            counts.update(controller.scheduler.sample_counts)
+        return counts
+
+    @property
+    def all_passed(self) -> bool:
+        return all(controller.scheduler.all_passed for controller in self._controllers)
+
+    @property
+    def verdict_time(self) -> float | None:
+        """Seconds from the first read until every port had passed, or None."""
+        times = [controller.scheduler.verdict_time for controller in self._controllers]
+        return None if None in times else max(typing.cast(list[float], times), default=0.0)
+
+    def sweep(self, now: float) -> Snapshot | None:
+        """
+        Reads every port due at time now, on all controllers at once.
+
+        Returns:
+            Snapshot | None: The samples read, or None if no port was due or
+            every read failed.
+        """
+        if self._pool is None:
+            samples = self._sweep_controller(self._controllers[0], now)
+        else:
+            futures = [self._pool.submit(self._sweep_controller, controller, now) for controller in self._controllers]
+            samples = [sample for future in futures for sample in future.result()]
+            samples.sort()
+
+        if not samples:
+            return None
+        return Snapshot.from_samples(samples, self._passing_voltage, self._passing_power)
+
+    def close(self) -> None:
+        """Waits for the reads in flight and releases the controllers."""
+        if self._pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._split_directory:
+            self._split_directory.cleanup()
+            self._split_directory = None
+
+    def _sweep_controller(self, controller: _Controller, now: float) -> list[Sample]:
+        # A controller's schedule is only touched by its own sweep
+        poe, scheduler = controller.backend, controller.scheduler
+        log_events = events.enabled()
+        samples = []
+        for port in scheduler.due_ports(now):
+            try:
+                voltage = poe.getPortVoltage(port)
+                power = math.nan
+                if voltage >= self._passing_voltage:
+                    power = poe.getPortPower(port)
+            except Exception:
+                logger.warning("Failed to read LAN %d", port, exc_info=True)
+                instrumentation.count("sdk.read_errors")
+                continue
+
+            sample = Sample(time.monotonic(), port, voltage, power)
+            passed = scheduler.record(port, voltage, power, sample.timestamp)
+            samples.append(sample)
+
+            if log_events:
+                self._log_events(port, voltage, power, passed)
+        return samples
+
+    def _log_events(self, port: int, voltage: float, power: float, passed: bool) -> None:
+        if passed:
+            events.event("port_passed", key=port, port=port, voltage=voltage, power=power)
+
+        # Ports of different controllers are disjoint, so sweeps in parallel never share a key
+        above = voltage >= self._passing_voltage
+        if self._above.setdefault(port, above) != above:
+            self._above[port] = above
+            events.event(
+                "voltage_crossed",
+                key=port,
+                port=port,
+                voltage=voltage,
+                threshold=self._passing_voltage,
+                direction="up" if above else "down",
+            )
@@ -0,0 +1,300 @@
+import glob
+import logging
+import os
+import queue
+import re
+import struct
+import threading
+import time
+import typing
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Directory to record samples to, recording is off when empty
+DEFAULT_RECORD_DIR = os.environ.get("POE_TESTER_RECORD_DIR", "")
+# Most recording files kept in the directory, across runs, 0 keeps them all
+DEFAULT_MAX_FILES = int(os.environ.get("POE_TESTER_RECORD_MAX_FILES", "64")) or None
+
+FILE_MAGIC = b"POEREC\x00\x01"
+FILE_EXTENSION = ".poerec"
+FILE_VERSION = 1
+# magic, version, record size, wall clock start, monotonic start, device
+HEADER_FORMAT = "<8sIIdd32s"
+HEADER_SIZE = 64
+
+# Power is NaN when it was not read for a sample
+RECORD_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("port", "<u4"),
+        ("voltage", "<f4"),
+        ("power", "<f4"),
+    ]
+)
+
+
+class SampleRecorder:
+    """
+    Streams samples to append-only files of fixed-width binary records.
+
+    Samples are collected in a buffer of batch_size records by the thread
+    producing them, single samples and sweeps alike, and the buffer is handed
+    to a background writer thread when it is full or flush_interval has
+    passed, so disk I/O never blocks sampling. A new file is started whenever the current one reaches
+    max_bytes, and the oldest files in the directory, those of earlier runs
+    included, are removed beyond max_files.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        device: str = "",
+        max_bytes: int = 64 * 1024 * 1024,
+        max_files: int | None = DEFAULT_MAX_FILES,
+        batch_size: int = 1024,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._directory = directory
+        self._device = device
+        self._max_bytes = max(max_bytes, HEADER_SIZE + RECORD_DTYPE.itemsize)
+        self._max_files = max(max_files, 1) if max_files is not None else None
+        self._batch_size = max(batch_size, 1)
+        self._flush_interval = flush_interval
+
+        self._buffer = np.empty(self._batch_size, dtype=RECORD_DTYPE)
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._queue: queue.SimpleQueue[np.ndarray | None] = queue.SimpleQueue()
+
+        self._file: typing.BinaryIO | None = None
+        self._file_size = 0
+        self._file_index = 0
+        self._files: list[str] = []
+        # Names hold no dashes but the ones separating the session, see Recording.session
+        self._prefix = re.sub(r"[^\w.]+", "_", device) or "samples"
+        self._started = time.strftime("%Y%m%d-%H%M%S")
+        self._session = self._started
+        self._run = 1
+        self._records_written = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._writer = threading.Thread(target=self._write_batches, name="SampleRecorder", daemon=True)
+        self._writer.start()
+
+    @property
+    def files(self) -> list[str]:
+        """Files written so far, oldest first."""
+        return list(self._files)
+
+    @property
+    def records_written(self) -> int:
+        return self._records_written
+
+    def record(self, port: int, timestamp: float, voltage: float, power: float) -> None:
+        """Records one sample. Must always be called from the same thread."""
+        self._buffer[self._buffered] = (timestamp, port, voltage, power)
+        self._buffered += 1
+        if self._buffered == self._batch_size or time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def record_batch(self, ports: np.ndarray, timestamps: np.ndarray | float, voltages: np.ndarray, powers: np.ndarray) -> None:
+        """Records a sweep of samples. Must be called from the same thread as record()."""
+        shared_timestamp = np.ndim(timestamps) == 0
+        start = 0
+        while start < len(ports):
+            end = min(len(ports), start + self._batch_size - self._buffered)
+            records = self._buffer[self._buffered : self._buffered + end - start]
+            records["timestamp"] = timestamps if shared_timestamp else timestamps[start:end]
+            records["port"] = ports[start:end]
+            records["voltage"] = voltages[start:end]
+            records["power"] = powers[start:end]
+            self._buffered += end - start
+            start = end
+            if self._buffered == self._batch_size:
+                self.flush()
+
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hands the buffered samples to the writer thread."""
+        self._last_flush = time.monotonic()
+        if not self._buffered:
+            return
+
+        # The writer keeps the filled buffer, a new one is cheaper than a copy
+        self._queue.put(self._buffer[: self._buffered])
+        self._buffer = np.empty(self._batch_size, dtype=RECORD_DTYPE)
+        self._buffered = 0
+
+    def close(self) -> None:
+        """Writes everything recorded so far and stops the writer thread."""
+        self.flush()
+        self._queue.put(None)
+        self._writer.join()
+
+    def _write_batches(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+
+            # Write whatever else is already waiting in one go
+            batches = [batch]
+            stop = False
+            while True:
+                try:
+                    batch = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if batch is None:
+                    stop = True
+                    break
+                batches.append(batch)
+
+            try:
+                self._write(np.concatenate(batches) if len(batches) > 1 else batches[0])
+            except OSError:
+                logger.exception("Failed to write samples to %s", self._directory)
+
+            if stop:
+                break
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def _write(self, records: np.ndarray) -> None:
+        while len(records):
+            if self._file is None or self._file_size >= self._max_bytes:
+                self._rotate()
+
+            assert self._file is not None
+            room = max((self._max_bytes - self._file_size) // RECORD_DTYPE.itemsize, 1)
+            chunk, records = records[:room], records[room:]
+            self._file.write(chunk.tobytes())
+            self._file_size += chunk.nbytes
+            self._records_written += len(chunk)
+
+    def _rotate(self) -> None:
+        if self._file:
+            self._file.close()
+
+        while True:
+            path = os.path.join(self._directory, f"{self._prefix}-{self._session}-{self._file_index:04d}{FILE_EXTENSION}")
+            try:
+                self._file = open(path, "xb")
+                break
+            except FileExistsError:
+                if self._file_index:
+                    raise
+                # Another run of the device started in the same second
+                self._run += 1
+                self._session = f"{self._started}-{self._run}"
+        self._file_index += 1
+
+        self._file.write(
+            struct.pack(
+                HEADER_FORMAT,
+                FILE_MAGIC,
+                FILE_VERSION,
+                RECORD_DTYPE.itemsize,
+                time.time(),
+                time.monotonic(),
+                self._device.encode("utf-8")[:32],
+            ).ljust(HEADER_SIZE, b"\x00")
+        )
+        self._file_size = HEADER_SIZE
+        self._files.append(path)
+
+        if self._max_files is not None:
+            # After the device, names start with the session's start time, so they sort oldest first
+            pattern = os.path.join(glob.escape(self._directory), f"{glob.escape(self._prefix)}-*{FILE_EXTENSION}")
+            paths = sorted((old for old in glob.glob(pattern) if old != path), key=os.path.basename)
+            for old in paths[: max(len(paths) - self._max_files + 1, 0)]:
+                try:
+                    os.remove(old)
+                except OSError:
+                    logger.warning("Failed to remove old recording", exc_info=True)
+                if old in self._files:
+                    self._files.remove(old)
+
+
+@dataclass
+class Recording:
+    """A recording file, with its records memory-mapped read only."""
+
+    path: str
+    device: str
+    start_time: float
+    start_monotonic: float
+    records: np.ndarray
+
+    @property
+    def session(self) -> str:
+        """
+        The run the file was recorded in, the time it started as named by the
+        recorder, or the file's own name if it was renamed.
+        """
+        name = os.path.splitext(os.path.basename(self.path))[0]
+        match = re.fullmatch(r"[^-]+-(.+)-\d{4}", name)
+        return match.group(1) if match else name
+
+    def wall_clock(self, timestamps: np.ndarray | float) -> np.ndarray | float:
+        """Converts monotonic sample timestamps to seconds since the epoch."""
+        return self.start_time + (timestamps - self.start_monotonic)
+
+
+def open_recording(path: str) -> Recording:
+    """
+    Memory-maps a recording file. A partial record at the end, left by a crash,
+    is ignored.
+
+    Raises:
+        ValueError: If the file is not a recording or uses another record layout.
+    """
+    with open(path, "rb") as file:
+        header = file.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE:
+        raise ValueError(f"{path} is not a PoE recording")
+
+    magic, version, record_size, start_time, start_monotonic, device = struct.unpack_from(HEADER_FORMAT, header)
+    if magic != FILE_MAGIC:
+        raise ValueError(f"{path} is not a PoE recording")
+    if version != FILE_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path} uses unsupported recording version {version}")
+
+    count = (os.path.getsize(path) - HEADER_SIZE) // RECORD_DTYPE.itemsize
+    if count:
+        records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+    else:
+        records = np.zeros(0, dtype=RECORD_DTYPE)
+
+    return Recording(path, device.rstrip(b"\x00").decode("utf-8"), start_time, start_monotonic, records)
+
+
+def open_recordings(path: str) -> list[Recording]:
+    """Memory-maps every recording in a directory, or matching a glob pattern, in name order."""
+    pattern = os.path.join(path, f"*{FILE_EXTENSION}") if os.path.isdir(path) else path
+    return [open_recording(file) for file in sorted(glob.glob(pattern))]
+
+
+def recording_sessions(recordings: typing.Iterable[Recording]) -> dict[str, list[Recording]]:
+    """
+    Groups recordings by the run they were recorded in, oldest run first.
+    Timestamps of different runs do not line up, so runs are only analyzed
+    or replayed one at a time.
+    """
+    sessions: dict[str, list[Recording]] = {}
+    for recording in recordings:
+        sessions.setdefault(recording.session, []).append(recording)
+    return dict(sorted(sessions.items(), key=lambda session: min(recording.start_time for recording in session[1])))
+
+
+def load_records(recordings: typing.Iterable[Recording]) -> np.ndarray:
+    """Concatenates the records of several recordings into one in-memory array."""
+    arrays = [recording.records for recording in recordings]
+    return np.concatenate(arrays) if arrays else np.zeros(0, dtype=RECORD_DTYPE)
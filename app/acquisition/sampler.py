@@ -0,0 +1,136 @@
+import logging
+import os
+import time
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+from app import instrumentation
+from app.backends import DEFAULT_BACKEND
+from app.models import DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+
+from .agent import DEFAULT_AGENT, AgentReader
+from .controllers import MAX_CONTROLLER_THREADS, DeviceReader
+from .recorder import DEFAULT_RECORD_DIR, SampleRecorder
+from .scheduler import DEFAULT_KEEPALIVE_INTERVAL
+from .snapshot import Snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class PoeSampler(QObject):
+    """
+    Reads PoE port measurements away from the GUI thread.
+
+    The sampler is meant to be moved to a QThread. It creates and owns the
+    PoE backends on that thread and reports timestamped samples through
+    signals that Qt queues back to the receivers' thread. Every tick sweeps
+    the ports and reports them as one immutable Snapshot. SDK calls are made
+    from the sampler thread, or for boards with several PoE controllers from
+    a thread pool sweeping the controllers at the same time. Which ports are
+    read in a sweep is left to a PortScheduler per controller, so ports that
+    have passed are only read now and then. With agent the ports are read
+    by an agent process instead, see app.acquisition.agent.
+    """
+
+    ports_ready = Signal(list)
+    snapshot_ready = Signal(Snapshot)
+
+    def __init__(
+        self,
+        device_file: str,
+        backend: str = DEFAULT_BACKEND,
+        interval: int = 1,
+        record_dir: str = DEFAULT_RECORD_DIR,
+        keepalive_interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        max_threads: int = MAX_CONTROLLER_THREADS,
+        agent: bool = DEFAULT_AGENT,
+    ) -> None:
+        super().__init__()
+        self._device_file = device_file
+        self._backend = backend
+        self._interval = interval
+        self._record_dir = record_dir
+        self._keepalive_interval = keepalive_interval
+        self._max_threads = max_threads
+        self._agent = agent
+        self._recorder: SampleRecorder | None = None
+        self._reader: DeviceReader | AgentReader | None = None
+        self._timer: QTimer | None = None
+        self._ports: list[int] = []
+
+        # Written from the GUI thread before the sampler starts
+        self.passing_voltage: float = DEFAULT_PASSING_VOLTAGE
+        self.passing_power: float = DEFAULT_PASSING_POWER
+
+    @property
+    def ports(self) -> list[int]:
+        return self._ports
+
+    @property
+    def reader(self) -> DeviceReader | AgentReader | None:
+        return self._reader
+
+    @Slot()
+    def start(self) -> None:
+        reader_class = AgentReader if self._agent else DeviceReader
+        self._reader = reader_class(
+            self._device_file,
+            self._backend,
+            self.passing_voltage,
+            self.passing_power,
+            self._keepalive_interval,
+            self._max_threads,
+        )
+        self._ports = self._reader.ports
+        if self._reader.controller_count > 1:
+            logger.info("Reading %d PoE controllers in parallel", self._reader.controller_count)
+        self.ports_ready.emit(self._ports)
+
+        if self._record_dir:
+            device = os.path.splitext(os.path.basename(self._device_file))[0]
+            self._recorder = SampleRecorder(self._record_dir, device)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self._interval)
+        if instrumentation.ENABLED:
+            self._sweep_latency = instrumentation.histogram("sampler.sweep")
+            self._timer.timeout.connect(self._timed_sweep)
+        else:
+            self._timer.timeout.connect(self._sweep)
+        self._timer.start()
+
+    @Slot()
+    def stop(self) -> None:
+        if self._timer:
+            self._timer.stop()
+        if self._reader:
+            self._reader.close()
+            logger.info("Samples per port: %s", self._reader.sample_counts)
+        if self._recorder:
+            self._recorder.close()
+            self._recorder = None
+
+    def _sweep(self) -> Snapshot | None:
+        if self._reader is None:
+            return None
+
+        passed = self._reader.all_passed
+        snapshot = self._reader.sweep(time.monotonic())
+        if snapshot is None:
+            return None
+
+        if self._recorder:
+            self._recorder.record_batch(snapshot.ports, snapshot.timestamps, snapshot.voltages, snapshot.powers)
+        self.snapshot_ready.emit(snapshot)
+
+        if not passed and self._reader.all_passed:
+            logger.info("Every port passed after %.3f s", self._reader.verdict_time)
+        return snapshot
+
+    def _timed_sweep(self) -> None:
+        """A sweep that records its duration in the sampler.sweep histogram."""
+        start = time.perf_counter_ns()
+        snapshot = self._sweep()
+        self._sweep_latency.record(time.perf_counter_ns() - start)
+        instrumentation.count("sampler.sweeps")
+        instrumentation.count("sampler.samples", len(snapshot) if snapshot else 0)
@@ -0,0 +1,123 @@
+import collections
+import math
+
+# Seconds between reads of a port that has already passed
+DEFAULT_KEEPALIVE_INTERVAL: float = 0.5
+
+
+class PortScheduler:
+    """
+    Decides which ports to read in every sweep, favouring the ports that have
+    not passed.
+
+    Ports that have not passed yet are read in every sweep. Once a port's
+    maximum voltage and power reach the thresholds it is retired to a
+    keep-alive read every keepalive_interval seconds, so sweeps get shorter
+    and the remaining ports are read more often, and the board reaches its
+    verdict sooner.
+    """
+
+    def __init__(
+        self,
+        ports: list[int],
+        passing_voltage: float,
+        passing_power: float,
+        keepalive_interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+    ) -> None:
+        self._keepalive_interval = keepalive_interval
+        self._passing_voltage = passing_voltage
+        self._passing_power = passing_power
+
+        self._max_voltage = dict.fromkeys(ports, 0.0)
+        self._max_power = dict.fromkeys(ports, 0.0)
+        self._sample_counts = dict.fromkeys(ports, 0)
+        self._last_read = dict.fromkeys(ports, -math.inf)
+
+        # The ports still to pass, and the retired ports by the time they were
+        # last read
+        self._active: collections.deque[int] = collections.deque(ports)
+        self._retired: collections.deque[int] = collections.deque()
+        self._start: float | None = None
+        self._verdict_time: float | None = None
+
+    @property
+    def passing_voltage(self) -> float:
+        return self._passing_voltage
+
+    @property
+    def passing_power(self) -> float:
+        return self._passing_power
+
+    @property
+    def sample_counts(self) -> dict[int, int]:
+        """Samples recorded for every port."""
+        return dict(self._sample_counts)
+
+    @property
+    def all_passed(self) -> bool:
+        return not self._active
+
+    @property
+    def verdict_time(self) -> float | None:
+        """Seconds from the first read until every port had passed, or None."""
+        return self._verdict_time
+
+    def is_passed(self, port: int) -> bool:
+        return port not in self._active
+
+    def due_ports(self, now: float) -> list[int]:
+        """
+        Returns the ports to read in a sweep at time now: every port that has
+        not passed, then the passed ports due for a keep-alive read.
+        """
+        if self._start is None:
+            self._start = now
+
+        due = []
+        while self._retired and self._last_read[self._retired[0]] + self._keepalive_interval <= now:
+            due.append(self._retired.popleft())
+        self._retired.extend(due)
+
+        ports = list(self._active) + due
+        for port in ports:
+            self._last_read[port] = now
+        return ports
+
+    def record(self, port: int, voltage: float, power: float, now: float) -> bool:
+        """
+        Records a sample of a port. A NaN power means power was not read.
+
+        Returns:
+            bool: True if the port passed with this sample.
+        """
+        self._sample_counts[port] += 1
+        if voltage > self._max_voltage[port]:
+            self._max_voltage[port] = voltage
+        if power > self._max_power[port]:
+            self._max_power[port] = power
+
+        if port not in self._active or not self._meets_thresholds(port):
+            return False
+
+        self._active.remove(port)
+        self._retired.append(port)
+        self._last_read[port] = now
+        if not self._active and self._start is not None:
+            self._verdict_time = now - self._start
+        return True
+
+    def set_thresholds(self, passing_voltage: float, passing_power: float) -> None:
+        """Changes the thresholds and re-evaluates every port against them."""
+        self._passing_voltage = passing_voltage
+        self._passing_power = passing_power
+
+        ports = list(self._active) + list(self._retired)
+        self._active = collections.deque(port for port in ports if not self._meets_thresholds(port))
+        self._retired = collections.deque(
+            sorted((port for port in ports if self._meets_thresholds(port)), key=self._last_read.__getitem__)
+        )
+        if self._active:
+            self._verdict_time = None
+
+    def _meets_thresholds(self, port: int) -> bool:
+        return self._max_voltage[port] >= self._passing_voltage and self._max_power[port] >= self._passing_power
@@ -0,0 +1,94 @@
+import typing
+from dataclasses import dataclass
+
+import numpy as np
+
+# One row per port read in a sweep, power is NaN when it was not read
+SNAPSHOT_DTYPE = np.dtype(
+    [
+        ("timestamp", "<f8"),
+        ("port", "<u4"),
+        ("voltage", "<f8"),
+        ("power", "<f8"),
+        ("passing", "?"),
+    ]
+)
+
+
+class Sample(typing.NamedTuple):
+    timestamp: float
+    port: int
+    voltage: float
+    # NaN when power was not read
+    power: float
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    The samples of one sweep over a device's ports, oldest first.
+
+    The records are read only, so a snapshot can be handed between threads
+    and to several consumers without copying.
+    """
+
+    # Monotonic time the sweep completed
+    timestamp: float
+    records: np.ndarray
+
+    @classmethod
+    def from_samples(cls, samples: typing.Sequence[Sample], passing_voltage: float, passing_power: float) -> "Snapshot":
+        """
+        Builds a snapshot, evaluating every sample against the thresholds in one
+        step. A sample without power does not pass.
+        """
+        records = np.array([(*sample, False) for sample in samples], dtype=SNAPSHOT_DTYPE)
+        records["passing"] = (records["voltage"] >= passing_voltage) & (records["power"] >= passing_power)
+        records.flags.writeable = False
+        timestamp = float(records["timestamp"][-1]) if len(records) else 0.0
+        return cls(timestamp, records)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        timestamps: np.ndarray,
+        ports: np.ndarray,
+        voltages: np.ndarray,
+        powers: np.ndarray,
+        passing_voltage: float,
+        passing_power: float,
+    ) -> "Snapshot":
+        """Builds a snapshot from samples already in arrays, like from_samples()."""
+        records = np.empty(len(ports), dtype=SNAPSHOT_DTYPE)
+        records["timestamp"] = timestamps
+        records["port"] = ports
+        records["voltage"] = voltages
+        records["power"] = powers
+        records["passing"] = (records["voltage"] >= passing_voltage) & (records["power"] >= passing_power)
+        records.flags.writeable = False
+        timestamp = float(records["timestamp"][-1]) if len(records) else 0.0
+        return cls(timestamp, records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def ports(self) -> np.ndarray:
+        return self.records["port"]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self.records["timestamp"]
+
+    @property
+    def voltages(self) -> np.ndarray:
+        return self.records["voltage"]
+
+    @property
+    def powers(self) -> np.ndarray:
+        return self.records["power"]
+
+    @property
+    def passing(self) -> np.ndarray:
+        """Whether each sample on its own reached both thresholds."""
+        return self.records["passing"]
@@ -0,0 +1,59 @@
+import os
+import typing
+from urllib.parse import parse_qs, urlsplit
+
+# Backend used when none is given explicitly, e.g. POE_TESTER_BACKEND="simulated?latency=0.004"
+DEFAULT_BACKEND = os.environ.get("POE_TESTER_BACKEND", "rssdk")
+
+
+class PoeBackend(typing.Protocol):
+    """The subset of the rssdk RsPoe interface used by the application."""
+
+    def setXmlFile(self, path: str) -> None: ...
+
+    def getPortList(self) -> list[int]: ...
+
+    def getPortVoltage(self, port: int) -> float: ...
+
+    def getPortPower(self, port: int) -> float: ...
+
+
+def create_backend(spec: str = DEFAULT_BACKEND) -> PoeBackend:
+    """
+    Creates a PoE backend from a spec string. With instrumentation enabled
+    its reads are timed.
+
+    The spec is a backend name optionally followed by query style options,
+    for example "rssdk", "simulated?latency=0.002&jitter=0.001&dead_port=3"
+    or "replay?path=recordings/&session=20260312-141502&speed=10".
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    parts = urlsplit(spec)
+    name = parts.path
+    options = parse_qs(parts.query)
+
+    backend: PoeBackend
+    if name == "rssdk":
+        from rssdk import RsPoe
+
+        backend = RsPoe()
+    elif name == "simulated":
+        from .simulated import SimulatedPoe
+
+        backend = SimulatedPoe.from_options(options)
+    elif name == "replay":
+        from .replay import ReplayPoe
+
+        backend = ReplayPoe.from_options(options)
+    else:
+        raise ValueError(f"Unknown PoE backend '{name}'")
+
+    from app import instrumentation
+
+    if instrumentation.ENABLED:
+        from .timed import TimedPoe
+
+        backend = TimedPoe(backend)
+    return backend
@@ -0,0 +1,166 @@
+import logging
+import time
+import typing
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from app.acquisition.recorder import load_records, open_recordings, recording_sessions
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayPoeError(RuntimeError):
+    """Raised by ReplayPoe when a port has nothing recorded."""
+
+
+class _PortTrack:
+    """The recorded samples of one port, in time order."""
+
+    def __init__(self, timestamps: np.ndarray, voltages: np.ndarray, powers: np.ndarray) -> None:
+        self.timestamps = timestamps
+        self.voltages = voltages.tolist()
+        # Power is only read once the voltage passes, so a sample without one
+        # reports the last power read before it, or 0 before any was
+        read = ~np.isnan(powers)
+        latest = np.maximum.accumulate(np.where(read, np.arange(len(powers)), -1))
+        self.powers = np.where(latest >= 0, powers[np.maximum(latest, 0)], 0.0).tolist()
+        self.cursor = -1
+        self.last = len(self.voltages) - 1
+
+
+class ReplayPoe:
+    """
+    A stand-in for rssdk.RsPoe that plays back a recording made with
+    POE_TESTER_RECORD_DIR.
+
+    Every read returns what the port measured at the same point of the
+    recorded run, so a field failure can be reproduced without the board. At
+    a speed of 1 the run plays in real time, at 10 ten times as fast. With
+    speed None every voltage read moves the port on to its next recorded
+    sample however little time passed, so a run replays as fast as the
+    application reads it and always with the same samples. Once a port's
+    samples run out it keeps reporting its last one.
+    """
+
+    def __init__(
+        self,
+        records: np.ndarray,
+        speed: float | None = 1.0,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            records: Recorded samples, as returned by load_records().
+            speed: How many times faster than recorded to play, or None to
+                play one sample per read.
+            clock: Source of the time the replay follows.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("The replay speed must be positive")
+
+        self.speed = speed
+        self._clock = clock
+        self._tracks: dict[int, _PortTrack] = {}
+        self._ports: list[int] = []
+        self._playing = 0
+        self._finished = False
+
+        records = np.sort(records, order="timestamp", kind="stable")
+        self._records = records
+        self._first_timestamp = float(records["timestamp"][0]) if len(records) else 0.0
+        self._duration = float(records["timestamp"][-1]) - self._first_timestamp if len(records) else 0.0
+        self._start_time = clock()
+
+    @classmethod
+    def from_options(cls, options: dict[str, list[str]]) -> "ReplayPoe":
+        """
+        Creates a ReplayPoe from parsed backend spec options: path, a recording
+        file, a directory of them or a glob pattern, session, the run to play
+        when path holds several, the newest by default, and speed, a number or
+        "max".
+
+        Raises:
+            ValueError: If no path is given, the session was not recorded there
+                or nothing was.
+        """
+        if "path" not in options:
+            raise ValueError("The replay backend needs the path of a recording")
+
+        path = options["path"][-1]
+        sessions = recording_sessions(open_recordings(path))
+        if "session" in options:
+            session = options["session"][-1]
+            if session not in sessions:
+                raise ValueError(f"No session {session} in {path}, recorded are: {', '.join(sessions) or 'none'}")
+        elif sessions:
+            session = list(sessions)[-1]
+            if len(sessions) > 1:
+                logger.info("Replaying the newest of %d sessions in %s, %s", len(sessions), path, session)
+        else:
+            raise ValueError(f"No recorded samples in {path}")
+
+        records = load_records(sessions[session])
+        if not len(records):
+            raise ValueError(f"No recorded samples in session {session} of {path}")
+
+        speed = options.get("speed", ["1"])[-1]
+        return cls(records, None if speed == "max" else float(speed))
+
+    @property
+    def finished(self) -> bool:
+        """True once every port has reported its last recorded sample."""
+        return self._finished
+
+    def setXmlFile(self, path: str) -> None:
+        root = ET.parse(path).getroot()
+        self._ports = [
+            int(port.attrib["id"]) for poe_element in root.findall("poe_controller") for port in poe_element.findall("port")
+        ]
+
+        ports = self._records["port"]
+        self._tracks = {}
+        for port in self._ports:
+            samples = self._records[ports == port]
+            if len(samples):
+                self._tracks[port] = _PortTrack(
+                    samples["timestamp"].astype(np.float64), samples["voltage"], samples["power"]
+                )
+
+        self._start_time = self._clock()
+        self._playing = len(self._tracks)
+        self._finished = False
+
+    def getPortList(self) -> list[int]:
+        return list(self._ports)
+
+    def getPortVoltage(self, port: int) -> float:
+        track = self._track(port)
+        if self.speed is None:
+            if track.cursor < track.last:
+                track.cursor += 1
+                if track.cursor == track.last:
+                    self._playing -= 1
+                    if not self._playing:
+                        self._finish()
+        else:
+            elapsed = (self._clock() - self._start_time) * self.speed
+            track.cursor = max(int(np.searchsorted(track.timestamps, self._first_timestamp + elapsed, side="right")) - 1, 0)
+            if elapsed >= self._duration and not self._finished:
+                self._finish()
+        return track.voltages[track.cursor]
+
+    def getPortPower(self, port: int) -> float:
+        # The power of the sample the last voltage read returned
+        track = self._track(port)
+        return track.powers[max(track.cursor, 0)]
+
+    def _track(self, port: int) -> _PortTrack:
+        track = self._tracks.get(port)
+        if track is None:
+            raise ReplayPoeError(f"Nothing recorded for port {port}")
+        return track
+
+    def _finish(self) -> None:
+        self._finished = True
+        logger.info("Replay finished")
@@ -0,0 +1,161 @@
+import enum
+import math
+import random
+import time
+import typing
+import xml.etree.ElementTree as ET
+
+
+class SimulatedPoeError(RuntimeError):
+    """Raised by SimulatedPoe when a failure is injected into a read."""
+
+
+class RampCurve(enum.Enum):
+    STEP = "step"
+    LINEAR = "linear"
+    EXPONENTIAL = "exponential"
+
+
+class SimulatedPoe:
+    """
+    A stand-in for rssdk.RsPoe that needs no hardware.
+
+    Ports come from the poe_controller sections of a device XML file, the same
+    as the SDK. Every port ramps from 0 to its supply voltage and, once the
+    powered device has been classified, to its load power. Reads can be slowed
+    down with a fixed latency plus random jitter, and can be made to fail at a
+    given rate to exercise the error paths.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        ramp_time: float = 2.0,
+        ramp_curve: RampCurve = RampCurve.EXPONENTIAL,
+        voltage: float = 52.0,
+        power: float = 6.5,
+        noise: float = 0.01,
+        failure_rate: float = 0.0,
+        dead_ports: set[int] | None = None,
+        weak_ports: set[int] | None = None,
+        seed: int | None = None,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            latency: Seconds every read takes.
+            jitter: Maximum random seconds added to every read.
+            ramp_time: Seconds for a port to reach its full voltage and power.
+            ramp_curve: Shape of the ramp.
+            voltage: Supply voltage the ports settle at.
+            power: Load power the ports settle at.
+            noise: Relative random noise applied to every reading.
+            failure_rate: Probability (0-1) of a read raising SimulatedPoeError.
+            dead_ports: Ports that never power up.
+            weak_ports: Ports that only reach half their voltage and power.
+            seed: Seed for the random generator, for repeatable runs.
+            clock: Source of the time the ramps follow, e.g. a simulated
+                clock to replay a run faster than real time.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.ramp_time = ramp_time
+        self.ramp_curve = ramp_curve
+        self.voltage = voltage
+        self.power = power
+        self.noise = noise
+        self.failure_rate = failure_rate
+        self.dead_ports = dead_ports or set()
+        self.weak_ports = weak_ports or set()
+
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._ports: list[int] = []
+        self._start_delays: dict[int, float] = {}
+        self._start_time = clock()
+
+    @classmethod
+    def from_options(cls, options: dict[str, list[str]]) -> "SimulatedPoe":
+        """Creates a SimulatedPoe from parsed backend spec options."""
+
+        def number(key: str, default: float) -> float:
+            return float(options[key][-1]) if key in options else default
+
+        def ports(key: str) -> set[int]:
+            return {int(port) for port in options.get(key, [])}
+
+        seed = options.get("seed")
+        return cls(
+            latency=number("latency", 0.0),
+            jitter=number("jitter", 0.0),
+            ramp_time=number("ramp", 2.0),
+            ramp_curve=RampCurve(options.get("curve", ["exponential"])[-1]),
+            voltage=number("voltage", 52.0),
+            power=number("power", 6.5),
+            noise=number("noise", 0.01),
+            failure_rate=number("failure_rate", 0.0),
+            dead_ports=ports("dead_port"),
+            weak_ports=ports("weak_port"),
+            seed=int(seed[-1]) if seed else None,
+        )
+
+    def setXmlFile(self, path: str) -> None:
+        root = ET.parse(path).getroot()
+        self._ports = [
+            int(port.attrib["id"]) for poe_element in root.findall("poe_controller") for port in poe_element.findall("port")
+        ]
+
+        # Ports are not all detected at the same moment
+        self._start_time = self._clock()
+        self._start_delays = {
+            port: self._random.uniform(0, self.ramp_time / 4) for port in self._ports
+        }
+
+    def getPortList(self) -> list[int]:
+        return list(self._ports)
+
+    def getPortVoltage(self, port: int) -> float:
+        self._transaction(port)
+        return self._reading(port, self.voltage, 0.0)
+
+    def getPortPower(self, port: int) -> float:
+        self._transaction(port)
+        # Power only starts flowing once the port voltage is mostly up
+        return self._reading(port, self.power, self.ramp_time / 2)
+
+    def _transaction(self, port: int) -> None:
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if port not in self._start_delays:
+            raise SimulatedPoeError(f"Port {port} does not exist")
+        if self.failure_rate and self._random.random() < self.failure_rate:
+            raise SimulatedPoeError(f"Simulated read failure on port {port}")
+
+    def _reading(self, port: int, target: float, delay: float) -> float:
+        if port in self.dead_ports:
+            return 0.0
+        if port in self.weak_ports:
+            target /= 2
+
+        elapsed = self._clock() - self._start_time - self._start_delays[port] - delay
+        value = target * self._ramp(elapsed)
+        if self.noise:
+            value *= 1 + self._random.uniform(-self.noise, self.noise)
+        return max(value, 0.0)
+
+    def _ramp(self, elapsed: float) -> float:
+        if elapsed <= 0:
+            return 0.0
+
+        duration = self.ramp_time / 2
+        if duration <= 0 or self.ramp_curve == RampCurve.STEP:
+            return 1.0 if elapsed >= duration else 0.0
+        elif self.ramp_curve == RampCurve.LINEAR:
+            return min(elapsed / duration, 1.0)
+        # Exponential: ~99% of the target after the ramp duration
+        return 1.0 - math.exp(-5 * elapsed / duration)
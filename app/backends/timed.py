@@ -0,0 +1,41 @@
+import time
+
+from app import instrumentation
+
+from . import PoeBackend
+
+
+class TimedPoe:
+    """
+    Wraps a backend to record the latency of every port read in the
+    sdk.getPortVoltage and sdk.getPortPower histograms, failed reads included.
+    """
+
+    def __init__(self, backend: PoeBackend) -> None:
+        self._backend = backend
+        self._voltage_latency = instrumentation.histogram("sdk.getPortVoltage")
+        self._power_latency = instrumentation.histogram("sdk.getPortPower")
+
+    @property
+    def backend(self) -> PoeBackend:
+        return self._backend
+
+    def setXmlFile(self, path: str) -> None:
+        self._backend.setXmlFile(path)
+
+    def getPortList(self) -> list[int]:
+        return self._backend.getPortList()
+
+    def getPortVoltage(self, port: int) -> float:
+        start = time.perf_counter_ns()
+        try:
+            return self._backend.getPortVoltage(port)
+        finally:
+            self._voltage_latency.record(time.perf_counter_ns() - start)
+
+    def getPortPower(self, port: int) -> float:
+        start = time.perf_counter_ns()
+        try:
+            return self._backend.getPortPower(port)
+        finally:
+            self._power_latency.record(time.perf_counter_ns() - start)
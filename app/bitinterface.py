@@ -1,7 +1,13 @@
+import collections
 import ctypes
 import enum
+import logging
+import time
 from multiprocessing import shared_memory
-from PySide6.QtCore import QCoreApplication
+from PySide6.QtCore import QCoreApplication, QTimer
+
+from app import instrumentation
+from app.log import EventLog
 
 PLUGIN_INTERFACE_VERSION: int = 4
 
@@ -9,6 +15,17 @@ PLUGIN_MAXDISPLAYTEXT: int = 20
 PLUGIN_MAXERRORTEXT: int = 100
 PLUGIN_MAXERRORTEXTLONG: int = 201
 
+# Milliseconds between attempts to hand queued messages to BurnInTest
+DRAIN_MIN_INTERVAL: int = 1
+DRAIN_MAX_INTERVAL: int = 100
+# Seconds to wait for BurnInTest to take all queued messages
+FLUSH_TIMEOUT: float = 10.0
+# Seconds a message may wait for BurnInTest before the handshake is logged as stalled, and between those logs
+STALL_TIMEOUT: float = 5.0
+
+logger = logging.getLogger(__name__)
+events = EventLog(logger, STALL_TIMEOUT)
+
 class PluginStatus(enum.Enum):
     PLUGIN_NOSTATUS = 0  # Nothing interesting for BurnInTest to know about
     PLUGIN_STARTUP = 1  # Not used - for future use
@@ -99,7 +116,7 @@ class BitInterfaceStructure(ctypes.Structure):
 
 class BitInterface:
     def __init__(self, key: str, window_title: str):
-        self._mem = shared_memory.SharedMemory(key, False)
+        self._mem: shared_memory.SharedMemory | None = shared_memory.SharedMemory(key, False)
         self._struct = BitInterfaceStructure.from_buffer(self._mem.buf)
 
         self._struct.interface_version = PLUGIN_INTERFACE_VERSION
@@ -125,6 +142,16 @@ class BitInterface:
         self._struct.verify_operations_text = "Verify:".encode('utf-8')
         self._struct.new_display_text = True
 
+        # Outbound messages, handed over whenever BurnInTest has consumed the last one,
+        # with the perf_counter_ns() they were queued at
+        self._pending_status: tuple[PluginStatus, bytes | None, int] | None = None
+        self._pending_errors: collections.deque[tuple[ErrorSeverity, bytes, int]] = collections.deque()
+        self._message_wait = instrumentation.histogram("bit.message_wait") if instrumentation.ENABLED else None
+        # perf_counter_ns() of the last message BurnInTest took
+        self._last_delivery = 0
+        self._drain_timer = QTimer()
+        self._drain_timer.timeout.connect(self._on_drain_timer)
+
     @property
     def test_running(self) -> bool:
         return bool(self._struct.test_running == 1)
@@ -194,50 +221,184 @@ class BitInterface:
         self._struct.verify_operations = value
 
     def set_status(self, status: PluginStatus, message: str, wait: bool = False) -> None:
+        """
+        Queues a status update for BurnInTest.
+
+        A status that has not been handed to BurnInTest yet is replaced by the
+        newer one. Unless wait is True this returns immediately.
+        """
         if len(message) > PLUGIN_MAXDISPLAYTEXT:
             raise ValueError("Status message too long")
 
-        self._wait_for_status()
-        self._struct.status = status.value
-        self._struct.status_message = message.encode('utf-8')
-        self._struct.new_status = True
+        self._pending_status = (status, message.encode('utf-8'), time.perf_counter_ns())
+        self._schedule_drain()
 
         if wait:
-            self._wait_for_status()
+            self.flush()
 
     def set_error(self, severity: ErrorSeverity, message: str, wait: bool = False) -> None:
+        """
+        Queues an error message for BurnInTest.
+
+        Errors are delivered one at a time in the order they were queued. Unless
+        wait is True this returns immediately.
+        """
         if len(message) > PLUGIN_MAXERRORTEXT:
             raise ValueError("Error message too long")
 
-        self._wait_for_error()
-
-        if severity.value > ErrorSeverity.ERRORWARNING.value:
-            self._struct.error_count += 1
-
-        self._struct.error_severity = severity.value
-        self._struct.error_message = message.encode('utf-8')
-        self._struct.new_error = True
+        self._pending_errors.append((severity, message.encode('utf-8'), time.perf_counter_ns()))
+        self._schedule_drain()
 
         if wait:
-            self._wait_for_error()
+            self.flush()
 
     def set_pretest_complete(self, wait: bool = False) -> None:
-        self._struct.status = PluginStatus.PRE_TEST_PLUGIN_COMPLETED.value
-        self._struct.new_status = True
+        """Queues the pre-test completed status, delivered after all queued errors."""
+        self._pending_status = (PluginStatus.PRE_TEST_PLUGIN_COMPLETED, None, time.perf_counter_ns())
+        self._schedule_drain()
 
         if wait:
-            self._wait_for_status()
-    
-    def _wait_for_error(self) -> None:
-        while self.test_running and self._struct.new_error:
-            QCoreApplication.processEvents()
+            self.flush()
 
-    def _wait_for_status(self) -> None:
-        while self.test_running and self._struct.new_status:
-            QCoreApplication.processEvents()
+    @property
+    def pending(self) -> int:
+        """Number of messages not yet handed to BurnInTest."""
+        return len(self._pending_errors) + (self._pending_status is not None)
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> bool:
+        """
+        Blocks until every queued message has been delivered and acknowledged by
+        BurnInTest, or the timeout in seconds expires. Qt events keep being
+        processed while waiting.
+
+        Returns:
+            bool: True if everything was delivered, False on timeout.
+        """
+        start = time.perf_counter_ns()
+        deadline = time.monotonic() + timeout
+        delay = DRAIN_MIN_INTERVAL
+        while True:
+            if self._drain_all():
+                # BurnInTest is taking messages, check back soon
+                delay = DRAIN_MIN_INTERVAL
+            if self._is_idle():
+                self._record_flush(start)
+                return True
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self._record_flush(start)
+                events.event("bit_flush_timeout", logging.WARNING, pending=self.pending, timeout=timeout)
+                return False
 
-    def __del__(self):
-        self._wait_for_error()
-        self._wait_for_status()
+            QCoreApplication.processEvents()
+            time.sleep(min(delay / 1000, remaining))
+            delay = min(delay * 2, DRAIN_MAX_INTERVAL)
+
+    def _record_flush(self, start: int) -> None:
+        if instrumentation.ENABLED:
+            instrumentation.histogram("bit.flush").record(time.perf_counter_ns() - start)
+
+    def _schedule_drain(self) -> None:
+        # Deliver right away when BurnInTest is ready, the timer picks up the rest
+        self._drain()
+        if self.pending and not self._drain_timer.isActive():
+            self._drain_timer.start(DRAIN_MIN_INTERVAL)
+
+    def _on_drain_timer(self) -> None:
+        delivered = self._drain_all()
+
+        if not self.pending:
+            self._drain_timer.stop()
+        elif delivered:
+            self._drain_timer.setInterval(DRAIN_MIN_INTERVAL)
+        else:
+            # BurnInTest has not picked up the last message yet, back off
+            self._drain_timer.setInterval(min(self._drain_timer.interval() * 2, DRAIN_MAX_INTERVAL))
+            self._check_stalled()
+
+    def _check_stalled(self) -> None:
+        # A long queue BurnInTest keeps taking from is not stalled, only one it
+        # took nothing from since the oldest message was queued or the last delivery
+        queued = [queued for _, _, queued in self._pending_errors]
+        if self._pending_status:
+            queued.append(self._pending_status[2])
+        waited = (time.perf_counter_ns() - max(min(queued), self._last_delivery)) / 1e9
+        if waited >= STALL_TIMEOUT:
+            events.event("bit_handshake_stalled", logging.WARNING, pending=self.pending, waited=waited)
+
+    def _drain_all(self) -> bool:
+        """Drains for as long as BurnInTest keeps taking messages, returns whether any were."""
+        delivered = False
+        while self._drain():
+            delivered = True
+        return delivered
+
+    def _drain(self) -> bool:
+        """Hands queued messages to BurnInTest where its slots are free."""
+        delivered = False
+
+        if self._pending_errors and self._error_slot_free():
+            severity, message, queued = self._pending_errors.popleft()
+            if self._message_wait:
+                self._message_wait.record(time.perf_counter_ns() - queued)
+            if severity.value > ErrorSeverity.ERRORWARNING.value:
+                self._struct.error_count += 1
+
+            self._struct.error_severity = severity.value
+            self._struct.error_message = message
+            self._struct.new_error = True
+            delivered = True
+
+        if self._pending_status and self._status_slot_free():
+            status, message, queued = self._pending_status
+            # Completing makes BurnInTest close the interface, so all errors go first
+            if status != PluginStatus.PRE_TEST_PLUGIN_COMPLETED or (
+                not self._pending_errors and self._error_slot_free()
+            ):
+                self._pending_status = None
+                if self._message_wait:
+                    self._message_wait.record(time.perf_counter_ns() - queued)
+                self._struct.status = status.value
+                if message is not None:
+                    self._struct.status_message = message
+                self._struct.new_status = True
+                delivered = True
+
+        if delivered:
+            self._last_delivery = time.perf_counter_ns()
+        return delivered
+
+    def _error_slot_free(self) -> bool:
+        return not (self.test_running and self._struct.new_error)
+
+    def _status_slot_free(self) -> bool:
+        return not (self.test_running and self._struct.new_status)
+
+    def _is_idle(self) -> bool:
+        return not self.pending and self._error_slot_free() and self._status_slot_free()
+
+    def close(self) -> None:
+        """Delivers the messages still queued, then releases the shared memory."""
+        if self._mem is None:
+            return
+
+        self._drain_timer.stop()
+        self.flush()
+        self._release()
+
+    def _release(self) -> None:
+        if self._mem is None:
+            return
+
+        # The structure exports the buffer, it has to go before the mapping can close
+        del self._struct
         self._mem.close()
         self._mem.unlink()
+        self._mem = None
+
+    def __del__(self):
+        # A finalizer must neither block on BurnInTest nor pump events, and the
+        # drain timer may be gone already at shutdown, close() delivers the rest
+        if getattr(self, "_mem", None) is not None:
+            self._release()
@@ -0,0 +1,226 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+INDEX_FILENAME = "device_index.json"
+
+
+@dataclass(frozen=True)
+class DeviceEntry:
+    filename: str
+    name: str
+    ports: tuple[int, ...]
+    mtime_ns: int
+    size: int
+    sha1: str
+
+    @property
+    def has_poe(self) -> bool:
+        return bool(self.ports)
+
+
+def scan_device_file(path: str) -> tuple[str, tuple[int, ...]] | None:
+    """
+    Reads the computer id and PoE port ids of a device file, the ports of
+    every poe_controller element in file order.
+
+    Returns:
+        tuple[str, tuple[int, ...]] | None: The name and ports, or None if the
+        file is not a computer description.
+    """
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError):
+        return None
+    if root.tag != "computer":
+        return None
+
+    name = root.attrib.get("id") or os.path.basename(path)
+    ports = tuple(
+        int(port.attrib["id"]) for port in root.iterfind("poe_controller/port") if port.attrib.get("id", "").isdigit()
+    )
+    return name, ports
+
+
+@dataclass(frozen=True)
+class PoeController:
+    """A PSE chip of a device and the ports it drives."""
+
+    bus_address: str
+    chip_address: str
+    ports: tuple[int, ...]
+
+
+def _controller_key(element: ET.Element) -> tuple[str, str]:
+    return element.attrib.get("bus_address", ""), element.attrib.get("chip_address", "")
+
+
+def read_poe_controllers(path: str) -> list[PoeController]:
+    """
+    Reads the PoE controllers of a device file, in file order. Elements that
+    address the same chip are merged into one controller.
+    """
+    controllers: dict[tuple[str, str], list[int]] = {}
+    for element in ET.parse(path).getroot().findall("poe_controller"):
+        ports = controllers.setdefault(_controller_key(element), [])
+        ports.extend(int(port.attrib["id"]) for port in element.findall("port") if port.attrib.get("id", "").isdigit())
+    return [PoeController(bus, chip, tuple(ports)) for (bus, chip), ports in controllers.items()]
+
+
+def split_device_file(path: str, directory: str) -> list[tuple[PoeController, str]]:
+    """
+    Writes a copy of a device file for every PoE controller, keeping only that
+    controller's elements, so a backend can be set up for each one.
+
+    Returns:
+        list[tuple[PoeController, str]]: Every controller and the path of its file.
+    """
+    root = ET.parse(path).getroot()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    files = []
+    for index, controller in enumerate(read_poe_controllers(path)):
+        key = (controller.bus_address, controller.chip_address)
+        controller_root = copy.deepcopy(root)
+        for element in controller_root.findall("poe_controller"):
+            if _controller_key(element) != key:
+                controller_root.remove(element)
+
+        controller_path = os.path.join(directory, f"{stem}-{index}.xml")
+        ET.ElementTree(controller_root).write(controller_path, encoding="utf-8", xml_declaration=True)
+        files.append((controller, controller_path))
+    return files
+
+
+def _file_hash(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+class DeviceCatalog:
+    """
+    An index of the device files in a directory, cached on disk.
+
+    Entries are keyed by file name and validated against the file's
+    modification time and size, falling back to a content hash, so only new
+    or changed files are parsed on refresh. A prebuilt index, such as the one
+    shipped with the frozen build, can seed the cache.
+    """
+
+    def __init__(self, directory: str, index_path: str, prebuilt_index: str | None = None) -> None:
+        self._directory = directory
+        self._index_path = index_path
+        self._prebuilt_index = prebuilt_index
+        self._entries: dict[str, DeviceEntry] = {}
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def load(self) -> None:
+        """Loads the cached index, or the prebuilt one when there is no cache yet."""
+        for path in (self._index_path, self._prebuilt_index):
+            if path and os.path.exists(path):
+                try:
+                    self._entries = self._read_index(path)
+                    return
+                except (OSError, ValueError, KeyError, TypeError):
+                    logger.warning("Ignoring unreadable device index %s", path, exc_info=True)
+
+    def devices(self) -> list[tuple[str, str]]:
+        """Returns the name and path of every device with PoE ports, sorted by name."""
+        devices = [
+            (entry.name.upper(), os.path.join(self._directory, entry.filename))
+            for entry in self._entries.values()
+            if entry.has_poe
+        ]
+        return sorted(devices)
+
+    def refresh(self) -> bool:
+        """
+        Brings the index up to date with the directory and saves it when
+        anything changed.
+
+        Returns:
+            bool: True if the index changed.
+        """
+        entries: dict[str, DeviceEntry] = {}
+        changed = False
+
+        try:
+            files = [entry for entry in os.scandir(self._directory) if entry.is_file() and entry.name.endswith(".xml")]
+        except OSError:
+            logger.warning("Failed to list device files in %s", self._directory, exc_info=True)
+            files = []
+
+        for file in files:
+            stat = file.stat()
+            cached = self._entries.get(file.name)
+            if cached and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+                entries[file.name] = cached
+                continue
+
+            try:
+                sha1 = _file_hash(file.path)
+            except OSError:
+                continue
+
+            if cached and cached.sha1 == sha1:
+                # Same content with a new timestamp, e.g. after an install
+                entries[file.name] = DeviceEntry(cached.filename, cached.name, cached.ports, stat.st_mtime_ns, stat.st_size, sha1)
+                changed = True
+                continue
+
+            scanned = scan_device_file(file.path)
+            name, ports = scanned if scanned else ("", ())
+            entries[file.name] = DeviceEntry(file.name, name, ports, stat.st_mtime_ns, stat.st_size, sha1)
+            changed = True
+
+        if entries.keys() != self._entries.keys():
+            changed = True
+
+        self._entries = entries
+        if changed:
+            self.save()
+        return changed
+
+    def save(self, path: str | None = None) -> None:
+        path = path or self._index_path
+        index = {
+            "version": INDEX_VERSION,
+            "files": {name: asdict(entry) for name, entry in sorted(self._entries.items())},
+        }
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w") as file:
+                json.dump(index, file, indent=1)
+            os.replace(temp_path, path)
+        except OSError:
+            logger.warning("Failed to save the device index to %s", path, exc_info=True)
+
+    def _read_index(self, path: str) -> dict[str, DeviceEntry]:
+        with open(path) as file:
+            index = json.load(file)
+        if index.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported device index version {index.get('version')}")
+
+        entries = {}
+        for name, entry in index["files"].items():
+            entry["ports"] = tuple(entry["ports"])
+            entries[name] = DeviceEntry(**entry)
+        return entries
+
+
+def build_index(directory: str, index_path: str) -> DeviceCatalog:
+    """Builds a fresh index of a directory, used to ship a prebuilt index."""
+    catalog = DeviceCatalog(directory, index_path)
+    catalog.refresh()
+    catalog.save()
+    return catalog
@@ -0,0 +1,350 @@
+"""
+Runs the pre-test of many units at once from one supervisor.
+
+Every unit is tested by a headless worker process of its own, so a crash in
+the SDK only takes down that unit's worker, which is then restarted. Workers
+publish their measurements in a telemetry segment the supervisor creates for
+them, and the supervisor shows every unit in one window:
+
+    PoE Tester --fleet FLEET_FILE
+
+The fleet file lists the units as JSON, each with a device file and
+optionally the key of its BurnInTest segment, a backend and a timeout:
+
+    {
+        "passing_voltage": 48, "passing_power": 4.5,
+        "units": [
+            {"name": "Slot 1", "device": "devices/ivh9016.xml", "bit_key": "BIT_PLUGIN_INT_1"},
+            {"name": "Slot 2", "device": "devices/ivh9008.xml", "backend": "simulated"}
+        ]
+    }
+"""
+
+import argparse
+import enum
+import json
+import logging
+import os
+import sys
+import typing
+from dataclasses import dataclass
+
+from PySide6.QtCore import QObject, QProcess, QProcessEnvironment, QTimer, Signal
+
+from app.log import child_log_file
+from app.models import DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+from app.telemetry import TelemetryReader, TelemetryStructure, WorkerState
+
+logger = logging.getLogger(__name__)
+
+# Seconds a worker waits for every port to pass, like --timeout of a headless run
+DEFAULT_UNIT_TIMEOUT: float = 60.0
+# Milliseconds between reads of the telemetry segments
+POLL_INTERVAL: int = 200
+# Times a crashed worker is restarted before its unit is given up
+MAX_RESTARTS: int = 3
+# Milliseconds to wait before restarting a crashed worker
+RESTART_DELAY: int = 1000
+# Exit code of a headless run without a device to test
+NO_DEVICE_EXIT_CODE: int = 2
+
+
+class UnitState(enum.Enum):
+    STARTING = "Starting"
+    RUNNING = "Running"
+    PASSED = "Passed"
+    FAILED = "Failed"
+    RESTARTING = "Restarting"
+    # Crashed more often than it may be restarted, or could not be tested
+    CRASHED = "Crashed"
+
+
+FINAL_STATES = (UnitState.PASSED, UnitState.FAILED, UnitState.CRASHED)
+
+
+@dataclass(frozen=True)
+class FleetUnit:
+    name: str
+    device_file: str
+    bit_key: str | None = None
+    # Backend spec for the worker, defaults to the supervisor's POE_TESTER_BACKEND
+    backend: str | None = None
+    timeout: float = DEFAULT_UNIT_TIMEOUT
+
+
+@dataclass
+class UnitStatus:
+    """What the supervisor knows about a unit's worker."""
+
+    unit: FleetUnit
+    state: UnitState = UnitState.STARTING
+    pid: int = 0
+    restarts: int = 0
+    # Share of one CPU the worker used since the previous read
+    cpu_percent: float = 0.0
+    resident_bytes: int = 0
+    samples: int = 0
+    # The last consistent copy of the unit's telemetry segment
+    telemetry: TelemetryStructure | None = None
+
+
+@dataclass(frozen=True)
+class FleetConfig:
+    units: list[FleetUnit]
+    passing_voltage: float = DEFAULT_PASSING_VOLTAGE
+    passing_power: float = DEFAULT_PASSING_POWER
+
+
+def read_fleet_file(path: str) -> FleetConfig:
+    """
+    Reads the units of a fleet file. Relative device files are relative to the
+    fleet file.
+
+    Raises:
+        ValueError: If the file is not a valid fleet file.
+    """
+    try:
+        with open(path) as file:
+            config = json.load(file)
+    except (OSError, json.JSONDecodeError) as error:
+        raise ValueError(f"Could not read fleet file {path}: {error}") from error
+
+    directory = os.path.dirname(os.path.abspath(path))
+    units = []
+    for index, unit in enumerate(config.get("units", [])):
+        if "device" not in unit:
+            raise ValueError(f"Unit {index + 1} of {path} has no device")
+        units.append(
+            FleetUnit(
+                unit.get("name", f"Unit {index + 1}"),
+                os.path.join(directory, unit["device"]),
+                unit.get("bit_key"),
+                unit.get("backend"),
+                float(unit.get("timeout", DEFAULT_UNIT_TIMEOUT)),
+            )
+        )
+    if not units:
+        raise ValueError(f"{path} lists no units")
+
+    return FleetConfig(
+        units,
+        float(config.get("passing_voltage", DEFAULT_PASSING_VOLTAGE)),
+        float(config.get("passing_power", DEFAULT_PASSING_POWER)),
+    )
+
+
+class FleetSupervisor(QObject):
+    """
+    Starts a headless worker process per unit and follows them through their
+    telemetry segments.
+
+    A worker that exits without having reported a verdict crashed, and is
+    restarted after RESTART_DELAY up to max_restarts times. The CPU and
+    memory use of every worker is taken from what it reports about itself.
+    """
+
+    # The index of a unit whose status changed
+    unit_changed = Signal(int)
+    # True if every unit passed
+    finished = Signal(bool)
+
+    def __init__(
+        self,
+        config: FleetConfig,
+        poll_interval: int = POLL_INTERVAL,
+        max_restarts: int = MAX_RESTARTS,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._config = config
+        self._max_restarts = max_restarts
+        self._status = [UnitStatus(unit) for unit in config.units]
+        self._segments: list[TelemetryReader] = []
+        self._processes: list[QProcess | None] = [None] * len(config.units)
+        self._done = False
+
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setInterval(poll_interval)
+        self._poll_timer.timeout.connect(self._poll)
+
+    @property
+    def status(self) -> typing.Sequence[UnitStatus]:
+        return self._status
+
+    @property
+    def config(self) -> FleetConfig:
+        return self._config
+
+    def start(self) -> None:
+        for index in range(len(self._status)):
+            self._segments.append(TelemetryReader(f"poe_fleet_{os.getpid()}_{index}", create=True))
+            self._start_worker(index)
+        self._poll_timer.start()
+
+    def stop(self) -> None:
+        """Stops every worker still running and removes the telemetry segments."""
+        self._poll_timer.stop()
+        self._done = True
+        for process in self._processes:
+            if process and process.state() != QProcess.ProcessState.NotRunning:
+                process.finished.disconnect()
+                process.kill()
+                process.waitForFinished(1000)
+        for segment in self._segments:
+            segment.close()
+        self._segments.clear()
+
+    def _start_worker(self, index: int) -> None:
+        if self._done:
+            return
+
+        status = self._status[index]
+        unit = status.unit
+        program, args = _worker_command()
+        args += ["--headless", "--device", unit.device_file, "--timeout", str(unit.timeout)]
+        args += ["--passing-voltage", str(self._config.passing_voltage)]
+        args += ["--passing-power", str(self._config.passing_power)]
+        args += ["--telemetry", self._segments[index].name]
+        if unit.bit_key:
+            args.append(unit.bit_key)
+
+        environment = QProcessEnvironment.systemEnvironment()
+        if unit.backend:
+            environment.insert("POE_TESTER_BACKEND", unit.backend)
+        if record_dir := environment.value("POE_TESTER_RECORD_DIR"):
+            # Units of the same device must not write to the same recordings
+            environment.insert("POE_TESTER_RECORD_DIR", os.path.join(record_dir, unit.name))
+        # Nor rotate the same log file
+        environment.insert("POE_TESTER_LOG_FILE", child_log_file(unit.name))
+
+        process = QProcess(self)
+        process.setProcessEnvironment(environment)
+        process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedChannels)
+        process.finished.connect(lambda code, exit_status: self._worker_finished(index, code, exit_status))
+        process.errorOccurred.connect(lambda error: self._worker_error(index, error))
+        self._processes[index] = process
+
+        status.state = UnitState.STARTING
+        process.start(program, args)
+        status.pid = process.processId()
+        logger.info("Started %s on %s as process %d", unit.name, os.path.basename(unit.device_file), status.pid)
+        self.unit_changed.emit(index)
+
+    def _worker_finished(self, index: int, exit_code: int, exit_status: QProcess.ExitStatus) -> None:
+        self._read(index)
+        status = self._status[index]
+
+        telemetry_state = status.telemetry.state if status.telemetry else None
+        if telemetry_state == WorkerState.PASSED:
+            status.state = UnitState.PASSED
+        elif telemetry_state == WorkerState.FAILED:
+            status.state = UnitState.FAILED
+        elif exit_code == NO_DEVICE_EXIT_CODE and exit_status == QProcess.ExitStatus.NormalExit:
+            logger.error("%s has no device to test", status.unit.name)
+            status.state = UnitState.CRASHED
+        else:
+            self._restart(index, f"exited with {exit_code} before a verdict")
+
+        self.unit_changed.emit(index)
+        self._check_finished()
+
+    def _worker_error(self, index: int, error: QProcess.ProcessError) -> None:
+        # Crashes and exits are handled once the process finished
+        if error == QProcess.ProcessError.FailedToStart:
+            self._restart(index, "failed to start")
+            self.unit_changed.emit(index)
+            self._check_finished()
+
+    def _restart(self, index: int, reason: str) -> None:
+        status = self._status[index]
+        if self._done or status.restarts >= self._max_restarts:
+            logger.error("%s %s, giving up after %d restarts", status.unit.name, reason, status.restarts)
+            status.state = UnitState.CRASHED
+            return
+
+        logger.warning("%s %s, restarting", status.unit.name, reason)
+        status.restarts += 1
+        status.state = UnitState.RESTARTING
+        QTimer.singleShot(RESTART_DELAY, self, lambda: self._start_worker(index))
+
+    def _check_finished(self) -> None:
+        if self._done or not all(status.state in FINAL_STATES for status in self._status):
+            return
+
+        self._done = True
+        self._poll_timer.stop()
+        passed = all(status.state == UnitState.PASSED for status in self._status)
+        logger.info("Every unit finished, %s", "all passed" if passed else "not all passed")
+        self.finished.emit(passed)
+
+    def _poll(self) -> None:
+        for index, status in enumerate(self._status):
+            if status.state not in FINAL_STATES and self._read(index):
+                self.unit_changed.emit(index)
+
+    def _read(self, index: int) -> bool:
+        """Takes a new copy of a unit's telemetry. Returns True if it changed."""
+        if index >= len(self._segments):
+            return False
+
+        segment = self._segments[index]
+        status = self._status[index]
+        previous = status.telemetry
+        if previous and segment.generation == previous.sequence // 2:
+            return False
+
+        telemetry = segment.read()
+        if telemetry is None or telemetry.pid == 0:
+            return False
+
+        if previous and previous.pid == telemetry.pid and telemetry.timestamp > previous.timestamp:
+            status.cpu_percent = (
+                100 * (telemetry.cpu_seconds - previous.cpu_seconds) / (telemetry.timestamp - previous.timestamp)
+            )
+        status.pid = telemetry.pid
+        status.resident_bytes = telemetry.resident_bytes
+        status.samples = telemetry.samples
+        if status.state == UnitState.STARTING and telemetry.port_count:
+            status.state = UnitState.RUNNING
+        status.telemetry = telemetry
+        return True
+
+
+def _worker_command() -> tuple[str, list[str]]:
+    """The program and leading arguments that start this application again."""
+    if getattr(sys, "frozen", False):
+        return sys.executable, []
+    return sys.executable, ["-m", "app"]
+
+
+def run_fleet(argv: list[str]) -> int:
+    """
+    Runs the fleet supervisor and its window.
+
+    Returns:
+        int: 0 if every unit passed, 1 if any did not and 2 if the fleet file
+        could not be read.
+    """
+    from PySide6.QtWidgets import QApplication
+
+    from app.widgets.fleet_window import FleetWindow
+
+    parser = argparse.ArgumentParser(prog="PoE Tester", description="Runs the PoE pre-test of many units at once.")
+    parser.add_argument("--fleet", required=True, help="JSON file listing the units to test.")
+    args, _ = parser.parse_known_args(argv[1:])
+
+    app = QApplication(argv)
+    app.setStyle("Fusion")
+
+    try:
+        config = read_fleet_file(args.fleet)
+    except ValueError as error:
+        logger.error("%s", error)
+        return 2
+
+    supervisor = FleetSupervisor(config)
+    window = FleetWindow(supervisor)
+    window.show()
+    supervisor.start()
+    result = app.exec()
+    return result if result else int(not all(status.state == UnitState.PASSED for status in supervisor.status))
@@ -0,0 +1,266 @@
+"""
+Runs a BurnInTest pre-test without the GUI.
+
+Only QtCore is loaded: acquisition runs on the sampler thread and results are
+kept in a PortStateStore, without a table model or port objects. The device
+and thresholds come from the command line, falling back to the settings saved
+by the GUI:
+
+    PoE Tester --headless BIT_PLUGIN_INT... [--device FILE] [--passing-voltage V] [--passing-power W] [--timeout S]
+
+The measurements of every sweep are also published in the telemetry segment
+named by --telemetry when run as a worker of a fleet supervisor, or else in
+one of its own named by POE_TESTER_TELEMETRY.
+"""
+
+import argparse
+import logging
+import typing
+
+import numpy as np
+from PySide6.QtCore import QCoreApplication, QMetaObject, QObject, QSettings, Qt, QThread, QTimer, Signal
+
+from app import instrumentation
+from app.acquisition.sampler import PoeSampler
+from app.acquisition.snapshot import Snapshot
+from app.bitinterface import BitInterface, PluginStatus
+from app.models import DEFAULT_HISTORY_CAPACITY, DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+from app.models.port_state_store import PortStateStore
+from app.models.sample_history import SampleHistory
+from app.results import PortResult, send_results, send_thresholds
+from app.telemetry import DEFAULT_TELEMETRY, TelemetryWriter, WorkerState
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for every port to pass before failing the run
+DEFAULT_TIMEOUT: float = 60.0
+
+
+class HeadlessRunner(QObject):
+    """
+    Samples a device until every port passes or the timeout expires, then
+    reports the results the same way the main window does when it closes.
+    """
+
+    # True if every port passed
+    finished = Signal(bool)
+
+    def __init__(
+        self,
+        device_file: str,
+        passing_voltage: float = DEFAULT_PASSING_VOLTAGE,
+        passing_power: float = DEFAULT_PASSING_POWER,
+        bit_key: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        telemetry: str | None = None,
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._device_file = device_file
+        self._passing_voltage = passing_voltage
+        self._passing_power = passing_power
+        self._bit_key = bit_key
+        self._bit_interface: BitInterface | None = None
+
+        self._store = PortStateStore()
+        self._store.set_thresholds(passing_voltage, passing_power)
+        self._rows: dict[int, int] = {}
+        # The recent samples of every port by row, for sag, dropouts and time to threshold
+        self._history = SampleHistory(DEFAULT_HISTORY_CAPACITY) if DEFAULT_HISTORY_CAPACITY else None
+        # The ports and their rows in the order they are published
+        self._published_ports: list[int] = []
+        self._published_rows = np.empty(0, np.intp)
+        self._samples = 0
+        self._done = False
+
+        self._sampler: PoeSampler | None = None
+        self._sampler_thread = QThread(self)
+
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.setInterval(int(timeout * 1000))
+        self._timeout_timer.timeout.connect(self._timed_out)
+
+        self._telemetry_name = telemetry
+        self._telemetry: TelemetryWriter | None = None
+
+    @property
+    def store(self) -> PortStateStore:
+        return self._store
+
+    @property
+    def history(self) -> SampleHistory | None:
+        return self._history
+
+    def results(self) -> list[PortResult]:
+        store = self._store
+        return [
+            PortResult(
+                port,
+                float(store.voltage_max[row]),
+                float(store.current_max[row]),
+                float(store.power_max[row]),
+                bool(store.passing[row]),
+            )
+            for port, row in self._rows.items()
+        ]
+
+    def start(self) -> None:
+        if self._bit_key:
+            self._bit_interface = BitInterface(self._bit_key, "PoE Tester")
+            # We only use the read and verify operations
+            self._bit_interface.read_operations = 0
+            self._bit_interface.verify_operations = 0
+            self._bit_interface.set_status(PluginStatus.PLUGIN_STARTUP, "Starting")
+            send_thresholds(self._bit_interface, self._passing_voltage, self._passing_power)
+
+        if self._telemetry_name:
+            self._telemetry = TelemetryWriter(self._telemetry_name)
+        elif DEFAULT_TELEMETRY:
+            try:
+                self._telemetry = TelemetryWriter(DEFAULT_TELEMETRY, create=True)
+            except FileExistsError:
+                logger.error("Not publishing telemetry, another run publishes to %s", DEFAULT_TELEMETRY)
+
+        self._sampler = PoeSampler(self._device_file)
+        self._sampler.passing_voltage = self._passing_voltage
+        self._sampler.passing_power = self._passing_power
+        self._sampler.moveToThread(self._sampler_thread)
+
+        self._sampler_thread.started.connect(self._sampler.start)
+        self._sampler_thread.finished.connect(self._sampler.deleteLater)
+        self._sampler.ports_ready.connect(self._ports_ready)
+        self._sampler.snapshot_ready.connect(self._update_snapshot)
+
+        if instrumentation.ENABLED:
+            instrumentation.EventLoopMonitor("headless.event_loop_lag", parent=self).start()
+
+        self._sampler_thread.start()
+        self._timeout_timer.start()
+
+    def finish(self) -> None:
+        """Stops sampling and reports the results, once."""
+        if self._done:
+            return
+        self._done = True
+        self._timeout_timer.stop()
+
+        if self._sampler_thread.isRunning():
+            QMetaObject.invokeMethod(self._sampler, "stop", Qt.ConnectionType.BlockingQueuedConnection)
+            self._sampler_thread.quit()
+            self._sampler_thread.wait()
+        self._sampler = None
+
+        results = self.results()
+        for result in results:
+            logger.info(
+                "LAN %d: Voltage: %.2fV, Current: %.2fA, Power: %.2fW, %s",
+                result.port,
+                result.max_voltage,
+                result.max_current,
+                result.max_power,
+                "passed" if result.passing else "failed",
+            )
+
+        passed = bool(results) and all(result.passing for result in results)
+        if self._telemetry:
+            self._publish(WorkerState.PASSED if passed else WorkerState.FAILED)
+            self._telemetry.close()
+            self._telemetry = None
+        if self._bit_interface:
+            send_results(self._bit_interface, results)
+            self._bit_interface.close()
+            self._bit_interface = None
+        instrumentation.log_summary()
+        self.finished.emit(passed)
+
+    def _ports_ready(self, ports: list[int]) -> None:
+        for port in ports:
+            self._rows[port] = self._store.add()
+            if self._history is not None:
+                self._history.add()
+        self._published_ports = list(self._rows)
+        self._published_rows = np.fromiter(self._rows.values(), np.intp, len(self._rows))
+
+    def _update_snapshot(self, snapshot: Snapshot) -> None:
+        if self._done:
+            return
+
+        rows = np.fromiter((self._rows[port] for port in snapshot.ports.tolist()), np.intp, len(snapshot))
+        store = self._store
+        store.update(rows, snapshot.timestamps, snapshot.voltages, snapshot.powers)
+        if self._history is not None:
+            self._history.append(rows, snapshot.timestamps, store.voltage[rows], store.current[rows], store.power[rows])
+
+        samples = len(snapshot)
+        self._samples += samples
+        if self._bit_interface:
+            self._bit_interface.cycle += samples
+            self._bit_interface.read_operations += samples
+            self._bit_interface.verify_operations += samples
+        self._publish()
+
+        if self._store.all_passing:
+            self.finish()
+
+    def _publish(self, state: WorkerState = WorkerState.RUNNING) -> None:
+        if self._telemetry:
+            self._telemetry.publish(self._published_ports, self._store, self._published_rows, state, self._samples)
+
+    def _timed_out(self) -> None:
+        logger.warning("Not every port passed within %.1f s", self._timeout_timer.interval() / 1000)
+        self.finish()
+
+
+def parse_args(argv: typing.Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="PoE Tester", description="Runs the PoE pre-test without the GUI.")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--device", help="Device file to test, defaults to the last one chosen in the GUI.")
+    parser.add_argument("--passing-voltage", type=float, help="Voltage (V) every port must reach.")
+    parser.add_argument("--passing-power", type=float, help="Power (W) every port must reach.")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="Seconds to wait for every port to pass.")
+    parser.add_argument("--telemetry", help="Existing shared memory segment to publish measurements to, as created by a fleet supervisor.")
+    # BurnInTest passes the key of its shared memory as an argument
+    args, unknown = parser.parse_known_args(argv[1:])
+    args.bit_key = next((arg for arg in unknown if arg.startswith("BIT_PLUGIN_INT")), None)
+    return args
+
+
+def _setting(settings: QSettings, key: str, default: float) -> float:
+    value = settings.value(key)
+    if isinstance(value, (float, str)):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return default
+
+
+def run_headless(argv: list[str]) -> int:
+    """
+    Runs the pre-test without the GUI.
+
+    Returns:
+        int: 0 if every port passed, 1 if any failed and 2 if there is no
+        device to test.
+    """
+    app = QCoreApplication(argv)
+    args = parse_args(argv)
+
+    settings = QSettings()
+    device_file = args.device or settings.value("device")
+    if not device_file:
+        logger.error("No device file given and none saved by the GUI")
+        return 2
+
+    passing_voltage = args.passing_voltage
+    if passing_voltage is None:
+        passing_voltage = _setting(settings, "passing_voltage", DEFAULT_PASSING_VOLTAGE)
+    passing_power = args.passing_power
+    if passing_power is None:
+        passing_power = _setting(settings, "passing_power", DEFAULT_PASSING_POWER)
+
+    runner = HeadlessRunner(str(device_file), passing_voltage, passing_power, args.bit_key, args.timeout, args.telemetry)
+    runner.finished.connect(lambda passed: app.exit(0 if passed else 1))
+    QTimer.singleShot(0, runner.start)
+    return app.exec()
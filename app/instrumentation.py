@@ -0,0 +1,222 @@
+"""
+Latency histograms and counters for the hot paths of a run.
+
+Set POE_TESTER_INSTRUMENT to time every SDK read, every sweep of the sampler,
+how late the event loop runs its timers and how long messages wait to be
+handed to BurnInTest. The main window then shows them on a diagnostics page,
+and a summary is logged when a run ends. Without it nothing is timed and the
+hot paths are the same as without this module.
+
+Histograms keep their counts in log-linear buckets like HdrHistogram, so
+recording is a few integer operations and percentiles are within 1% of the
+recorded values from nanoseconds up to minutes.
+"""
+
+import logging
+import os
+import threading
+import time
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+logger = logging.getLogger(__name__)
+
+ENABLED = bool(os.environ.get("POE_TESTER_INSTRUMENT"))
+
+# Buckets per power of two are 2 ** (SUB_BUCKET_BITS - 1), for values of 2 ** SUB_BUCKET_BITS ns and up
+SUB_BUCKET_BITS: int = 7
+# Longest latency told apart from longer ones, about 18 minutes
+MAX_LATENCY_NS: int = 1 << 40
+# Percentiles shown in summaries
+PERCENTILES: tuple[float, ...] = (50.0, 90.0, 99.0, 99.9)
+# Milliseconds between the timer ticks of an EventLoopMonitor
+LAG_INTERVAL: int = 50
+
+_HALF_BUCKET_BITS = SUB_BUCKET_BITS - 1
+
+
+def _bucket(value: int) -> int:
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    if shift <= 0:
+        return value
+    return (shift << _HALF_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_range(index: int) -> tuple[int, int]:
+    """The lowest and highest value counted in a bucket."""
+    if index < 1 << SUB_BUCKET_BITS:
+        return index, index
+    shift = (index >> _HALF_BUCKET_BITS) - 1
+    low = (index - (shift << _HALF_BUCKET_BITS)) << shift
+    return low, low + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    Counts of latencies in nanoseconds, safe to record from several threads.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self._counts = [0] * (_bucket(MAX_LATENCY_NS - 1) + 1)
+        self._last = len(self._counts) - 1
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """Counts a latency in nanoseconds."""
+        # Inlined _bucket(), this is called for every SDK read
+        if value < 0:
+            value = 0
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        index = value if shift <= 0 else (shift << _HALF_BUCKET_BITS) + (value >> shift)
+        if index > self._last:
+            index = self._last
+        with self._lock:
+            self._counts[index] += 1
+            if not self.count or value < self.min:
+                self.min = value
+            if value > self.max:
+                self.max = value
+            self.count += 1
+            self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """The latency at or below which the given percentage of latencies are, 0 without any."""
+        if not self.count:
+            return 0
+
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_range(index)[1], self.max)
+        return self.max
+
+    def copy(self) -> "LatencyHistogram":
+        """A copy to read while this one keeps being recorded to."""
+        histogram = LatencyHistogram(self.name)
+        with self._lock:
+            histogram._counts = self._counts.copy()
+            histogram.count, histogram.total = self.count, self.total
+            histogram.min, histogram.max = self.min, self.max
+        return histogram
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts = [0] * len(self._counts)
+            self.count = self.total = self.min = self.max = 0
+
+
+_lock = threading.Lock()
+_histograms: dict[str, LatencyHistogram] = {}
+_counters: dict[str, int] = {}
+
+
+def histogram(name: str) -> LatencyHistogram:
+    """The histogram of the given name, created the first time it is asked for."""
+    with _lock:
+        if name not in _histograms:
+            _histograms[name] = LatencyHistogram(name)
+        return _histograms[name]
+
+
+def count(name: str, amount: int = 1) -> None:
+    """Adds to a counter, when instrumentation is enabled."""
+    if ENABLED:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + amount
+
+
+def histograms() -> list[LatencyHistogram]:
+    """Copies of every histogram, sorted by name."""
+    with _lock:
+        names = sorted(_histograms)
+    return [_histograms[name].copy() for name in names]
+
+
+def counters() -> dict[str, int]:
+    with _lock:
+        return dict(sorted(_counters.items()))
+
+
+def reset() -> None:
+    """Clears every histogram and counter, e.g. to only measure from now on."""
+    with _lock:
+        for histogram in _histograms.values():
+            histogram.reset()
+        for name in _counters:
+            _counters[name] = 0
+
+
+def format_latency(value: float) -> str:
+    if value < 1e3:
+        return f"{value:.0f} ns"
+    elif value < 1e6:
+        return f"{value / 1e3:.1f} us"
+    elif value < 1e9:
+        return f"{value / 1e6:.2f} ms"
+    return f"{value / 1e9:.2f} s"
+
+
+def summary() -> list[str]:
+    """A line for every histogram with samples and every counter."""
+    lines = []
+    for histogram in histograms():
+        if not histogram.count:
+            continue
+        percentiles = "  ".join(
+            f"p{percent:g} {format_latency(histogram.percentile(percent))}" for percent in PERCENTILES
+        )
+        lines.append(
+            f"{histogram.name}: {histogram.count} in {format_latency(histogram.total)}, "
+            f"mean {format_latency(histogram.mean)}  {percentiles}  max {format_latency(histogram.max)}"
+        )
+    lines.extend(f"{name}: {value}" for name, value in counters().items())
+    return lines
+
+
+def log_summary() -> None:
+    """Logs the summary, when instrumentation is enabled."""
+    if ENABLED:
+        for line in summary():
+            logger.info("%s", line)
+
+
+class EventLoopMonitor(QObject):
+    """
+    Measures how much later than asked a timer fires on the thread this lives
+    on, which is how long events waited behind whatever the thread was busy
+    with.
+    """
+
+    def __init__(self, name: str, interval: int = LAG_INTERVAL, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._histogram = histogram(name)
+        self._interval_ns = interval * 1_000_000
+        self._last = 0
+        self._timer = QTimer(self)
+        # A coarse timer may fire up to 5% late by design, which is not lag
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self) -> None:
+        self._last = time.perf_counter_ns()
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def _tick(self) -> None:
+        now = time.perf_counter_ns()
+        self._histogram.record(now - self._last - self._interval_ns)
+        self._last = now
@@ -0,0 +1,146 @@
+"""
+Logging to a rotating file, written by a background thread.
+
+The root logger only puts records on a queue, and a QueueListener thread
+writes them to the file, so logging more never adds disk I/O to the
+sampling or GUI threads. POE_TESTER_LOG_LEVEL sets the level, WARNING by
+default. Every process writes a file of its own, as rotating a file another
+process holds open fails on Windows: POE_TESTER_LOG_FILE names it, and a
+supervisor sets it for the processes it starts.
+
+Notable moments of a run are logged as events through an EventLog, e.g.
+
+    port_passed port=3 voltage=52.104 power=6.511
+
+with the event name and its fields also kept on the record as its event and
+fields attributes. An event that keeps recurring, like a noisy voltage
+crossing its threshold, is only logged once per interval for each key, and
+the next record says how many were left out in between.
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+import typing
+
+from app import APP_NAME
+
+if typing.TYPE_CHECKING:
+    from logging.handlers import QueueListener
+
+DEFAULT_LOG_LEVEL = os.environ.get("POE_TESTER_LOG_LEVEL", "WARNING")
+DEFAULT_LOG_FILE = os.environ.get("POE_TESTER_LOG_FILE") or f"{APP_NAME}.log"
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(threadName)s] %(name)s: %(message)s"
+MAX_LOG_BYTES: int = 100_000_000
+LOG_BACKUPS: int = 2
+# Seconds between events of the same name and key
+EVENT_INTERVAL: float = 1.0
+
+_listener: "QueueListener | None" = None
+
+
+def start_logging(
+    path: str,
+    level: int | str = DEFAULT_LOG_LEVEL,
+    max_bytes: int = MAX_LOG_BYTES,
+    backup_count: int = LOG_BACKUPS,
+) -> None:
+    """
+    Sends the records of every logger to a rotating log file through a queue,
+    written by a background thread until stop_logging() or exit.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    # Only the entry point sets up logging, the window's imports go without these
+    import queue
+    from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+    if isinstance(level, str):
+        level = level.upper()
+    file_handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(records)
+    # Records are queued with their message and traceback merged, the file handler adds the rest
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    _listener = QueueListener(records, file_handler)
+    _listener.start()
+    logging.basicConfig(level=level, handlers=[queue_handler], force=True)
+    # Runs before logging's own shutdown, which would close the file first
+    atexit.register(stop_logging)
+
+
+def child_log_file(name: str) -> str:
+    """The log file for a process this one starts, e.g. "PoE Tester Slot 1.log"."""
+    stem, extension = os.path.splitext(DEFAULT_LOG_FILE)
+    return f"{stem} {name}{extension}"
+
+
+def stop_logging() -> None:
+    """Writes the records still queued and stops the writer thread."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    _listener = None
+
+
+def _format_field(value: object) -> str:
+    return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+
+class EventLog:
+    """
+    Structured, rate limited events logged to one logger. Safe to use from
+    several threads.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        interval: float = EVENT_INTERVAL,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._logger = logger
+        self._interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        # The time every name and key was last logged, and how often it was left out since
+        self._last: dict[tuple[str, object], float] = {}
+        self._suppressed: dict[tuple[str, object], int] = {}
+
+    def enabled(self, level: int = logging.INFO) -> bool:
+        """True if events of the level are logged, to skip working out their fields."""
+        return self._logger.isEnabledFor(level)
+
+    def event(self, name: str, level: int = logging.INFO, key: object = None, **fields: object) -> bool:
+        """
+        Logs an event unless one of the same name and key was logged less than
+        the interval ago.
+
+        Returns:
+            bool: True if it was logged.
+        """
+        if not self._logger.isEnabledFor(level):
+            return False
+
+        now = self._clock()
+        with self._lock:
+            last = self._last.get((name, key))
+            if last is not None and now - last < self._interval:
+                self._suppressed[(name, key)] = self._suppressed.get((name, key), 0) + 1
+                return False
+            self._last[(name, key)] = now
+            suppressed = self._suppressed.pop((name, key), 0)
+
+        if suppressed:
+            fields["suppressed"] = suppressed
+        text = " ".join(f"{field}={_format_field(value)}" for field, value in fields.items())
+        self._logger.log(level, "%s %s", name, text, extra={"event": name, "fields": fields})
+        return True
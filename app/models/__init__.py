@@ -0,0 +1,8 @@
+import os
+
+# Default pass thresholds, kept here so they can be read without loading the
+# models and NumPy
+DEFAULT_PASSING_VOLTAGE: float = 48
+DEFAULT_PASSING_POWER: float = 4.5
+# Samples kept per port in the history of a run, 0 keeps none
+DEFAULT_HISTORY_CAPACITY: int = int(os.environ.get("POE_TESTER_HISTORY_CAPACITY", "4096"))
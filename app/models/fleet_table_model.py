@@ -0,0 +1,133 @@
+import typing
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QPersistentModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor
+
+from app.fleet import FleetSupervisor, UnitState
+from app.telemetry import port_records
+
+# The telemetry field and unit shown in every port column
+_PORT_COLUMNS = (
+    ("voltage", "V", "Voltage"),
+    ("max_voltage", "V", "Max Voltage"),
+    ("current", "A", "Current"),
+    ("max_current", "A", "Max Current"),
+    ("power", "W", "Power"),
+    ("max_power", "W", "Max Power"),
+)
+_WORKER_COLUMNS = ("State", "Process", "Restarts", "CPU", "Memory", "Samples", "Passing")
+
+_PASSING_BRUSH = QBrush(QColor(Qt.GlobalColor.green))
+_FAILING_BRUSH = QBrush(QColor(Qt.GlobalColor.red))
+_STATE_BRUSHES = {
+    UnitState.PASSED: _PASSING_BRUSH,
+    UnitState.FAILED: _FAILING_BRUSH,
+    UnitState.CRASHED: _FAILING_BRUSH,
+    UnitState.RESTARTING: QBrush(QColor(Qt.GlobalColor.yellow)),
+}
+
+
+class FleetTableModel(QAbstractTableModel):
+    """
+    The ports of every unit of a fleet in one table, like PoeTableModel shows
+    the ports of one device. Rows are grouped by unit in the order of the
+    fleet file.
+    """
+
+    def __init__(self, supervisor: FleetSupervisor, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._supervisor = supervisor
+        self._ports = [port_records(None) for _ in supervisor.status]
+        # The first row of every unit, and of the unit after the last
+        self._offsets = np.zeros(len(self._ports) + 1, dtype=np.intp)
+        supervisor.unit_changed.connect(self._unit_changed)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, /, role: int = Qt.ItemDataRole.DisplayRole) -> typing.Any:
+        unit = int(np.searchsorted(self._offsets, index.row(), side="right")) - 1
+        port = self._ports[unit][index.row() - self._offsets[unit]]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            name, suffix, _ = _PORT_COLUMNS[index.column()]
+            return f"{port[name]:.2f}{suffix}"
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            return _PASSING_BRUSH if port["passing"] else _FAILING_BRUSH
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return int(self._offsets[-1])
+
+    def columnCount(self, /, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return len(_PORT_COLUMNS)
+
+    def headerData(self, section, orientation, /, role=...):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return _PORT_COLUMNS[section][2]
+
+        unit = int(np.searchsorted(self._offsets, section, side="right")) - 1
+        port = self._ports[unit][section - self._offsets[unit]]
+        return f"{self._supervisor.status[unit].unit.name} LAN {port['port']}"
+
+    def _unit_changed(self, unit: int) -> None:
+        ports = port_records(self._supervisor.status[unit].telemetry)
+        if len(ports) == len(self._ports[unit]):
+            self._ports[unit] = ports
+            if len(ports):
+                first, last = int(self._offsets[unit]), int(self._offsets[unit + 1]) - 1
+                self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+            return
+
+        # A unit's ports only become known once its worker runs
+        self.beginResetModel()
+        self._ports[unit] = ports
+        self._offsets[1:] = np.cumsum([len(unit_ports) for unit_ports in self._ports])
+        self.endResetModel()
+
+
+class FleetWorkerModel(QAbstractTableModel):
+    """One row per unit of a fleet, with the state and resource use of its worker."""
+
+    def __init__(self, supervisor: FleetSupervisor, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._supervisor = supervisor
+        supervisor.unit_changed.connect(self._unit_changed)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, /, role: int = Qt.ItemDataRole.DisplayRole) -> typing.Any:
+        status = self._supervisor.status[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return status.state.value
+            elif col == 1:
+                return str(status.pid) if status.pid else ""
+            elif col == 2:
+                return str(status.restarts)
+            elif col == 3:
+                return f"{status.cpu_percent:.1f}%"
+            elif col == 4:
+                return f"{status.resident_bytes / 2**20:.1f} MB"
+            elif col == 5:
+                return str(status.samples)
+            elif col == 6:
+                ports = port_records(status.telemetry)
+                return f"{np.count_nonzero(ports['passing'])}/{len(ports)}"
+        elif role == Qt.ItemDataRole.BackgroundRole and col == 0:
+            return _STATE_BRUSHES.get(status.state)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return len(self._supervisor.status)
+
+    def columnCount(self, /, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return len(_WORKER_COLUMNS)
+
+    def headerData(self, section, orientation, /, role=...):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return _WORKER_COLUMNS[section]
+        return self._supervisor.status[section].unit.name
+
+    def _unit_changed(self, unit: int) -> None:
+        self.dataChanged.emit(self.index(unit, 0), self.index(unit, self.columnCount() - 1))
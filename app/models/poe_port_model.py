@@ -1,7 +1,27 @@
+import math
+
 from PySide6.QtCore import QObject, Signal
 
+from .port_state_store import (
+    MAX_CURRENT_CHANGED,
+    MAX_POWER_CHANGED,
+    MAX_VOLTAGE_CHANGED,
+    CURRENT_CHANGED,
+    POWER_CHANGED,
+    VOLTAGE_CHANGED,
+    PortStateStore,
+)
+
 
 class PoePortModel(QObject):
+    """
+    The measurements of a single port.
+
+    Values live in a row of a PortStateStore. A port starts out with a store of
+    its own and is moved into the table's store when added to a PoeTableModel,
+    so per-port setters and vectorized batch updates see the same state.
+    """
+
     voltage_changed = Signal(int, float)
     max_voltage_changed = Signal(int, float)
     current_changed = Signal(int, float)
@@ -10,18 +30,12 @@ class PoePortModel(QObject):
     max_power_changed = Signal(int, float)
     value_changed = Signal(int)
 
-    _voltage = 0.0
-    _voltage_max = 0.0
-
-    _current = 0.0
-    _current_max = 0.0
-
-    _power = 0.0
-    _power_max = 0.0
-
     def __init__(self, id: int) -> None:
         super().__init__()
         self._id = id
+        self._store = PortStateStore(capacity=1)
+        self._row = self._store.add()
+
         self.voltage_changed.connect(self.value_changed)
         self.max_voltage_changed.connect(self.value_changed)
         self.current_changed.connect(self.value_changed)
@@ -33,65 +47,80 @@ class PoePortModel(QObject):
     def id(self) -> int:
         return self._id
 
+    @property
+    def store(self) -> PortStateStore:
+        return self._store
+
+    @property
+    def row(self) -> int:
+        return self._row
+
+    def attach(self, store: PortStateStore) -> int:
+        """Moves this port's state into a new row of another store and returns the row."""
+        row = store.add()
+        store.copy_row(row, self._store, self._row)
+        self._store = store
+        self._row = row
+        return row
+
+    @property
+    def timestamp(self) -> float:
+        """Monotonic time of the last sample applied to this port."""
+        return self._store.value("timestamp", self._row)
+
+    def add_sample(self, timestamp: float, voltage: float, power: float = math.nan) -> None:
+        """Applies a sample. A NaN power means power was not read and is left unchanged."""
+        self.emit_changes(self._store.update_row(self._row, timestamp, voltage, power))
+
+    def emit_changes(self, flags: int) -> None:
+        """Emits the change signals for the PortStateStore.update flags of this port's row."""
+        if flags & VOLTAGE_CHANGED:
+            self.voltage_changed.emit(self.id, self.voltage)
+        if flags & MAX_VOLTAGE_CHANGED:
+            self.max_voltage_changed.emit(self.id, self.max_voltage)
+        if flags & CURRENT_CHANGED:
+            self.current_changed.emit(self.id, self.current)
+        if flags & MAX_CURRENT_CHANGED:
+            self.max_current_changed.emit(self.id, self.max_current)
+        if flags & POWER_CHANGED:
+            self.power_changed.emit(self.id, self.power)
+        if flags & MAX_POWER_CHANGED:
+            self.max_power_changed.emit(self.id, self.max_power)
+
     @property
     def voltage(self) -> float:
-        return self._voltage
+        return self._store.value("voltage", self._row)
 
     @voltage.setter
     def voltage(self, value: float) -> None:
-        if self._voltage != value:
-            self._voltage = value
-            self._update_current()
-            self.voltage_changed.emit(self.id, value)
-        
-        if self._voltage_max < value:
-            self._voltage_max = value
-            self.max_voltage_changed.emit(self.id, value)
-        
+        self.emit_changes(self._store.set_voltage(self._row, value))
 
     @property
     def max_voltage(self) -> float:
-        return self._voltage_max
+        return self._store.value("voltage_max", self._row)
 
     @property
     def current(self) -> float:
-        return self._current
-
-    @current.setter
-    def current(self, value: float) -> None:
-        if self._current != value:
-            self._current = value
-            self.current_changed.emit(self.id, value)
-
-        if self._current_max < value:
-            self._current_max = value
-            self.max_current_changed.emit(self.id, value)
+        """Derived from power and voltage whenever either is set."""
+        return self._store.value("current", self._row)
 
     @property
     def max_current(self) -> float:
-        return self._current_max
+        return self._store.value("current_max", self._row)
 
     @property
     def power(self) -> float:
-        return self._power
+        return self._store.value("power", self._row)
 
     @power.setter
     def power(self, value: float) -> None:
-        if self._power != value:
-            self._power = value
-            self._update_current()
-            self.power_changed.emit(self.id, value)
-        
-        if self._power_max < value:
-            self._power_max = value
-            self.max_power_changed.emit(self.id, value)
+        self.emit_changes(self._store.set_power(self._row, value))
 
     @property
     def max_power(self) -> float:
-        return self._power_max
-    
-    def _update_current(self) -> None:
-        if self.voltage > 0:
-            self.current = self.power / self.voltage
-        else:
-            self.current = 0
+        return self._store.value("power_max", self._row)
+
+    @property
+    def passing(self) -> bool:
+        """Whether the maxima reach the thresholds of the store the port is in."""
+        return self._store.is_passing(self._row)
@@ -1,48 +1,112 @@
 import typing
-from PySide6.QtCore import QAbstractTableModel, QObject, Qt, QModelIndex, QPersistentModelIndex
-from PySide6.QtGui import QColor
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QObject, Qt, QModelIndex, QPersistentModelIndex, QTimer
+from PySide6.QtGui import QBrush, QColor
 
 from .poe_port_model import PoePortModel
+from .port_state_store import PortStateStore
+from .sample_history import SampleHistory
+from .trend_buffer import TrendBuffer
+
+if typing.TYPE_CHECKING:
+    from app.acquisition.snapshot import Snapshot
+
+# Bounds for how often (Hz) changed rows are reported to the views
+MIN_REFRESH_RATE: int = 20
+MAX_REFRESH_RATE: int = 60
+
+# The store column and unit shown in every table column
+_CELL_COLUMNS = (
+    ("voltage", "V"),
+    ("voltage_max", "V"),
+    ("current", "A"),
+    ("current_max", "A"),
+    ("power", "W"),
+    ("power_max", "W"),
+)
+# Cells show values to 2 decimals, so values are compared at that scale
+_CELL_SCALE = 100
+# How close a scaled value must be to a rounding tie to be keyed like it is formatted
+_CELL_TIE_TOLERANCE = 1e-6
+
+_PASSING_BRUSH = QBrush(QColor(Qt.GlobalColor.green))
+_FAILING_BRUSH = QBrush(QColor(Qt.GlobalColor.red))
 
-class PoeTableModel(QAbstractTableModel):
-    passing_voltage: float = 48
-    passing_power: float = 4.5
 
-    def __init__(self, /, parent: QObject | None = None):
+class PoeTableModel(QAbstractTableModel):
+    def __init__(self, /, parent: QObject | None = None, refresh_rate: int = 30, history_capacity: int = 0):
         super().__init__(parent)
-        self._data: dict[int, PoePortModel] = {}
+        # Ports in row order, plus the row of every port id
+        self._ports: list[PoePortModel] = []
+        self._rows: dict[int, int] = {}
+        # Measurements of every port, stored by row, and their extremes over the
+        # whole run. The recent samples behind them are only kept when a
+        # history_capacity is given.
+        self._store = PortStateStore()
+        self._history = SampleHistory(history_capacity) if history_capacity else None
+        self._trends = TrendBuffer()
+
+        # The text of every cell, None until it is painted, and the rounded
+        # values it was formatted from. A cell is only formatted again once its
+        # rounded value changes.
+        self._cell_text: list[list[str | None]] = []
+        self._cell_keys = np.zeros((16, len(_CELL_COLUMNS)), dtype=np.int64)
+
+        # Port changes are gathered and reported to the views once per frame
+        self._dirty_rows: set[int] = set()
+        self._flushed_flips = 0
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self.flushChanges)
+        self.setRefreshRate(refresh_rate)
+
+    @property
+    def ports(self) -> typing.Sequence[PoePortModel]:
+        """The ports in row order. This is the model's own list and must not be modified."""
+        return self._ports
 
     @property
-    def ports(self) -> list[PoePortModel]:
-        return list(self._data.values())
+    def passing_voltage(self) -> float:
+        return self._store.passing_voltage
+
+    @property
+    def passing_power(self) -> float:
+        return self._store.passing_power
+
+    @property
+    def store(self) -> PortStateStore:
+        return self._store
+
+    @property
+    def history(self) -> SampleHistory | None:
+        """Recent samples and running statistics of every port, by row, or None without a history_capacity."""
+        return self._history
+
+    @property
+    def trends(self) -> TrendBuffer:
+        """Voltage and power extremes of every port over the whole run, by row."""
+        return self._trends
 
     def data(self, index: QModelIndex | QPersistentModelIndex, /, role: int = Qt.ItemDataRole.DisplayRole) -> typing.Any:
 
         col = index.column()
         row = index.row()
-        port_model = self.ports[row]
 
         if role == Qt.ItemDataRole.DisplayRole:
-            if col == 0:
-                return f"{port_model.voltage:.2f}V"
-            elif col == 1:
-                return f"{port_model.max_voltage:.2f}V"
-            elif col == 2:
-                return f"{port_model.current:.2f}A"
-            elif col == 3:
-                return f"{port_model.max_current:.2f}A"
-            elif col == 4:
-                return f"{port_model.power:.2f}W"
-            elif col == 5:
-                return f"{port_model.max_power:.2f}W"  
+            if row in self._dirty_rows:
+                # Changed since the last frame, the cache is brought up to date by the flush
+                return self._format_cell(row, col)
+
+            text = self._cell_text[row][col]
+            if text is None:
+                text = self._cell_text[row][col] = self._format_cell(row, col)
+            return text
         elif role == Qt.ItemDataRole.BackgroundRole:
-            if self.is_port_passing(port_model.id):
-                return QColor(Qt.GlobalColor.green)
-            else:
-                return QColor(Qt.GlobalColor.red)
+            return _PASSING_BRUSH if self._store.is_passing(row) else _FAILING_BRUSH
     
     def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
-        return len(self._data)
+        return len(self._ports)
     
     def columnCount(self, /, parent: QModelIndex | QPersistentModelIndex = QModelIndex()):
         return 6
@@ -63,31 +127,174 @@ class PoeTableModel(QAbstractTableModel):
                 elif section == 5:
                     return "Max Power"
             elif orientation == Qt.Orientation.Vertical:
-                return f"LAN {self.ports[section].id}"
+                return f"LAN {self._ports[section].id}"
     
     def addPort(self, port: PoePortModel):
-        self.beginInsertRows(QModelIndex(), len(self._data), len(self._data))
-        self._data[port.id] = port
+        if port.id in self._rows:
+            raise ValueError(f"LAN {port.id} is already in the model")
+
+        row = len(self._ports)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ports.append(port)
+        self._rows[port.id] = row
+        port.attach(self._store)
+        if self._history is not None:
+            self._history.add()
+        self._trends.add()
+        self._add_cells(row)
         self.endInsertRows()
         port.value_changed.connect(self._on_port_changed)
 
     def getPort(self, port_id: int) -> PoePortModel:
-        return self._data[port_id]
+        return self._ports[self._rows[port_id]]
     
+    def refreshRate(self) -> int:
+        return 1000 // self._frame_timer.interval()
+
+    def setRefreshRate(self, rate: int) -> None:
+        """Sets how many times per second changed rows are reported, clamped to 20-60 Hz."""
+        rate = max(MIN_REFRESH_RATE, min(rate, MAX_REFRESH_RATE))
+        self._frame_timer.setInterval(1000 // rate)
+
+    def addSample(self, port_id: int, timestamp: float, voltage: float, power: float = np.nan) -> None:
+        """Applies one sample to a port and records it in the port's history and trend."""
+        row = self._rows[port_id]
+        self._ports[row].add_sample(timestamp, voltage, power)
+
+        store = self._store
+        voltage = store.value("voltage", row)
+        power = store.value("power", row)
+        if self._history is not None:
+            self._history.append_sample(row, timestamp, voltage, store.value("current", row), power)
+        self._trends.append_sample(row, timestamp, voltage, power)
+
+    def addSnapshot(self, snapshot: "Snapshot") -> None:
+        """Applies the samples of a sweep as one batch."""
+        rows = np.fromiter((self._rows[port] for port in snapshot.ports.tolist()), np.intp, len(snapshot))
+        self.updateRows(rows, snapshot.timestamps, snapshot.voltages, snapshot.powers)
+
+    def updateRows(
+        self,
+        rows: np.ndarray,
+        timestamps: np.ndarray | float,
+        voltages: np.ndarray,
+        powers: np.ndarray,
+    ) -> None:
+        """
+        Applies a batch of samples, one per row, with a single vectorized store,
+        history and trend update. A NaN power leaves that row's power unchanged. Change signals are
+        emitted only for the ports whose values changed.
+        """
+        store = self._store
+        flags = store.update(rows, timestamps, voltages, powers)
+        if self._history is not None:
+            self._history.append(rows, timestamps, store.voltage[rows], store.current[rows], store.power[rows])
+        self._trends.append(rows, timestamps, store.voltage[rows], store.power[rows])
+
+        for i in np.flatnonzero(flags):
+            self._ports[rows[i]].emit_changes(int(flags[i]))
+
     def is_port_passing(self, port_id: int) -> bool:
-        port_model = self.getPort(port_id)
-        return port_model.max_voltage >= self.passing_voltage and port_model.max_power >= self.passing_power
+        return self._store.is_passing(self._rows[port_id])
+
+    def allPassing(self) -> bool:
+        """True if there are ports and every one of them passes, without scanning them."""
+        return self._store.all_passing
+
+    def setThresholds(self, passing_voltage: float, passing_power: float) -> None:
+        """Changes the thresholds, re-evaluating every port in one batch and repainting the ones that flipped."""
+        flipped = self._store.set_thresholds(passing_voltage, passing_power)
+        if len(flipped):
+            self.dataChanged.emit(
+                self.index(int(flipped.min()), 0),
+                self.index(int(flipped.max()), self.columnCount() - 1),
+                [Qt.ItemDataRole.BackgroundRole],
+            )
+
+    def flushChanges(self) -> None:
+        """
+        Reports the rows changed since the last frame with one dataChanged
+        covering all of them. The text is only included when a shown value
+        changed, and the background when a port's pass state flipped since the
+        last frame.
+        """
+        self._frame_timer.stop()
+        if not self._dirty_rows:
+            return
+
+        rows = self._dirty_rows
+        self._dirty_rows = set()
+
+        roles = []
+        if self._invalidate_cells(np.fromiter(rows, np.intp, len(rows))):
+            roles.append(Qt.ItemDataRole.DisplayRole)
+        if self._store.passing_flips != self._flushed_flips:
+            self._flushed_flips = self._store.passing_flips
+            roles.append(Qt.ItemDataRole.BackgroundRole)
+        if not roles:
+            return
+
+        top_left = self.index(min(rows), 0)
+        bottom_right = self.index(max(rows), self.columnCount() - 1)
+        self.dataChanged.emit(top_left, bottom_right, roles)
 
     def _on_port_changed(self, port_id: int):
-        try:
-            row = next(i for i, id in enumerate(self._data) if id == port_id)
-        except StopIteration:
+        row = self._rows.get(port_id)
+        if row is None:
             print("Warning: Port not found when attempting to update the table view.")
             return
-        
-        # Create QModelIndex instances for the top-left and bottom-right of the row.
-        top_left = self.index(row, 0)
-        bottom_right = self.index(row, self.columnCount() - 1)
 
-        # Emit the dataChanged signal for the entire row
-        self.dataChanged.emit(top_left, bottom_right, [Qt.ItemDataRole.DisplayRole])
+        self._dirty_rows.add(row)
+        if not self._frame_timer.isActive():
+            self._frame_timer.start()
+
+    def _format_cell(self, row: int, col: int) -> str:
+        name, unit = _CELL_COLUMNS[col]
+        return f"{self._store.value(name, row):.2f}{unit}"
+
+    def _cell_values(self, rows: np.ndarray | slice) -> np.ndarray:
+        """
+        Keys of the text shown in the cells of the given rows, equal exactly
+        when the text is.
+
+        The text is the value rounded to 2 decimals, which rint() of the scaled
+        value gets wrong within rounding error of a tie, e.g. 54.765 is shown
+        as 54.77 but scales to 5476.499... Values that close are rounded like
+        the text instead. The sign bit tells -0.00 from 0.00.
+        """
+        store = self._store
+        values = np.column_stack([store.column(name)[rows] for name, _ in _CELL_COLUMNS])
+        scaled = values * _CELL_SCALE
+        keys = np.rint(scaled)
+        ties = np.abs(np.abs(scaled - keys) - 0.5) < _CELL_TIE_TOLERANCE
+        if ties.any():
+            for row, col in zip(*np.nonzero(ties)):
+                keys[row, col] = round(round(float(values[row, col]), 2) * _CELL_SCALE)
+        return keys.astype(np.int64) * 2 + np.signbit(values)
+
+    def _add_cells(self, row: int) -> None:
+        if row == len(self._cell_keys):
+            keys = np.zeros((len(self._cell_keys) * 2, len(_CELL_COLUMNS)), dtype=np.int64)
+            keys[:row] = self._cell_keys
+            self._cell_keys = keys
+
+        self._cell_keys[row] = self._cell_values(slice(row, row + 1))[0]
+        self._cell_text.append([None] * len(_CELL_COLUMNS))
+
+    def _invalidate_cells(self, rows: np.ndarray) -> bool:
+        """
+        Drops the cached text of the cells in rows whose rounded value changed.
+
+        Returns:
+            bool: True if any cell changed.
+        """
+        keys = self._cell_values(rows)
+        changed = keys != self._cell_keys[rows]
+        if not changed.any():
+            return False
+
+        self._cell_keys[rows] = keys
+        changed_rows, changed_cols = np.nonzero(changed)
+        for row, col in zip(rows[changed_rows].tolist(), changed_cols.tolist()):
+            self._cell_text[row][col] = None
+        return True
@@ -0,0 +1,308 @@
+import math
+
+import numpy as np
+
+from . import DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+
+# Flags returned by PortStateStore.update for the fields that changed in a row
+VOLTAGE_CHANGED = 0x01
+MAX_VOLTAGE_CHANGED = 0x02
+CURRENT_CHANGED = 0x04
+MAX_CURRENT_CHANGED = 0x08
+POWER_CHANGED = 0x10
+MAX_POWER_CHANGED = 0x20
+PASSING_CHANGED = 0x40
+
+
+class PortStateStore:
+    """
+    Measurement state of many ports held as NumPy columns, one row per port.
+
+    Columns are exposed as views of the rows in use. Adding rows may
+    reallocate the columns, so views should not be kept across calls to add().
+    Single values are read with value() and written with update_row(),
+    set_voltage() and set_power(), the per-row counterparts of update().
+
+    The pass state of every row is kept up to date against the store's
+    thresholds: a row is only re-evaluated when its maximum voltage or power
+    rises, and a count of passing rows makes all_passing O(1).
+    """
+
+    _FLOAT_COLUMNS = (
+        "_timestamp",
+        "_voltage",
+        "_voltage_max",
+        "_current",
+        "_current_max",
+        "_power",
+        "_power_max",
+    )
+
+    def __init__(self, capacity: int = 16) -> None:
+        self._size = 0
+        self._capacity = max(capacity, 1)
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, np.zeros(self._capacity, dtype=np.float64))
+        self._passing = np.zeros(self._capacity, dtype=np.bool_)
+        # The full float columns by their public name, e.g. "voltage_max"
+        self._columns = {name[1:]: getattr(self, name) for name in self._FLOAT_COLUMNS}
+        self._passing_count = 0
+        self._passing_flips = 0
+        self._passing_voltage = DEFAULT_PASSING_VOLTAGE
+        self._passing_power = DEFAULT_PASSING_POWER
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the columns."""
+        return sum(getattr(self, name).nbytes for name in self._FLOAT_COLUMNS) + self._passing.nbytes
+
+    @property
+    def timestamp(self) -> np.ndarray:
+        return self._timestamp[: self._size]
+
+    @property
+    def voltage(self) -> np.ndarray:
+        return self._voltage[: self._size]
+
+    @property
+    def voltage_max(self) -> np.ndarray:
+        return self._voltage_max[: self._size]
+
+    @property
+    def current(self) -> np.ndarray:
+        return self._current[: self._size]
+
+    @property
+    def current_max(self) -> np.ndarray:
+        return self._current_max[: self._size]
+
+    @property
+    def power(self) -> np.ndarray:
+        return self._power[: self._size]
+
+    @property
+    def power_max(self) -> np.ndarray:
+        return self._power_max[: self._size]
+
+    @property
+    def passing(self) -> np.ndarray:
+        """Pass state of every row."""
+        return self._passing[: self._size]
+
+    @property
+    def passing_count(self) -> int:
+        return self._passing_count
+
+    @property
+    def all_passing(self) -> bool:
+        """True if there are rows and every one of them passes."""
+        return self._size > 0 and self._passing_count == self._size
+
+    @property
+    def passing_flips(self) -> int:
+        """How many times a row's pass state flipped, to tell whether any did since it was last read."""
+        return self._passing_flips
+
+    def column(self, name: str) -> np.ndarray:
+        """The rows in use of a float column by its name, e.g. "voltage_max"."""
+        return self._columns[name][: self._size]
+
+    def value(self, name: str, row: int) -> float:
+        """One value of a float column, without building a view."""
+        return float(self._columns[name][row])
+
+    def is_passing(self, row: int) -> bool:
+        return bool(self._passing[row])
+
+    @property
+    def passing_voltage(self) -> float:
+        return self._passing_voltage
+
+    @property
+    def passing_power(self) -> float:
+        return self._passing_power
+
+    def set_thresholds(self, passing_voltage: float, passing_power: float) -> np.ndarray:
+        """
+        Changes the thresholds and re-evaluates every row against them in one step.
+
+        Returns:
+            np.ndarray: The rows whose pass state flipped.
+        """
+        self._passing_voltage = passing_voltage
+        self._passing_power = passing_power
+        return self.evaluate(None)
+
+    def add(self) -> int:
+        """Adds a zeroed row and returns its index."""
+        if self._size == self._capacity:
+            self._grow(self._capacity * 2)
+
+        row = self._size
+        self._size += 1
+        self.evaluate_row(row)
+        return row
+
+    def copy_row(self, row: int, source: "PortStateStore", source_row: int) -> None:
+        for name in self._FLOAT_COLUMNS:
+            getattr(self, name)[row] = getattr(source, name)[source_row]
+        # The source may have had other thresholds
+        self.evaluate_row(row)
+
+    def update(
+        self,
+        rows: np.ndarray,
+        timestamps: np.ndarray | float,
+        voltages: np.ndarray,
+        powers: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Applies a batch of samples in one vectorized step.
+
+        Rows must be unique within a batch. A NaN power means power was not read
+        for that row and the stored power is kept. Current is derived from power
+        and voltage, all maxima are updated, and the rows whose maximum voltage
+        or power rose are re-evaluated.
+
+        Returns:
+            np.ndarray: The *_CHANGED flags of every row in the batch.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        voltages = np.asarray(voltages, dtype=np.float64)
+        powers = np.asarray(powers, dtype=np.float64)
+
+        old_voltage = self._voltage[rows]
+        old_current = self._current[rows]
+        old_power = self._power[rows]
+
+        powers = np.where(np.isnan(powers), old_power, powers)
+        currents = np.divide(powers, voltages, out=np.zeros_like(voltages), where=voltages > 0)
+
+        self._timestamp[rows] = timestamps
+        self._voltage[rows] = voltages
+        self._current[rows] = currents
+        self._power[rows] = powers
+
+        flags = np.zeros(len(rows), dtype=np.uint8)
+        flags |= np.where(voltages != old_voltage, VOLTAGE_CHANGED, 0).astype(np.uint8)
+        flags |= np.where(currents != old_current, CURRENT_CHANGED, 0).astype(np.uint8)
+        flags |= np.where(powers != old_power, POWER_CHANGED, 0).astype(np.uint8)
+        flags |= self._update_max(self._voltage_max, rows, voltages, MAX_VOLTAGE_CHANGED)
+        flags |= self._update_max(self._current_max, rows, currents, MAX_CURRENT_CHANGED)
+        flags |= self._update_max(self._power_max, rows, powers, MAX_POWER_CHANGED)
+
+        raised = np.flatnonzero(flags & (MAX_VOLTAGE_CHANGED | MAX_POWER_CHANGED))
+        if len(raised):
+            flags[raised[self._evaluate(rows[raised])]] |= PASSING_CHANGED
+        return flags
+
+    def update_row(self, row: int, timestamp: float, voltage: float, power: float = math.nan) -> int:
+        """
+        Applies one sample to a row like update() applies a batch, without the
+        overhead of one.
+
+        Returns:
+            int: The *_CHANGED flags of the row.
+        """
+        self._timestamp[row] = timestamp
+        return self._set_row(row, voltage, power)
+
+    def set_voltage(self, row: int, voltage: float) -> int:
+        """Sets the voltage of a row, returns the *_CHANGED flags of the row."""
+        return self._set_row(row, voltage, math.nan)
+
+    def set_power(self, row: int, power: float) -> int:
+        """Sets the power of a row, returns the *_CHANGED flags of the row."""
+        return self._set_row(row, math.nan, power)
+
+    def evaluate(self, rows: np.ndarray | None) -> np.ndarray:
+        """
+        Re-evaluates the pass state of the given rows, or of every row when rows
+        is None.
+
+        Returns:
+            np.ndarray: The rows whose pass state flipped.
+        """
+        if rows is None:
+            rows = np.arange(self._size)
+        rows = np.asarray(rows, dtype=np.intp)
+        return rows[self._evaluate(rows)]
+
+    def evaluate_row(self, row: int) -> bool:
+        """
+        Re-evaluates the pass state of one row, without the overhead of a batch.
+
+        Returns:
+            bool: True if the row's pass state flipped.
+        """
+        passing = bool(
+            self._voltage_max[row] >= self._passing_voltage and self._power_max[row] >= self._passing_power
+        )
+        if passing == self._passing[row]:
+            return False
+
+        self._passing[row] = passing
+        self._passing_count += 1 if passing else -1
+        self._passing_flips += 1
+        return True
+
+    def _evaluate(self, rows: np.ndarray) -> np.ndarray:
+        # Returns a mask of the rows whose pass state flipped
+        passing = (self._voltage_max[rows] >= self._passing_voltage) & (self._power_max[rows] >= self._passing_power)
+        flipped = passing != self._passing[rows]
+        count = int(np.count_nonzero(flipped))
+        if count:
+            self._passing[rows[flipped]] = passing[flipped]
+            # Every flip to passing adds one, every flip to failing takes one
+            self._passing_count += 2 * int(np.count_nonzero(passing[flipped])) - count
+            self._passing_flips += count
+        return flipped
+
+    def _set_row(self, row: int, voltage: float, power: float) -> int:
+        # A NaN voltage or power is left unchanged, current is derived from the
+        # two once both are set
+        flags = 0
+        if not math.isnan(voltage) and self._voltage[row] != voltage:
+            self._voltage[row] = voltage
+            flags |= VOLTAGE_CHANGED
+        if not math.isnan(power) and self._power[row] != power:
+            self._power[row] = power
+            flags |= POWER_CHANGED
+        if not flags:
+            return 0
+
+        voltage = self._voltage[row]
+        current = float(self._power[row] / voltage) if voltage > 0 else 0.0
+        if self._current[row] != current:
+            self._current[row] = current
+            flags |= CURRENT_CHANGED
+
+        if self._voltage_max[row] < voltage:
+            self._voltage_max[row] = voltage
+            flags |= MAX_VOLTAGE_CHANGED
+        if self._current_max[row] < current:
+            self._current_max[row] = current
+            flags |= MAX_CURRENT_CHANGED
+        if self._power_max[row] < self._power[row]:
+            self._power_max[row] = self._power[row]
+            flags |= MAX_POWER_CHANGED
+        if flags & (MAX_VOLTAGE_CHANGED | MAX_POWER_CHANGED) and self.evaluate_row(row):
+            flags |= PASSING_CHANGED
+        return flags
+
+    def _update_max(self, column: np.ndarray, rows: np.ndarray, values: np.ndarray, flag: int) -> np.ndarray:
+        raised = values > column[rows]
+        column[rows[raised]] = values[raised]
+        return np.where(raised, flag, 0).astype(np.uint8)
+
+    def _grow(self, capacity: int) -> None:
+        for name in self._FLOAT_COLUMNS + ("_passing",):
+            column = getattr(self, name)
+            grown = np.zeros(capacity, dtype=column.dtype)
+            grown[: self._size] = column[: self._size]
+            setattr(self, name, grown)
+        self._columns = {name[1:]: getattr(self, name) for name in self._FLOAT_COLUMNS}
+        self._capacity = capacity
@@ -0,0 +1,263 @@
+import typing
+from dataclasses import dataclass
+
+import numpy as np
+
+FIELDS = ("voltage", "current", "power")
+
+# Rows of the running statistics of a port, one column per field
+_MEAN, _M2, _MIN, _MAX = range(4)
+
+
+class HistoryWindow(typing.NamedTuple):
+    """Samples of one port in chronological order."""
+
+    timestamp: np.ndarray
+    voltage: np.ndarray
+    current: np.ndarray
+    power: np.ndarray
+
+
+class Downsampled(typing.NamedTuple):
+    """Per-bucket aggregates of one field, with NaN for empty buckets."""
+
+    start: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    mean: np.ndarray
+
+
+@dataclass(frozen=True)
+class RunningStats:
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    variance: float
+
+
+class SampleHistory:
+    """
+    Fixed-capacity, preallocated ring buffers of timestamped samples, one per
+    port row.
+
+    Only the most recent capacity samples of every port are kept, so memory
+    stays bounded however long a run lasts. Running minimum, maximum, mean and
+    variance cover every sample ever appended and are updated in O(1) per
+    sample (Welford's method).
+
+    A sample is stored as its timestamp followed by its fields, and the
+    statistics of a port in one block, so appending a sweep writes each with a
+    single scatter.
+    """
+
+    def __init__(self, capacity: int = 16384, rows: int = 16) -> None:
+        self._capacity = capacity
+        self._rows = 0
+        self._allocated = 0
+
+        # Timestamp and fields of every kept sample, by row and slot
+        self._samples = np.zeros((0, capacity, 1 + len(FIELDS)), dtype=np.float64)
+        # Samples ever appended per row, which also tells the next slot and
+        # how many are kept
+        self._count = np.zeros(0, dtype=np.int64)
+        # Running statistics per row, the _MEAN to _MAX rows of every field
+        self._stats = np.zeros((0, 4, len(FIELDS)), dtype=np.float64)
+
+        self._grow(rows)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        return self._samples.nbytes
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add(self) -> int:
+        """Adds an empty row and returns its index."""
+        if self._rows == self._allocated:
+            self._grow(max(self._allocated * 2, 1))
+
+        row = self._rows
+        self._rows += 1
+        return row
+
+    def append(
+        self,
+        rows: np.ndarray,
+        timestamps: np.ndarray | float,
+        voltages: np.ndarray,
+        currents: np.ndarray,
+        powers: np.ndarray,
+    ) -> None:
+        """Appends one sample to each of the given rows, which must be unique."""
+        rows = np.asarray(rows, dtype=np.intp)
+        samples = np.empty((len(rows), 1 + len(FIELDS)), dtype=np.float64)
+        samples[:, 0] = timestamps
+        samples[:, 1] = voltages
+        samples[:, 2] = currents
+        samples[:, 3] = powers
+        values = samples[:, 1:]
+
+        count = self._count[rows]
+        self._samples[rows, count % self._capacity] = samples
+        count += 1
+        self._count[rows] = count
+
+        stats = self._stats[rows]
+        mean = stats[:, _MEAN]
+        delta = values - mean
+        mean += delta / count[:, np.newaxis]
+        stats[:, _M2] += delta * (values - mean)
+        if count.min() == 1:
+            first = count == 1
+            stats[first, _MIN] = values[first]
+            stats[first, _MAX] = values[first]
+        np.minimum(stats[:, _MIN], values, out=stats[:, _MIN])
+        np.maximum(stats[:, _MAX], values, out=stats[:, _MAX])
+        self._stats[rows] = stats
+
+    def append_sample(self, row: int, timestamp: float, voltage: float, current: float, power: float) -> None:
+        """Appends one sample to one row, cheaper than append() for a single sample."""
+        count = int(self._count[row])
+        sample = self._samples[row, count % self._capacity]
+        sample[0] = timestamp
+        count += 1
+        self._count[row] = count
+        stats = self._stats[row]
+        for i, value in enumerate((voltage, current, power)):
+            sample[1 + i] = value
+
+            mean = float(stats[_MEAN, i])
+            delta = value - mean
+            mean += delta / count
+            stats[_M2, i] += delta * (value - mean)
+            stats[_MEAN, i] = mean
+
+            if count == 1 or value < stats[_MIN, i]:
+                stats[_MIN, i] = value
+            if count == 1 or value > stats[_MAX, i]:
+                stats[_MAX, i] = value
+
+    def clear(self, row: int) -> None:
+        self._count[row] = 0
+        self._stats[row] = 0
+
+    def length(self, row: int) -> int:
+        """Number of samples currently kept for a row."""
+        return min(int(self._count[row]), self._capacity)
+
+    def stats(self, row: int) -> dict[str, RunningStats]:
+        """Running statistics of every field of a row, over all samples appended."""
+        count = int(self._count[row])
+        stats = self._stats[row]
+        return {
+            field: RunningStats(
+                count=count,
+                minimum=float(stats[_MIN, i]),
+                maximum=float(stats[_MAX, i]),
+                mean=float(stats[_MEAN, i]),
+                variance=float(stats[_M2, i] / (count - 1)) if count > 1 else 0.0,
+            )
+            for i, field in enumerate(FIELDS)
+        }
+
+    def window(self, row: int, start: float | None = None, end: float | None = None) -> HistoryWindow:
+        """
+        Returns the kept samples of a row with start <= timestamp <= end, in
+        chronological order. The arrays are copies.
+        """
+        appended = int(self._count[row])
+        length = min(appended, self._capacity)
+        first = (appended - length) % self._capacity
+        timestamps = self._samples[row, :, 0]
+
+        # Samples are in time order from the oldest slot on, wrapping around once
+        lo, hi = 0, length
+        if start is not None:
+            lo = self._search(timestamps, first, length, start, "left")
+        if end is not None:
+            hi = self._search(timestamps, first, length, end, "right")
+        return self._slice(row, first, lo, max(hi, lo))
+
+    def latest(self, row: int, count: int) -> HistoryWindow:
+        """Returns the most recent count samples of a row, oldest first."""
+        appended = int(self._count[row])
+        length = min(appended, self._capacity)
+        first = (appended - length) % self._capacity
+        return self._slice(row, first, max(length - max(count, 0), 0), length)
+
+    def downsample(
+        self,
+        row: int,
+        field: str,
+        buckets: int,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> Downsampled:
+        """Aggregates a field of a row into evenly spaced time buckets."""
+        window = self.window(row, start, end)
+        values = getattr(window, field)
+        timestamps = window.timestamp
+
+        if not len(timestamps) or buckets <= 0:
+            empty = np.zeros(0, dtype=np.float64)
+            return Downsampled(empty, empty, empty, empty)
+
+        first = timestamps[0] if start is None else start
+        last = timestamps[-1] if end is None else end
+        edges = np.linspace(first, last, buckets + 1)
+        bounds = np.searchsorted(timestamps, edges[:-1], side="left")
+        counts = np.diff(np.append(bounds, len(timestamps)))
+        filled = counts > 0
+
+        minimum = np.full(buckets, np.nan)
+        maximum = np.full(buckets, np.nan)
+        mean = np.full(buckets, np.nan)
+        starts = bounds[filled]
+        minimum[filled] = np.minimum.reduceat(values, starts)
+        maximum[filled] = np.maximum.reduceat(values, starts)
+        mean[filled] = np.add.reduceat(values, starts) / counts[filled]
+        return Downsampled(edges[:-1], minimum, maximum, mean)
+
+    def crossings(self, row: int, field: str, threshold: float) -> np.ndarray:
+        """Timestamps of the kept samples where a field rose to or above threshold."""
+        window = self.window(row)
+        above = getattr(window, field) >= threshold
+        rising = above & ~np.concatenate(([False], above[:-1]))
+        return window.timestamp[rising]
+
+    def _search(self, timestamps: np.ndarray, first: int, length: int, value: float, side: str) -> int:
+        """Binary search of a row's ring for value, returning a position counted from the oldest sample."""
+        older = timestamps[first : min(first + length, self._capacity)]
+        position = int(np.searchsorted(older, value, side=side))
+        if position < len(older):
+            return position
+        newer = timestamps[: length - len(older)]
+        return len(older) + int(np.searchsorted(newer, value, side=side))
+
+    def _slice(self, row: int, first: int, lo: int, hi: int) -> HistoryWindow:
+        """Copies positions lo to hi, counted from the oldest sample, of a row."""
+        start = (first + lo) % self._capacity
+        count = hi - lo
+        if start + count <= self._capacity:
+            samples = self._samples[row, start : start + count]
+        else:
+            split = self._capacity - start
+            samples = np.concatenate((self._samples[row, start:], self._samples[row, : count - split]))
+        # Each column is copied out contiguous
+        return HistoryWindow(*np.ascontiguousarray(samples.T))
+
+    def _grow(self, rows: int) -> None:
+        extra = rows - self._allocated
+        if extra <= 0:
+            return
+
+        self._samples = np.concatenate((self._samples, np.zeros((extra, self._capacity, 1 + len(FIELDS)))))
+        self._count = np.concatenate((self._count, np.zeros(extra, dtype=np.int64)))
+        self._stats = np.concatenate((self._stats, np.zeros((extra, 4, len(FIELDS)))))
+        self._allocated = rows
@@ -0,0 +1,170 @@
+import typing
+
+import numpy as np
+
+TREND_FIELDS = ("voltage", "power")
+# Buckets kept per port, at least as many as a chart is pixels wide
+DEFAULT_BUCKETS: int = 2048
+# Seconds a bucket covers until the first compaction
+DEFAULT_BUCKET_WIDTH: float = 0.1
+
+
+class Trend(typing.NamedTuple):
+    """Minimum and maximum of a field per column, NaN where no sample fell."""
+
+    start: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+
+
+class TrendBuffer:
+    """
+    Minimum and maximum voltage and power of every port over the whole run, in
+    a fixed number of time buckets per port row.
+
+    Buckets start bucket_width seconds wide from a row's first sample. Once a
+    sample falls past the last bucket, neighbouring buckets are merged in pairs
+    and the width doubles, so a run of any length fits into the same
+    preallocated arrays and reading a trend never touches more than buckets
+    values per row. Unlike SampleHistory, which keeps the latest samples
+    exactly, this keeps the extremes of all of them.
+    """
+
+    def __init__(self, buckets: int = DEFAULT_BUCKETS, bucket_width: float = DEFAULT_BUCKET_WIDTH, rows: int = 16) -> None:
+        if buckets < 2 or buckets % 2:
+            raise ValueError("The number of buckets must be even")
+
+        self._buckets = buckets
+        self._bucket_width = bucket_width
+        self._rows = 0
+        self._allocated = 0
+
+        self._min = np.zeros((len(TREND_FIELDS), 0, buckets), dtype=np.float64)
+        self._max = np.zeros((len(TREND_FIELDS), 0, buckets), dtype=np.float64)
+        # Time of the first bucket, width of every bucket and buckets up to the latest sample, per row
+        self._start = np.zeros(0, dtype=np.float64)
+        self._width = np.zeros(0, dtype=np.float64)
+        self._used = np.zeros(0, dtype=np.intp)
+
+        self._grow(rows)
+
+    @property
+    def buckets(self) -> int:
+        return self._buckets
+
+    @property
+    def nbytes(self) -> int:
+        return self._min.nbytes + self._max.nbytes
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add(self) -> int:
+        """Adds an empty row and returns its index."""
+        if self._rows == self._allocated:
+            self._grow(max(self._allocated * 2, 1))
+
+        row = self._rows
+        self._rows += 1
+        return row
+
+    def append(self, rows: np.ndarray, timestamps: np.ndarray | float, voltages: np.ndarray, powers: np.ndarray) -> None:
+        """Adds one sample to each of the given rows, which must be unique."""
+        rows = np.asarray(rows, dtype=np.intp)
+        timestamps = np.broadcast_to(np.asarray(timestamps, dtype=np.float64), rows.shape)
+        values = np.array([voltages, powers], dtype=np.float64).reshape(len(TREND_FIELDS), len(rows))
+
+        first = self._used[rows] == 0
+        if first.any():
+            self._start[rows[first]] = timestamps[first]
+
+        # Samples of one sweep are merged in time order, none are older than a row's first
+        index = np.maximum((timestamps - self._start[rows]) // self._width[rows], 0).astype(np.intp)
+        for i in np.flatnonzero(index >= self._buckets):
+            index[i] = self._compact(int(rows[i]), int(index[i]))
+
+        self._min[:, rows, index] = np.fmin(self._min[:, rows, index], values)
+        self._max[:, rows, index] = np.fmax(self._max[:, rows, index], values)
+        self._used[rows] = np.maximum(self._used[rows], index + 1)
+
+    def append_sample(self, row: int, timestamp: float, voltage: float, power: float) -> None:
+        """Adds one sample to one row, cheaper than append() for a single sample."""
+        if self._used[row] == 0:
+            self._start[row] = timestamp
+
+        index = max(int((timestamp - self._start[row]) // self._width[row]), 0)
+        if index >= self._buckets:
+            index = self._compact(row, index)
+
+        for i, value in enumerate((voltage, power)):
+            # Like fmin and fmax, a NaN sample leaves the bucket as it is and a NaN bucket takes the sample
+            if value != value:
+                continue
+            minimum = self._min[i, row, index]
+            if not minimum <= value:
+                self._min[i, row, index] = value
+            maximum = self._max[i, row, index]
+            if not maximum >= value:
+                self._max[i, row, index] = value
+        if index >= self._used[row]:
+            self._used[row] = index + 1
+
+    def clear(self, row: int) -> None:
+        self._min[:, row] = np.nan
+        self._max[:, row] = np.nan
+        self._width[row] = self._bucket_width
+        self._used[row] = 0
+
+    def span(self, row: int) -> tuple[float, float]:
+        """The time of a row's first sample and the end of its latest bucket."""
+        start = float(self._start[row])
+        return start, start + int(self._used[row]) * float(self._width[row])
+
+    def trend(self, row: int, field: str, columns: int) -> Trend:
+        """
+        The minimum and maximum of a field of a row from its first sample on,
+        merged into at most the given number of columns of equal time.
+        """
+        used = int(self._used[row])
+        if not used or columns <= 0:
+            empty = np.zeros(0, dtype=np.float64)
+            return Trend(empty, empty, empty)
+
+        field_index = TREND_FIELDS.index(field)
+        minimum = self._min[field_index, row, :used]
+        maximum = self._max[field_index, row, :used]
+        bounds = np.arange(used)
+        if used > columns:
+            bounds = np.arange(columns) * used // columns
+            # fmin and fmax skip the empty buckets within a column
+            minimum = np.fmin.reduceat(minimum, bounds)
+            maximum = np.fmax.reduceat(maximum, bounds)
+        else:
+            minimum, maximum = minimum.copy(), maximum.copy()
+        return Trend(self._start[row] + bounds * self._width[row], minimum, maximum)
+
+    def _compact(self, row: int, index: int) -> int:
+        """Merges a row's buckets in pairs until index fits, returning where it moved to."""
+        half = self._buckets // 2
+        while index >= self._buckets:
+            for extremes, merge in ((self._min, np.fmin), (self._max, np.fmax)):
+                buckets = extremes[:, row]
+                buckets[:, :half] = merge(buckets[:, 0::2], buckets[:, 1::2])
+                buckets[:, half:] = np.nan
+            self._width[row] *= 2
+            self._used[row] = (self._used[row] + 1) // 2
+            index //= 2
+        return index
+
+    def _grow(self, rows: int) -> None:
+        extra = rows - self._allocated
+        if extra <= 0:
+            return
+
+        empty = np.full((len(TREND_FIELDS), extra, self._buckets), np.nan)
+        self._min = np.concatenate((self._min, empty), axis=1)
+        self._max = np.concatenate((self._max, empty), axis=1)
+        self._start = np.concatenate((self._start, np.zeros(extra)))
+        self._width = np.concatenate((self._width, np.full(extra, self._bucket_width)))
+        self._used = np.concatenate((self._used, np.zeros(extra, dtype=np.intp)))
+        self._allocated = rows
@@ -0,0 +1,53 @@
+import typing
+
+from app.bitinterface import BitInterface, ErrorSeverity
+
+
+class PortResult(typing.NamedTuple):
+    """The outcome of one port at the end of a run."""
+
+    port: int
+    max_voltage: float
+    max_current: float
+    max_power: float
+    passing: bool
+
+
+def send_thresholds(bit_interface: BitInterface, passing_voltage: float, passing_power: float) -> None:
+    bit_interface.set_error(
+        ErrorSeverity.ERRORNONE,
+        f"Using the following thresholds: {passing_voltage:.2f}V, {passing_power:.2f}W",
+    )
+
+
+def send_results(bit_interface: BitInterface, results: typing.Iterable[PortResult]) -> list[int]:
+    """
+    Reports the measurements of every port to BurnInTest, then a critical error
+    for the ports below threshold, and completes the pre-test. Waits for
+    BurnInTest to take all of the messages.
+
+    Returns:
+        list[int]: The ids of the failed ports.
+    """
+    failed_ports = []
+    for result in results:
+        bit_interface.set_error(
+            ErrorSeverity.ERRORNONE,
+            f"LAN {result.port}: Voltage: {result.max_voltage:.2f}V, Current: {result.max_current:.2f}A, Power: {result.max_power:.2f}W",
+        )
+
+        if not result.passing:
+            failed_ports.append(result.port)
+
+    if failed_ports:
+        bit_interface.set_error(
+            ErrorSeverity.ERRORCRITICAL,
+            f"LAN(s) {", ".join(map(str, failed_ports))} below threshold",
+        )
+
+    # Messages are queued, wait once for BurnInTest to take all of them. A
+    # timeout is logged by the interface.
+    bit_interface.set_pretest_complete()
+    bit_interface.flush()
+
+    return failed_ports
@@ -0,0 +1,149 @@
+"""
+Startup timing.
+
+Set POE_TESTER_STARTUP_PROFILE to have the time of every startup phase logged
+and printed against its budget. Run this module to see which packages the
+main window spends its import time on:
+
+    python -m app.startup [--budget MS] [--top N]
+"""
+
+import argparse
+import collections
+import logging
+import os
+import subprocess
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+PROFILE_STARTUP = bool(os.environ.get("POE_TESTER_STARTUP_PROFILE"))
+
+# Milliseconds each phase may take, counted from the end of the previous one
+PHASE_BUDGETS: dict[str, float] = {
+    "imports": 250,
+    "application": 100,
+    "window": 150,
+    "shown": 150,
+}
+# Milliseconds importing the main window may take, checked by the import report
+IMPORT_BUDGET: float = 300
+
+MAIN_MODULE = "app.widgets.mainwindow"
+
+# Phases are counted from when this module is first imported, at the start of run()
+_start = time.perf_counter()
+_marks: list[tuple[str, float]] = []
+
+
+def mark(phase: str) -> None:
+    """Records the end of a startup phase."""
+    if PROFILE_STARTUP:
+        _marks.append((phase, time.perf_counter()))
+
+
+def finish() -> None:
+    """Marks the window as shown and reports, call once the event loop runs."""
+    mark("shown")
+    report()
+
+
+def phases() -> list[tuple[str, float, float | None]]:
+    """
+    Returns:
+        list[tuple[str, float, float | None]]: The name, milliseconds and budget
+        of every phase marked so far.
+    """
+    result = []
+    previous = _start
+    for phase, timestamp in _marks:
+        result.append((phase, (timestamp - previous) * 1000, PHASE_BUDGETS.get(phase)))
+        previous = timestamp
+    return result
+
+
+def report() -> bool:
+    """
+    Logs the time of every phase marked so far, and prints it when there is a
+    console.
+
+    Returns:
+        bool: True if every phase was within its budget.
+    """
+    if not PROFILE_STARTUP:
+        return True
+
+    within_budget = True
+    lines = []
+    total = 0.0
+    for phase, elapsed, budget in phases():
+        total += elapsed
+        over = budget is not None and elapsed > budget
+        within_budget = within_budget and not over
+        lines.append(f"{phase:<12} {elapsed:8.1f} ms" + (f"  (budget {budget:.0f} ms{', OVER' if over else ''})" if budget else ""))
+        if over:
+            logger.warning("Startup phase %s took %.1f ms, budget %.0f ms", phase, elapsed, budget)
+    lines.append(f"{'total':<12} {total:8.1f} ms")
+    logger.info("Startup took %.1f ms", total)
+
+    # GUI builds on Windows have no console
+    if sys.stderr:
+        print("\n".join(lines), file=sys.stderr)
+    return within_budget
+
+
+def import_times(module: str = MAIN_MODULE) -> tuple[float, dict[str, float]]:
+    """
+    Imports a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        tuple[float, dict[str, float]]: The milliseconds the import took and the
+        milliseconds spent in every top-level package.
+
+    Raises:
+        RuntimeError: If the module could not be imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {module}:\n{result.stderr}")
+
+    total = 0.0
+    packages: dict[str, float] = collections.defaultdict(float)
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if not own.strip().isdigit():
+            continue
+        packages[name.strip().split(".")[0]] += int(own) / 1000
+        if name.strip() == module:
+            total = int(cumulative) / 1000
+    return total, dict(packages)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.startup", description="Reports the import time of the main window.")
+    parser.add_argument("--module", default=MAIN_MODULE, help="Module to import.")
+    parser.add_argument("--budget", type=float, default=IMPORT_BUDGET, help="Milliseconds the import may take.")
+    parser.add_argument("--top", type=int, default=15, help="Number of packages to list.")
+    args = parser.parse_args()
+
+    total, packages = import_times(args.module)
+    for name, elapsed in sorted(packages.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"{name:<32} {elapsed:8.1f} ms")
+    print(f"{'import ' + args.module:<32} {total:8.1f} ms (budget {args.budget:.0f} ms)")
+
+    if total > args.budget:
+        print("Import time is over budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
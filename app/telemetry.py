@@ -0,0 +1,434 @@
+"""
+Live port measurements published in shared memory, for fleet supervisors,
+station dashboards and other tools to read without asking the application.
+
+The segment is a versioned header followed by a fixed array of port records,
+all rewritten in place after every sweep. The header's sequence number works
+as a seqlock: it is odd while the writer is updating the segment and goes up
+by two with every update, so a reader can tell whether the copy it made is
+consistent and whether anything changed since its last read.
+
+A run publishes to a segment of its own when POE_TESTER_TELEMETRY names one,
+and a fleet worker to the segment its supervisor created for it. To watch a
+segment from a shell:
+
+    python -m app.telemetry NAME
+
+The module only needs NumPy, so tools can read segments without Qt:
+
+    reader = TelemetryReader("poe_station_1")
+    for port in port_records(reader.read()):
+        print(port["port"], port["voltage"], bool(port["passing"]))
+"""
+
+import argparse
+import ctypes
+import enum
+import logging
+import os
+import sys
+import time
+import typing
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+if typing.TYPE_CHECKING:
+    from app.models.port_state_store import PortStateStore
+
+logger = logging.getLogger(__name__)
+
+# Segment to publish the measurements of a run to, off when empty
+DEFAULT_TELEMETRY = os.environ.get("POE_TESTER_TELEMETRY", "")
+
+TELEMETRY_MAGIC = b"POETLM"
+# Changes whenever the layout of the header or the port records changes
+TELEMETRY_VERSION: int = 2
+# Most ports a segment holds, as many as a hardware agent reports
+TELEMETRY_MAX_PORTS: int = 256
+# Times a reader retries a copy the writer changed underneath it
+READ_ATTEMPTS: int = 8
+# Seconds a reader waits before its first retry, doubled for every further one
+READ_BACKOFF: float = 50e-6
+# Seconds between updates of the memory a writer reports, it is slow to find
+MEMORY_INTERVAL: float = 1.0
+# Seconds to watch an existing segment for a writer still publishing to it,
+# before removing it as left behind by a run that crashed
+TAKEOVER_WAIT: float = 0.5
+
+
+class WorkerState(enum.IntEnum):
+    STARTING = 0
+    RUNNING = 1
+    PASSED = 2
+    FAILED = 3
+
+
+class PortTelemetry(ctypes.Structure):
+    _fields_ = [
+        ("port", ctypes.c_uint32),
+        ("passing", ctypes.c_uint32),
+        ("voltage", ctypes.c_double),
+        ("max_voltage", ctypes.c_double),
+        ("current", ctypes.c_double),
+        ("max_current", ctypes.c_double),
+        ("power", ctypes.c_double),
+        ("max_power", ctypes.c_double),
+    ]
+
+
+class TelemetryStructure(ctypes.Structure):
+    _fields_ = [
+        # Layout of the segment, for readers to check before they trust it
+        ("magic", ctypes.c_char * 8),
+        ("version", ctypes.c_uint32),
+        ("header_size", ctypes.c_uint32),
+        ("record_size", ctypes.c_uint32),
+        ("max_ports", ctypes.c_uint32),
+        # Odd while the writer is updating the segment
+        ("sequence", ctypes.c_uint64),
+        ("pid", ctypes.c_int64),
+        ("state", ctypes.c_int32),
+        ("port_count", ctypes.c_uint32),
+        # Wall clock time of the last update
+        ("timestamp", ctypes.c_double),
+        # Resources the writing process uses
+        ("cpu_seconds", ctypes.c_double),
+        ("resident_bytes", ctypes.c_uint64),
+        ("samples", ctypes.c_uint64),
+        ("ports", PortTelemetry * TELEMETRY_MAX_PORTS),
+    ]
+
+
+HEADER_SIZE: int = TelemetryStructure.ports.offset
+# The ports as NumPy records, for writing and reading them in one step
+PORT_DTYPE = np.dtype(PortTelemetry)
+
+
+def port_records(telemetry: TelemetryStructure | None) -> np.ndarray:
+    """The ports of a copy of a segment as NumPy records, without copying them again."""
+    if telemetry is None:
+        return np.empty(0, PORT_DTYPE)
+    return np.frombuffer(telemetry, PORT_DTYPE, telemetry.port_count, HEADER_SIZE)
+
+
+def _resident_bytes() -> int:
+    """Resident memory of this process, or 0 if it cannot be found."""
+    if sys.platform == "win32":
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        get_current_process = ctypes.windll.kernel32.GetCurrentProcess
+        get_current_process.restype = wintypes.HANDLE
+        get_process_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+        get_process_memory_info.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]
+
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+        if get_process_memory_info(get_current_process(), ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+        return 0
+
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+# Segments this process created and removes again
+_owned_segments: set[str] = set()
+
+
+def _open_segment(name: str, create: bool) -> shared_memory.SharedMemory:
+    if create:
+        try:
+            mem = shared_memory.SharedMemory(name, True, ctypes.sizeof(TelemetryStructure))
+        except FileExistsError:
+            mem = _replace_stale_segment(name)
+        _owned_segments.add(mem.name)
+        return mem
+
+    mem = shared_memory.SharedMemory(name, False)
+    if sys.platform != "win32" and mem.name not in _owned_segments:
+        # The segment belongs to whoever created it, it must outlive this process
+        resource_tracker.unregister(mem._name, "shared_memory")
+    return mem
+
+
+def _replace_stale_segment(name: str) -> shared_memory.SharedMemory:
+    """
+    Removes a segment left behind by a run that crashed, or with another
+    layout, and creates it again.
+
+    Raises:
+        FileExistsError: If a writer is still publishing to the segment.
+    """
+    mem = shared_memory.SharedMemory(name, False)
+    try:
+        live = _has_live_writer(mem)
+    finally:
+        mem.close()
+    if live:
+        if sys.platform != "win32":
+            resource_tracker.unregister(mem._name, "shared_memory")
+        raise FileExistsError(f"Telemetry segment {name} is in use by a running writer")
+
+    logger.warning("Replacing stale telemetry segment %s", name)
+    mem.unlink()
+    return shared_memory.SharedMemory(name, True, ctypes.sizeof(TelemetryStructure))
+
+
+def _has_live_writer(mem: shared_memory.SharedMemory) -> bool:
+    """Whether the segment has this layout and its sequence moves within TAKEOVER_WAIT."""
+    if mem.size < ctypes.sizeof(TelemetryStructure):
+        return False
+    header = TelemetryStructure.from_buffer(mem.buf)
+    try:
+        if header.magic != TELEMETRY_MAGIC or header.version != TELEMETRY_VERSION:
+            return False
+        sequence = header.sequence
+        deadline = time.monotonic() + TAKEOVER_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.01)
+            if header.sequence != sequence:
+                return True
+        return False
+    finally:
+        del header
+
+
+def _close_segment(mem: shared_memory.SharedMemory, owner: bool) -> None:
+    mem.close()
+    if owner:
+        _owned_segments.discard(mem.name)
+        mem.unlink()
+
+
+class TelemetryWriter:
+    """
+    Publishes the measurements of a run. With create the segment is created
+    and removed again on close, otherwise it is one a supervisor created.
+
+    Raises:
+        FileExistsError: With create, if another writer is still publishing
+            to a segment of that name. One left behind is replaced.
+    """
+
+    def __init__(self, name: str, create: bool = False) -> None:
+        self._mem = _open_segment(name, create)
+        self._owner = create
+        self._struct = TelemetryStructure.from_buffer(self._mem.buf)
+        self._ports = np.frombuffer(self._mem.buf, PORT_DTYPE, TELEMETRY_MAX_PORTS, HEADER_SIZE)
+        self._memory_time = -MEMORY_INTERVAL
+        self._truncated = False
+
+        # A writer that crashed while updating leaves the sequence odd
+        self._struct.sequence += self._struct.sequence % 2
+        self._begin()
+        self._struct.magic = TELEMETRY_MAGIC
+        self._struct.version = TELEMETRY_VERSION
+        self._struct.header_size = HEADER_SIZE
+        self._struct.record_size = PORT_DTYPE.itemsize
+        self._struct.max_ports = TELEMETRY_MAX_PORTS
+        self._struct.pid = os.getpid()
+        self._struct.state = WorkerState.STARTING
+        self._struct.port_count = 0
+        self._struct.samples = 0
+        self._end()
+
+    @property
+    def name(self) -> str:
+        return self._mem.name
+
+    def publish(
+        self,
+        ports: typing.Sequence[int],
+        store: "PortStateStore",
+        rows: np.ndarray,
+        state: WorkerState,
+        samples: int,
+    ) -> None:
+        """Rewrites the segment with the measurements of the given store rows, one per port."""
+        count = min(len(ports), TELEMETRY_MAX_PORTS)
+        rows = rows[:count]
+        if count < len(ports) and not self._truncated:
+            self._truncated = True
+            logger.warning("Only publishing the first %d of %d ports to %s", count, len(ports), self.name)
+
+        now = time.monotonic()
+        update_memory = now - self._memory_time >= MEMORY_INTERVAL
+        if update_memory:
+            self._memory_time = now
+            resident_bytes = _resident_bytes()
+
+        self._begin()
+        published = self._ports[:count]
+        published["port"] = ports[:count]
+        published["passing"] = store.passing[rows]
+        published["voltage"] = store.voltage[rows]
+        published["max_voltage"] = store.voltage_max[rows]
+        published["current"] = store.current[rows]
+        published["max_current"] = store.current_max[rows]
+        published["power"] = store.power[rows]
+        published["max_power"] = store.power_max[rows]
+        self._struct.port_count = count
+        self._struct.state = state
+        self._struct.samples = samples
+        self._struct.cpu_seconds = time.process_time()
+        if update_memory:
+            self._struct.resident_bytes = resident_bytes
+        self._end()
+
+    def close(self) -> None:
+        del self._struct
+        self._ports = np.empty(0, PORT_DTYPE)
+        _close_segment(self._mem, self._owner)
+
+    def _begin(self) -> None:
+        self._struct.sequence += 1
+
+    def _end(self) -> None:
+        self._struct.timestamp = time.time()
+        self._struct.sequence += 1
+
+
+class TelemetryReader:
+    """
+    Reads a telemetry segment. With create the segment is created for a writer
+    to publish to, and removed again on close.
+
+    read() makes a consistent copy. Readers that can live with a record
+    changing while they look at it can use header and ports instead, which
+    map the segment itself without copying anything.
+    """
+
+    def __init__(self, name: str, create: bool = False) -> None:
+        self._mem = _open_segment(name, create)
+        self._owner = create
+        self._struct = TelemetryStructure.from_buffer(self._mem.buf)
+
+    @property
+    def name(self) -> str:
+        return self._mem.name
+
+    @property
+    def ready(self) -> bool:
+        """
+        True once a writer initialized the segment.
+
+        Raises:
+            ValueError: If the segment has a layout this reader does not know.
+        """
+        if self._struct.magic != TELEMETRY_MAGIC:
+            return False
+        if self._struct.version != TELEMETRY_VERSION:
+            raise ValueError(f"Telemetry version {self._struct.version} is not supported, expected {TELEMETRY_VERSION}")
+        return True
+
+    @property
+    def generation(self) -> int:
+        """The number of updates published so far, to tell cheaply whether there is anything new."""
+        return self._struct.sequence // 2
+
+    @property
+    def header(self) -> TelemetryStructure:
+        """The segment itself, read live."""
+        return self._struct
+
+    @property
+    def ports(self) -> np.ndarray:
+        """The port records of the segment as a read only view, read live."""
+        count = min(self._struct.port_count, TELEMETRY_MAX_PORTS)
+        ports = np.frombuffer(self._mem.buf, PORT_DTYPE, count, HEADER_SIZE)
+        ports.flags.writeable = False
+        return ports
+
+    def read(self, into: TelemetryStructure | None = None) -> TelemetryStructure | None:
+        """
+        Copies the segment, into the given structure to avoid allocating one.
+
+        Returns:
+            TelemetryStructure | None: A consistent copy, or None if no writer
+            initialized the segment yet or it kept updating it during every
+            attempt.
+
+        Raises:
+            ValueError: If the segment has a layout this reader does not know.
+        """
+        if not self.ready:
+            return None
+
+        copy = into if into is not None else TelemetryStructure()
+        for attempt in range(READ_ATTEMPTS):
+            if attempt:
+                # Give the writer time to finish its update instead of spinning
+                time.sleep(READ_BACKOFF * 2 ** (attempt - 1))
+            before = self._struct.sequence
+            if before % 2:
+                continue
+            # Only the ports in use, the records past them are stale anyway
+            count = min(self._struct.port_count, TELEMETRY_MAX_PORTS)
+            ctypes.memmove(ctypes.addressof(copy), ctypes.addressof(self._struct), HEADER_SIZE + count * PORT_DTYPE.itemsize)
+            if self._struct.sequence == before:
+                return copy
+        return None
+
+    def close(self) -> None:
+        del self._struct
+        _close_segment(self._mem, self._owner)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.telemetry", description="Shows the live measurements of a telemetry segment.")
+    parser.add_argument("name", help="name of the shared memory segment")
+    parser.add_argument("--interval", type=float, default=0.5, help="seconds between updates")
+    parser.add_argument("--once", action="store_true", help="show the measurements once and exit")
+    args = parser.parse_args()
+
+    try:
+        reader = TelemetryReader(args.name)
+    except FileNotFoundError:
+        print(f"No telemetry segment named {args.name}", file=sys.stderr)
+        return 1
+
+    telemetry = TelemetryStructure()
+    generation = -1
+    try:
+        while True:
+            if reader.generation != generation and reader.read(telemetry):
+                generation = telemetry.sequence // 2
+                print(
+                    f"Process {telemetry.pid} {WorkerState(telemetry.state).name.lower()}, "
+                    f"{telemetry.samples} samples, {telemetry.resident_bytes / 2**20:.1f} MB"
+                )
+                for port in port_records(telemetry):
+                    print(
+                        f"  LAN {port['port']:<3} {port['voltage']:6.2f}V {port['current']:5.2f}A {port['power']:6.2f}W"
+                        f"  max {port['max_voltage']:6.2f}V {port['max_power']:6.2f}W  {'pass' if port['passing'] else 'fail'}"
+                    )
+            if args.once:
+                return 0
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        del telemetry
+        reader.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
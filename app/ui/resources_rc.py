@@ -0,0 +1,4635 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x14\xa6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x03\x00\x00\x00k\xacXT\
+\x00\x00\x00\xc1zTXtRaw prof\
+ile type exif\x00\x00x\
+\xdamP\xc1\x0d\xc3 \x0c\xfc3EG\x00\xdb\x80\x19\
+\x874\x89\xd4\x0d:~\x8f\xd8T\xa1\xeaI\x9c\x0fl\
+\x0e\xe3p\xbc_gx\x0cP\x92 \xb9ji\xa5D\
+@\x9a4\xea\x10\x1a\x0d\xfd\xe2\x14\xe5\xe2\x89\xe4\xbc\x9c\
+\x87\xaf$DFdKh\xf1[\xf3<-61u\
+\xa8|3\xd2\xa7'\xb65\xd1\xc4\x22\xe9\x8f\x91?\xc4\
+\xa3#\x82\xd8\xdd\xa8\xb9\x11\x93%\x92\x1bt\xfbV,\
+M\xeb\xfd\x0b\xdb\x11W\xa8\xad0\xe8\x9c3\xa9\x16~\
+\xf7R1\xbd=\xe3\x1d&:8q\x043\xab5\xc0\
+c\xe5\xc0\x1d\x82\x8dQ\x88\xa2K\x0b\x18\xf0N0\x90\
+\x7fs\x9a\x08\x1f\x0enYut\x88\x12-\x00\x00\x01\
+\x83iCCPICC profile\
+\x00\x00x\x9c}\x91=H\xc3@\x18\x86\xdf\xa6JE\
+*\x1d\xec \xe2\x90\xa1:\xd9E\x8b8\x96Z,\x82\
+\x85\xd2Vh\xd5\xc1\xe4\xd2?h\xd2\x90\xa4\xb88\x0a\
+\xae\x05\x07\x7f\x16\xab\x0e.\xce\xba:\xb8\x0a\x82\xe0\x0f\
+\x88\xbb\xe0\xa4\xe8\x22%~\x97\x14Z\xc4x\xc7q\x0f\
+\xef}\xef\xcb\xddw\x80\xd0\xae3\xd5\x1c\x88\x03\xaaf\
+\x19\xd9TB,\x14W\xc5\xc0+\xfc4C\x00b\x12\
+3\xf5tn1\x0f\xcf\xf1u\x0f\x1f\xdf\xef\xa2<\xcb\
+\xbb\xee\xcf1\xa2\x94L\x06\xf8D\xe28\xd3\x0d\x8bx\
+\x83xn\xd3\xd29\xef\x13\x87YUR\x88\xcf\x89\xa7\
+\x0d\xba \xf1#\xd7e\x97\xdf8W\x1c\x16xf\xd8\
+\xc8g\x17\x88\xc3\xc4b\xa5\x8f\xe5>fUC%\x8e\
+\x11G\x14U\xa3|\xa1\xe0\xb2\xc2y\x8b\xb3Zo\xb2\
+\xee=\xf9\x0b\x83%m%\xc7uZ\x13Ha\x09i\
+d BF\x135\xd4a!J\xbbF\x8a\x89,\x9d\
+'<\xfc\xe3\x8e?C.\x99\x5c50r$\xd1\x80\
+\x0a\xc9\xf1\x83\xff\xc1\xef\xde\x9a\xe5\xd9\x197)\x98\x00\
+\x06_l\xfbc\x12\x08\xec\x02\x9d\x96m\x7f\x1f\xdbv\
+\xe7\x04\xf0?\x03WZ\xcf\xdfh\x03\xf3\x9f\xa4\xb7z\
+Z\xe4\x08\x08m\x03\x17\xd7=M\xde\x03.w\x80\xb1\
+']2$G\xf2\xd3\x12\xcae\xe0\xfd\x8c\xbe\xa9\x08\
+\x8c\xde\x02\xc3kn\xdf\xba\xe78}\x00\xf2\xd4\xab\xe5\
+\x1b\xe0\xe0\x10\x98\xaaP\xf6\xba\xc7\xbb\x87\xfa\xfb\xf6o\
+M\xb7\x7f?vNr\xa8ecgT\x00\x00\x0dv\
+iTXtXML:com.adob\
+e.xmp\x00\x00\x00\x00\x00<?xpac\
+ket begin=\x22\xef\xbb\xbf\x22 \
+id=\x22W5M0MpCehiHz\
+reSzNTczkc9d\x22?>\x0a\
+<x:xmpmeta xmlns\
+:x=\x22adobe:ns:met\
+a/\x22 x:xmptk=\x22XMP\
+ Core 4.4.0-Exiv\
+2\x22>\x0a <rdf:RDF xm\
+lns:rdf=\x22http://\
+www.w3.org/1999/\
+02/22-rdf-syntax\
+-ns#\x22>\x0a  <rdf:De\
+scription rdf:ab\
+out=\x22\x22\x0a    xmlns\
+:xmpMM=\x22http://n\
+s.adobe.com/xap/\
+1.0/mm/\x22\x0a    xml\
+ns:stEvt=\x22http:/\
+/ns.adobe.com/xa\
+p/1.0/sType/Reso\
+urceEvent#\x22\x0a    \
+xmlns:dc=\x22http:/\
+/purl.org/dc/ele\
+ments/1.1/\x22\x0a    \
+xmlns:GIMP=\x22http\
+://www.gimp.org/\
+xmp/\x22\x0a    xmlns:\
+tiff=\x22http://ns.\
+adobe.com/tiff/1\
+.0/\x22\x0a    xmlns:x\
+mp=\x22http://ns.ad\
+obe.com/xap/1.0/\
+\x22\x0a   xmpMM:Docum\
+entID=\x22gimp:doci\
+d:gimp:3befa1fc-\
+227f-46d6-afca-7\
+cfdb844e72e\x22\x0a   \
+xmpMM:InstanceID\
+=\x22xmp.iid:f727e3\
+a1-c889-4cbd-b95\
+3-7045838d6f8b\x22\x0a\
+   xmpMM:Origina\
+lDocumentID=\x22xmp\
+.did:ba32a6bd-32\
+5f-4311-8d9d-fc6\
+bd6118d44\x22\x0a   dc\
+:Format=\x22image/p\
+ng\x22\x0a   GIMP:API=\
+\x222.0\x22\x0a   GIMP:Pl\
+atform=\x22Windows\x22\
+\x0a   GIMP:TimeSta\
+mp=\x22174101427513\
+1115\x22\x0a   GIMP:Ve\
+rsion=\x222.10.38\x22\x0a\
+   tiff:Orientat\
+ion=\x221\x22\x0a   xmp:C\
+reatorTool=\x22GIMP\
+ 2.10\x22\x0a   xmp:Me\
+tadataDate=\x222025\
+:03:03T10:04:33-\
+05:00\x22\x0a   xmp:Mo\
+difyDate=\x222025:0\
+3:03T10:04:33-05\
+:00\x22>\x0a   <xmpMM:\
+History>\x0a    <rd\
+f:Seq>\x0a     <rdf\
+:li\x0a      stEvt:\
+action=\x22saved\x22\x0a \
+     stEvt:chang\
+ed=\x22/\x22\x0a      stE\
+vt:instanceID=\x22x\
+mp.iid:6af178fa-\
+2a65-4c63-a4a0-5\
+1c6034248c9\x22\x0a   \
+   stEvt:softwar\
+eAgent=\x22Gimp 2.1\
+0 (Windows)\x22\x0a   \
+   stEvt:when=\x222\
+025-03-03T10:04:\
+35\x22/>\x0a    </rdf:\
+Seq>\x0a   </xmpMM:\
+History>\x0a  </rdf\
+:Description>\x0a <\
+/rdf:RDF>\x0a</x:xm\
+pmeta>\x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+                \
+                \
+                \
+                \
+               \x0a\
+                \
+                \
+                \
+                \
+                \
+                \
+    \x0a           \
+                \
+                \
+                \
+                \
+                \
+         \x0a      \
+                \
+                \
+                \
+                \
+                \
+              \x0a \
+                \
+                \
+                \
+                \
+                \
+                \
+   \x0a            \
+                \
+                \
+                \
+                \
+                \
+        \x0a       \
+                \
+                \
+                \
+                \
+                \
+             \x0a  \
+                \
+                \
+                \
+                \
+                \
+                \
+  \x0a             \
+                \
+                \
+                \
+                \
+                \
+       \x0a        \
+                \
+                \
+                \
+                \
+                \
+            \x0a   \
+                \
+                \
+                \
+                \
+                \
+                \
+ \x0a              \
+                \
+                \
+                \
+                \
+                \
+      \x0a         \
+                \
+                \
+                \
+                \
+                \
+           \x0a    \
+                \
+                \
+                \
+                \
+                \
+                \
+\x0a               \
+                \
+                \
+                \
+                \
+                \
+     \x0a          \
+                \
+                \
+                \
+                \
+                \
+          \x0a     \
+                \
+      \x0a<?xpacket\
+ end=\x22w\x22?>\x13\x83\xeaV\x00\x00\
+\x02(PLTE\x00\x00\x00\xff\xff\xff\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xea\
+\xd8d\x00\x00\x00\x01tRNS\x00@\xe6\xd8f\x00\
+\x00\x00\x01bKGD\x00\x88\x05\x1dH\x00\x00\x00\x09\
+pHYs\x00\x00\x0d\xd7\x00\x00\x0d\xd7\x01B(\x9b\
+x\x00\x00\x00\x07tIME\x07\xe9\x03\x03\x0f\x04#\
+e\xdd\xc6\x9f\x00\x00\x02\x19IDATx\xda\xed\xdd\
+Kn\xc30\x0c\x05@\x82\xf7?t\x97q\x9aO\x0b\
+[\x96hs\xb8$@\xc9o6q\x12\x01\x8axT\
+\xb6\xa9xS\xd9\xac\xba\xe7\xff%\x90-\xab{\xfe\x8d\
+@w\x80\xcc\xde\x02\x99\xcd\x05\x004\x07\xc8l.\x00\
+\xe0\xeb\x1b\xf2=k\x9b\xb9c\xfe\xa7\xd4-\xf3o\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf88r\
+\xd9\xa3\x90\xc7\x00\xeep\x18\xf4\x08\xc0=\x8e\xc3\x02\x00\
+\xb0\x17\xe0\x0e\xc7\xa1\x01\x00\x00\x00\x00\xc0a\x80\x1d\x8d\
+\x1c\xd8\xd8\xf3 \x93\x00bq\x03\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x809\x00Q\xbe\x01\x00\xc0\x14\x80\xf8\xdc\
+\x88\x13\x1b_\xf6\x9d\x05\x10/C\xef\x1b\xa3\x01\xfe\xdc\
+w\x1a@\xbc\xce,kd\xac\x00(\xff\xbf/\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\xc0\xde\xeb<\xce\x8fZ\xe1\x92\
+\x95r\xf1\xa7\xdf2S.?\x00\x00\x00\xa6\x02d\xb5\
+\xfcc\x01\xe2z\x00\x01\x00\xc0H\x80\xb8\x1a@\x8c\x06\
+\x88k\x01\xc4x\x80Z_\x93\xc6=6\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xf8\x1f\
+\xe7r@\xcc\xe1\x8bO\x05\xd8\xbb\xf6\x89K\x03\x98\x0c\
+\x90\xb5V\x06\x00\x00\x00\x00\x00\xa3\x00b-@\xac\x07\
+\x88\x95\x00Q\x01 \xd6\x01D\x0d\x80\x7f\xec3{\x16\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x22\x009u\xb4\
+\x22\xc0\x81\x02\x00\x00\x00\x00\x00\x00\x00\x5c\x13 \x8a\xe6\
+\x070\x0d j\xe6\x9f\x08P\xb4\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x004\x06\xc8\x96\xf93Z\x0a<e\
+\xce\xd6\x05\xa0\xb9@\x00\x00\xd0Z\xe0\xf5S\xa1g~\
+\x00\xd1=\x7fK\x82\xcfo\x87=\xf3\xf72\xd8\x84\xfe\
+\x01E\x06\x8d\x09\x03I\x07\xc2\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x01\x0a\x09\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x03\xe8\x00\x00\x03 \x08\x06\x00\x00\x00\xb0\x18H=\
+\x00\x00\x00\x09pHYs\x00\x00\x0c.\x00\x00\x0b\x13\
+\x01}\xd9\xb6\xe5\x00\x00\x00 cHRM\x00\x00z\
+%\x00\x00\x80\x83\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00u\
+0\x00\x00\xea`\x00\x00:\x98\x00\x00\x17o\x92_\xc5\
+F\x00\x01\x09\x8fIDATx\xda\xec\xddy\x90$\
+\xe7y\xdf\xf9\xef\xf3ffU\xdf\xc74\xe6\xc0\xcc\xe0\
+\x18\x10\x07\x01\x828y\x81  \x1e\x92)\x91\x92%\
+{\xad\xb5V\x8a\xf5\xda\x92C\xab\xd5j7\xf4\x87\x15\
+\xde\x95ekW\x0a\xd9\xe1\xb0\x1c\xe1U\xd8\x11\xab\xd5\
+ZR\xd8a[\x96\xb9ZQ\x07W\x14E\x81\xa4(\
+\xde\x80p_s_\x98{\xfa\x98\xee\xae#3\xdfg\
+\xff\xc8\xea\xc1\x00\xe8\xe9\xae\xaa\xee\xe9\xe9\x99\xf9}\x18\
+\xc9\xc1`z\xaa\xb2\xde\xcc*\xd4\xef=\x9e\xd7\xdc\x1d\
+\x11\x11\x11\x11\x11\x11\x11\xb9\xba\x82\x9a@DDDD\
+DDD\x01]DDDDDDD\x14\xd0ED\
+DDDDD\x14\xd0EDDDDDDD\x01\
+]DDDDDDD\x01]DDDDDD\
+D\x14\xd0EDDDDDD\x14\xd0EDDD\
+DDDD\x01]DDDDDDD\x01]D\
+DDDDDD\x14\xd0EDDDDDD\x14\
+\xd0EDDDDDDD\x01]DDDDD\
+DD\x01]DDDDDDD\x14\xd0EDD\
+DDDD\x14\xd0EDDDDDDD\x01]\
+DDDDDDD\x01]DDDDDDD\
+\x14\xd0EDDDDDD\x14\xd0EDDDD\
+DDD\x01]DDDDDDD\x01]DD\
+DDDDD\x14\xd0EDDDDDD\x14\xd0\
+EDDDDDDD\x01]DDDDDD\
+D\x01]DDDDDDD\x14\xd0EDDD\
+DDD\x14\xd0EDDDDDDD\x01]D\
+DDDDDD\x01]DDDDDDD\x14\
+\xd0EDDDDDD\x14\xd0EDDDDD\
+DD\x01]DDDDDDD\x01]DDD\
+DDDD\x14\xd0EDDDDDD\x14\xd0E\
+DDDDDDD\x01]DDDDDDD\
+\x01]DDDDDDD\x14\xd0EDDDD\
+DD\x14\xd0EDDDDDDD\x01]DD\
+DDDDD\x01]DDDDDDD\x14\xd0\
+EDDDDDD\x14\xd0EDDDDDD\
+D\x01]DDDDDDD\x01]DDDD\
+DDD\x14\xd0EDDDDDD\x14\xd0ED\
+DDDDDD\x01]DDDDDDD\x01\
+]DDDDDDD\x14\xd0EDDDDD\
+D\x14\xd0EDDDDDDD\x01]DDD\
+DDDD\x01]DDDDDDD\x14\xd0E\
+DDDDDD\x14\xd0EDDDDDDD\
+\x01]DDDDDDD\x01]DDDDD\
+DD\x14\xd0EDDDDDD\x14\xd0EDD\
+DDDDD\x01]DDDDDDD\x01]\
+DDDDDDD\x14\xd0EDDDDDD\
+\x14\xd0EDDDDDDD\x01]DDDD\
+DDD\x14\xd0EDDDDDD\x14\xd0ED\
+DDDDDD\x01]DDDDDDD\x01\
+]DDDDDDD\x14\xd0EDDDDD\
+D\x14\xd0EDDDDDDD\x01]DDD\
+DDDD\x01]DDDDDDD\x14\xd0E\
+DDDDDD\x14\xd0EDDDDDDD\
+\x01]DDDDDDD\x01]DDDDD\
+DD\x14\xd0EDDDDDD\x14\xd0EDD\
+DDDDD\x01]DDDDDDD\x01]\
+DDDDDDD\x14\xd0EDDDDDD\
+\x14\xd0EDDDDDDD\x01]DDDD\
+DDD\x01]DDDDDDD\x14\xd0ED\
+DDDDD\xae!\xa9\x9a@\xae\x15\x8f\xfd\xfc\x1f\
+l\xf8s\xc6\xe0\x14\xc1\xa9\xc7\x1a\xee\x0588\x0e\x9e\
+`!%ZN\xc8\x0b0#\x8b)\xed\x01#kF\
+,\xcfi\x0fV\xfd_f)\x10 D0\xa7XL\
+\x08\x8b\x01\x9b\x5c \x06\xc3\xcf\x8eP\xa400\xb9\x88\
+\xc5\x1a\xb1,0\x83P:\xb9\x05\x82AL#\x89'\
+x\x8c\x98\x19\xe6F,\x9d\x0b\xc7'\x19\xbd}\x9e\x85\
+#C\x8cl;A\xc8\x069\x9dNS\xf7\x1ac>\
+\x5c\x9d\xabt\xa5\xbe\xe84\x87\x12\x82A\xe9N\x9aD\
+\xda\x8b\xc3\xb4\xe6\x06\x18\xdar\x9e\xf6\xe2 C\x13%\
+\xe7\xcb\xf3\x0c\x85aj1\xc5\xcd q\x1a'GI\
+\xc6\x16\xa8e98\x10\x02\xd1`1,\x92\xb5\xa0\xa0\
+\xa0^\x1b%\x89\x814\x8f\xa4m\xa79\x9ap!\xce\
+1\xe6C\xb4-R'\xa3\xcc[Xf`)\xe6\xd6\
+\xb9z\x8eY\x80\x08f\xe0\x0e\x16\x22\x0e\xc4\x18\x88\xa1\
+$\xb1\x04J \x82\x1b\x04\xfcb\xefk;D\xea\xed\
+\xea\x9f}\xd0\x89e\x02\x96\x12[\x0bXH\xb0\x90\xe0\
+\x89\xd3\x9a\x19\xa46\xd2b\xb8U\xb28\x14\xb0h`\
+\x8e%)\xd1K\xf0\x08\x16!&P\xb4\xf1\x90b\xc1\
+\x88\x01\xcc\xdf\xfc#\x8b\x9d\xdfwn=7\x07\x0c\xb3\
+@$b\x0e!)\xb9pt\x92l\xa8E}\xaa\x81\
+\x97\x06\x068XH\xf1X\xbc\xf9bYz\x1c\x18h\
+\x18E\x0ae\xea\xd5\x0fW\x8f\x8c\xfb\xd2?\xb3\xca\x1d\
+\xbf\xf4\xa7\xf6\xb6\xdfw\x1eg\xe91\xcdq\xaf^\x98\
+\x01\xb1\xac\x9e#\x84\xa5\xe7\xb57\xff^\xe2\x94\x18\xa1\
+\xbc\xe4Y\x1cZ\x17\x06\x18\x1co\xe0\x11<\xc0\xe0\xa2\
+\x91gN\xcc \xbaW\x8fg\x09N$IKb\x91\
+a\xa53\xd8\x80\xc5a'$)\xb8\x11c\x8e\x91\x10\
+)\x09\x16\x01#o\xd4\x09YIHJ\x82\x07.d\
+\x8b$1a\xd83J\x22\xd3\x07v\xb2e\xcf\xc9N\
+\xdb;\x94FHKf\x0f\xdfL}b\x8e\xda\xe8\x02\
+\xd5\x85\xa3s\xc1\xaa\xd7_k\x1a\xad\xb4s^e \
+\x0c^\xe0\x89\x8f\xffgj\xf56\x16 I\x02>\xba\
+\x05N\x9fa\xef\xd4yv\xcdN\x90\xb5k\x9d\xe7\x91\
+\xd5\x98\x81\xa79\xad\x1a\x0c7\x02\x9e\x05\xe6\x07r\xb2\
+\x99:\xe9@\x82\xc5\x1c\xc3\x08\x06\xed\x9a\xd1.\x9a\x8c\
+\xb4S|j\x0b\xcc\xce\xe0E\x89\x13\xb0P\xddTf\
+N\xb0\x00I\xf5\xa6\xcbH\xa7\xcc\xb8\xa9(\xe3vw\
+\xb6{d[t\xdf\x9e\x97>\x15#\x93E\xe9\xe3\xb5\
+\xccF\xb3\xc4\x86\x1c\x86\x80\x01\xa0\x06d\xd5\x7f\xa4\x08\
+T\x9f$9\xd0\x06\x16\x81E\x87\x0bn>\x13\xdc\xce\
+\x02g\xcc9\xe5\xc6)\xe0\xa4\x85p\x1a\x8f\xd3\x11\x9b\
+\x86\xd82\x0f\x17\xdf\x04\x16\x00\x0bxt\x82;\xa5A\
+\xb0\xea\xa3\xa4\x08\x8e\xe1\x10\xe0\xe0\xe44w\x9d\xdeJ\
+\xcb\x8dz(03\x22\xb0\xd0\xac3To\x93\xe0D\
+\xab>\x04\xcc\x9cvZ\x10b \x89\x01\xa7\xba_!\
+R\x96\x01wH2\xb0\x10\x88\xed\xb2\xf3\xd9\xe3o\xf9\
+\xdc4\x0b\xd5\xfb:B\xbbH\xa9\xd5\xda\xe4II\xad\
+H(B$\x8d)\x1e!\x04'v\x9e\xd3\xcd\xab\x0f\
+!\x1c#`\x01b\x8c\x1c\x9a\x9c\xe1\x8e\x99)\xc82\
+b\xbb\x89Q\x9dS\x9e\xe6\xd4\xca\x1a$\xd5\xe7e\x19\
+\x9c\xb4L)\xa2\x91$\x91h\x91\xe0\x017'D#\
+.\x9d\xa7q\xf1s\xcf\xa8\xfe|\xe9\xf3\xd4\xcd\xb0\xa1\
+!|a\x9eF^c\xb0\x9ew\xbe\x93@\x99\x94\xa4\
+e\x82\xd5jx\xbbM\xbbH\xa8\xa5%ep\x92\xd2\
+(=\x90\x06\xaf\xda%\x96\xd5\xf3\xbau^_\xc4\x0d\
+\xcc\xadj\x17_\xba_\x0d3\x88D\xe6\xea-&\x9a\
+C\xd8\xc48\xe5\xf49\xe6\xdb\x03\x8c\xd4\xdb\x84\xa5O\
+\xc4\xce\xf3\x16EB\x9a\x16\x9d\xe7\x0d\xc4\x18\x08iI\
+\xc4\x091\x10\xdd\x08\x89_\xfc\xbd;XR=\xd7\xd2\
+\xf7\x1b\xf77\xcfs\xbe\xdeb\xac9\x84M\x8c\x11g\
+\xa7Yh\x0d04\xd0\xae>\xeb=\x92'%\xf5\x98\
+b\xb5\x1ae\xb3M\xe9\x81,D\x0a\x8b$\x1eX\xba\
+bK\xd7\xf3\x97\xbe\xeb)}\x10\x89\x02\xba\x88\x88\x88\
+\x88\xac1\xdc\x03!Xu\xa4a2\x96vG+\xf7\
+\xfb\xe6\x1a\xf9{g\x17\x8b\xfbf\xe7\xcb\xdds\xf3\xe5\
+\xf6\x85Fy\xd3B3\xa6\xadv\xa4\x99G\xday\xa4\
+\xd1\x8a\x14\x85\xb3m2\xe3\xe3\x8fNp\xcb\xf6:E\
+\xe9==\xb7\xb9\xbd\xa5\xb3\xec\xe2?\xc7\x18\x81\x19\xc3\
+\xcf\x80\x9d\x05?\x06v\x048\x0a\x1c\x04?\x0e\x9c\xe9\
+\x1c\xad\x95\xba\xcdDDD\x01]DDDd\xd3\xa6\
+\xf2,5,\xb3\xa1\x22\xd8\xa33\x17\x8a\x8f\x9d\x9a.\
+>r\xe2\x5c\xfb\xbd\xa7\xce\xb5w\x9c\x99-\x98_,\
+h\xb6\x22D.\x19\xfa\xec\xfc_t\x88\xb0mG\x9d\
+'\x1e\x18\xe5\xdd\xb7\x0f24\x10z\x0a\xe7]\x08\xc0\
+\x96\xceq\xcf\xc5\xc8\xbd4\x01\xa6\x1a\x0d\x9e\x89\xc6\xb4\
+\xc1qw\x0ea\x1c6\xd8k\xd8Q\xc7\x8f%n\xa7\
+\x80Y]p\x11\x11\x05t\x11\x11\x11\x91\xcd\x95\xcb\x0d\
+\xeaYH\xcb\x92'\x8f\x9d\xc9\xff\xab\xd7\x9e=\xf4\xc9\
+\x83\xc7\x1b\xef:=\x9d\xd3h\x94PzgH\xdd\xaa\
+\x1f\x0eVM'\xef,\xbdp\x07\xf2\xc8\xd4M5\x9e\
+xh\x8c\xfb\xef\x18\xa6^\x0b\xe4E$\xc6\xab\xf2\x92\
+&:\xc7\x1e\xe0#\x00\xc9\xd20|i\xcd\xdb\xceO\
+\xcex\x88GS\xb7\xa3`\xfb\x1c\xf6\x01\x87\xcc\xfc0\
+\xd5\xc8\xfb\xb4\xee\x0a\x11Q@\x17\x11\x11\x11\x91\x0dU\
+Km\xbc,\xcb\x1f}\xe9\xa5\x85\x9f\xf8\xce\x8bs\x8f\
+\x1e9\xdd\x22\xb6c\x15\xc6\x03Xb\x90\xd8e\xff\xbe\
+\x17NH\x8c\x0f=<\xce\x13\x0f\x8d3:\x94\xd0\xca\
+#\xadv\xdc\xac/y u\xdb\xe1\xb0#\x98\xbf\xff\
+\xd2\xb1\xfd\xa1z;\x07\xceD8\x01\x1c\x02\xf6\x03\x07\
+\xccm\x9f\xc1q\xaa\x7f\xaf\x91w\x11Q@\x17\x11\x11\
+\x11\x91\xf5\xe1@0\xb2zf?~\xe0\xd8\xe2?\xf8\
+\xf3\xefL\xdfy\xf8xg\xb9vjX\xad\xbb\x0dw\
+\xbc\x1d\x99\xdaR\xe3\xd3\x1f\xd9\xc2\xdd\xb7\x0c\x92\x17N\
+s\xf3\x06\xf3\xb7\xbc\xfe\xcb\xc8\x80\x9d\x9d\xe3Q\xac*\
+\xe3\x98\x96\x09T\x85\xec\xce\x18v\xd2\xdd\x0f\x00\x07\xcc\
+\xfc\xb5*\xc8\xdba\xe0\x140\xaf\xbbKD\x14\xd0E\
+DDD\xa4\xebp:\x98\xf1X\xdej\xff\x8b?y\
+f\xfa\xf1\xaf\xbfx\x81XD\xc8\x02\xd6\xedct\xa6\
+\xb4\xdf\xb5g\x88\x1f|r\x8a\xf1\xe1\xe4\x9a\x08\xe6k\
+tIx\xf7G\xa0\xda}\xc1\xaa2\xe4\x0d\x8f\xf1\x9c\
+\x99\x1d\x06?\x0c\xbc\x86U\xa3\xef\xc01\xe0,\xd0\xd0\
+\xdd'\x22\x0a\xe8\x22\x22\x22\x22r1\x9d\x8fZ\xfas\
+\xe7\xe7\x1a\xbf\xfc\xd9\xaf\x9c\xaf\x1f}\xa3Y\x05\xf3,\
+t\xff\x10\x0e\x14\x91\xf7\xdd?\xc6\xa7><I\x08F\
++\xbf\xe1\xeb\xa2\x0f\x02\xbb1\xdf\x0d<\x0eK\xab\xf3\
+\x0d\x83y\xdcO8\x1c7\xb3\xbdI\x88\xfb\x81\xbd\xe6\
+v\x08x\x83j\xcd{\xa9\x9bSD\x14\xd0EDD\
+Dn\x10f6PK\xf8\xf5W^m\xfe\x9d\xdf\xff\
+\xcaY\x16\x16\x8a\xae\xa7\xb2\xbf=\x9c?\xfe\xc8\x04\x7f\
+\xed\x03\x13\x94\x91\xf5\xae\xd0~=\x1a\x01\xee\xaa\x0e\xff\
+h\x9a\x94\xe0FVM\x9b?\x97\xc4p\x1a\xfc\x90\x19\
+\x07\x80\xd7\xa9\x0a\xd6\x1d\xa1\x1ay\x9f\xe5m3\xf2\xd5\
+\xda\x22\xa2\x80.\x22\x22\x22rM\xa7sF\xea\x99\xfd\
+\xce7_\xb9\xf0\xe9?\xfa\x8b\xf3\x94\xd1{\x1a5\xbf\
+(\x8f<\xf6\xf08\x9f\xfc\xe0$E\x11/\xee\xb2&\
+}\x9b2l\x0a\xb8\x17\xab\xc2\xb7\x99\x03\xe4\xe66\x0d\
+\x1c\xed\xaco\x7f\x1d\xf7\xbd\xc0\x81,\x86\xa5J\xf3Z\
+\xef.\x22\x0a\xe8\x22\x22\x22\x22\xd7\x0e'`\xf5a\xec\
+?~\xf5\xc5\xb9O\x7f\xee/\xcf\x83u*\xb3\xf7\xfa\
+H\xed\xc8\x83\xf7\x8eV\xe1\xbct\x85\xf3++\x03\xb6\
+u\x8eG\xc1q\xaf&\xcc\xef\x9e\x1do:\xf1\x04y\
+\xfe\x06\xd8>`/\xb0\xcf\xdc\xf6SU\x99?\x05\x14\
+jB\x11Q@\x17\x11\x11\x11\xd9d\x06\xd2\xe4\xff\xf8\
+\xfa\xb3s?P\x85\xf3\xa5\xfd\xcb{\x0c\xe7y\xe4\xd6\
+\xdd\x03|\xff\xe3[p\x87\xa8t~\xd5\x18\x0c\x00{\
+\xf0\xb8\xc7\xe0qp\x0c\xc8\xca\x14\xf0i\xca\xf24\xd8\
+\xc1\xe0\x1cp\xfcu\xb3\xb7L\x99\x9fA\xb3\xe4ED\
+\x01]DDD\xd6#\x9ax\x88\x90\x16\xb8)c\xac\
+\x12\xe2:\xd5\xda\xd3\x9f\xfa\xab\xd7/\xfc\xf7\x17G\xce\
+\xfb\x09\xe7\xa532\x92\xf2CONQ\xcb\x8c\xbcP\
+\xdbob\x93\xb8O\x82\xddcn`\x10\xaa\xf7J\x11\
+<\x9c\x07\x8e\x99\xdba\xaf\xd6\xba\xef\xa5\xaa2\x7f\x88\
+\xaa\xca\xfc\x055\x9f\x88\x02\xba\x88\x88\x88\xc8\xea\x81\xd3\
+\xa1\x1dJ^\xb9\xe9,\x89\x9b\x1ad\x15\xa5E\xeeh\
+\x8e\xdf\x7f\xe6\xf5\xec_\xfc\xe1W\xce\xe1\x06\x16\xfah\
+\xb7N\x16\xff\xe4\x87&\xd96Y\xbb\x11\xb6R\xbb\x9e\
+\xbf{/M\x99\x7f\x04\x03\xeb\x5c\x5cs\x9a`'\x81\
+\xe3\xe0\xfb\xa8\x8a\xd4\xed\x03\xf6SU\x99?\x05\xa8[\
+FD\x01]DDD\xa4\x93\x13\xcd\xb9}v\x82\x22\
+\x89\x9a\xa0\xdb\x85\x90\x924\xe6\xfc\xd7\xfe\x9f/\x9f\x1d\
+i\xe7\x8e\xa5\xfdujx\x1e\xb9\xff\xdd#<x\xd7\
+\x08-\x85\xf3\xeb\xd5\x00p{\xe7x|irJ\xd5\
+\x0f\xe63\xdeh\x9c\xc2\xecP--\xf7\xf3\xce*\xf3\
+\x9a2/\xa2\x80.\x22\x22\x227V:\x07bd\xa4\
+\x95`\x9e\xa8=V\x0b\xe7\xc1\xf0$\xfc\x9d?\xfc\xd2\
+\xe9\x8fM\xcf\xb4{\xdeJ\xedb\xb3G\x18\x1cN\xf9\
+\xf8#\x13\xc4\xe8Ja7\xa6\x09<N\x00\xf7d!\
+V\xdb\xec\x01\x06EZ&\xd3\xc0Q/\x8aC\xc0\xde\
+\x10\xfcu\xe0 \xd5\x94yU\x99\x17Q@\x17\x11\x11\
+\x91\xeb2\x9c\xd7R\x18\x1f\xc7\xd1P\xdd\x8a:\x83\xe4\
+\x99\x95c_\xfa\xe6\xe9_x\xfd\xe0B\xdf\xe1\x1c\x80\
+\x22\xf2\xa1G\xc7\xd96\x99ij\xbb\xbc\xfd\xbd\x97\x02\
+[\x81\xad\xc4\xf8\x08@\x1a\xaa{$\x89\xd6\xc48\x19\
+,\x1e\x07\xdb\xe7\x1e\xf7\xf2\xe6\x94yU\x99\x17Q@\
+\x17\x11\x11\x91k7\x158$\x09\xec\xd8^\x0d\xe9\xca\
+\x8a\x09*\xab\xa7\x9c8p\xea\xef\x7f\xf9\xe9\xf3w\x90\
+\xf6\xbfV\xdfKgb2\xe3\xfd\xf7\x8d\xd2.\xd4\xee\
+\xd2\x93\x01\xe0v\x83\xdb\x1d\x7f|)\xd9\x9b\x1b\x0e\xd3\
+f~\x1a\xec\xa09\x07x\xb3X\xdd\x11\xe08\x97L\
+\x99Wg\x9c\x88\x02\xba\x88\x88\x88l\xc6\xdcy\xe2\x0d\
+5B\x17\x0c\xf0\xd4\xc6\xbf\xf4\xd4\x99\x9fm6\xc1j\
+k(\xa6\x17\x9d\xc7\x1f\x18cl(\xd1\xe8\xb9\xac\xa7\
+\xc9\xceq\xcf\xc5\xf77`F\x0eL\x83\x1fu\xe70\
+\xc6\xeb\xf52\xd9\x0b~\x80\x18\x0f\xa3)\xf3\x22\x0a\xe8\
+\x22\x22\x22r\xf5\x05\x8b\x84DU\xdb\xbb\x91%\xc6\xc1\
+\x13\xcd\xbf\xfd\xd2\xbe\x85[\xc8\xfa\x9f\xda\xee\x85\xb3}\
+[\x9d\x87\xee\x1a\xa1\x9d+\x9c\xcb\xc6\xdc\xbe\xbcYe\
+\xfeQsc(\xcfp\x1c\x9f\x9bm\x9a\x85\x13CY\
+~\xdc\xaa\xa9\xf2\xd5\x94y\xf7\x03TU\xe6O\xa3)\
+\xf3\x22\x0a\xe8\x22\x22\x22\xb2\x01\xb4\xa5Z\xb7\x0d\x05X\
+\xed\xe9W\xe7\x7f\xb2l\xc7\xfe\x0b\xc3u~}\xe2\xc1\
+q\x06\xeaA\x95\xdb\xe5\xaa\xde\xd1\x1d\x03\xc0\x9e4\xf8\
+\x1e\x87\x8f,\xfd{\xcfs\x80\xe9$)O\x81\x1d\x0c\
+\x9d)\xf3f\xbe\x0f8L5e~\x16\xcd\x96\x17Q\
+@\x17\x11\x11\x9152pw\xdaQ\xdf\xad\xbb\x91\x04\
+\x98\x9f/\xbek\xef\xd1\xc6\xa3kY{N\x1e\xb9m\
+\xd7 \xf7\xed\x19\xd2\xe8\xb9l\xd6\xc0~\xa9I3&\
+\x81w\x9b\x1b\x18\x989\xb8\xe5\x01;\x8fq\xcc\xf0C\
+\xc0\xebV\x8d\xbc\x1f\xe8\x84\xf7\xb3h\xca\xbc\x88\x02\xba\
+\x88\x88\x88\xf4 $\x5c\xdc\xd7IVd\x89qv\xa6\
+\xf1c\x17\x16K\xb0>\x03\xbaC\x92\x06\x9exh\x9c\
+4\x81v\xaev\x95kV\x06l\x07\xb6\x9b\xf1(\x0e\
+\x86\x819f4pN\xba\xfb1`\x1f\xf8>\xdeY\
+e\xbe\x5cz\x1f\xe9\x13H\x14\xd0EDDD\x81\xd3\
+\x1dKkj\x88n\xbfX\xa561\xdfX\xf8D,\
+\x1c\xebs\x04\xddK\xe7\x96\xdd\x03\xbck\xd7\x00y\xae\
+X\x22\xd7\xadA`O\xe7xb\xa9\x0f\xd0c\xc4\xb0\
+\xe9\xe1v\xfd\x94\x9b\x1fdqq?\xd8\xde4\xc4\xb7\
+W\x99\x17Q@\x17\x11\x11\x91\x1b(\x9c\x9b3\xdfL\
+\x99\x9f\x09\xd5tUY9X\xbb16\x1c\x1fn4\
+\x8a\xdd\xd5\x8c\x83\xfeG\xd0\x07j\x81`P\xaaY\xe5\
+\xc64\x19\xdc&\xc1\xdf\xed\xad&\x981\x90\xe5\xe0\xe4\
+\xc0y\xc3\x8e\xa619\x0c\xbc\xeee\xbct\xca\xfc\x19\
+`A\xcd'\x0a\xe8\x22\x22\x22r]\x06\xce\xc1z\xa4\
+^k\xab1\xbaT\xcf\xfc\xe1\x85V\x5c\x87\xb6\xd7\x94\
+^\x11\xe0\xedKE.N\x99\x0fn\xefs\x80\xa2\xc0\
+\x0cR\x8b\x0d\x87\x13\xc1\xed8\xb0\xcf\x97\xaa\xccW\xe1\
+\xfd\x0d\xaai\xf3\x22\x0a\xe8\x22\x22\x22r-\xa6\xf3*\
+%\xa67o\xc5\xeb\x83\xa0\x22q\xab\x0b\x81t\xe6\xec\
+\xfd\x8d\x86v\x9a\x12\xb9\x0a\x06\x81;\x0c\xbb\x03xb\
+\xe9\x83\xcc\x02t\xc2\xfa\xddj\x22Q@\x17\x11\x11\x91\
+k\x93\x01f\x94\xc7O\xe0\x1e\xd4\x1e]\xf2\xba\xdd\xd2\
+.M\xc3\xdf\x22\x9b\xcb\x94\x9a@\x14\xd0EDD\xe4\
+\xfa\x08\xea\xd2\xad\x01\xb0\x9dy\xeej7\x91\xcdE\xd3\
+ZD\x01]DDD\xaem\x8e\x91\x17\xa9F\xd0\xbb\
+e\x0c\xd5<N\xe5\xc5\xda\xd7\xa0\x07C!_DD\
+\x01]DDD\xa4\x937\xcd\xa9\xa7\x85\x02z\xf7\x01\
+}\xc4\xdd\x06\x8a\xd2\xd7\xa1\xed\xd5\x9c\x22\x22\x0a\xe8\x22\
+\x22\x22\x22\x1d\x0eD\xb4\x9c\xba\xfb|\xcedt\x06\xcb\
+\xb8\x86-\xd6DDD\x01]DDDd\x99\xc0\xa9\
+\x91\xdc^\xda\xcb\x18u\xf7ZQ*\x9f\x8b\x88H\x7f\
+4gMDDDd}\x0c\xbbC\xa9-\xe9DD\
+\xa4O\x1aA\x17\x11\x11\x91\xe5\x99\x11\x92\x84\xa85\xe8\
+\xdd5\x17>\x14\xf3HQ\xaa\x8a\xbb\x88\x88(\xa0\x8b\
+\x88\x88\xc8z\xf1\xea\x88\xee\xb8kD\xb8\xab\x80n\x0c\
+D\x9c\xb5\x17\x89s\x82\x992\xbe\x88\x88\x02\xba\x88\x88\
+\x88H'&\xba\xe31\xe2\xae\xa8\xd8U{\x19\x03\xd5\
+\x14w\xb5\x85\x88\x88(\xa0\x8b\x88\x88\xc8:2\xc0\xdc\
+T\xc6\xbd\xdb\xf62\x06=v\xd6\xa0\xabOCDD\
+\x14\xd0EDDd\xfd8Xg\xae\xbbt\x91\xd0\x19\
+\x8c\x80k\x04]DD\xfa\xa4\xaa/\x22\x22\x22r\xd9\
+\xc4)=\xb5\xd7\x80;Z\xb3/\x22\x22}\xd3\x08\xba\
+\x88\x88\x88\x5c\x86_r\xc8\xaa\xf1\x1c\x06\xab\xa2zj\
+\x0b\x11\x11Q@\x17\x11\x11\x91\xf5\x0c\x9cf\x98\x19\x1a\
+I\xef\xba\xbdj1\xaeO@\x0f\x89\xdaSDD\x01\
+]DDD\xa4\xa3\x9a\xae\x8dF\x84\xbbm/\xc8\xdc\
+\xc1q\xd4\xa9!\x22\x22\xfd\xd0\x1at\x11\x11\x11\x91\xf5\
+Q\x8b\xea\xd0\x10\x11\x915\xd0\x08\xba\x88\x88\x88\x5c\x86\
+\xd6\xa0\xf7\xc2 \xbb8\xc5]\x03\xe8\x22\x22\xa2\x80.\
+\x22\x22\x22\xeb%\x89\x09YL\x88\xae\x09w]\x84s\
+,t\x02\xba\x9ac]\x04\x83\x10\x8c\x10 \x98\x11;\
+\x15\xf2\xcb\xd2\x89jd\x11Q@\x17\x11\x11\x91\x1b&\
+\x1ca\x1c\x1d\x9f\xa5=2\x83EU,[M\x19\x9c\
+]\x8d\xd1`\xe7\x92u\x99\xe2~#\x0e\xc0\x87`$\
+\xa1\xfa\xb5,\x9dF+23\x9fs~\xae\xe0\xdcl\
+\xce\xd9\xd9\x82V+\xf2\xbe{G\xb8{\xf7\x10y|\
+\xcb\x86\xf39p\x1e\x98\x06\xe6:\xbf.\x02M\xb8X\
+\x14\xa0\x0e\x0c;\x8c\x83O\x186\x01L\x01\x99\xee`\
+\x11Q@\x17\x11\x11\x91M\xcb\xcd\x19n\x0e0\xc4(\
+D\x8d\xa0w\xd3^u\xcfB\x83\xc8z\x8c\xa1\x07\xb3\
+\x1b\x22\xa4'\xc1HS#F\xe7\xc2B\xc9\xe9\x99\x9c\
+\xa3\xa7Z\x1c;\xdd\xe6\xf4L\xce\xec\x5c\x0e\xad\x08\xf5\
+\xc0-;\x06x\xf0\xaeavo\xad\x9f_\x0c\xf9k\
+\x89\xdb\xb3\x89\x87\x17\xddx\xcd\x9c\xa3\x8e\x9f7\xb7Y\
+\x8c|\xe9\x0aT\xbb\x10t\x16it\xd6\x1e\xc4P\x02\
+\x9ef\x9eL4\x8bdK\x12\xca\xdbR\xf3w;\xf6\
+\x10\xf0\x00p\x170\xae\xbbZD\x14\xd0EDDd\
+s\x04N`\xa2=@\xdd\x0d\xd7\x14\xf7\xee\xc2f\xea\
+\xe1\x9c/\xaaH\xdc*\xcc K\x0c\x0c\xce\xcd\x16\xec\
+?\xd6d\xef\xb1\x06\xc7\xcf\xb4\x99_, w(\xfd\
+b(\xbf\xef\x8e\xc1\xe2\xce]\x83\xcfl\x9d\xc8\xbe\x98\
+\x04{*\xe6<\x7fd\xf0\xc2\xa9\x89\xc6\x00#y\x9d\
+\xd2\xfaj\xf0\x028\xeb\xceY\xe0u\x83/\xb8u\x82\
+|\xb4\x9d\x84\xf8\xa09O8\xf6]\x06\x0f\x03\x83\xba\
+r\x22\xa2\x80.\x22\x22\x22W-\xa1[\xe2\x90E\xd5\
+\x88\xeb6x\x06B\x8c\xaa\xe2\xbeb0O\x03E\x19\
+\xd9{\xac\xc9_\xbd>\xcf\xfecM\x1a\x8b\x05`\xd5\
+\xdeB\xa5S\x1bJ\xb8o\xcf\x10\x8f\xdc3\xfa\xe2-\
+\xdbk\xbf\xeb\xb5\xf2\xb3e\xc1\xf3e\x1bJs\x127\
+\xae\xf0\xfc\x827\x807\x0c\xfe\xbf\x22D\xa2\x87\xbb\x92\
+h\x1fK,\xfeM\xb0'\x80!]M\x11Q@\x17\
+\x11\x11\x91\x0dLS\x10cI,\x0b\x8d\xa0w\xc9-\
+h\xb1\xfeediU\xe4\xed\x95\x83\x8b|\xed\xc59\
+\x0e\xbf\xd1\x84\xe8\x90\x04\xc8\x02\xe4\x914\x0d<\xfc\x9e\
+Q>t\xdf\xe8\xe7\xc7\xb7\x86\x7f\xe3\xed\xecOc\xf4\
+V\xab\x1d17jW\xeb\xba\xc2\xde\x08{\x13\xf8\xbf\
+\xca2\xdc\x9d\x84\xf8\xc3\x18?\x06\xdc\xab++\x22\x0a\
+\xe8\x22\x22\x22\xb2Q\x19]\xbb\x85\xf5\xd6^\x89k\x1f\
+\xf4\xb7\x08\x01ji\xe0\xd0\xc9&_zz\x96}G\
+\x1a\xd5\x1f$\x86%\x86G\x87\xdc\xb9\xe3\xd6A\xbe\xfb\
+\xfd\x13_\xb9m\xdb\xc0\xaf\x14\x05\x7fz!o\x13J\
+\xa7\xb6\xf9n\xc0\xd7q~\xc5R\xfb\xd5\xd2\xfd\x07B\
+\xe4\x7f\x02\x9e\xd4\x95\x16\x11\x05t\x11\x11\x11\xb9\xa2\xa2\
+\x1b\xd1\x0dw\xc5\xf4n8\x84\xf5\x0a\xe7v\x1d\xf4\x8e\
+\xd4R\xa3\x99;O==\xcd\xd7\x9f\x9f\xa3\xc8#d\
+\xe1\xe2\xcb\xf2<20\x10\xf8\xc4c\x93\xa7\xdew\xdf\
+\xe8/\x86`\xbf\xd1j\xc7\xe8\xde\x99\xee\xbe\xb9\xb5\xdc\
+\xfc3\xe6\xf6\x19\x82}\xca\xdd\x7f\x1ex\x5c\xef\x02\x11\
+Q@\x17\x11\x11\x91+\x926\x97~\xd1\x80p\xd7\xb1\
+:uw\xdc\xbd\x93\xb0\xd7\x18\xd0\xafa\x03\xb5\xc0\xd1\
+\xd3-\xfe\xe8\xab\xe79~\xa2Y\x05\xf3\xec\xcd\xd4\xed\
+\xed\xc8\xce\xed5~\xe0\xbbw\xfe\xf1m\xdbk\xffs\
+c\xaey\xa0\x8c\xd7B._\xd6\xe7\x02\xf6y7\xfb\
+o\xdd\xe3/\x06\xb7\xdb\xa3m\x9ew\x8dYU-\xdf\
+\xec\xcd\xd9\x1d\xee\x10\xa3\xeb\xbd-\xa2\x80.\x22\x22\x22\
+\xd7NH\xb77\x0f\xe9*\x0b\xdd\xe8\xd3\xdb\xcd\xa0\x96\
+\x05\x9eym\x9e\xcf\xfd\xe5y\x9a\xcd\x12\xab]\x12\xcc\
+\x1dh;\x0f\xbd{\x94O=>\xf6\xbf\x0dN\x0d\xff\
+R\xa3\x1d}=:5\xae\xb2\x12\xf8m\x87\xcf\xcd\x0d\
+\xb4\xfe\xc9H\xab\xf6?n\x86\x93\x0a\x01\xca\x12N\x9d\
+oS\x94N\x08\x90\x981P\x0f\x8c\x0d'\x98\xab\x03\
+ND\x01]DDD\xae\x91\xb4\x85\x16\xa1\xf7\xc8/\
+m\xbb\x1bL0H\x12\xe3\xcf\xbf3\xc3S\xdf\x99\x01\
+\xe3\xad\xa3\xe6\x0e\x14\xce\x07?8\xdcx\xff\x07\xc7~\
+\xaa\xde\x0c\xff\xae\x9dG\xaexD4\xab\x8e\xb2\xc4\xcc\
+0\xb7+y}N\x9f\x1e\x99\xff\x99\x91\xd6M\x7f\xe6\
+\x1e\xff\x95\x19\xb7]\xbd\xeba\xe4E\xe4\xbf\xfc\xf9Y\
+\xf6\x1fkV\xd7\xa3\xf3\xba33\x1e\xbc{\x98\xef\xfb\
+\xf0\xd4\xe9\x08\xff'\xd1G\xdc}\x02\x98\xa0\xda\x03~\
+\x02\x18\x06F:\xc7(\xa0\x22\x88\x22\x0a\xe8\x22\x22\x22\
+r\xb5\xc2y\x08U\x91m\x15=\xeb:\x07&1\xde\
+\x98C\x92!\x18\xc1\xe0\x8f\xbfv\x9eo=7WM\
+i\xbf$\x04\xbb\x03\xa5\xf3=\xef\xdbr\xfe\x9e\x8f\xd9\
+\x8f\xec\x0b\xb3_\xd8:?u\xc5\xce\xc7\xa9\xa63X\
+\x9aRZ\x8a\xa5\x09\xbe\xb0@H\x8d\x10\xabY!\x0e\
+d\xc1\xabi\xf5!\x01\x8f\x17\xf3<\xd6\x7f\xbfA\xc0\
+p\xc2\xef\xbb\xfb3\xc1\xfc7\x83\xdb'\xca\xab0\xe5\
+=\xcb\x8c\xaf>w\x81}\xfb\x17\xa1\x1e\xe0\x92\x02\x86\
+\xad\x22r\xe8D\x93\x08OY\x92\xfc\x22^VK3\
+\xf0j\x0b\xbb\xaaS#\xf5\x18G\x80\x11w\x1b\xc5\xd8\
+\x8e\xfb-\x8e\xed\x09\x89\xdd\x8f\xfbw\xe3>\xa9w\xbe\
+\x88\x02\xba\x88\x88\x88\xc8&\xed\xd6\xb8\x01\xc3\xb9U\xc7\
+\x1f~\xf5<O\xbfx\x99p^8\x9f\xf8\xd0\xe4\xcc\
+G\x1f\x9a\xfa\x1b\x87\x8bs_\xb9\xd2\xdf@-vN\
+`\x95i\xf3f^e\xf1$\x81\xe8\xc4\x22R\x16N\
+\xadV\x15\xb9\xcbc\xff\xc1\xda\x8c#\xad\x98}z6\
+k\xfc\xabm1\xf9\xa9\x8d,\xb6\x18\x0c\xe6\x17K\xfe\
+j\xef\x02d\xf6\x8efp\x9c\x9d[\xeb\xd4\xcc\xbfT\
+\xb4\xda\x90,;8^\x003\x9d\x03\xe0\x15\x00\x8fF\
+\xc8\x0cJ\xff_\x22\xfc3\xbd\xedE\xd6\xf9\xfd\xab&\
+\x10\x11\x11\x11Y\x9ft\x1e;U\xf5\xd6\x1a\xc5\xc25\
+R\xc6\xdd:\xd3\xda\xff\xe4\x1b\xd3\xcb\x86s\x00\xf2\xc8\
+\x87\x1f\x1e\x9b\xff\xf8\xc3\xe3\x7f\xb3\xc8\xcb\xaf\x5c\xb1\x19\
+\x19\xde)\x97\xb0\x86\xb5\xec\xc1\xe0\xd0\x1b\x0d>\xff\xed\
+i\xf6\xbd\xd1\x22M\xad\xef\x873\xa0pk\xed\x9b\x98\
+\xfd\x1f\xa2\xf9/m\xe4\xd5L\xd3\xc0\x91\x93-\xa6g\
+rH\x96\x7f\xe6\xdbv\xd4\xdbV\xaf}\xd5\x07\x07 \
+M\xbb\x9f1`\xe0y\x89G\x7fV\xefz\x91+\xf0\
+\xfeU\x13\x88\x88\x88\xc8\xb2i\x87j\xda\xabk\x8e{\
+\xd7\xf9\x8e\xf5\xdcf\xed\x1aP\xcb\x8c\xa7\x9e\x9e\xe5\x1b\
+\xcf\xcdV\xeb\xcd\xdf>R\xdb\x8e<t\xf7X|\xe8\
+\xe3\xd9\xdfo\xcc\x17O\x0d\xc4\xb4S\x98l\xfd\xee)\
+s\xc7\xa8\x8a\xcc\xad\xc7\xa3\x06\x83C\xa7\xdb\xbcpp\
+\x91\x0f\xdc\x93\xf0\xd8\x03\xbb\x08k\x08\xe9\xc1\x8d\xd2\xc3\
+/\x96^k\xa5\xd6\xfe\x95\x8d\xb8.\x86\xb3\xf7\xe8\x22\
+\xc4\xce\x94\xf5K\xaf\x89CVO\xd8\xb5m\xe0\xb5X\
+\xf8kD\xc7\x9dj\x19@Y\xac\xfa\xb8\x89\xc5\xa5v\
+>\x064\x81\x01\xbd\xf5E\xd6\xf3?$\x22\x22\x22\x22\
+oM<\x94eF\x91\xd7\x08\xa1\xe0\xcd\xcd\xd6t\xac\
+|\x10n\xa4\xce\x8c\x81Z\xe0\xb9\xbd\x0b<\xf5\xed\x19\
+H\x97\x09\xe7yd\xd7\x8e\x01\xbe\xff#[\xfeai\
+\xf1?\x97\xee\xb8U\x81\xb5\x16\x935\x85i\xef\xdc\xa7\
+\x10\xb1+\xb0\xe8?K\xab\x17s\xe8h\x83\x13\xa7\x9a\
+,4\xdbU\x819\xeb\xef\x5c\xdd!Z\xf2O\x0d\xff\
+'W\xfc\xedk\xd0hE\x0e\x9fl-?z\x1e\x9d\
+\xa9\x89\x94\xc9\xd1\xe4\xabE^\xe4\xb1,\x89\xb1\xc4=\
+\xae\xd23d\x98\xa5\x98\x05\xcc\x12,$\xe70k\xe8\
+\x03SD\x01]DDD\xae\xe8\x17|'o\x0f\xf0\
+\xda\xcb\x8f\x13c\x8a\x99F\xd0{\x0a\x8e7\x80Zf\
+\x1c;\xdd\xe2\x8f\xbfz\xbe*\xc8\xf6\xf6p^:\xc3\
+\xc3)\x9f\xfa\xc4\xc4\x7fJ\x07\xc3\xafN\xcd\x8d\x11\xc8\
+h\xa6\xb0\xa51\xc2\xfd\x17\xb6\x90\xa7\xb1\xaf\xe7.-\
+r\xd3\xe2\x00\x83E\x8a_\xc1{\xd3\x0c\xd2$\x10=\
+rn:\xbfd\xab\xb2\xdeRz\xea\x81\xc4\x02\x899\
+f\xe1\x97\xcd\xc2\xbf\xb9\x92\xd7&I\x8c33\x05\xe7\
+\xe6\x0a\x96\x1d\xfa/\x9d[\xb6\xd6\x19\xa8\x85/E\x8f\
+Uq<\x8f+V\x83\xac\xd6\xeaG\xdcJ\xdc:\xbf\
+R\xb6qo\xea]/\xb2\xbe4\xc5]DDD\x96\
+\xf9\x92\x9fs\xfc\xe8}\x8c\x8e-p\xf7}_\xa4\xc8\
+\xebj\x94\xd5\x05_\x1a.\xbd\x8e\xeb\xc5\x85\x00\xcd\x96\
+\xf3\xd9\xbf8O\xa3\x11\xb1\xcc\xde\xd9K\xe1\xce\xf7~\
+h\xcb\xcbwN\x8c\xfcL\xd1\x80\x1a\x09K\x13\xdb\x0d\
+\xeb\xfcLB\x11S\xf2\xd0\xee>4Sm\xcb6p\
+\x85\xc3\xf9\xdb\x83\xba\x19\xcc7\x0b\x9a\xed\xc8\xd6\xf1\x8c\
+\x91\x91\xac\xab\xde\x98\x92\xc8p9\xc4p}\x80\x1c\x07\
+\x06\xf0\x18\x7f\xb6\xcc\xdb{p\xff\xd4\x15y\xef\x06\xe3\
+\xc8\xc9&\xb1\x1d\xdf\xb2\x07\xfd\x9b\x17\xd0\xb8uG}\
+\x0e\xf8&\xcb\x14\xae[j\xd7e\xef\xe0\xb7\xbe\xe66\
+0\xaf\xb7\xbd\x88\x02\xba\x88\x88\x88l\x80,kq\xe0\
+\xb5\x0f2:z\x9c\x9boy\x95\xbc\xad\xa5\xa6+q\
+,\xb9\x11\xa6\xb8g\x89\xf1\xf9oLs\xe2ds\xd9\
+\x00\xe8y\xe4\xbd\xf7\x8e\x14\xb7=\x98\xfets\xde\xce\
+\xc7\xcc\xdf\x96\xec\xfcb\xdc&o`D\xa2\xd9e\xbb\
+4\xaaP\xef\x04\xe2\xc5\xb5\xeb~\x15fu\x043\xca\
+\xe8\x9c\x9cn1\x9e;\xe3\x13\x81`U\x97\xc1\xb2\xe7\
+\xed\xce\x80\xe5\xecZ\x0c\xb4c\xe3\x92\x9f\xf3\x02\xfc'\
+\xc0\xfe\x02\xb8s\xbd\xcf3F\xe7\xe0\xc9\xd6\xb2\xd3\xd5\
+\xab\xf5\xe7\x81\x1dS\xb5\xe7\x8a\x18\x0f_\xae\x1d\xad\xbb\
+\x0e\xa6\x16pA\xef|\x11\x05t\x11\x11\x11\xd9\x00\xd5\
+\xd4v\xe7\xe5\xe7>\xce\xd0\xd0,\xa3\x13\xa7)\xcbL\
+\x0d\xb3RH_\x8f\xdc\xe8U\x18\xb4M8a\xbe\x9e\
+\x05^9\xb4\xc8\xb7:\x15\xdb\xdfq\xea\xa53>\x9e\
+\xf1\xc9\xf7O\xfe\xcbZ\xc3\xbe\xdc\xf0UF\xc7\x8b\xa5\
+}\xb7/\xf3\xa5\xd4\x9c,Z5\xfe\xbe\x96P^\xad\
+\x1f\xdf\x92\x04\xee2\xb3\x1d\x06%p\x8ch{\xcd}\
+\xc1\xbb\x7f\x18\xc0\x98\xb9\x90\xd3h\x1b\xdb\xc6j\x0c\xd4\
+\x93\xb7\x5cw\x07RJ\xdc \xc3\x19l'\x94V\xbe\
+m]\xa9\x9dt\xe3'\x22|\x01\xa8\xad['B0\
+\xe6\x17KN\x9ek\xc3r;\xa7\x95\xce\xd4\x96\x8c\x9b\
+\x86j\x7f\x11\xda\x90\xf9\xe5_h\x11\x1c\xf7\x15\xa3z\
+\xdb\xf1\x053\xbd\xefE\x14\xd0EDDdC\x84P\
+\xd2X\x1c\xe5\x95\xa7?\xc1#\x1f\xfd=\x92P\x10\xa3\
+J\xd8\xdc\x98\xf7\x02,\xb6J\xbe\xf0\xed\xe9\xaa\xea\xf7\
+r\xc1,:\x1f}d\xfc\xe5\xf1\x91\xda/\xb7\xda\xde\
+)k\xdf]\x82s\x9cK\xc7\xa3\xcd\x9c\xe0\x91\xb0\xd6\
+\xe5\x02\xb1\xfc^\xcb\xcb\xbf\xdb\xcc\xe3\x933\x0b\xc5\xcd\
+K\x1d)\xc1\xa0^\x0b\x07\x06k\xe1s\xf5\xcc~+\
+\x96\xf6L;v\xdf\x16\xed\xb6s\xfc\x5c\x8b\xad\x135\
+\xc6\x87R\x96\xb6L/\x81\x22\x06\xc0\xb9\x18\xcb\x97\x09\
+\xc2\x11\xbe\xe2\xf0\xcfS\x8b\xffx\xdd\xbe\xd8\x078=\
+\x93sa\xbe\x5c\xfe\x02Eg\xd7\xd6\x1ag\xb7\xcd}\
+e\xbe,\x96\x1d)_\xbab\xdbgG\xc9b\xb2b\
+\xc7\x88A\xaew\x86\x88\x02\xba\x88\x88\x88l\xe4\x97\x85\
+\xb4\xcd\xb9s\xbby\xf5\xd5'y\xf0\x81?\xa5(j\
+j\x94e2\x9b\x19i\x19\xaf\xdf\x17XK\x03O=\
+3\xcd\x993\xed\xcbNm\x7f\xd7\xed\xc3<\xf0\xee\x91\
+\x9f_l\x97\x0b\xfdL\xf7O;\x0f[/\x03\x81r\
+m'l<\xe6E\xf1\xbf\x9b\xfb\xf7$\x18\xa7gr\
+~\xef\xcf\xcf2\xdf\x8c\xa4\xa9\x11\x02\xa4I\xb8c|\
+8\xf9\x99][k?u\xcfm\x83\xff\xe1\xf6\x1d\xf5\
+_\xcc\x12;\xdc\xd5\xc3w\x96\xd2\x9f\x9an\xd1jG\
+\xa6\xc6k\xa4\x1e\x98l\x0cS\xc4t\xd5~\x09wH\
+\xcd\xffij\xc5\xf7\x17\xc4\x87\xd7\xe3\x1aY0\x8e\x9d\
+n\xe3\xc5e\xd6\x9f\x9b\xb1k\xeb\xc0\xe9\x0b\x1e\x9f\x9e\
+\xc3/\xbb\xce<\x98\xb3\xcd\xde\xb2C\xc1\xe5\x1a\xa1\xd4\
+[_D\x01]DDD6XVkrh\xdf\x83\
+l\x19;\xce-w\xbcH\xd1V\xd1\xb8\x1b\xea\x0bc\
+j\xbcq\xb6\xcd7_\xbc\x00\xe9\xf2k\x9bC\x0a\x1f\
+{d\xcbg\x07\xa7\xb6}\xb6\xdd.\xfb\xa8\x93g\x94\
+\xe60;M\xc8\x8b\xb5l\x06of\xfe\x0bn\xfc#\
+w\xaf\x03\x14\xa5\xb3\xe7\xe6\x01~\xe4\x93\xdb\xf8\xfc\xd7\
+\xa79r\xac\x01\x99\xd1\x22\xb20_\xf0\xc6\x89f\xfa\
+\xed\x97.\xfcw\xb7\xde<\xf0}{v\xd4\xffa\x9a\
+\xd8oww\xc6`f\xcc\xcc\x17\xb4\xf2\xc8\xf0N\xc8\
+\x80\xc5\xb1\xd9n\xcf\xb5\x99[\xfc\xb9-\x8b\x83\x9fO\
+\xdc\x92\xb5.j(K\xe7\xc8\xc9\xe6e\xd7\x9f\xa7u\
+c\xfb\x96\xfa\xd3c\xc7'\xcen)\xfd\xf2\x1d\x07I\
+\xa4>\xdc \xa6\xcer\x85\xe4.\x09\xf3\x85\xde\x1d\x22\
+\x0a\xe8\x22\x22\x22r\x15\x84P\xf2\xf2_}\x17\xe3\xe3\
+g\x19\x9d<E\xa9\x91\xf4\x1b\xe7\xda\x9b\xf1\xd5\xe7f\
+i7\xca\xe5Gf\xf3\xc8\x83\xf7\x8d\xb7\x17\x1fY\xfc\
+\xe5\xaf\x97\xaf`Y\xef\xcb \xa29{\xce\x0e3\x95\
+g\xc4\xfe\xc3\xf9\xa8\xbb\xff&\xc6\xdfz\xfb\x1f\x14\xa5\
+\xb3{k\x8d\xbf\xfb\xe9m\xfc\xd9wf\xf8\xda\xb3s\
+\x90\x18\x96VQ\xdb\x81#o4\xb7\x1d9\xd5\xfa\xad\
+\xc9\xf1\xf41\x0b\xfc\x0c]N\xe1\xae*\xdbG\xce-\
+6\xa8os,v9\xad\xdf\x9c4\x86/N\xf9\xe0\
+\xef\x00?\xb6\xb6\xf7'\xd5\xfa\xf3\xf3\xf9\xf2\xeb\xcf\xa3\
+\xb3e\x22cr,\xfb\xb2Y\x83d\xc5m\xd5\xc0\xcd\
+.\xd6\x07X\xe1\x15\x94\xb8\xb6a\x14Q@\x17\x11\x11\
+\x91\x0dg!\x927\x06y\xf1\xe9\xef\xe6}O~\x86\
+$)\x89\xb1\xda>K\x088i\xbc\x0e\xb7X\xcbR\
+\xe3\xe0\x1bM^\xdc\xbf\xb8|a8\x87Z=\xf0\xe1\
+\x87'\xfe\xd3X\xba\xe3\xe9\xc5\xa4\xe8\xb9\x05\x1c\x83\xb2\
+`$?w\xb1R{\x1f\xc6\x81\xff\x17\xf8\xd8\xe5~\
+ /\x9c\x10\xe0S\x8fm\xa1\x9e\x05\x9e\xfa\xf6\x0c$\
+U\x085\x80\xd4p\x87\xe9\xd9\xe2'\xb3\xcc\xb7\xa7\xa3\
+\xe1G\x81Ew_5\x87\xba\xc1\xf0\x89A\xb6\xcd\xd7\
+\x99\x18I\xe9e\xb5C\x11\xe2/\xbb\xf1\xd7\x81\xd1~\
+_|\x12\xaai\xfc\xf3\x0b\xc5e\xd7\x9f\xdf<U\xf7\
+\xb1A\xbe\x92\xe7\xc5\xaa\xd7#\xcfW\xbf\x8a!\xac\xa5\
+/ED\x14\xd0EDDdM\x924\xe7\xfc\xd9\x9d\
+\xbc\xfa\xe2\xe3\xbc\xf7\xe1\xa7:\x01]\xdf\xd0\x97\xfa0\
+\xd6\xab\xaf\x22\x04:\xed\xba9:?\xbe\xfe\xe2\x1c\xb1\
+\x88\xcb\x8f\x8c\xe7\x91\xf7\xdc7\xd2\xd8\xb5}\xe8\x9f\x17\
+\xc7\xe7\x18\xec\xf7\x94\x17\x1bD\x0c7\xe8\xb6`{p\
+c\xa1^\x10b2\x90\x16\xf6;\xd8\xe5\xc3\xf9\xc5\x9c\
+\x1a\xa1\x95G>\xfe\xe8\x04\xf3\x8d\x92o??\xf7\x96\
+Y\x01K\x813o\xf1\x83\x0b\xed\xdao\x9a\xd9\x8f\xd6\
+ki\xf4.\x12\xb7\x03sEA\xdd\x03I\xd2\xd3\xab\
+\x7f\x0d\xf8\xb7\xc0\xcf\xf6\x7f\xcf\x18\xc7N\xb7\xf0\xc2\xb1\
+\xda\xf2\xef\xc9\xdd\xdb\xea\x87c\xb4\x17\x8aUG\xf8\xad\
+\xcb\xf7\xb5:\xe7D\x14\xd0EDD\xe4\xea~y\xc8\
+\xda\x1c\xda\xf7\x00\x93[N\xb2\xfb\xf6W(rMu\
+\xbf^e\xa9q\xe4T\x8b\xbd\x87\x1boVp\xbb4\
+\x9eu\xf6\xd5\xfe\xe0{\xc6~/6\x9a\xaf\xc4\xa2\xf7\
+\xc0vq\xce\x81U\xff\xd4Kw\xcf\xd2\x14l7\xff\
+\x97\x86}o\xb7\xcf\xee^My\xffk\x1f\x98\xe4\xd8\
+\x996'N\xb5\xb0\xb7\xaf\xadO\x8c\xe3'\xdb\x7f\xfb\
+\xe8\xa9b\xff\xf7=6\xf5\x8f\xda=\xbc\xb6\x18\x9dv\
+\xab\xdd[\xd7\x95\xf3kn\xfc80\xd6\xcf\xb5\xaa\xd6\
+\x9f\xb7\x96\xcd\xd5\xee\x90d\x81\x9d[k\xdf,\xa3\xcf\
++v\x8bl^\xda'EDDDzcNHJ\
+^z\xf6\xa3\xcc\xcel%IT'\xeab0\xbb\xde\
+.\xb5\xc17_\xba@\x99\xc7\xe5k\xb6\x15\x91\xbbo\
+\x1b\xccwlO\x7fm\xc1sZI\xd1\xd3\xd1L\x0a\
+\x0a+\xabam\xf7\x9e\x8fh\xce@;\xfd\x91\xac\x08\
+?\xed=N\xe4(\xa33P\x0b|\xef\x07'I\x12\
+{\xc7\x14v\xeb|S\xfe\xc6\xf3\xd3\xff\xeb\xb13\xcd\
+\xbf\x9ef\x19\xd1\x12bX\xe5\xb0\x04O3\xd2,\xc5\
+,b\xe6\xdd\x1e\x07\x81\xff\xd8\xd7\x17\xfa`\xcc7\x96\
+\xd6\x9f/?\xbd}|4ej<\xfd\xb2\xe3\x98\xb1\
+\xe2!\x22W\x8fF\xd0EDD\xa4\x8f\xe0\x16i\x17\
+u^\xfa\xe6w\xf3\x81\x8f\xfd\x17,\x94\xb8\xdf\xd0\xdf\
+\xec\x03\x84\xe4z\xaa\x97\x95&\xc6\xa9\xf39\xaf\x1dn\
+,_\xb9\x1d\xb0\xc4x\xf0\xae\xb1/\x15y\xf2\xadX\
+\xf47\xee\x13\x86\x07 M{\xaf5f@Q\xec\x88\
+\x8b\x8b\xbf\xdao\xaal\xe5\x91;v\x0ep\xff]\xc3\
+<\xf7\xf2\x05x[\x01<\x0bFc\xb1\xb4/}\xeb\
+\xfc\xbf\xfe\xe0\x0f/|k\xd7\xb9\x91\x93\xdd\x16\x80\x03\
+\xa7\xb0\x95\x8b\xa0\xbf\xf3\xaf\xc4\xdfH<\xfc8\xd0\xd3\
+\xb4\x94$\xc0\xa9\xf39\xf3\x8bE\xb5\xc1\xfb;\x02:\
+\xec\x9a\xaa\xe5Cu\xbe\x96\x17\xe5\xea\xcd\xe5\x8a\x08\x22\
+\x0a\xe8\x22\x22\x22rMI\x92\x9c\xd9\xb37\xf3\xdas\
+O\xf2\x9e\x0f|A[\xaf]g\x8b\xf1\xd3\xc4x~\
+\xdf\x02y\xf32\x95\xdb\x0bg\xd7\xcdu\xee\xd8U\xfb\
+\xb7e\xe9\xbdgd\xa7\x1a\xae\x8dN\xcc\xf3>Z\xdb\
+\xf0\xa2\xfc9`\xd7Z^gt\xe7\xb1\xf7\x8c\xf2\xf2\
+\x81\x05\xf2r\x99\x11\xe4,\xf0\xd2\xc1\x85[\xee\x7f\xbd\
+\xfeK\xe5\x96\xdaO\xe6]&\xee\xea\xe5E\x92\xb2\xdd\
+\xcb\x8bz\x06x\x0a\xe3\x93\xbd\x05t\xe3\xe8\xe9\x16\x5c\
+n\xfd\xb9;\xb7\xdd2\xbc7\x0c\x8f\xbe\xea\xcdU\xb6\
+\xb0s\xc7\x1b9\x22\xa2\x80.\x22\x22\x22\xd7ZHO\
+\xdb\x1c>\xf0\x00\x13\x93'\xd9}\xd7\x0b\xe47xH\
+_\xaf\x11\xf4\xab=\xcd8\x04\xb8\xb0X\xf2\xc2\xfe\x85\
+\xe5\xa7LW\xc9\x96\x07\xde5r\xa0\x9e\x85\xcf\xb5\xda\
+e\xef\xfd\x13\x9dJpes\xb1\xbf6\x82[\xcc\xc2\
+\x8f\xaf\xb5\xb1\xf2\xc2\xd9\xb9\xb5\xc6=\xb7\x0e\xf1\xe2\xde\
+\xf9wT\xaa7\x83\xb2\x1dy\xe9\xd9\xe6\xdf\xbb\xfbG\
+\xb6\xfc\xdf1\xd4\xbeE7\x15\xe30\xac,\xf0\x93'\
+\xa9~\xbe\xeb\xad\xd7~\xdbz\x0c\xe8E\xe9\x1c=\xd5\
+Za\xff\xf3\x84][\x93\xaf\xb7[\xcdV\x8c\xab\x95\
+\xa3G\x8b\xd0E\x14\xd0EDD\xe4Zd\xe6\x18\xce\
+\xfe\xa7\x9fdt\xea4\xa3\xe3g)\xcb\x1b\xf7\xeb\x85\
+\xfbR\xba\xb15\xb6+Wu<>K\x02/\x1f\x9b\
+gf\xb6X~z{\x84\xe1\xd1\x84=\xb7\x0c\x7ff\
+\xb6\x91]p\xef\xadd\xb9S\x15B\x1a\xac\x95$\xfd\
+\xb65\xf1\xbf!2\xb1^\xaf\xf9\xc1\xbb\x86yq\xff\
+\xc2\xf2W/\x0d\xbcz\xbc\x91\x9e\xdb\x7f\xec\xe7\xb6\x8c\
+\xa4?\x5c\xc6\xee\x13lH\x02\x84\xa4\xfb\xd0k\xf6'\
+\x1e\xcbc\xb8\xef^\xf6\xbe\xe0\xad\x1dAI0.,\
+\x96\x9c<\xdf^~\xff\xf3\x22\xb2s\xf7\x10[\xa7\x06\
+\xbe\x98\xe7y\x97\xe7\xa1\x88 \xa2\x80.\x22\x22\x22\xd7\
+\xa4\x10JZ\x8b\xc3\xbc\xf8\xcc'x\xffG\x7f\x97\xc4\
+\x22\xd1U\x87\xf6Z\x16\xddy\xe9\xe0\x22D_\xbe\xae\
+z\x11\xb9s\xf7h11\xc1g\xdaE\x83~f\xb7\
+\xa7nX\x0c}\x0d\xd6\x9a\x91\xe2\xfc\xd7\xeb5\xd0\x9b\
+\x17\xce\xed7\xd7\xd96U\xe3\xf4\xd9\xf6;:%,\
+@k\xb1\xe4\xd5C\x8b\xdf\xff\xe4\xa3\x13\xf7\x15\xed\xf8\
+r\xf7'\xdb\xa9\xcal\xdd\xfe\xb8\xcfD\xfc\x0f\x1c~\
+\xda\xac\xaa\xa4o\x18etbt\xcc\x8c$5\xf2\x22\
+\xe2^\xcdv8;\x93\xb3\xb0\xf8\xce\xf9\xf9\xee@\x09\
+\x0f\xde9tzp\xdb\xd6?k\x15\xabl\xdd\x17\x8c\
+8\xdf\xa0<7\xb7\xfcZv\x11Q@\x17\x11\x11\x91\
+k\xe0\x0bE\xda\xe6\xd4\xb9\x9d\xbc\xf2\xea\xfbx\xf0\xbe\
+o\xd1o\xc10\xb9\xfa\x92\xc487\x9bs\xf0\x8d\xe6\
+\xf2[\xabu\x82\xdc}\xb7\x0f=\x93\xe6\xe931\x8f\
+}>\x0fx\xe8/b\xbbs\xbf\xc3\x03\xeb\xf5\x9a\xdd\
+a\xb0\x9ep\xf7-\x83\x9c>\xddZ>M\x07\xe3\x95\
+\xc3\x8b\x03\x8f\xbdw\xf4o\x85\xc8/u\xbb\x9c\xc1\xf0\
+\xa5\x8d\xed\xbb\xee\xbc0\x0b\xbf\x0f\xf1\xa7\x8b\xd2y\xe9\
+\xc0\x22\x87N6\x99[(\xc9\x0b\xc7\x80]\xdb\xea<\
+\xf9\xe0\x18YZU\x9f\xaf\xd7\x02i\x1a(\xda\x11\xbf\
+\xb8$\xc1\xa1\x84{\xef\x1e>\xf3\xd0\x9d\xc3?\x93\x1f\
+;q\xa6\xab\xe7\x8f\xa1\xa7\xf3\x15\x11\x05t\x11\x11\x11\
+\xd9\xa4!}\xdf\xcb\x1f\xe0\xe6\xc9\xd3l\xddy\xf0\x86\
+\xdc\x1f\xbd\x97\xa9\xcf\x9bU\x96\x18\xfb\x8f7i.^\
+\xa68\x5ct&\xc6Sn\xbfy\xe0\xb3i\xf02d\
+}\x04b|M[\xd2\xb9\xf1q\x9cl=_w\x8c\
+\xce\x9d\xbb\x07\xf9\xcb\xe7\xe6p_f9wb\x9c<\
+\x97s\xe6|\xfe\xe9mS\xd9\xaf\xe4\x85\x97\xdd>\xb6\
+\x11\x09=\xac\x95w\xf7\xaf\xd7\xd2p\xe0\xd9\xbd\x17\xee\
+\xf8\xc3/\x9e\xad\x86\xe0\xcd.\xf6\x1b\x1c:\xb4\xc8\xd8\
+p\xc2\x87\xef\x1f\xa5\x99\xc7\x7f\xbd}*\xdb\xff\xf7\xbe\
+\x7f[x\xfa\xd5\xf9\xc1\xb3\xb3\xc5@YBj\xd6\xa8\
+\xef\x8c\xaf}\xf2\xdd\x13\xdf\xc8\x12;^\x16]\x0c\xe2\
+;\xbd\xce~\x19\xd2'\x9f\x88\x02\xba\x88\x88\x88lB\
+f\xd5\xea\xdd\x97\x9f\x7f\x92\x0fN\x9c\xa1Vo\x10c\
+\xa2\x86\xb9\x06;\x19^?\xd2\xb8|\x9a+\x9d;w\
+\x0f\x14\x83C\xe1\xf3\xad\xdc\xfb[+\xefT{\x9f\xf7\
+}\xaf\xd9G\xd7\xfbu\x17\xd1\xb9\xf9\xa6\x8c\xa9\x89\x94\
+\xb3\xd3\xef\xdcO\xdc\x0c\x8aV\xc9\xa1S\xad\xf7\xde\xbc\
+\xa3vg\x01\xaf\xf5\xd2\xa3\xe0eO\x9d7\xf3\xc0S\
+E\xe1w\x90\x18\x96\xbd}\xea\xbaq\xf4d\x0b\xee\x1f\
+\xc3\xe0\xb7\xdc\xfd\x99\x1dS5\xb6m\xa9\xd1jG\x8a\
+\x02\xb2\x90\x90M\xe6US{\xd7\xa7Ib=\x5c\x17\
+\xe33\xc0,\xb0\x1d\xd8\x02\xdc\x04\x8c\x03u\xbd\x93D\
+\x14\xd0EDD\xe4*K\x92\x82\xb9\x99m|\xfbO\
+\xff\x06O\xfc\xd0\xbf\xc7=\xdc\xe8\xfb\xa3\xf7%\x5c\xa5\
+2\xeeIbL_(\xaa-\xbb\x92\xe5\xf7>'\x18\
+\xf7\xdc6\xf4\x22\xf0\x82\xf7Y\xee;q0\xfa\x9dF\
+\xedc%<\xb4\xde\xaf=F\x18\xaa\x07vo\xabs\
+\xf6l\xfb\xb2\xd5\xeb\x0f\xbd\xd1\x1c|\xec\x91\xad\x1fH\
+\xd2\xe4\xb5\xee_\xbeS6\x9a\xd5t\xf7n\xa7\xc6\x87\
+\xf0\x85\x91\xa1\xe4'\x96\xef\x001\x1a\xad\x92\x22:\x06\
+\xc3PUr\xcfs':\x9d\xc3\x89eo;\x0b\x98\
+A\xd2\xc35\x8d\xd8\xaf;\xfcz\xc0\x89X\x06\x8c\x19\
+6\xe6\xb0\x0d|;\xcev\x8c\x9b\x81\xdd\x98m\xc7}\
+\x1bf\xdb\x80\x09\xdcG\xe8q\xbfw\x11\x05t\x11\x11\
+\x11\x91^\xbf\x5c\xa4-\x8e\x1d\xbe\x97\xa3G\xee\xe5\xd6\
+[_!\xbf\x81\xa6\xba{\x5c\x9f\xc7\xb9d6\xf3\xc6\
+^\xbb`\x1c>\xd9\xa2\xb9\x18\xdf1j[%2g\
+l4e\xd7M\xf5/\xc6\x82v\xd2g\xe7K#\xcd\
+\x89\xd6\xe7\xdau\x0f\xef\xae\x15\xc9\xce+\xd3\x02\xc6\xad\
+\xdb\xeb<\xfb\xca\x85\xcb\xf5\x9cp\xe2\x5c\x9b\x85\xb9\xc6\
+c\x83\x83\xb5\x7f\x1f\xbbN\xbfF0\xc3c\xf73\x0e\
+\xca\xc8\xd7F\x06\x93\x19Kl\xe2\x1dS\xee\x0d\xda\x05\
+\xc4\xb2z<\xf7ji\xc2\xc4h\xc2\x91Sk\xdfE\
+\xa0O9p\xaes\x1c|\xe7=\x1d\xf0\x98c\x03C\
+\x03\x84d\xd4\xe7/\xdcD\xb0\x7f\x00\xf6\xe3\xfa\xd4\x14\
+Q@\x17\x11\x11\x91+\xc5 \x84\x82\x17\x9f\xfd.\xc6\
+F\xcf16q\x96\xb2\xb8!\xber\xd8\xb5\xbe\x02\xdd\
+\x81C'Z\x97\x1f\xe5-\xe1\xd6\xedu\x86\x07\x93/\
+\xb7\xfb,\x0e\x87U\x15\xdc{\xdd\x9a\xed\x92F~/\
+pE\xd6N\x94\xb1\xda\x13=\xad%\xd5\xe8\xb4\xbd3\
+\xa0\xcf\xcd\x97\x9c\x9b\xcd\x1f\xb8u(\x0be\xec\xaeK\
+\xc6pb\x19\xc9\x8b\xee\xcf\xa5\x08~ld(}~\
+\xa0\x1e\x9el4\xdfY\xa1=\xc6j\x1d\xff\xd2<\x04\
+w\xe7\xbe\xdb\x07\x99[(x\xfdH\x8bl\xb3\xf6\x8b\
+\x995\x09\xa1\x09~\x06\xec\xa0>0E\x14\xd0ED\
+D\xe4\x0a\x0b!\x92\xe7u^z\xe1\x09\x1e{\xfc\x0f\
+\x08\x81\xeb}\xaa{0\xb3k\xfa{\x95\x19\xb4\xf2\xc8\
+\x89\xb3\xed\x15\xe3\xef\x9d\xbb\x07\xcfY\xe2\xdf\xa6\xec\xaf\
+;\xc2\x1c\xb2\xb2\xff*\xe1\x0e\x0f_\xa9\x8e\x90\x18\x9d\
+\xc9\x91\x94\xb1\xe1\x84\xf3\xb3\xcb\xafC\x8f\xed\xc8\xa9s\
+\xed\xbbn\xd9\x9en)\x8bx\xb6\xfb~\x09\xa3\x96\xf4\
+rC\xe1\xc9 \xdf\x18\x19\x0cO6\x1a\xef\xacG\x17\
+\x1d.\xdd\xb4\xdd\xbd\xda\x19\xedC\xef\x19%\x96p\xf8\
+D{}\xab\xe8\xad\x97\xa2\xa8\xa6\x9aT\x1d\x0e\x19\x22\
+\xa2\x80.\x22\x22\x22W^\x92\xe6\x9c:q\x1b\xaf\xbe\
+\xf8a\xee{\xe8+7dU\xf7k\xac\x87\x81\xd9\x85\
+\x82\x99\xf9\xe5\xcb}\xbbCZ7v\xdeT{\xb6\xcc\
+\xfdd\xdfe\xd8\xad\xaa\xe2\xde\x7f@\xb7\xbb\xafT\x1b\
+\xc4\xce\x96e['2\xceO\xe7\xcbwT\x18\x9c:\
+\xdf\xde\x92\xd8\xd8mI\xf0\xee\x02\xba;\x84\x04\x9b\x1c\
+\xaf\x82\xa9w\xd7Nu/\xbfv\xd3\xf8y\xce\xbc}\
+M\xbcu\xba*\x969\xff\x10\xe0\xf1\x07FIl\x81\
+\xa3\xc5\xfc\xe6\xba\xc9\xcc\xf0\xbc\x0d\xed\xe5\xca\xe4\x8b\x88\
+\x02\xba\x88\x88\x88\x5cQY\x96sp\xef\xc3l\xbb\xf9\
+\x107m;JQh\xc0l\xd3\x06\xf4\x00\xb3\x17\x0a\
+\x9a\xad\xb2\x1a\x8a}\xbb\xd2\xb9iK\x8d-\xe3\xe9w\
+\x1c#\x84>\x03\x96\xfbZ\xd6\x02\x0cc\xbc\xebJ.\
+%H\x12c\xc7T\xc6k\x07.\xb3\x96\xdb\x8c\xb3\xe7\
+\xdbi\xb9e\xea]\xc9\xd0\xf0\xd3]Ug7\xa0\x8c\
+\x14\xe7\xa6;U\xdb\xbak\xbb4\xf5\x17\xb6o\xa9\xcd\
+\xbf\xb2oad\xb9\xcc\xbf\xdc3\xc7X]\xbe\x0f\xbe\
+g\x84l\xa6\x80M\xb3\xee\xc2\xdf\xd2\x86\x22\xa2\x80.\
+\x22\x22\x22\x1b\xcc,\x12c\xc6K\xcf>\xc1\x87?\xf6\
+\x19B(q\x0fj\x98\xd5\xc2\xf2U\x080\xc1\x8c\xb3\
+\xb39\x94`\xcb]\xa2\xe8\xec\xbc\xa9F=\x0b\xcf\xb4\
+\xda\xfd\xa7>\xf35e\xc6m^m\xe5u\xe5b\xa4\
+;7Md\xcbwRt\xc2\xf6\xf4b\xc9\xe2\xb1S\
+\xf7\xd43\xebz\x0b3\xdcYh\xd6)\xca\xa4\xebj\
+\x05\xb5,\x1c\xdd\xb6\xa5~\x90\x84\xf7\xf6\xf2\x1a\xaa\x91\
+t\xe7}S\x13P\x82\x97\xdeU\x97\x80\x03i\x0c\x04\
+\xb7U\xaf\x91\x01\xed\xe0\x94]\xbd\x16\xc7c\xa97\xb6\
+\x88\x02\xba\x88\x88\x88\x5cmIR0s~;{_\
+\xf9\x00\xefy\xe8+\xe4\xed\xebw\x8b\xe4\xf5\x1a\xac\xbc\
+*\x03\x8c\x06\xe7\xe7\x8a\x15Gxo\x9e\xaa\xe7\x16\x92\
+\x97,\x89}\xb6\x8f\xd3&\xef\xbb\x9d\x02\xb6;-\x93\
+\xd1+\x1b\xd0ar,%\xa4U\xf8^\xaeP\xdc|\
+#\xb2\xd0\x8c\xf7\x0c\x0f\xd5(\xcb\xee+\xb9\x8f\x8c\xb4\
+)(\xb0.G\xd0CB\xbe\xbdL\x9e\x1f\x1cH\xdf\
+\xdbh\xc5\xe5;N\x96\xfb{\x06E\x09Y\x9a\x10,\
+\xe2]V\x9bO\xa2qtl\x8e\xb9z\x8b\xd5*\xf4\
+\x97\xe6l[\x18f\xacY\xa74\xbf\xb8l!\x10:\
+[\xbbU\x15\xe6\x0d\x8d\x96\x8b(\xa0\x8b\x88\x88\xc8\xe6\
+\xfa\xc2\x91\xb59\xb0\xf7!\xb6n;\xc2\xd6\x1dG\xae\
+\xcb\xa9\xeeN\xb5\xf7\xf4\xb5\xaa\x8c\xce\xec|\xb1l\xef\
+\x80;XjLM\xa4gb\x8c'\xe8\xf3u\x1aN\
+\xb2\x96\xc0\xe6\xb6\x8b+\xbc\x87X\x8c06\x9424\
+\x10\x98_|g\xf5t\x0c\xf2<2\xbbP\xec\xda\xb1\
+%\xa3\xe8~\x08\x1d\x0c\x92^\x0a\xd0\x9709l/\
+l\x9dH9r\xa2u\xf9Q\xfdKCv0\x16\x9a\
+\x91\x03'\xdb\xdc\x7f{Z\xb5V\x97\xa7\x18\xdc\xd8\xbb\
+\xe5\x1c\x07&\xa7\xa9\xc5\x95{\x03\xdaI\xe4\xb1\xa3\xbb\
+\x19o\xd5(\xc2\x9b\x1d6\xf1m\xc5\x09\xcc\x8d$j\
+\xd6\x8c\x88\x02\xba\x88\x88\x88l\x1afN\x8c\x09\xcf>\
+\xfd\x09>\xf2\xf1\xdf\xa5^o\x10c\xa2\x86\xd94\xd7\
+\x07\xca\xd2\x99[(/\x1b\x7fkY`|$9\x92\
+\xc7b\xa6\xf4\xfe+\xb8'kY\xe2`\xdc}\xa5\xbb\
+@\xa2;C\x03\x81\x91\xc1\x84\xf9\x85r\x99S\x00/\
+\x9c\xd9\x0b\xc5\xcdE\x0cCy\x19\x17{8\x7f\xe8e\
+\xf6\x81C\xadf/\xdd~\xf3\x00G\x8e7W\xed\x9b\
+H\x82\xd1hG\x9e\xdd\xdf\xc4\xac\x93\xe7{l\xb04\
+\x06jeB\xb6j\xa86B\x17;3\xb891D\
+\x82B\xba\x88\x02\xba\x88\x88\x88l\x1eI(Y\x98\x9f\
+\xe0\xd5\x17>\xcc\xc3\x1f\xf8S\x05\xf4\xcd\x14\xd0\x81f\
+;\xb2\xd8\x88\xcbg\xc0\xe8\x0c\x0d$\x0c\xd4\xc2a\x9c\
+\xd8\xf7\x10\xb6\x19\xbe\xb6\x01\xf0\xddW\xbc1\x1c\xd2\xc4\
+\x18\x1bN8y\xe6\xf2\x0d6\xb3\x10\xb7-\xe6\xb5\xf1\
+V\xe1\xdd\x05t7B(\x19\x8e\x0b=\x9e\x8f\xef\xbf\
+\xeb\x96\xc1\xc6W\x9f\x9b\x1b\x8c+\x14?OBu\x0d\
+\x9f\xdd\xd7\xe4B#29\xbay\x02q4\x07\x85t\
+\x11\x05t\x11\x11\x11\xd9d_<\xb2\x16G\x0f\xdd\xcb\
+\xf6\x9d\x07\xd9y\xcb^m\xbd\xb6Y\x02z0\x9am\
+\xa7\xd1\x8e\xcb'@\x87\xa1\x81\x84z\x15\xd0\xfb_W\
+\xbc\xb6\x02q\x18l\xdd\x80|N\x1a\x8c\xb1\xe1\xb4\xb3\
+\xd9\xf8\xf2\xaf\xf5\xc2B>2Zon\xaf\x85x\xa2\
+\xeb\x076Hn\xbe\x0d\xab\xd5\xe8j\x99\x80\x19\xee\xf1\
+\xd8\xae\xf4\xf8\x99][k\xb7\x1e=\xd1\x82\xcc\x96\x09\
+\xe7o\x8e\x9c_h8i\xd8|\xeb\xbe\xa39\x1e\xa2\
+\xa6\xbb\x8b(\xa0\x8b\x88\x88\xc8\xa6\x0a\x83\xe6\xbc\xfc\xfc\
+\x13LM\x9d$\xab/j$}\xd96\xda\xd8\x80e\
+@+\x8f\xb4\xf2\xcb\x8c\xa0;\x0c\xd6\x03f\xe9\xb1v\
+\xde\xff\xf3$\xa1$X\xbf\x1b\xa8\x13\x80\x9dlD\xd1\
+1\x83\xf1\x91t\xc5\xa7\x9ao\x94Y\x8c\xbe\xddzi\
+d\xa0\x9c>\x0f!\xe92\xa0\x03\xce|\xdd\xfc\xf8c\
+\xef\x1d\xbd\xf5\xe8\x89&\xfe\xb6i\xe5I0\x16[U\
+8\x9f_\x8c\xa4\x89\x11\xe3\xe6\xbc\xaf5\xdd]D\x01\
+]DDD6\x99\x10\x0a\x16\xe6&y\xee\xa5\x0f\xf0\
+\xbe\xf7\xff\x19\x5c\x1f\x01\xdd\xb8\x86ww6\x83F+\
+\x12K\x87d\xf9\x84^\xaf\x05R+O\xac%[\x05\
+|-U\xbd\x07\xe2\x15\xdeb\xed\xe2\xabu\x18\x1dJ\
+.\x7fE\xcdXlFb\xc9\x96,XO5\xf3\xda\
+\x8b\xf3\xc4\x9e\xe6\x11\x987C8\xf0\x9e=\xc3\x8f}\
+\xf8\xe16_{n\x0e\x0a\xc7\x0c\x06k\x81F\xbb\x5c\
+|\xf1P\x9bF\x1b\xea\xb5\xea\xe2D\xab\x82{_7\
+\xf1\x15^\xe4\xaf\xe9\xee\x22\x0a\xe8\x22\x22\x22\xb2\xc9\xd4\
+\xb2\x9c\xbdG\xde\xc5\x8e\x1d\x87\xb8u\xf7~\xf2k\x7f\
+\xaa\xbb\xe1$\x9bu\xe4\xb2\x9b\x80\xbe\xd0(\x97\x0a\x8d\
+/\x9f\x8ek\xc1\xcd8\x15\xcc\xd7\xd8L}\x1b\x07\x1f\
+\xd9\x90\x80\x8e32\x18.\xdf\x18\x9d\x0e\x8dV\x11o\
+\xaa\xa7Io\xd5\xfb-`\xbd\xb7\xe1\xe1\x22:\xdf\xf3\
+\x81I\xde\xb3g\x98/|k\x9aS\xe7\xda\xfc\xd1\xd7\
+\xces\xfeB\xf9\x0b\x8b\xcd\xf8F\x12\xde\xdc\x84-\x96\
+n7mI\xe3\xa3w\x0e\xb5p\xffM\x87\x17\xba\x09\
+\xe7ms\x16k9e\x88\xabv\xa3\xe4IY\x85\xed\
+>Czg\xba{K\x9f\x86\x22\x0a\xe8\x22\x22\x22r\
+\xd5\x13aU*\xec\xe5\xe7?\xcc\xd6-\xa7\xa8]'\
+U\xdd\xaf\xd5]\xd6\xcc\x8cF+^~\x0ft\x87z\
+\xcd\xf2\xe8\xe1lQ\xf6\xff\x22C\x12\xd72\xcd`\x0a\
+gl\xa3\xae\xe3`=`I5:\xfe\x8es6h\
+\xb5#E\xc9\xaeZ\xd6\xdbu7\x0b\xf4\xb1\x12\xff\xb0\
+{Ui\x7f\xcf\xcdu\xbe\xf7\xb1I~\xe3\xf7O\xf2\
+\xcd\xbf\x9a\x85\xc4~\xe8\x1d\x97\xacp\xf2\xb2\xbe\xd4q\
+\xf0\xb5\xae\x02\xba\x1b\x0b\xb56\x03\xed\x1a{\xceO\xad\
+:\x92^$\xceh\xab\xfe\x04\xd8.\xf3\xbe.j\xee\
+\xc6\xc3\xe6\x88\x88\x02\xba\x88\x88\x88\x5cmIR2?\
+7\xc9\xc1\xd7\x1f\xe2\xbe\x87\xfeBk\xd1\xaff@\x07\
+\x9a\xed\x95+\xb8\x0dd\xa1af\x17,\xf8\x9a\x9eg\
+\x0dC\xe8\xe3\xc0\xc0F\x05\xf4\x81ZB=\x0b4[\
+\xcb\xac\xcb7\xa3(\x9dV\xbb\xdc12\x98\xd0K>\
+u3\xb0\xd0\xeb\x09\x1d\xc3\xab\xe9\x19\xcdvdj,\
+c\xcbD\xc6\x99sml\x99%\x09\x0e\x847\xa7\xb8\
+\xe7\xdd\x9d\x973\xd8\xae\xf1\xd8\xa1=\xdd_\xcd\xa4\xf8\
+\xc7\x1e\xe2\xf7$\xae\xf7\xae\x88\x02\xba\x88\x88\x88\x5c\xfb\
+_D\xb26\x07\xf7>\xc4\xb6\x9d\x87\xd8\xb2\xf58e\
+\x91\xa9Q\xae\x02\x07Z\xadr\xc5\x9f\xc9\x12\x9bMB\
+\xb9\x90\xf4Y\xe4\xcd\xcc \xac\xe1\xab\xa7\xfbp\x8c\xe5\
+\x86\xb4G\xacf\x0c\x90\xa5F\xb3\xb5\xfc\xac\x82\x22:\
+\xcd6\xa31\x06\xca\x1ef\x15\x989fE\xaf\xa7t\
+\x16\xac\x04\x92\xe8P\xcb\x8c-#)g\xce\xb4\xe12\
+\xd98\xc6\xfezB\x8a\xd0\xfd\xf5\x0d\xe6\x0d\xd3\xdbG\
+D\x01]DDD\xae\x0ffN\x8c\x09/?\xfb\x04\
+\x1f\xfa\xe8\xef\x11B\x89\xbb\x8aG\x85\x0dn\x02w\xa7\
+\xd1^9\xd0%\x89\xcd\x815\xfa\xdd\xc7\xdc#\x98\xf7\
+\x1f\xb0\x1d&6\xb2=\xb24\x90%v\xd9\x11\xff2\
+BQ\xc6\xd14\x94x\x0fa\xd8\xfb+'x\x16g\
+\x9ej\x16\x01!\x18#C\x09\x17\xf7n[\xbe\xbd\xaa\
+\x91t\xd6\xb6\xb5\x9d\x88l\xf0\xe7\xbf\x9a@DDD\
+\xae\xa6$\xc9\x999\xb7\x83}\xaf\xbe\x9f$-\xd4 \
+W\x81\xc7jM\xf5JE\xd1,\xd8\x05'\xb4\xaa\xaf\
+\x8f}\x1c\x16p\xf3\xbe\x0f\xcc\xa76\xf4\xbe\x0cP\xab\
+\x85\xcb\xa7\xdb\xe8\xb4\x0b\x1f'\x90\xbaU\xc1\xbb\x9b\x03\
+\x8cX\x86^\x8fi`\xfe\xd2\xf4=4\x10V\xe9d\
+P2\x17\xb9\x16i\x04]DDD\xae\xfe\x17\x92\xac\
+\xe0\xc8\xfe\xf7\xb2\xeb\xd6W\x19\x1d;OY\xea+\xca\
+F\xb1N\x8ek\x15\x91\x956\xfeN\x12[L\x93\xe0\
+\xfd^\x1a\x8fqM\xfbs;lh@\x0f\xc1\x18\xa8\
+-\x1f\x82\xcd\xc0K\xc8\x8b8aP\xc7\xbd\xe8\xe5\x95\
+\x98\xf5<F\xd6xK@\x07\xea\xd9j\x01\xdd\x95\xcf\
+E\xaeA\x1aA\x17\x11\x11\x91M\x90\x12#y^\xe7\
+\xe5\xe7>RMq\xbf\x16K;\x1b\xbdm\xb7\xb5\x89\
+\xb8C^\xac\xb0\xc7\x1aF\x1aX\x08V\x10\xac\xec\xeb\
+\x80rm#\xe8\xf8\xf8\xc65\x08\x04\x83zf\x97/\
+\xd1\xeeP\x14>jF\xdd\xac\x0a\xed\xdd\x1f\xde\xeb\xd1\
+\x02\xce^\xfa\xf4Yf\xab^S\x11\xb9\xf6\xa8{Z\
+DDD6\xc7\x97\x92\xb4\xcd\xa9\x93\xb7s\xf4\xd0\xbd\
+\xdc~\xe7\xf3\xe4\xed\xba\x1ae\x83:\x16\x1c(\x0a_\
+\xf1g\x821gnX\x1f\xc9\xcf0\x1a\x06\x8b\xf4\xbf\
+\xcdZ\x0a\x03\x83e\xb2!\xa3\xc2N\x15\xa4k\xa9\xad\
+\xf8S\xed\xdc3<\xa4\xbd\x9fT_\x7fa\xe6\xd2\x0e\
+\x94\x95\xcf\xadZ\xb6\xb0\xfc\x1eq\x22\xa2\x80.\x22\x22\
+\x22\xd2\x85$)\xd8\xfb\xea\xfb\xd9\xba\xe30\x03\x03\x0b\
+\xdazm\x83\x941R\x94+\x8d\xa0\x03\xd8B\xa4\xbf\
+e\xcd\x8e\x93Ec8\x865\xe4E\x1b\xdc\xc8A\xe1\
+\x10\xaa*\xee+\xbd\xe0v\x113\xc7\x07{\x9dL~\
+\xf9\xd2n+\x9a\xb9\xf47Y\x1aV|\x14\x0d\xa0\x8b\
+\x5c\x9b4\xc5]DDD6\xcf\x17\x93P\xb2pa\
+\x8cW^x\x8c\x10\xca\x1b\xb3\x11lc\xab\xb8\x1bP\
+\x96\xac\xbcUX55{\xde\xbd\x1a\x94\xed\xe7\xa8F\
+\xe1\x8d\xfe\xff\xc7\xf0\x06_\x06\xb2U\xd6y\x97\xa5g\
+`C=\xceo\xa7\xf7)\xf1\x80\xb1p\xe9s'\xc1\
+VN\xf9\xee\xc4>{\x02DD\x01]DDD\x04\
+\x804\xcd9q\xec.\xce\x9c\xba\x95$\xcd\xd5 \x1b\
+\x90D\xa3W\xdb\x86\xad\xf2s\x0bK\x85\xc1\xfb:|\
+\xcdIqx\xa3\x9bf\xb5i\xe4\xd1\xa9\x81\x0f\xf7\xde\
+\x1a\xfd\xfc\x8d7\x8b\xc49\x9dN\x9c\x15N\xafjs\
+\xdd\xde\x22\x0a\xe8\x22\x22\x22\x22k\xc9\x8b\xe6x\x0c\xbc\
+\xf2\xc2\xe3\xc42\xc5L)\xe3J'\xf4\x18\xbd*p\
+g\xcb\x07=\x80$\xd8b\x96Z\xb5?x\x1f\xc7:\
+\x0c\xe4nx@O\x93\x95\xcf\xba\x8c\x9e\x02C\x1bt\
+:\x17.\xbd*KK\x05|\xf9KZ\xcd\x5c\xd0D\
+w\x91k\x8e\xd6\xa0\x8b\x88\x88\xc8\xa6\x93\xa49\xe7\xcf\
+\xdd\xcc\x81}\x0fq\xf7\xbd\xdfR\xc1\xb8+\x1a\xcf!\
+FV\xde\x02\xcd\xa0(i\xcd-:y\xd1\xdf^i\
+\x89\xf9Z\xeb\x95\xd56\xb2]\x9c\xd5\xa7\x91w\x96\x05\
+\x0cl\xd0)\xbde\x1f\xf4\xea\xdc\xec\xb2\x0b\xda\xdd\xab\
+Bqvq#=\x11Q@\x17\x11\x11\x11\xe9SH\
+\x0a\x0e\xec}\x88\x9d;\xf728|A\x05\xe3\xaed\
+\x18u_q\x8b8\x0b\xc6\x1b\xe7\x9a\xe5B+\xef{\
+/\xf3\xfb\xf7\x0c1<\x98\xf4\xfb\xf7\x0d\xc86\xba]\
+\x92Un\xb9\xce\xb2\x80\x8d\xea8\xb8pi\xe7A0\
+V]_\xaeX.\xa2\x80.\x22\x22\x22\xb2>\x01=\
+D\x1a\x0b#\xbc\xf6\xe2#<\xfa\xf8\x9f\x13\xdb7N\
+@7l\xe3\xc2\x95UA3F_1\x1d_\x98\x8f\
+^\xe4\xd5z\xf5~Ta\xb6\xef\xd1\xdc\x8d\x0f\xe8K\
+\xa3\xd4+\xa4\xe02:\xe0\x19=Wq\xb7\xde\x9b\xc1\
+h^z&K\xc5\xe3.\xbbM\xbbk\x0d\xba\x88\x02\
+\xba\x88\x88\x88\xc8z~QIs\x8e\x1f\xbd\x9b]\xc7\
+\x0f\xb2\xfd\xe6C\x14Ev\x03\xbcj\xbb*[W\xaf\
+\x96\xe5\x22\x1e\xbd\x8fU\xcd\x17g`\xfb\x9a\x0a\x8a\x07\
+\xae\xc2\x08\xfajk\xd0\xa3C\xbbL\xd2v\x11zj\
+\x8f,D\x92\xdek+\xb4\xfcm\x01}\xe5\xe7q\x05\
+t\x11\x05t\x11\x11\x11\x91u\x8c\xaa\xe6\x94e\xc2\xbe\
+W\x1eb\xdb\x8e#\xf4\xbd\x83\xb4\xac\xd0\x1d\xb04\xc5\
+}\x85\xd4W\x8d\xd4z\xd9\xc7\xa8\xec\xd2\x15\xf3\xb7\xd7\
+$\xef9\xa0[\xb2\xf1\xf7\xdf\xea\x7f\x9e\x1aYi\xbd\
+\xb6y_\xf7p\x9b\xbe\xbaGDD\x01]DDD\
+d\xbd\xbe\xac\xa49\xe7N\xef\xe2\xf0\x81{\xb9\xfd\xce\
+\x17(r\x15\x8c\xbb\x9aa\xbe\xff\xbfgkx\x04l\
+3~o5\x8c$\x89\xb54\xedma}\x04\x8a\x1e\
+\xc3\xb3A\x19.\xd9\xaa.\xd8\xea\xa3\xfb\xda\x07]D\
+\x01]DDDd\xddS\xa1\x85\xc8\xfeW\x1fe\xc7\
+\xae\xc3\xd4j\x0db\xd4N\xb1\xeb)v12\x1e\xa3\
+{\x19\xbd\xef\x11\xf4k\x8d\xe3$\x89uQ\x88-\x06\
+'\xf6xK\x1bI\xef\xfb\xc2k8\x5cD\x01]D\
+DD\xe4\xea\x0b\xa1`a~\x8a\xfd{?\xc2{\x1e\
+\xf8\x1c1j\x14}\xa3,\xad\x1f\xcfs\xb7`\xfd\x07\
+\xf4\xebw=\xb4\x05\xef\xb9\x0b\xa2\xaf.\x0b\xef\xe5!\
+\xdc\xab\xad\xf34\x80.r\x8d\xfd\xf7NM \x22\x22\
+\x22\xd7\x824ks\xfc\xe8\xbb\x99\x9b\xbe\x89\x90\x14\xd7\
+w(6\xc5\xaaM\xf1Ey\xb55\xe8\x80\xbb%\x1e\
+\x8d\xde\x8e\xbeN\xc7\xdfz\x8f\xac\xb4F\xdeT\xc6]\
+D\x01]DDD\xe4J\x86\xd6H\xbb]\xe7\x95\x17\
+\x1e\xbb\xeeG\x05\x95\xcf7\x87.\xf3\xad\xbd\xb9\xbe\xbe\
+\xdbc\x03\xce\x1d\xcd\x89\x17Q@\x17\x11\x11\x11\xb9\x82\
+\x924\xe7\xf4\xa9\xdb8s\xeaV\x924W\x83\xacW\
+\x87@7?\x13\xcc,\x18\xfd\x1e\xd7d@_\xed\x8b\
+t\x00w\xd2\xa5\xc1\xean\x8f>C\xba\xf5\xf2\x93\x17\
+\x8b\xc4\x89\xc85Ek\xd0EDD\xe4\x9a\x0a\x92\x1e\
+\x03\xaf~\xf3#l\xfb\xc1\xc3\x9d\xed\xbbd\xcd\xedj\
+\xab\x8f\xda\x17\x85\x93\x84>\xd6\xa0{\xe7\xb1\xaf\xc3\x0b\
+\x95\x84*\x0b[\xaf\x15\xd9-`I\xd2kC\x9a\xc7\
+r}{\x18DD\x01]DDDdM\xa1(\xc9\
+9{l\x0f\xc7\x0f\xde\xcb\xae;^\xa6\xc8k\x9b\xe6\
+\xdc\xae\xe7<\x14\xdd-\xf6[\xc5\xdd\xd7\xdc6\xd5\xce\
+d\x1b\xc8\xa8\x8a\xac\xadt\xe2!\x18\x18e\xaf\x03\xe2\
+\xd1{\x7f5f$\xbd<\x8d;D%\xf4%\xa5\x9a\
+@\x14\xd0EDDD\xaeTr2\xd8\xfb\xea\xc3l\
+\xdb\xbd\x8f\x10\x1c\xf7\xcd1\x85:\xc6k\xaf9\x9d\xaa\
+(]X*\xb5~\x99\xa1t\xbb\xfa\xa7Yl\xf4\x8d\
+\xe6\xab\xf4F$\xc10\xbc4\xeb-\x08\x07\x22\xd6\xfb\
+BS\xeb\xf9\xfeR>\x17Q@\x17\x11\x11\x11\xb9\xd2\
+\x92\xa4`v\xe6&\x8e\x1f\xbd\x93\xdb\xdf\xb5\xb9F\xd1\
+\xd7!\x17\x12\xc2\x06\x86+\xaf\xaa\x95\x87\x15\xe6\xb8\xbb\
+\xc3\xc8P\x12F\x06\x12b\x8f\x0b\x9b\x97\xb6YKB\
+\xf5\xbb>\x83~th_\x8d^\x81\x95\x03:`\x1e\
+{\x0d\xe8\xe0\xab\x86\xffen\x8c\xe4\xd2\xebaf+\
+\xb6\xe5\xd2zw\x15\x1c\x14Q@\x17\x11\x11\x11\xb9\xe2\
+B(9\xbc\xff\x01v\xdf\xba\x1f\xb3\xb8iF\xd1\xd7\
+)\xa3o\xec\xf3\x05\xab:\x05.\x17\xf6J\xe7\xb6\x1d\
+\x83\xc9\xfdw\x8c\xd0.\xfa\x9b&04\xe0\xc4\xd8w\
+\xbfC\xe4*\x04\xf4\xd5F\xacC0,\xa4\xa5\x85\x1e\
+;-b\x89\xf7\xbe\xd7Zz\xe9\x9d\xb1\xda=\xa2]\
+\xd6D\x14\xd0EDDD64\xa0\xcf\xcdl\xe3\x8d\
+#wq\xeb\xbb^\xbc\xbeF\xd17\xba-W\x19A\
+\xc7ap\xc0j\xdb\xff\x7f\xf6\xde<\xde\x92\xb3,\xf0\
+\xff>o\xd5\xd9\xee\xda\xb7\xf7\xeet\xba;\xfb\xd6I\
+\x9a\xac\xac\x01& `@p\x82 ?\x11\xf53\xae\
+\x0c::\xea8.0*.\xa3\xe3\xb8\xc2\xb8\xcc\xa0\
+\x82\x80\xfc\x14FDA\xb6(\x84M\x88\x84\x00\x09\xd9\
+\xd3\xdd\xe9\xf4\xbe\xdd\xfd\x9eSU\xef\xfb\xcc\x1f\xe7\xde\
+^\xefr\xeal\xf7\x9e\xee\xe7\xcb\xa7\x92\xd0}\xea\xd4\
+\xa9\xb7\xde\xaaz\xbf\xef\xf2<k#jIs\xdd\x07\
+\xd5Zhq\x09\x80v=l\xbf\x0fs\xc9\xca\xe6?\
+\xe7(\x02\x02\x99\xe4</\x0d.\x7f\x87\x92P\xca;\
+Ro~n\x18&\xe8\x86a\x18\x86a\x18]C\xc4\
+\xb3\xeb\xb1\xeb\xd9\xbc\xf51D\xf4\xbc\x1aE\xef\x16\xf5\
+5\xe8\xd4\xd7D/bti\xa6\xe54Q\xd2\xb49\
+\xed\xd3\xd6\x87sk\xdd\xad\x5cK\x8f\xa0\xc7NH2\
+Ig\x92\xc6g=(P\x88\x94\xc8\xe5\x16\xe8\xbe\xbc\
+\xe5\x1dl\x08\xdd0L\xd0\x0d\xc30\x0c\xc30\xbaE\
+\x14e\x8c\x8f\xaec\xd7\x13;\xb8\xe2\x9a\xfbm\x14\xbd\
+9s&rB\xbch\xaerEU\xfb\xc55\xbf\xa6\
+\xd9\x89\xb4\x16J[u\xba\xdbE\xe3\x97Xo\x1fG\
+\x8eB\x94\xa5\xa1\x90wj\x8043\xba\x9dO\xd0O\
+\xfe\xc30\x8c^\xc2Y\x11\x18\x86a\x18\xbd!\x11V\
+\x04\xc6\x02\x8d\x19\xe7y\xfc\xe1g1=\xb9\x0a\xe7,\
+\x9bR3\xb7V\xe4\xe6\x82\xb8-\xfc!U\x06\x90S\
+9\xd3\xf3n\xccE\x89ov\x83\xa9\xae\x0b\xba_,\
+?\x9c\x10\xc7\x00\x92\x9eL-\xd0\xf0\xd6\x14\xfd\xf9\xfa\
+3l\x0d\xbaa\xf4\x226\x82n\x18\x86a,\x07\x11\
+P\x9amp\xf6\xcdn\x15\xd0200\xfb\xe7s[\
+\x19(\xfb\x82\x96\xd5\xd5\xff{v\xdf\xe2\xec{\xac0\
+\xbb\xcd\xfd\xb7\xcc~\x7f\xc4\xa9\xc5\xa3s\xef\xbb@=\
+\x1f\xae\xcc\xfe{\xce\xe62 \x9d\xdd\x923\xfe[\x98\
+\x11\x98\x01\xaa\xd4\xff=\xb7M\xa1\x8c\x03\x93\xe7\xfcy\
+}K\xads\xa1;\x88\xf3$\xd3\x03\x1cx\xe4z.\
+\xbb\xf5^B\x12\xf5~\xa7C\x97CoG\x91\x109\
+Y\xb4\xae\xaa\xea\x80\x13%\x7f\xc4\xf2\xb9\x9c\xe2B\x92\
+I\xd3#\xf0\x91\xd3I'\xdd\xbb\x99\x04H\xfdbI\
+\xd0!\x8e\x04\x84$\xb7s7w\x1aCyw\x08,\
+{z<\xc30L\xd0\x0d\xc30\x8ce\xa02+\xd9\
+#\xc0\xea\xd9m\xdd\xec\xb6FU\xd7\x08\xac\x02]\xad\
+\xde\xad\xaa\xac\x9f\x18\x12\xa7\x15\xf5R\x06*(e\xa0\
+\xa0\xc1\xcf\x99\xc0\x99\x0de\x85\xacp\xd6H\x96\x82\x9e\
+\xf6\x07\xdapkX\xe7\xf9\xdb\xd3\xbeGe\xee\xcbg\
+\xd7\xe6\x86\xb3\x9a\xec\xa7\xed\x17dn*Z\x98\x15\xf8\
+\x9a\x08\xd5\xd2@mZU\xc6\x10\x1d\x13e4-\xea\
+hp\x1c\x03\x0e\x01\x87\x059\x02\x9c\x00\x8e\x03\xc7f\
+%\xbff\x22\xdfB\x83&N\xd9\xfb\xd45l\xbc\xe6\
+\xebT\xcaS\x84\x10Y\xa1\xe4\xec\x10\x88\xa3\xc5\x83\xc4\
+\x85\xc0\xa0\x0f\x905\x1d\xe8M\x89]\xf3\xc6(\xe8L\
+\xb7\xcb%\xcbt\x81\xce\x8a\xfay\xc4\x91C\x83\xe6\xbe\
+w\xe5\xe4\xb4\x82\x1c\xa5\xa7:\x90{H\xdc\x9e)\x86\
+a\x82n\x18\x86a\x9cw\x14f\x85{\x0d\xb0\x05\xe7\
+.B\xd8\x04l\x15e\x93(\xeb\x80\xf5\xce32+\
+\xe9\xe5Sq\xba\xe4\xb4V\xa2\x9e\xfc/W\xc8\x9bk\
+I\x97r\xec\xce\xb4P\x1bo\x0c;N\xcd\x04\xa0\x9e\
+r\xe9\xd4\xbe\xbep\xaa\x08\x04\x99-\x16E\x90Z\xc8\
+\xe2IT\x8f\xa9p\xb8V\xe1\x08\xb0_5\xecAe\
+\x1f\xb0\x17\xd8\x7f\x9a\xcc[\x83{!\xe1q\x81\x99\xe9\
+\x01\xf6<\xb1\x83ko\xfc\x82\x09z\xde[\xc4A\x1c\
+\xbb\xc5\xec\x18\xef\xb5?M\x03Y\x1a\x9a=\xc4\xa2\xa9\
+\xdc\x1a`\xba\x9b\xe3\xc1\x0ad\x8b\x8d\xa0\x8b\x10Gd\
+\x0a\xb9\xd7\xc6\x07\x97\x7f1\xbf\x84Pi\xf8\x99$@\
+\x98\x0d\x12gC\xe8\x86a\x82n\x18\x86a\xf4\xe4\xfb\
+`cp\x5c\x04\x5c\x02\x5c\x0a\x5c\x12Bv9\xaa\x1b\
+\x80\xf5\xa8\x1b\x01u\xb8\xe8d{O\xb4Qa\xd4\x16\
+\x9c\xb9\x8d\xfbvF\xce[\xf9\xcd%\x94\x12\xb0\x06\xe1\
+\xca,\xae\x97\xa9\x9e\x16:Z\xf1\x89\xc0QUwX\
+D\xf7\xb8\x82\x7fBDw\x01\x8f\xcf\x0a\xfc3\xc0\xc4\
+\xc9\xcf\x87\x0b\xb75\x1e\xc7)O\xef\xb9\x96m\x97?\
+D\xa5<i\x92\x9e\xa3\xb6\x0aP*.>\xc5\xdd\x07\
+\xadD*DM\x1a\x9f\xd2r\xff\xd2DW\xcbEu\
+QAw\x0e\xa2H\x12\xea3`\xf2\xc9\xb6of\x1a\
+\x82\x0e\x9f\xd5?\xd0\xe8c\xc8n\x04\xc30A7\x0c\
+\xc30V(\x05\xd0\x0d\x88\xbb\x0c\x91\xab\x11\xae%\xc8\
+\xe5\xc5\x81\xdae\xe2tc\xb5\xe4\x86Q\xd09\xf3\xd6\
+V\xdd\xb7\xd5\xe1\xde\xf3@\xces|T\xe6?n\x11\
+\xd8\x0clV\x95\x9d\xae\xe0O\xee\x17$\xa4\x15_:\
+$\xca\xd3\x01}\x0c\x91G\x8a\x03\xd5\x87\x80\xc7f\xc5\
+\xfd\xd4\xc8\xde\x05\x90~\xcc\xb9\xc0\xd4\xf4\x00{\x9e\xba\
+\x9e\xeb\xae\xff\x9c\x09z\x9e\xb2\x13(\x15\x1c\x8b\xe5\xfc\
+N3\x1d\xf4B!\x08i\xd3wFk\x8f\x84c\xdd\
+\x15t\xa8\xa5a\xc1\x11\xe8\xd9e\x01\x89\x04\xa6\x5c\xce\
+\xf3\x0a\xf9\xd7\xd2\x0b\xc8\xc8\xe9\x05X\x9f%/\x8b\x17\
+\xaa\x82\xaa\xb8\xc6\x1fi6\xdcn\x18&\xe8\x86a\x18\
+F\xa7\xa8\x00\x17\x07\xc7\xb5\xc0\x8d\x1ad\xa7\xaa^\x89\
+f\x17K\x1c\x0f\x9e\xdeV\x96sZ\x97+a\x1e\xf5\
+\x85%\xe7\x0d\xef{\xe6\xc7\x0aNe\x0b\xe8\x16\x85\xe7\
+\xa20\xb8\xe9\x18\x1a\xa4\x86r\x00\xe4q\xe0\x1b\xc0\xfd\
+\xae\x90}S\x9c\xee\xa2\x89\xd1\xbe\x9e\x12\xcd(e\xcf\
+\xeek\xd8v\xc97\xa9Tzx\x14]\xba\x7f\xbc\xa5\
+F\xd03\xaf\x03\x82V\x84\xe6\x04]TZ\xba\xbf\x14\
+\x8ev\xab\x9f\xa9\x1e\xd4\x0e\x92T\x17\x1c\xaav\x02\x85\
+\xd8\xa5DQ5w\xd2\xb4\x90;\xdb@\x11tu\xde\
+\x9dB\xb051\x86a\x82n\x18\x86a,\x17[\x80\
+k\x11n\x09\xe8\xad\xc0u\x91\xca\xb6\x10QO\x0c\xdd\
+\xf0\x8cJm\xc3G\xda,\xb9\xda\xc6\xdf\xde\xcbr\xde\
+\xc0\x97\xcdNq/\xa1l\x07\xb6#\xbc4\xf8\x88\xfe\
+\x0d\xc7\x02\xc2\xd3h\xf4\x08\xc2\xbf\x81\xfe+\xf0M\xe0\
+\xe9\xf3J\xd0]`ff\x90=\xbbvp\xdd\xf5\x9f\
+\xefYA_\x22\xa0z\x07\x8e'\x94\x0b\x8b\xafA\xcf\
+\xbc\x0e+RA\x18o\xf68-\xfa\xe2X7;,\
+\x82*\xc9B\xeb\xed\xb5>\xc5=\x8eI}\xf0\x99\xcf\
+\xf3\xecP\xc9\xff\xa8\x11J\xc0\x90\xe4.o\x13t\xc3\
+0A7\x0c\xc30\xba\xc5e\x82\xdc\x84\xf2\x5c\xd0\xdb\
+q\x5c#\xe8\xaa\xd6\x9ac\xda\x06\x07\xedA9_6\
+1\xef@y-\xf4\xc7\xf5\x80\xf3\xdbg\xb7\x97\xd7?\
+\xe7\xc6Q\x1eU\xe1\xbe\xe0\xb8\x17\xf87\xe0\xc9^\xbf\
+1\xa28e\xcf\xeek\xd9~\xe9\x83\x94m-z\xc3\
+\x94J\x8bGp\xcb\xbc\xf6\xbb\xa0\xfd\xae\x05\xcb\x0e\xad\
+\xa5I\x9b\x04\x09\x80\xebFy\xd4\xa7\xb8/\x14dM\
+\x89\xa3\x888\x92qU\xadi\xde\x19>\xf9g\x02\x0c\
+\xc9l\x10\xca\x93\xb7\xb4,\x91\xb2N\xc1\x9b\x9f\x1b\x86\
+\x09\xbaa\x18\x86\xd116 \xdc\xaa*/Vx\x81\
+\x88\xee\x10\x95\x0am\x1b!Yar\xde\x13S\xda[\
+\xfd\x89]\x92\xf3\x85?4\x04\xdc\x8ark\x1a\xf3f\
+\x90\x19E\x1fR\xf8\xbc \x9f\x06\xbe\x02\x1c\xe9\xb5\x1b\
+\xc5I`ff\x80\xddO\xf5\xf6(z7Q\x85J\
+\xd1\xd5\x87\xee\x17\xa0\x9aj9\x08\xab\x83\xf0T\xf3\x07\
+ji\x8e\xfa\x18\xf5\xb8\x0a\x03\x9d.\x8f\xb9\x1c\xe8\xe9\
+\x22#\xe8\x85X\x88DN\xa82#9\xef\xdc&J\
+a\xcd\xd9\xe7\xbd\x98\x9c\xcf\xadL\xd7\xfa\x12zi8\
+`\xbc\x9e\xb7\x89\x22\xac\xab\xc20A7\x0c\xc30Z\
+&\x02n\x00^\xac\xa2/U\xb8u\xb6\x91\xb6@\x93\
+\xa3\x83\xa3\xc0&\xe7\xad\x1d\xbb[r\xde\xfa\xbe\x15E\
+oA\xb8E\x90\x9f\xd4\xa0G\x83\xa4\xf7!\xfaI\x85\
+{\x80\x07{\xa5\xa1\x1b\xc7\x19{v_\xc7\xf6K\x1e\
+\xa4\x5c\xb1Q\xf4\xa5k\x85\xd2W\x8e@\x16\x12H!\
+I\x82\x0b\xca\xda\xa0\xcd)\xa6\x00\xc1\x05\xb4\xf9*t\
+\xc2\x85hR\xba!\xe8\x22\xd4\xd2@\x92-<\xda]\
+,\x08\x91\x93\x13\xa2\x92k&\xb9\x88\xce\xa6\xc0\xc8\xc5\
+ZTJ\xa7\xff\x81\x93\xa5\xaf\x82*\xb8\x88\xd85\xb8\
+\xc4I\x15\xf0\xe7e\x0d\x0fv\x97\x1b&\xe8\x86a\x18\
+F3\x94\x81\xdb\x15\xbe\x1d\xf86\x90\x1bT\xd5-\xee\
+Y\x1d\x16=\x93\xf3\xd6\x8e\xdb\xc1\xf5\xe6]\xb8Nk\
+U\xc3+\x80W\xa8h\xe6\xbc>\x80\xf0I\x85\x8fR\
+\x1f]\xcfV\xea\x8d$s\xa3\xe8\xbbwp\xdd\x8e\xde\
+\x1bE\x97.\x07\x89S\x85\xbe\xb2Cdv}\xb4\x9c\
+k\xd7I\x1a\xf0*\xeb]\x145u\xfb8\x15\x8eV\
+\xa6\x99,\xd4\xea\x01\xe3\xf2\xfeFab\xd3\xc4\xe0D\
+)\x8b7\xaah\xc7\xcb\xbf\x96\x06\xd2l\x81 qZ\
+\x8fz\x1fGL\xa2\x9a\xaf\xbbB\xc9?\x93@X\xd7\
+\xcc\x19[\x908\xc30A7\x0c\xc30\xf2\xabV\x11\
+\xe59\x12\xc5\xaf\x06\xf9vT\xaej|g\x93\xf3\x0b\
+G\xce\x97\xfd:\xc5\xa8\xde\xa2p\x0b\xf0\x0b\x82<\xa8\
+\xf01\x85\x7f\x00\xfeUt\xe5\xc9z\x14\xa5\xec\xd9u\
+-\xdb\xb7\x7f\x93re\xaaw$]\xe6\x9c\xb0{r\
+\xa5\x0a\xe5\xa2#\x8ae\xfe\xdc\xdf\x02I\xa6\xf8,l\
+.\xc4\x8e\xa6\xb2x\x8b\xb2n\xaa\x9f\xb5\xda\xd7\xec\xcf\
+\xac\x22\x1cV\xd1+\xba\xd1A\x92$\xb3\x82\xbe@\x81\
+\x15\x0bB\x14\xc9\x894kfMy\xde\x1dt\xdb\xd9\
+w\xa4\x93\xa5;rr\xc7\xa2s\x10\xc7\xae\xe1sP\
+\xafJ\x08\xdd\xefQ2\x0c\x13t\xc30\x0c\xa3\xdd2\
+\x15\xe3n\x00ymLtw\x10\xbd\x16q\xb9\xf6_\
+~9\xb7\x1c\xe7\xdd\x95\xf3\xb6\xac9o\xfe\xb8\xe7~\
+\xc5\x0eQv\xf8\x98\xff\x02\xfa@V\xe0\x83\xc0\xff\x05\
+\x1e^)\xb7Z=\xa2\xfb\x00\xbbw]ok\xd1\x1b\
+\x12t\xa1R\x12&\xa6\xe6\x17\xaej\x12\xa8\xa5a[\
+\xe4\xeaN\xd6\x9c\xf9:\xc4\xb9\xe6+\xa3\xea\xfent\
+\x5c\x88\xc0t-\xa0^\x91x~\xf9,\x17\x1dNd\
+\x9f\xe4,h)\x97\x91b!\xdf\x89W\xab[C\x92\
+\xe4\x16\xe1\xdc#\xe8\xaa\xa8o4\x8b\x9e\x80j09\
+7\x0c\x13t\xc30\x8c\xdem\x04\x0bkB,\xafR\
+\xd57\xf6\xd1w\x87\x0a\x85\x86\x9b6\xddZo\xdeq\
+9\xd7\x16\xbf\xce\xa6\xb5wU\xcc\x1b\xfb\x9a\x9di\xac\
+;\x9d\xca/9\x8d>\x0b\xfc\x958\xfd(0\xba\xec\
+\x0d\x9d(c\xcf\x1e\x8b\xe8\xbe\xa4\xc8\xa9R.9*\
+\xc5\x88\x89\xc9y\x16!;a\xa6\x16H3\xb6D\x03\
+\xc5\xe6\xf3\xa5\xa9\xb6\x94kM\xd1\xa3\xdd(\x0fA\x98\
+\x98\xf6\x8b\xd6\xfd\xbeR\x84w~_\xe2B\xae\xf1\xf0\
+\xb8VCjI\xde\xf3\xbe\xf8\x0c\x11Vpn6\x8a\
+\xfb\x22!\x01|h\xdf#\xa7\xbd\xcf\x17\xc30L\xd0\
+\x0d\xc30\x96\x97\x1b@\xdf\xe4cy\xbd\x8f\xd9\x22\xba\
+\x22\x03\x84\x99\x9c\xf7\x8a\x9cw\xb3\xf1\x9c'\xf8\x15\x94\
+\x11y\x19\xe8\xcb\xfa\xd6\x9d\xd8\xad\xc1\xfd-\xe8\xbb\x81\
+\x87\x96\xeb\xc6\x13\x17\x98\x99\x1e`\xf7\xae\xeb\xb8n\xc7\
+\x17zF\xd0\xa5\xeb\x8b\xd0\xa1\x10;\xfa*n\xc1k\
+\x9ef\xcat\xd5o\x19\x09\xbe\xe0\xbd\xa6\xcd\xde\x87-\
+-\x1f\x17\xf6w\xa7\xfcab\xca/l\xbf\x0a\x03}\
+\x0e\x159\x9aw9y\xear\xaf\x06\x89\x0b\xc1m?\
+\xfbw\xd4\x05]\x80\xb0\xa0\xa1k\xfd\x1fQ\x07\xb3U\
+\xf4\x88\xa5K\x86a\x98\xa0\x1b\x86a\x18\x1a\xb9\x97\xf6\
+\x85\xfe7\xab\xca+\x80R\xd3\xed\x99\xf3bZ\xfb2\
+\xe58?\x1f\xe5\xbc\x1b\xcb\x0fZ\xfd\x0a\x17\xb6\x8b\xf2\
+\xb3 ?\x8e\xe8GQ\xfe\x0c\xe1\x93\xcb\xd2\xd89\x19\
+\xd1\xfd\xa1N\x8e\xa2\x0b\xf5\xcc\x0bm\xb1\x9de\xf0s\
+\x9c\xc0\xaa\xfe\x18\x16\x88\xd2\x1e\xbc2>\x95m\xd9J\
+q\x8d\x0fz\xb0\xe9c\xb5vnOu\xa5<\x94%\
+G\xd0\xfb\xcb\x91/\xf8\xe8`\xc8\xf2\x9dP\x16\x85|\
+K\xd0\x955 \x9b\xce\xbe^\x91,\x91\x10^\xe7\xa6\
+\xb8\xab\xcb\x179_\xda\xf4\xa0ZQX\x14w\xc3\x04\
+\xdd0\x0c\xe3\x02\xc6\x01\xdfY\x09\xe5\xff\xe4\xc4\xbd\x80\
+H85b\x9ew=`\x1b\x85\xab\xe5&V\x0f\x06\
+\x83\xeb\x96\x9c\xaf\xcc\x1c\xe7\xcd\x1fW[\xfd\x863\xbe\
+\xa0\xac\xe8\xdd\x08w\x83~\x1ex\x07\xf0w@\xd2\xad\
+\x1bR$03=\xd8\xe9Qt\xa1\xa9\xf4\xd6+\xe8\
+\xc1\xe5\x84\x91\xa1x\xde\xeb/\x02\xea\x95\x13\x13\xd9\x88\
+\x88l\x86\x16\x04\xbd\xb5\x9fy@:^_ \xf3\xca\
+\xe8T\xb6p^x'\xf4U\xdct-\xf2\x87jq\
+\xe3\xee\xe7\x10\x0a\xde\xe5\xf4s.Vtd\xbe\x1a\xe7\
+\x9ct\xee\xf1g\x18\xc6\xb25\x22\x0d\xc30\x8c\xb65\
+\xd0\xe5u\x0a_\x10\xe5\x83N\xdd\x0bN5Gu\x99\
+\xe4\xbc\x81\xe3\x9e\xcf\x91\xdaM\xce\xbb,\xe7K\xd6\xb7\
+\xe7\x0b|\x00\x91\x7f\x05\xde\x04Z\xec\xd6\xcd\x19E)\
+{v_\xc7\xd4\xd40\xcey\x8c\xf9o\x99\xd5C\xf1\
+\xc2R*pd4\x8d@\xaf\x96\xd3z$\xf2lg\
+\xf6e4\xb5\xed\x05&:]\x16\xa9W\xc6'\xfd\xfc\
+\xb3\xdb\x15$\x16\xfa\xca\xd1\xd1\x10\xc2\x893\x9f\xf1K\
+l\xaa\xb8\x00\x92gS\xbd\x9csfg(\x22\x82[\
+b\x08\xbd\x0bi\xd6\xecf2\x8c6c#\xe8\x86a\
+\x18\xed\xe1\x158\xf9yUyA[\xa4\xc9\xd2\xa8\xb1\
+|\xeb\xcdM\xce\x9b\x97\xf3\x86yV \xbc\xbb\xe2K\
+?\xe9\x94\xff\x09|\xa0\xd3\x0d}\xe7\xe6F\xd1w\xf4\
+\xc4Zt\xb7\x0cC(\xaa\xca\xea\xa1\x18\x89\xea\xb9\xd0\
+\xcf\x99f/\xc2\xb1\xb1\x8c\xd4s\x13\xc2\xfb\xb5\xc9\xaa\
+\xe6\x8a\x05\x88\xa2f\xeb\xdbAj\xd5\xa3\xaa:\xd8\xb1\
+\xb2\x17a|&cj\xc6/8'\xa2\x18\x09\x83\x15\
+\xb7\xb7\x98E\x13Q\xa3\x12\xacB\x1ay&JI\xc3\
+#\xe8\x0a\x14}t}\x1c\xdc9\x7f!\xcc\x8e\xa0/\
+r\xf8z\x908\x895\xc7\xba\x02\xc9\x17$\xc0\xf7\xf8\
+\xc4\x11\xc30A7\x0c\xc38\x9fP/7\x95F&\
+\xdf*N_3\x7f\x03\xc8\xe4\xbc\xb7\xe4\xbc\x17\xd7\x9b\
+\xb7rlmO\x917Y\xcfc\xdc\xb3\x14\xde\xab\xa2\
+?&\xf0\xeb\xc0?u\xf2~\x8d\xa2\x94\xa7w_\xc7\
+\xf6K\x1e\xa4\x5c\x9e\xb2\x88\xee\xf3\xc8\xdcP\x7f\xcc@\
+_\xc4\xc4Tv\xae\xa1;8:\x9a21\xedw\x0e\
+\xf6\xc7\x04\x9f\xff\xba\x8b\x80&\x09\xda\xfc\xc8\xee\x94\x88\
+\xecA\xb8\xa4\x93\x9d#\x13S\x9e\x99\xda\x02\xf9\xbd\x83\
+R)GT\x8a\xee\xe9\xa0\xaa\x8d\xd6\x7f\x01\x9c\x0a\xc5\
+\x10\xe5\x12t\xa7r\xedB\xbf3Zb\x8a\xbb\x0f\x8a\
+\x08q\xa31\x0d\xeaA\xe1s\x09wjw\x8ea\x98\
+\xa0\x1b\x86a\xac\x04\xd6\xa0\xfa_A\xdf\x221\xe5\xb6\
+\x8d\xa4\x9a\x9c\x9b\x9c\xe7\xfa\xda\xeeGjo\x97\x9c\x9f\
+\xb5\xef\xf3\x14\xfd\x18\xf0A\xe0\x97\xe9P\xd4w\xe7\x02\
+\xd3\xd3\x03=3\x8a\xdemT\x95\x81J\xc4\xea\xa1\x98\
+\x89\x89\xec\xdc\x85\x90\x22L\xcfx\x8e\x8c\xa6\xd7\x8f\x0c\
+\x15\xd7\x87\xa0\x87s\x1f$\x04\xa4\xaf\x1fY\xb3\xba\xb9\
+\xfbU\x9c2z\xfc1\x1d\x1f\x7fQ\xa7\xa6\x198\x11\
+\x8e\x8e\xa5h\xa6Ha\xfe\x08\xee\x83}\x11\x85\xa2{\
+\xcc#\x8d\x0b\xad\xd4\xa7\xac\x17B\x1e\x01\x96\x8a\x8a^\
+7\xdf-$\x22\xc4\xf1\xd2\x9d.\xf5\xf6\xbe4~k\
+\xe6\x1bAOz$L\x9cEq7L\xd0\x0d\xc30\
+\xce\xdfV,\xdf\xa5\xc2\xaf\xab\xea\x15\x0b\xcb\x8d\xc9\xb9\
+\xc9\xf9J\x97\xf3\xaeOk_\xb2\x9e\xab\xf2Z\x90\x97\
++\xfc\xbe\xc0o\x01\x93mo\xf8t'\xa2{\x8f\x0a\
+:\xc4\x05a\xcb\xba\x12{\xf6\xcep\xb6\xd4\xcd\x05\x8a\
+\xdb{\xb8\xb6\xfe\xea\xad}\xcfr!|\xa2\xa9\x03M\
+\xcf\xe0\xd3\x83MV=\x01\xef\x1f\x94N\xae\x01\x108\
+|\x22]0\x9a=\xaa\x0c\xf79J\x1b\xd7?\x92\x94\
+\xfa\x91Ff\x03\x08\x90e\xe8\xbe}h\xaeg\x95n\
+\x07\xb6\xcc\xdf\x91\x00q\xb4\xc8\x14\xf7\x93Q\xdc\x89\xf3\
+\xdc\xe8y\xb3\xc6\xf5H\x1c:\x8b\xe2n\x98\xa0\x1b\x86\
+a\x9cgR\x8e\x126\x0d\xe8\xc0\x7f\x17\xdc\x9bt\xb1\
+\x16QK\x9e\xd6A\xc9\xec\xb6\x98\xe7\xfa:\x8b\xd4\xde\
+=9_\xdei\xed\x0d\x1cx@\xe0\x97Py\x0d\xf0\
+s\xc0\xc7\xda\xea^\xdd\x89\xe8\xde2\xd1\x12k\x8b;\
+)\xe9\xdb6\x95\xf8B$\xf3g\x00w\xc2\x9e\xfd5\
+&5y\xc1t9\xfb\x844\x953MI\xc7\x87\xd0\
+,\xcam\x83\xaaP\x88\xe5\xc1\xe1J\xa6\xaa\xedOF\
+W\xf7h\xe5\xf0\xf1d\xe1`y\x0akW\x15\x139\
+~\xec\x11\xd2\xa3\xf9\xaa\x7f\xc8\xa9\xc0\xc2\xf5\xa0\x95y\
+\x05\xdd\x09\xf1RS\xdc\xbd\x02\x9aK\xd0Um\x8a\xbb\
+a\x98\xa0\x1b\x86a\xacp\xc4\xe9+\x83\x86?t\xe2\
+.i\xab4i\x17d\xef|\x96\xf3n\x05\x83\xeb\xe6\
+\xbe\x17\xb6\x9c\x9f\xce\x0eG\xf8(\xf0\xbf\x14\xde\x0a\x1c\
+o\x9b\xfc\xdaZ\xf4E\x85n\xf3\xda\x22\x03\xfd1\x93\
+\xd3\xf3\xa4\x19s\xc2\x81\xe3\x09c\x93\xfe\x8e\xa1\xc1\xd8\
+\x05\xdf\xdc\xc8d_\xa9V\x9f>\xde\x9cb?\xa2*\
+'\x80\xd5\xed>\x7f\xe7\x84\xc9\xfa4\xfe\x85s\x1d9\
+X?T\xdcWN\xdc.I\x1a\xbf\x17\x92\xc8\x93\xb9\
+\x90\xf7\x94\x9f=_!\xa9B\xe4\x96\x18A\x07\xbc\x07\
+D\x0a\xe4\xe9\xcb\xc8'\xe8I\xef\xa4B7\x0c\x13t\
+\xc30\x8c\xdeF\x05\x0d\x12KA\xdf^p\xc9\xcfi\
+hs\xa8\xdan\xc9\xf9r\xc8\xa6v\xf3\xb7w\xe1\x9c\
+\xcf\x8bi\xed\xda\x96\x22\xd7\xee/\xdfx\xb3\xb8\xf8\xc5\
+\x1a\xb2\x1f\x07\xeei\x8f\x84\x05\xa6\xa7\x07\xd9\xb3k\x07\
+\xd7\xdaZ\xf43\x85.(\x83}\x11[\xd6\x15y\xe4\
+\xa9\xf4\x1cA\x17\x07\xd5\x19\xcf\xa1}\xd9M\x9b\xaf\xac\
+\x5c\x9ed\xe1\xb1f\x8e\x13\x00m~\x96\xfa!\xe0Q\
+\xe09\xed\x17\xf4\x93\x81\xf0\xe6\x1dAW\x85R\x14\xe3\
+/\xaa}\xf3\xef.yd\xb2\xd1\xee\x89 \xca\x8dG\
+6\xb3yr\x90\xcc5\xda\xa7!.h\xb8m\xa1\xdb\
+\xc6\x09\x14b\x99\xbd\xafd\xc1\xeb\xa9J\xa9\x83K\x8d\
+\xa6\xec\xae1\x0c\x13t\xc30\x8c\xce\xab\x9b\x0a\xae\x98\
+^T\x1a\x0a\xefRu/[\x5c\xcd\x97k\xbdy\x03\
+\xfb\xdbz\xf36\x8by\x87\xe4\xbc\x07\xd2\xa85%\xe7\
+\xed\xab\xe7\xd7\x88\x8b>\x0e\xf2\xab\xd4\xa3\xbd\xb7\xbc\x9e\
+t./\xfa\xb6\x15:\x8a\xbe\x9c\x89\xab\x9c\x13.\xdf\
+R\xe1\x91'\xa7\x16\xbc\xff\x1e\xdd;\xd3\x7f\xfd\x95}\
+wVI\x1fk\xe6~t@Q\xe2\xba\xf17\xe1\xf7\
+\x0a\xf7i\x07\x04=r\xc2\xdeC5\xc8\x14)\xce\x1f\
+\xc1}p b\xed\xaa\xbe\xcf\x9d(T\x1b\x8e\xa7\x16\
+P\xbc\x8fH<\xf8\xc6\x83\xc4]\x1c9\xae_\xb0\x8e\
+\x88P*\xb8E+Q\xe6\x03\x1a\xb4\x94\xefv\xcbU\
+\xfb&r\x06\x95[\xb6\xd7\xba\xb5l\x0c\x13t\xc30\
+\x8c^&\xc8m\x12\xa5\xef-\xf4\xa5W,\xbe\x1e\xcf\
+\x82\xc1]8r\xde\xa1\xce\x94\xf3/\xc7y\xa7\xeay\
+\xac\x1a~U\xd3\x99\xdb\x04\xf9!T\x0e\xb6&\xa1\xf5\
+\x88\xee+r\x14]\xea\xf2\xb5\x5cF\xe1\xbdr\xe9E\
+%J}\x11\xb5T\xcf\x9d\x1d\x1d\x09{\x0eT\x19\xab\
+\x86o/m[\xff\xc7\x81\xfc\xeb\xe5\xd5\x09zx\x12\
+\x99\xa9.\xbc\xd6{q\xeeE\xf8\x89\xb6\x16\xbb@\xea\
+\x95\xa7\x0e,\xf2\x9b\x82\xb2vm\x14\xb6\x86\xc1/l\
+\x7fjM\xae\x80oSY\x95,\xf2\x8dw\xbf(\xb7\
+\x01C\x8b}\xa4TZ\xbc\x83#\xf3\x90\x89\x96j\x91\
+o\xb4\xeaQ\xf0\x8e\x86c\x0b\x08\x13\xbd\xf0J\x17\xb1\
+\xb5\xf2\x86\x09\xbaa\x18F/\xf3\xca\x80\xbc\x07eD\
+\xdb-Mm\x1bQ49\xef\xae\x9cw\xe8\x82\x98\x9c\
+7S\x07^\xa9\xc2\xbd\xae\x90}\x1f\xf0\xa5\x96\x1aA\
+q\xc6\x9e\xdd\xd7\xb2\xcd\x22\xba\x9f%u\xca\xea\xa1\x02\
+\x17\xaf/\xf1\xc4\x9e\x19(\x9c\xbb\x0e}b2\xe3\x99\
+\xfd\xb5;\x9e\xf5\x9cK\xb7&\xc5\xbe\xa7\xd1\x9c\x93\x1a\
+\xa2\x08\xd5\xa7`\xef\xde\xfab\xea\xfc}\x18\xff\xeaC\
+\x18\x05V\xb5\xeb\xbc\x9d\x08'\xc63\x0e\x1cM\x16\xed\
+4\xb8xC\xf9q\xf5\xe9\xd7\xa7\x93Z\xbe\xfb\xc8A\
+\x9e\x1a&\x8eo[j4\xbb\x5cX\xacsDH3\
+E\x82\x94\x8a\x1a5\x1e\x0fS\x02*\x0d\xe7v\x9f\x11\
+uv\xd3\x18\x86\x09\xbaa\x18F\xc7\xbc\xf6\x8d\x82\xfc\
+\x1f\xa0\xd4viZ1#\xe7\xcb\xb5\xde\xbcW\xe5|\
+\xb9\xd6\x9b_\xc8r\xbe\xf8\xbe\xa2\x5c\x11\xaf\x9a\xf8'\
+\xaf\xfa\xa3 \x1fh\xf6(\x22\x81\xe9\xe9\xa1\x15\x1f\xd1\
+}9\x88\x9cp\xf5\xb6\x0aO\xec\x99\xe6\x9ctk\xb3\
+W\xe8[ON\x0e\xdd\xf0\xe4\x13\xaf\x0e.\xfe#\x0d\
+9\xaf\xb7\x80d\x1e/\x0e\xbc6SC\xf6\xa1|\xd9\
+9^\xd6\xb6Fq,<\xb9\xafJm\xc6#\xf3L\
+\x1dW\x05Wpl\xdbX\xfaT\x08LK\x8e\xc0k\
+\x1a\x1c\xe2s\x9d_\x05\x17^\xb8\xe8`\xbb@\xa9\xb8\
+\xf8\x14\xf7$S4h%\xca1\xc9A\xf3\x09\xf7h\
+O\xbc\xdbU\xbd\xdd\xd5\x86\x09\xbaa\x18F\x0f!\x0a\
+\x0a\xff\x01\xe5\xcfX8v\xef\x05.\xe7\xad~\x9d\xc9\
+\xb9\xc9y\xfb\xea\xb9\xc2\xb0\x13y?\xb0\x11\xf4\xf7\x9b\
+\x16\xd1(\xe5\xe9\xdd\xd7\xae\x9c\x88\xee\xb3\xa7\xefdy\
+\x7fF\xe6\x95+\xb7V\xe8\x1f\x88\x99\x9a\xf1\xc8\xd9?\
+(\x12\x9e:P\xe5\xf8\x91\xc9\xd7\x0do\x18yg\xe6\
+}\xfe0\x9a\x22\x84\xb8\x84j\xfe5\xf7\x0aD\x11\x7f\
+CZm\x8b\xa0\x0b\xf5\xa9\xfd\xdf\xda5\xcd\x82\x11\xcf\
+\x83\xb2fu\x91\xb5k\x0b\x1fN\xa3\x8c \x8d\x7fw\
+\x94\xb9\xbc\xe7w[\x10.[\xeas\xfd\x95\xc5S\xd5\
+%Y@\x95\x81\xdc\x8fQm\xb8\xe0\x0eR\x8f\x09\xb1\
+\xd2\x87\xd1M\xd0\x0d\x13t\xc30\x96Q6\x01A\xac\
+ \x1a4sE\xc9\x0a\xee\xfb\x05\xfe7K\xb6\x13/\
+d9\xb75\xe7\xdd\xeb\xd409o\xf0#\xa2\x81\xdf\
+CX\x83\xf2\xd6f\x8eX_\x8b>\xb4\xe2\xd6\xa2\xcb\
+2?\xc2}PF\x86\x0a\x5cqq\x85\x07\xbe5\x01\
+\xc5\xb3\xa3\xb9\x0b3\xd3\x81\xc7w\x8d\xdf~\xdb@a\
+g\xa8f\xf7\xe7\xb7l%*\x16\x91J\xa5\xb9\xfb\xdc\
+\xfb\x0fkR\xfd\x15\x84--7\x88ca\xdf\x91\x84\
+\xbd\x87\xaa\x10-p\x22^\xb9\xe2\xe2\xca\x03\x05W\xfe\
+|Rk\xd4\xf7\x84HB3~\xf8\x1dKI\xaf\xaa\
+R)9p\x0b\xe4\xac\x17H3Ea8\xcf\xa5\x91\
+|\x22\xbfO\x85q\xda\xb8\xd4\xc00L\xd0\x0d\xc38\
+\xcf|SH$c\x9c),h\xe9\xd2\xad\x90\xc2\xcc\
+\x101\xee5Z\xf1\x7f\xc6\xa2\xe3?\x96\xe3\xbc\xb9\xaf\
+k5l\xf8y4r~\xbeFj\xef\x96\x9c/\xfe\
+\xd7\xbf\xe4D*\xc0\xcf4s\xe4\xb9\x88\xee\xdb/y\
+\x90\x92\xe5E?\xe3\xf6\xbb\xfe\xb2~\x1ext\xb2>\
+\xca-\xe7\xf6\x22|\xe3\x89\xa9\xc2\xcdW\xf4\x7f\xbf\x0b\
+r\x7fS\xb7\xeb\xf4\x0c:\xddd\xa6.\xe18N\xde\
+\x05\xf2\xdfZ=\xd7\xc8\x09_{l\x92\xac\x16\x90\xe2\
+\x02\xd3\xdb\x8b\x8e\xeb/\xeb\xfb\xabJ!\xad\xc59,\
+\xd6\xfb\xdcwU\x9f*\xafj\xe4\xfa\xf4\x95\x1cQ$\
+\xf5U\x02\xf3\xbc\xc1\xb24\x90e:\x5c\x88\xc9\xb1\x06\
+\x9d\x1cS8\xe40\xaaO\xa0\xdc\xb2\xe0'\xa4\xbe\xbe\
+_\xe4\xcc:\x14\xb4^6\xdd\xc1Y\x908\xc3\x04\xdd\
+0\x8c\xe5#%#\x15{\x17-\xdd\x08Q\x86\xa3\xfe\
+\xdb\x05\xf7n\x94B{\xbf\xbcKr\xde\xf1\xef\xd0\xf6\
+\xff\x1c\x93\xf3\xeet\xa2tU\xcc\x97S\xceu\xee~\
+\xfe\xe9$\xf6*\xb8\x9f\xd5Y\xc9h\xd4\xa1\x9c\x0bL\
+M\x0f\xb0k\xd7\x0e\xae\xdb\xf1E\x13\xf4\xb9wI\x16\
+\xd8\xbe\xa9\xc4E\x1bJ\xec;X\x83\xf8\xdci\xee\xcf\
+\x1c\xac\xb1\xf7p\xfa\xba-\xeb+\xbf\x96f\xe1p3\
+\x96-Nsf\xf6:\x83?\x8e\x94\x1fA\xd8\xd8t\
+c8\x12\x0e\x9fHy\xf0\xc9\xe9s\xcf\xf1\xa4\xe9\x06\
+.\xd9\xde\x7f`\xcb\xfa\xf2{\xd3L\x1bNE\xa6\x0a\
+!\xe4\xbe7^\x88p\xc5R\x1f\x0a\x0a\x95\xb2#\x8e\
+\x04\x9f\xe9|EK\x9a)5O\x7fy\xa8\x12\xf9\xd0\
+\xe00\xbe\xf7h\x9a\xd1\xe0\xc2\x83\x0c\xe5c\x88\xder\
+\xba\x90\xc7\x91\xe0\x9c\x10\x82RM\x02\xd5\x9ag&\x09\
+$\x99\xd6;,B}\xfd\xfc\x86\xd5\x85nUg\x1b\
+\xb10L\xd0\x0d\xc3X\x16\xe3d\x95\x1f@\xc1&\xb8\
+/\xdd&D#\xbdH\x0a\xbc_\xf0C\x8d\x08@\xf7\
+\xdb\x03+0 \x5c\xb7\xce\xfd|[s\xde\x8d\xb6c\
+\xb7\x9b\x9f\xba\xf2\xcaM\x1d?#\xaa3\x91\xe7mQ\
+\x10|\xb1\xf1o*\xc5\x9e\x83\xfb\xae\xe0\x8a+\xef\xc7\
+9\x8f\xear>E\x05\xb7\x02V\xf4\xaa\xd6%\xea\xe6\
+\xab\x06\xd8w\xa0z\xce\x9bE\x04B\x12\xf8\xfa\x13\x13\
+\x1b.\xbb\xb8\xf2]\x12G\xefl\xe6z\x86\x10\x11\x92\
+\xd0lU8D\x14~\x03\xf4\x0f\x9b=\xcf(\x12\xbe\
+\xf4\xe083S\xd9\xbc\xa3\xe7s/\xd5g_\xbf\xea\
+O\x0a\x83\xfd\x87\x93$4\x5c\x80\xa1X\x82B\xb1\xf1\
+g\x9asp\xfc\xf8\xf7R\xab.\xb9\xcean\x8a{\
+\xa5\xec\xa8Md\xe7~^\x84\xc4+i\x1a\x06\x5c\xd0\
+J\xf0:\xd9\xd0\xbb1(!\x93\x86[\x12\x22\xbcS\
+\x22\xfdn\xe0J\x91\xfa\xa8\xf8\x9e\x835\x9e\xda_e\
+\xff\x91\x1a\xc7\xc73&\xa6\x03>\x0d\xa0\x8a\xc4\x8e\xcd\
+k\x0a\xdcz\xdd\x10\x1bW\xc7\xf5\xa2\xe9\xf8\x9a\x8e\xbc\
+i\x06\x0c\xc3\x04\xdd0\x8cv\xb4\xa4T)\xaa\x8d\xfc\
+4\xd2\xf8U'\x91*\xef\x0a\xca\xa5m\x15\x07\xcbq\
+N\xef\xa6Q\xbb0\xa7\xb5/o\x1a\xb5\xd6G\xce\xcf\
+\xb9\xbbU\xdf\x8a\xea\x91J5\xfe\xa3j)\xc7S!\
+\x0a\xd4&Wsh\xffel\xd9\xfe\x10YZ\xc4\xa8\
+\x8f\xa2_\xb3\xbd\x8f{G\x0a\x8c\x8ee\xc8\xd9\xeb\xb3\
+c\xc7\xb7vM\xf3\xfc\x9d\xc9\x7f\x5c5\xe4\xfe\xdc{\
+\x9di\xa6\x1eD\x91\xe0\x9a\xe8\x14\x11\x85j\xe4\xffT\
+T\xde\xe0\xd4='\xef\xfe\xc5\x82\xf0\xf4\xc1\x1a\x0f<\
+:\x05\xf1\xfc\xbd\x22\x9a\x05.\xdd\xd6\xbf\xeb\xea\x8bJ\
+\xefHOL\xe4\xaa\xf6aj&_\x87\xb9\xc8v\xd5\
+pW#\xc2\xaa\x0a\xa5\x82c\xa8/ft,\x9bw\
+\xc5z\x9a)\xd5\x9a\x1f\xd6\xb46\xd2\x90\xa0\xcfvF\
+H\xe4P\xdf\xa0\xa0\xc3a\x81W\x81\xfce\x9a\x85\xe7\
+\xdc\xfb\xc0\x18\x8f\xed\x99\xa1\x9a\x04\xe2\xd8Q*:\xd6\
+\x0c\x17X=\x14\xb3au\xa1\xba~\xa4\xfc\xc8\xc6\x91\
+\xc2\x17\xcaE\xfdLR\xe8;\x22\xea\xff@\xab\xd5\x1b\
+;)\xe9\x22dv7\x1b&\xe8\x86at\x0f\x07\xb8\
+\x04\x9f\xd9\xfb\xa7\x91\xd6\x9cz\x87\x94\xfa\x7f\x1e\x8d_\
+\xb6pK\xcb\xe4\xbc\xb7\xe4\xbc\xd5\x9fhr\xde\x8dK\
+\xdci9\x87\xd9\x99\xc7\xc2\xef\xa5\x05}\x1a\xe4\xefs\
+\xfd\x1aQ\x9e~r'\x1b/z\x1c\x11]\xe6Q\xf4\
+\x95A\x080\xd0\x17q\xcb\xd5\x83|\xfa\x8b\xc7\xcf\x09\
+\xa0&\x0ef\xa6<_\x7ft\xe2\x9a\x17?{\xe8u\
+3\xea\xdf\xddT\xa99(\x04\x87\xa8\xe4\xaab\x02D\
+*\x09\xc8[\x80{\x81\xfe\x86\x0f\xe9\x84\xcc\xc3'\xbe\
+|\x824\x09HA\xe6},\xc5\xb1\xe3\xa5\xb7\xacz\
+[\xb1\x18\x1dOSi\xd8#\xb3\xcc#\xde\xe7\xbd+\
+\xbe\x0f\x91\xa1F\x1f\x99\xc5\x820\xd4\x1f\xcd>?\xe5\
+\x9c\xc2\x09\x992]\x0dCNX#\xb0\xb7\xa1\x02\x05\
+\x04\xc57:\x1f\xaf\xfe\x91\xc7\x80;\xa3\xc8\xfd\xc8\xf3\
+o\x18~\xdd\x1d;\x87\xb7\x03\x22\xc2X\xec\xe4\xc98\
+\x96\x87E\xf8r\x14\xc9\x03\x933\xf1\x93\xde\x87\x90e\
+\x09\x12{\x08\xfe]\xc0\x1fb\x18\x86\x09\xbaa\x9c/\
+\xc2\x99NW\x988vI\xbe\xc8\xab\x17(\x8a\xd0\xb7\
+v\xfcv\x89\xb2_49?\x9f\xe4\x5c[\xf8\x98\xc9\
+ys\xa7\xbb\xbck\xce\x97 \xaa\x15\xfd_\x14\x12\xf7\
+b*\xd9\xd7\x1bn\x14\xb9\x94\x89\xc9a\xc6G\xd73\
+\xb2f\x1f\xdewm}\xec\x8a&\xcb\x94g]\xd9\xcf\
+}\xdf\x9a`lb\x9eQ\xf4H\xf8\xda\xe3S\xdcr\
+\xdd\xe0OUJ\x85\x0f\x84@\xad\xd9Z!\x92?\x07\
+\xc9\xec\xe7\xefW\xf4\xbf\x82\xfeQ\xa3\xfb\x15c\xe1\x93\
+_\x19\xe5\xe9}3\xf3\xe6=\x07 \x09<\xeb\xd9\x83\
+\x7f{\xc9\xe6\xf2\xfb\x92\xd47\xfe\xa8V%\xf8\x9c\x0b\
+\xce\x84a\x85\x1f\xc8w\xee\xc2\x9a\xe1x\xc1rQ\x85\
+\xf1i\x1f;\x91\xd5\x92\xb3P]\xa4\x04\x9fk\xaf\x19\
+\x81\xdf/\x15\xe4\xf7#\x91\xc1,\x0a\xce\x13\xa6%\x8b\
+\xd34ST!\x8a\xeb)\xfcD\x81\xb8@H=h\
+x\x5c:<\xc5=\xa8\x8d\xa0\x1b&\xe8\x86at\x09\
+\xe7\x02}\xab\xa6\x09Yd\x0b\xcf\x1bQ\x12/EU\
+\xf7{\x22\x94\xb5]\xb2fr\x8e\xe58\xcf\xf3\xb5m\
+:\xee\x85\x91F\xad\xf9rSFR\xf1\xef\x11//\
+Te\xb4\xd1\xe7c\x9aF\x1c8\xb0\x9d5\xeb\xf6\xe2\
+\x97+s\xf2l\xd4\xeb\x95\x82\x0f\xcap\x7f\xccm\xd7\
+\x0e\xf2\xa9\xf9F\xd1#al4\xe5k\x8fL\xde\xf8\
+\xa2\x9bV}\xcfL\xa6\x7f\xde\xf4\xfb\xa8\x95s\x17y\
+G@o\xd0\x10~h\xa9\x8f\x96\x8b\x8e\xaf=6\xc9\
+\xe7\xee\x1f]xj{-p\xd9\xf6\xbe'^t\xeb\
+\xf0\x8f\x07/\x8a6\xd8y P\xf3\x1e\xcdy\x1e\x82\
+\xbe\x09\xd8\x96\xf7\xb4\xd7\x8d\x14\x16^\xc3\xad\xca\xd8d\
+\x86:\xd9\x16r\xf6\xe2\x8b(\x12\xf2\xcf$Q\x05\x85\
+\x89P\xff\xf7\xb9\x83\xfb\xaah\x14#\x9b\xd7\xe1\xa2\x18\
+\xaa\xd5q=\xb0\xbf\xb3\xeb\xd0\x15[\x83n\x98\xa0\x1b\
+\x86\xd1\x856\x9c(R\x0a\xf4m\x1f79o\xe4\xfd\
+\xec\x05\xaa\xe1\x07\xbd\xcas\xe6op\xf4\x8c\xb4\x8c\x01\
+G\x80C\xb3\xff\x9d\x00\x0e\xb4\x02\xac\x016\x00\xeb\x80\
+b\xd3\xbf\xc1\xe4|\x05\xcay\x9b\x8a\xbc\xe7;\xa1r\
+=%o\x08)\xbf\x97\x16\xe4\x07\x5ch\xac}\x1e\xf0\
+\x1c8\xb0\x95\xcb\xaf\xec#\x8eSTW@\xb4\xb6\x15\
+@\x92\x05n\xbez\x80\xfb\x1f\x9d\xe4\xd8h:\xcfZ\
+t\xe1+\x0fO\xf2\xac\xab\x06~\xa1\xbf/\xfaP\x08\
+\x8c5{AEhzy\x81\x8b\xe3\x1f\xf7I\xb2A\
+\xe0;\x16:z\xb9T_7\xff\x91{\x8f\xd5\xa3\xfd\
+\x9fu(\x0d@\x16\xb8\xea\xf2\xfe\xc3\xaf~\xde\xba\xd7\
+\xad\xf5\x85C\x99*\x8dDx\x11 \xf5J\xd0\xfa\xe8\
+v\x8e\xbbcH\xd0\x9fl\xa6\xf3d\xdd\xaa\x22\x85\xa2\
+#\xf5:O*<8>\x96\x12\x02W:m\xf0\xee\
+\x9f\xcb\x87\xa6\xa0\x85\x80\x06\x10\xef\xa0MK>\x9c\x03\
+4!<\xf3\xf4\xdc+ \xed|\x908\x8b\xe2n\x98\
+\xa0\x1b\x86\xd1i\x1c\xd4\xc6\xcaL<2hr\xde\xc8\
+\x9b9\x08\xa5\x91\x99u\x85\xe1\xe4\x17\xe8\xbd\x91\xf3c\
+\xa0_\x04>\x03z\x9f\xa8{J\xd1\xc3H=\x97\x9e\
+\xa2'\x1b\xb4\x02\x22\x12\xfaU\xe5bA\xafU\xe4\xf9\
+\xc0\x0b\x81\x9d,XS\x9a\x95s\x8b\xd4\xde]9\xef\
+\xe5\x80p\xad\xcay\xf3\x99\x14\x04\xbe?R\xeeq\x91\
+\xbe\xb7\x91ge\x14gLM\x8fp\xec\xe8\x166_\
+\xf48Yf\xc1\xe2`v-z%\xe2\x05;\x87\xf9\
+\xf0?\x1f\x99g-\xba01\x96\xf2\xaf\x0fM\x5c\xf6\
+\xb2\xdbG\xde2^\x8d~\xbd\xd9[\xdc!\x94\x8b\x01\
+\x91\xa6\xeak\x0d\xe5{\xd2(\xbc7\x0e\xee\xd5\xe7\xc8\
+y\xd1\xf1\xf0\xeei>t\xcfQ\xd2L\xcf\xe8hP\
+\x05\xd2@\xa1\xecx\xde\xcd#\x07\xef\xd89|\xb7\x84\
+\xe8kI\x08\x0d\x8d\xea\x0b\xe0U\xa9\x91\xe5\xf6M\x81\
+7\xb3h\xd0\xd2\x85\x05}d(fd0\xe6\xf0\xf1\
+\xe4\x9c\xeb\x82\x08\xc7\xc63\x12\xcf5nh\x90%\xc7\
+\x91\x05\xb4VCj\x09s\xa9\x04D\x14_Hq!\
+B\xb2\xd6\x02\xd1\xaaB!\xcaf\xff\xfb\xe4o\xf5\xb3\
+[\xc7\xa2\xdc\x8a\xa8\xe5\x9e5L\xd0\x0d\xc3\xe8,\xe2\
+\x02\xf1`\xc6\xd4\xf1\x11p\xd61\xbcT\x83#\xa4\x11\
+A\xc6\x7f\xac8r\xf4\x22\x0d\xd2&1\xef\xac\xb4\xa8\
+\xf2y\x09\xe1\xddD\xee\xa3\x1a\xf4\x004\x14\x9cH\x81\
+I\xe0a\xe0a\x81\x0f\xa9\xe0\x14\xb9\x05\xf4\xf5\xa2\xbc\
+\x1e\xb8h\xc1\xe3wC\xcem\xbdy\xf3\xc7\xed\xa6\x9c\
+\xf7\xcez\xf3%\xf7\x8d2\xfd\x9dB\x99\xcf:\xd1\xbd\
+\x8d|e&\xca\xb1C[\xd9|\xd1\x13\xcb\xf7\xd8Z\
+\x81\x1d\xaf\xb54p\xc3\xe5\xfd|\xed\xb1I\xf6<S\
+=7\xa8Z,\xdc\xf7\xd0\x04\xd7_\xda\xff\xd3\xab\x86\
+\xfa\xfe\xff\xd4K\xee\x02\xacGe\xcf\xf0\x921D\xdc\
+\xd4\xbcdA&O\x94\xab\xaf_;]\xf9]A\xde\
+<\xf7\xe7\xc5\x82\xf0\xd0\xaei>t\xcf\x11\x92Y9\
+W\x05\xbcBP\xe2\x92\xe3\xea\xab\x06x\xfe\x0dC\xff\
+\xb6y]\xe9\xfb3\x1f\x1e\xca\xbcRp\x0d\xca9\xca\
+\x8c\xfa\xdc\xb5V\x90-\xa2\xfa\x9f\x9b}\x9cV\x8a\x8e\
+-\xebK\x1c>Z;W\xd0#\xe1\xf8x\xca\xd8t\
+\xd8\xb1v}\x7f\x9f\xf7:\xbd\xe4\xe3\xb9\x9a2o|\
+8\x09\xb8\xa8\xde\xe1\xad\xb8&nOA\xd5\xda+\x86\
+a\x82n\x18\xe7+A\x18\xb9d?br\xdeh\xc3\
+`$h\xe1\x87B\xe6V\xb6\x9c\x8b\x82\xca=\xc0\xff\
+\x10\xf8D}\xaee\xcbSl\x03\xf0\x15\x15\xbe\x12\x11\
+\xfd\x96\x06\xff\x03*\xfa\x13\xc0f\x93\xf3.\x9c\xb3\xc9\
+\xf9J\xd8wC6\xcdo;\xf4\x0d\x0d=3C\xca\
+\xb1\xfd\x1b\xa9^\xdbO\xb1X%\x84\xeeNs\x17V\
+\xd6\x1a\xf4\xd3o\xdfB\x0c/\xb9u\x15\xef>t\x88\
+L\xcf\xecH\x10'\xd4\xaa\x9e\xcf|mt\xe4\x0d/\
+)\xfe\x8f\xb4\x94|g*\x1er\x04~\x13\x15\x8a\xc1\
+\x11\x9c'\xccDhT\x0f\x1c\xd7L\x7f\x82\x22\xff\xd1\
+\x07\xf7\xb98\xd2_)8\xae\xdc\xbd\xbf\xc6_\x7f\xe2\
+0$\x01b\x87\xaa\x12\x17\x1d\xeb\xd6\x14\xb9|K\x99\
+\xeb.\xed\x1b\xdd\xb4\xa6\xf8N\x0d\xee\xbf\xd7\x12?)\
+\xae\xf1\xeb\x95i`\xdc%L\xf6e\x8c\xf8~\x82O\
+Yjz\x9b\x00\x01%\xcax\xbb\x83u\xdaBm\xbf\
+\xfc\xe22\xf7?<1oGORU\x0e\x1c\x9c\xde\
+\xba\xbe\xef\xe0\xd5Y\xa6\xf7/\xf4\x1dJ@\x01G\xbc\
+x\x0f\x91S\x9c\xf8\xba\xa8\xab \xdap:6$\xcc\
+\xfb\x17\x91vp\xf4\xbc^\x0e\xce\x82\xc4\x19&\xe8\x86\
+at\xb4\x99\x84\x8a\xa0\xa1\x88\x85=i\x987 l\
+i\x8f\x9cwF2\x9d\xe8\xee\xe9c\x03\xbfX\x1a\x98\
+~\xbf+j\xa7\x16\xcc\x1d\x06\xfd-Bx\x8f\x88{\
+\xab\x0a?\xd6\x1br\xde%\xb1\xcf\xbbo7\x02\xc2i\
+\xcbO\x8b\x95[\xe6\xda\x85\xeb5W\x8c\x22\xdf\x9di\
+\xfc\x9el\xba\xf4O\x8d|\xcb\xf4\xd4 \xa3G\xd7\xb3\
+q\xcb\xae\xae\x0b\xfaJ&I\x95K6\x95\xb9\xfd\xfa\
+!\xbe\xf0\xd5Q(\x9eU6\x05\xc7\xc3ON\xf1\xc0\
+\xb6\xc9\xd7\x5cw]\xe9\x0dQ-\xfa\xeb\xb8\xe1u\xfc\
+J\x16\x1c\x1a)aV\x10CP\xa4T\xc4e\x09\xcd\
+\xac\xe7\xd2\xa0\x1fp\xc3\xfd\x1f\xd3\x10^S*\xd4\xfe\
+\xfdKn]u\x93\x8al.\xc4\x12\x0d\xf5G\xac\x1d\
+.\x8c\xae\x1e\x8a\x1f-\x97\xa2\x7fH\xb3\xf0\xbe,\xd3\
+\xdd\xa1\xbe\x80\xbcQ\xf3#\xd3@-dx\xa7H\x1c\
+Q\x8e\x86\xc8\xc6\xc7\x16\x97\x5c\x85\xe0\x02\x91\xe8\xcbQ\
+}S+5>\xf3\x81K6\x95\x19\x1e\x8e\x19\x1b\x9f\
+'\xca\xbe*O<3S\xb8\xf1\x86\xb5\xff.S\xee\
+?\xf7Y,\xc4\x1eBm\xb2~\xbf\x04i\xe8\x1e\xd4\
+\xc8\xa38\x9e\x19\x18\xe7\xa2\x89\xa1\xfa\x92\x84\x05d]\
+\x04\xaaqJ \x9cS.N%.e\x9dU\x12\xb5\
+(\xee\x86\x09\xbaa\x18\x9dFl\xe1y\x1e\x22\x15\xbe\
+\xf7T\x83c\xe5\xc9y@\xfe\xa6R\x0b?9=S\
+8\xa0\x03B\xa7\xe3\xd9\x88p d\xd1\x9b\xab\x93\x95\
+\x8f\xf7\xad\x1e\x7f\xa7\xaa\xdbr^\xc8\xb9\xa5QkM\
+\xcc;\x5c\xcf\x1b\xfb\xeb\xced\x22\x10Q|R\xf8\xb5\
+\xb1=\x9b\xffE\x84\xeaR\xc7I\xaa\x15\x0e]v\x19\
+\x9b\xb7?\x0e\x99\xa5[;\xa3l2\xe5\x8e\x9dC<\
+\xbew\x86\xc3Gjg\xa4(\x93zg\x08\xf7\xdc7\
+\xca\x96-\xeb\xfe\xe7\xd0@\xfcE\x97\xb8=\xc8\xe2%\
+^w;%\xf61\xa9K\xce\xbc\x8c\x02Y\xf08\xe2\
+\xb9e\xd19\x1fxn\xdc\xc3{\xd6\xaf.\xbeg\xd3\
+\xfa\xd2\xb0:\xdd\x14\x11\x0d\xa6>$(GC\xc6\xbe\
+Z\xaa\x84\xa0\x0d\xcfW\x12 \xa8\x92\x14b\xd4\x03\x99\
+\xd6G\x88\x81\x10\x02\xde\x07\xe6\xa2\xbe\xcf\x17=]T\
+HDW\x17\xe2\xf0\x87Q\x8bs\xe1B\x80\xc1\xbe\x88\
+\xeb/\xed\xe7\xf3_\x1d=w\x9a{\xecx|o\x8d\
+\x03\xc7G\xefv\xc3\xd9\xef\x92J\x98\xbb\x1e2\xdb\x9e\
+XU+!\x22M=7\xa6\x8a)\xa0x\x09\x88F\
+\xa8(\x8a\xe2\xbc\xab/1s\x81\x08G\xd1\x95\x08\xea\
+!\x9cs\x9f\x0et\xba\xce\x9a\xa0\x1b&\xe8\x86at\
+\x1c\xb5\xa4\xe7y\xb8\x19\xb8uy\xe5\x5c\x17l\xe5\xb9\
+\x8c\xb7\xa1\xf2v\x9dk\xa5v\xab\x0e!\x84\xd4}\x04\
+'\x0f\xa2\xf2^T\x9fs~\xc9y\x87$\xd3\xe4\xbc\
+\xb5\xf3^\x069\xafWC!*\xa67\xad\xb9\xe2\xe9\
+\xef\x11x\xd7RC\xa4>\x8b\x99N\x86\xc8\x92R\xf7\
+\x9fX\xb3\xa6\xb7R\x97\xeb\x86\xa0TJ\x11\xaf|\xde\
+j\xde\xf3\xb1Cd\x1eN\x9f\x0e.\x9106\x96r\
+\xcf\x17\xc67\xbd\xfe\xce\xb5\xef\x9c\x8e\xd3WyU\x8d\
+\x83\xcc?\xc0*\x82\x04\x87[\xe2\xdd\xe6C\x98\x0d0\
+\xde\xdc\x8c\x06\x1f\x94,\xd1\xb1\x10\xe9X\x8c#\xf5\x81\
+H\xeaS\xb4%\xe7\xe5\xc9\x08T5\x05\x8d\xe6\x9d\x9b\
+\x1dEP\x93\x8c\xe0\x94\xa1Z\x89 z\xea\x18*$\
+\xce\x13!\x7f\x10\xa9\x5c\xd1\x8e\xcb\x9cf\xca-\xd7\xd4\
+\xa3\xecO\xcf\x04$:\xbd\x7f\x02\xa6&S\xbe\xf9\xcd\
+\x99\xdb^y\xfb\x9a;j)\x9f\x99\x93s\xef\x03\xb5\
+\xcc\xe3J2;\xc1=?n\x9e\x8b\xaa\xb3\xaf\xb3\xd3\
+\x07\xcb\x9d:\x22\x89\xc9\xb2\x1a*\xa7\x22\xce\x0b\x5c\xd6\
+\x857\x9e\x05\x893z\x06\x9b\xb3e\x18=i\xe7 \
+AmktS\xbd\x0b\x88V`\xa4\xf6\x80\xf2\xa3\xa2\
+\xbc}\xb9\xaa\x92\x00\xc1\xf1T!\xe1.\x97\x85O\xce\
+\xdfJ5979\xefm9?\xa3\xe1\x13g?\xab\
+.\xeb\xcf\xa2\x84\xc5\xb6P\x9c\xe1\xd8\xd8*\xa6\xa6\x06\
+q\xce\xd6\x12\x9dM\x92\x06.\xdd\x5c\xe6E7\x0fC\
+vn\xf9H\xd1\xf1\xd0\x13\x93|\xe9\x1b\x93we}\
+\xfe\xbf\x1c\xab\xccPL\x8bDY|\xe6\x96F\x14\xe2\
+\x01\xa2\xb8\xb2\xf4\xf3B\xea\xa3\xd6!\x84e\xc9^\x22\
+\xb3\x1d\x08\x89\x04f\x82\xc7\x13\x16\xfc\x19\xa2\xc2L\x9c\
+q\xa22C)D\x14\xd5\x11\xab\xc3\xf9\x18' N\
+\x7f<\x8e\xfc\x1b\xdb\xd5\x07\xe3\x83\xb2f\xb8\xc0\x0bv\
+\x0e\x81\x9f\xa7\xbe\xc6\x8e/?8\xe1\x1e?8\xf3\xb6\
+B\x11)\xa8P\xcb<\xfb\xc7\xabd]\xed\x09R\xd2\
+,\x22h\x89\x82\x0aq\x10D\xe5\xce\x8e_;\xb1\x11\
+t\xa3w\xb0\x11t\xc3\xe8A\x9c8K\xe8\x99\xe3\xbd\
+\x1c$\xbcd\xa5\xc9\xb9\x0a\x94\xaa\xfa\x16\x1f\xf3\xa7*\
+\xb2\xfc\x19Z%\x9cP\x09\xdf%\x22\x1fQx\xe1\xa9\
+a.\xcbqnr\xdei9o\xf3qu\xc9\x07\xc2\
+U\xe3\xc5\xe9\xd7\x8d\xc53\x7f\x11-\xb16:\xcdb\
+\x0eM\x0cq\xc5\xe0\x98\xadC\x9f\x87Z\x1ax\xde\xf5\
+C\xec?\x92\xf2\xad\xc7'\x91\xb3\xd7\xa3G\xc2\xa7\xff\
+\xed8#k\xd7\xbe\xfd\x8amC_\x0f.|\xdc\x9d\
+\xf6\x5cP\xa9O\x87\xcf_\x0b\x94\x10Eh\x92\x11\xb9\
+\xee\x98\xba\xcc\xfesBj\xa4\x12\xa8d\x05\x82,\xb5\
+O}d~:N\xf0R_W?1S\xa2\x5c\xae\
+}[\xac\xeew\x22\x95\xb6>\xfa\x934\xf0\xec\xeb\x86\
+x\xe6p\xc2C\x8fN\x22\xa5\xd3\x96\x1e8H\x92\xc0\
+\xdf\xfd\xf3\xd1\x17\xbf\xe1\xae\xb5?\xa7\x17\xd5\xfe\xbb\xee\
+-\x90&\x8a\xf4u\xbf\xa3C\xe2\x08\xd5\x88$\xe1\xb9\
+\x85\xd8\xdf\xd5\xe9W\xa0\x09\xbaa\x82n\x18F\xc7^\
+j\x8a\x12\xc4[a4\xceV\x85\x1d+MZ<\xfe\
+7$\xb8?\x16\x15T\x96\xb7VIP\xd2\xa2\x129\
+\x1d\x9f80\xfc\xdd\xc5\xc1\xea\xbd\x85J\xed\x8a\xd6\xfc\
+\xdar\x9c\x9b\x9c\xaf<9\x87\xfaz\xe0\xc1\xb4\xf4\x96\
+\xc1\xa4\xfc^\x84E\xa7\xbdfi\x11\x7fb=z\xd1\
+\x1e{\x92.p\x9b\x8b\x08\xafz\xc1j\x8e\x8f\xa7\x1c\
+<|\xd6zt'\xa4^\xf9\x87\x7f>Q\xf8\xbeW\
+\x16\xdf\xbdqu\xf4\xe2\xb4\xa6\xdf\x9a3&\x7f\x9a\xfa\
+6C\xe6\xeb\x17\xbd\xd3\x92>\x17\x15\xa4\x16\x02\x99h\
+K\xa3\xf7\xce\x85\x9bJ!z\x9fBQ;p=\x10\
+x\xf5\x1dk\xf0\x1e\x1eyb\x12\x0a\xee\xe4\xf2\x03\x89\
+\x85c\xa3)\xef\xfd\xd8\x91_\xbf\xf9\xe5\x85\xf1\xcb\xe2\
+\xe8\x7fE\xe2\x96\xad\xee(\xfa\xef$\xd2\xbfT\xa8t\
+\xfcM'\xce\xa6\xb8\x1b=\x83u\x07\x1bF\x0f\x12D\
+mk|\xdb\x01\x0c\xad(i\x11\xf9T$\xf1\xdb\xb2\
+J\x8c\x16\x22\x88\xa3z#j\x19\xe6l\xaa\x9e\x0aH\
+\xa7\x80O\xa3\x83\xaa\xee\xfb\x10\x9d19g.\xf7\x90\
+\xc9\xf9y\x22\xe7\xa7\x1a?rS\x84\xbc(\x0e\x8eE\
+7\x15&O\xac\xa5\xdb\xbdh\xce\xc9\x8aL\xb36\xaf\
+$\x07\xa5\xbf\xe4\xb8\xfb\xc5k\x19\x18\x88\xd1\xec\xcc\x0b\
+!\x9101\x95\xf17\xf7\x1cY\x7f|2|0*\
+\xc4\x17\xa98\xb4\x5cF\xe3\xa8\xb5\xe7\x85\xd4\x8f\xdf\xc9\
+\xdc\xda2\xfbH\x9b\xc9|=\xa2|K\xdf\xa5;\x06\
+J\xc9\x87\x15\xd6v\xea\xf7\xfa\xa0\x14\x22\xe1\xbb\xee\x5c\
+\xc3\x0bn]E\xe4@\x93p\xb2\x98\xa5 \x8c\x8ef\
+\xee\xde\x0f\xd5\xde\xf9\xc0\xd7\xab\xff[\x85-\xc5\x82\xd0\
+\xc5\xeaVvN\xeft!y\x1f\xea?\x19\x89^\xdc\
+\x8d\x83\xfa\xa06\x82n\xf4\x0c6\x82n\x18=\x86\xaa\
+\x80M\xb5\xcc\xd1\x22\xd2\xebE\x9a\xc9\x9d\xdd\xa1\xd4T\
+\xaa'BZ{\xb3\x88\xf3\xa7w\xe7\xab@\xea3|\
+\xd6\xad\xb5\xae\x82\x13Oq`\x1a\xcd\x04\x82\xe0q\x0c\
+l:\x0e\xf0\xa5\xe0\xe5\xb7D\xf8\xe5\xee\x89y\x8e2\
+\xb7H\xed\xad\xa9y\xb7r\x9c\xaf\x80\xf5\xe6\x8b\xed\xeb\
+\x82\xbe\xc9\xe1?\xb5\xd8\xee\x05Q\xa6F\x87I\x922\
+Q\x94\xcdvh\x19g\x93d\xca\xc65E\xbe\xeb\xce\
+\xb5\xfc\xf5'\x8ePM\xc2\x19\xa9\xbe\xa4 \x1c>\x9a\
+\xf0\x81O\x1e\xbe\xe6\xff\xfb\xb6\xf5\x1f\x1a\xee\x8f^\x99\
+\xc2\xd1\xf6<\xc9\x84\x10\x02\xce\xb9f\xf3\xa5/i\xe8\
+U\x1f\xea\xf9\xca[\x1b\xa9\xbf\x11\xf8{\xa0\xe3B\xea\
+\x83\xe2\x04^z\xdb*\xae\xde\xd6\xc7\x17\xbf9\xcec\
+O\xcf\x90V=8\x81\xa8>\xb3\xe1+\xdf\x98\xf8\xc1\
+]\xfb\xab\xaf\xbac\xe7\xf0\xff\xd9yy\xff\xfb\x10\x1e\
+N\xb2\xb6wvD\xc0\xa5\xaa\xdc\xac\xde\xbfXU_\
+\x18Gz\xd5\xc9\xf6L\xb7\xdex\xc1\xa6\xb8\x1b&\xe8\
+\x86at\xcc\xd0\xad\x81\x98\xb3m\xd5Xt\xd8.\x8d\
+&\x0a\xfc\x16I\xfa\xc4\xd9#>\x02\xa4\x12\x88J\xd3\
+]\x19\xc9\x10\xa7H\x9cR*'h\x10\xe6\xc2\x10\x9f\
+v\xec\xff\xa9\xde}\xb7\xaa\x5c\xbd\xa2\xe4\xbc[\xfb\x9e\
+\xf7\xeb\xcd/l9\x07\xc8\x22^\x9eL\xf5oD\xe5\
+\xe0\x82{\x04G\x8a#K\x0bDqj\xcf\xdfE\xa8\
+%\x81\xcb.\xaap\xf7\x9dk\xf9\xdbO\x1f%I\x02\
+\x12\x9f)\xe9\xfb\x0f\xd6x\xff'\x0f\xdf\xfe\xfa\x97\xae\
+\xfb\xfb\xb5kK\xdf9\x9dq\xb8]\xc7\x0f! \xce\
+\xb5\x7f\xe6\x81\xd4G\x9f\xa5\xb5\x1a\xfbb\x15\xfe\x1a\xd8\
+\xd0\xad\xeb\x11\xb4\x9e\xb3~\xcb\xfa\x22\xaf\xbbs-\x87\
+O\xa4<\xb2g\x9a\xc7\x9e\x9e\xe1\xe0\xf1\xb4.\xeb\x0a\
+G\x0e'\x1b>\xf4\xe9#\xbf\xf8\xe0\x93\xd3?\xfb\xa2\
+[\x86\xef\xdb\xb4\xb6\xf0/Y\xc2\xe7\x80\xaf\x03\x87\x1a\
+:\xd6\x99\x9d\xe0\x1b\x80k\x04v\x22z\xab\xa8\x5c\x0f\
+\x5c\xaeh\xe5\x9c\xf4j\xdd\xc4\xd9\x08\xbaa\x82n\x18\
+Fg\xec\x1c\xb1h\xc2y\xd9\xd4\x1d9oH\xa8v\
+)\xfc\xb1\xeb\x1bXP\xdf+\xfd\x19\x1a\x94p2\xbc\
+P\xfb{,B\xa8\x9b\xb8\xf8h1\x85\x99\x0c\x81\xdf\
+p\xc2{\xbaQ\xaf\x9b\xff\xe8\x85:r\xde\xca\xe9\x9e\
+'9\xce[\xdcW`mT\xc8\xee\x14\x09\xef[\xec\
+\x86\xc9B\xc4\xc4\xf8\x08\x95\xfe\x09\xbc\xcd^Z\x94j\
+\x12\xb8f[\x1f\xaf{\xe9:>x\xcfQ\xaaU\x7f\
+\xa6\xa4\x17\x1d\xfb\x0f\xd6\xf8\xab\x8f\x1d~\xee\xeb\xbfm\
+\xfd\xc76\xac-\xde]Ki\xdb\x02\x7f\x0d\x01\xcd\xda\
+\xe7a\xea[{\x06;\x85Bp?\xa8\xc8\x1f\x82V\
+\x96\xe3\x9a\xa4\xb3#\xe2\xebV\x15\xd8\xb8f\x15\xcf\xbb\
+~\x88c\xe3\x19\xfb\x8e$\xec=\x5c\xe3\xe0\xb1\x84\xd1\
+\xc9\x8cGwM\x15\x9f\xd8;\xf3\xbc\xbb\x9e\xbf\xfay\
+7_=@\x9aq\x82\xa0\x8f\x8bp?\xf05A\x1e\
+\x12\xd8\x07\x8c\x01)\xf5u\xe3#\x02\xdbV\xcfTv\
+\x80\xect\xea\xae\x05.\x15d\xf5\x8al@\x19\x86\x09\
+\xbaa\x18\xc6\x8a`\xa4\xf3\xd2\xd2\xc0\xc8\xb9\x0a\x89\xa4\
+\x7fVs\xc9\xf8R\xe2\xad\x91R\xd0\x02e\xda\x9b\x7f\
+\xd9\x15\x02\x91\x04$\x0a\x0d\x0dxG\xc2\x075\xc8/\
+\x84l\x91Q\xf4e[o~\xe1\xca\xf9\xf2\xad7_\
+Ar\xae\xed\xf9\xcdq)y\x19\xaa\xef[\xc4\xcf!\
+\x8b\x09!\xea\xeaCK\x00\xe9\xd1\xc1\xfaj\x12\xb8z\
+k\x85\xefyy]\xd2\xc7\xc6\xd33\x03\xc7\x15\x1dG\
+O\xa4\xfc\xe5G\x0e\xdc\xfc\xaa;\xd6\xfc\xf3\x8eK\xfa\
+\xdf\x90\x8a|%\xb4\xc9\x9f\x82\xf7\xf5\xceMi\xf1\xfb\
+Z\x9c-\xa1\xa2\xc3}Y\xe1\xb7\xfb\xb3\xc2\x0f\xfb\x15\
+\xd0\xb1\x9ey%\xf3\xf5\xdc\xe3\xebV\x15\xd8\xb8\xba\xc8\
+\xcdW\x0d\x90f\x81\xa9j`r\xc63=\xe3\xa9\x94\
+#\xbc\xd7\xb9w\xe7m\xa2\xdc\x06B\x5c/\x8f)\x84\
+1\x81\x0c(;u#@a\xfdT\x7f}\x14}e\
+\xcf0\xb1\x11t\xc3\x04\xdd0\x8c\x0ea}\xc0\xf9\xda\
+\xb9Bq\xb9\xe5\x9cz\xb4\xda\xf1\xbeP\xfa@%\x87\
+t\xab*\xedj\xd6I\x14\x18\x7fj3at$\xc7\
+\xf9\xcaLa\xe4\xf0\xfb\x06\xb7\x1c|{\x98g\xb4\xdd\
+\x22\xb5_Hr\xde\x1b9\xce\xf3w(\xc8\x1d\xa2a\
+\x10\x98Xpw/\x8c\x1e]\xcf\xa6-O\xd9\x135\
+\x87\xa4o\xdfX\xe2\xfb\xee\xda\xc0\xdf}\xf6({\xf7\
+U\xeb\x810g\xfdMba\xaa\x1a\xf8\x9bO\x1d\xb9\
+\xf4\xe0\xb3\x92O\xdd\xf1\xec\x8d?Q\x8c\xe4\xddI\x1b\
+\xe3l\x97\xd3Bss\x90\xb4\xb5\xfa\xaa(\x04\x7fg\
+\xd0\xf0{\x22r\xfd\x8akB\xe8)Y\x87zGP\
+\x7f%b\xb0/B\xa4>5~V\xd0\xe7\xa3\x7fv\
+;\xb3SDz\xa2ab\x82n\x98\xa0\x1b\x86\xd1\xa1\
+\x97\xab-\x81\xcc[\x5c\xc9J\x90\x16\x11>\xa7.\xec\
+\xce{4G\xdc\x96e{\x12 \x92*>\x1e\xcd#\
+\xe8\xb8(\xfd\x08\xc8[\xe1\xac\x8e\x8e\x0b2\xc7\xf9\x85\
+*\xe7\xad^\xd2\x15*\xe7u\xb6\xc6\xa5h\x87D|\
+i\xa1\x8fK\xc1\xe1}_w\x03Z\x09\xf4\xfa\xa3\xbe\
+\x96*k\x86c\xbe\xf7\x15\x1b\xb8\xe7\xbe\x13|\xf9\xc1\
+\x89\xfaZ\xee\xd9)\xef\x12\x09A\xe13\xf7\x8d\x0e\xed\
+>X\xfb\xcbW<w\xcds7\xaf\x8f\x7f\xa1V\x95\
+c\xadWGe\xa8Z\xca/\x8e*-=o\x9d\xca\
+\xd6\xf2\xb4\xfe|H'\x7f\x18\x91\x9eX\x0f\xa1\xda\xde\
+\xce\xe0\x15L\xd5\x9aD\x86\x09\xbaa\x18\x9dj\xbaY\
+\x11\xe4k~\x8c-\x8b\x9c\x9f\xed\x15\x99\xffTh\xe5\
+P\x8e\xe6\xe6\xbc\xce\xce\xf4\x14\xaf\x0co9\x8a\xb8|\
+\xe7\xacA\x1e\xf6Y\xf40\xa27^\xb8r\xde\xa6\xe3\
+Z\x1a\xb5\x95&\xe7\x00\x92\xa6z\xabz\xfd\xd2B\x1f\
+\x08>\xe3\xe8\xd15\xf8\xac\x88H\xe8\x8a\xa8\xf7\xf2\x14\
+\xf7\xd3I3%\x8e\x84W>o\x0d\x97n\xae\xf0\xa9\
+\xaf\x9c\xe0\xe8\xb1\x04bA\xdclj\xaf\xa2c\xf73\
+3\xbc\xeb#\x07~\xf8\xb9\xd7\x0f\xbe\xe8\xd9\xd7\x8e\xfc\
+|y\xd0\xfd\xdf)\xf5\xad\xd5\x1e\xa9\xa7D\x8bDQ\
+\x91E\x0bT\x01\xbc6_e\x85\x11A\xde\x5c\xf2\xee\
+'$\x8b\xd7\xf7\xc8\x88\xf2\x85\xd5r\x12jV\x0a\x86\
+\x09\xbaa\x18\xedWM\x04'\x01Tl\xa6{\xe3$\
+\xcb\x22-g\xed\xa0\xaa\xf7\x85V\xc46\x08\xe2<\xe4\
+\x18\x94\x91(\x80*\xa2\x828E\x03\xf5\x88\xed\xf9D\
+!\x95(\xdc\xafAn4979_\xf9r\xae\xcd\
+\x1c\xe9\x96\xc5\xee\x0b\x0d\x82v\xbbcT8o\xfab\
+CPjA\xb9\xf6\x92>\xb6n*\xf1\xe5\x07'\xb8\
+\xef[\x13LMf\x10\x09\x12\x09Rp$i\xe03\
+_\x19\xbd\xf2\xa1\xa7f>\xf4\xec\x9d\x03\x1f\xb9\xe6\x8a\
+\xcao\x96\x8a\xf2\xaf\xd5\xac\xb5\xd1]\xe7\x14\x9d\xa9.\
+\x98\x82M\xb5\xde\x89\xd9L\x8d\x15\x91>\xd2\xf4\xfb\x03\
+\xfc4\x22\x97\xceu\x0c\x18+\xb0\xfd\xa4&\xe8\x86\x09\
+\xbaa\x18\x1dk\xb7\x05\x02bs\xdd\x1boAiW\
+\xa5e\xfe`f'\xf0\xd9\xee\x96\xa5%\x80\x16K\x0d\
+\xb5\xdbE\x94\xea\xd1A\xd2\xc9B=\x94p\xd3\xa7+\
+\xc4\x95\xf4\xc1\xf2\x9a\x09\xb4\xa59\x90\x17\xe2\x9a\xf3\x0b\
+U\xce\xdb\x5cX\xda\xd9\x82v\xe8UQa\xda\xd5\xef\
+\xb0yn;\x17Q\x88f\xba\xfc\xd8\xaagq8\x9f\
+T\xaf\x96\x06J\x05\xc7Kn]\xc5\xce+\xfby\xe0\
+\xb1I\xbe\xf1\xc44\xc7G\xd3\xfa\xc2\xe7H\xa0\xe88\
+r\x22\xe1\x1f\xee9\xfe\x1d\xf7?X\xba\xeb\xb6\xeb\x06\
+?|\xf5\xb6\xbe?\xed+\xba\x7fI3\xc9\x9a\x0b\xd0\
+.P\xad\xd6;Y\xdcl\x88N\xad\x8by\xd4dT\
+~\x85X\xe0{\x9cF?\x83\x86\x1d\xf6\xa2\xed\x85\xb6\
+\x93\x09\xbaa\x82n\x18F7^8:;u\xcfh\
+\xb0\xcd\xbe\x5c\xc2\x22\x87\x5c\xb9|\xa2\xf5!1=\x15\
+\xc0HY\xf4\xeb4(RH(\x0c\xf9\x96\x8b\xd0\xc5\
+~_=o\xbbt\xa6\xdc\x16\xef\xdch\xff5\xeb\x91\
+4j\xb9\xe5\xdcr\x9c7wTeK\xf0\x85\x11\xe0\
+\xd8BM\xfb\xa9\x89\x11\xa6&\x86\x18Zu\x1c\xef;\
+\x1c\xd1]\xcf\x9f)\xee\xe7tv\x04\xa5\x9a(\xc3\xfd\
+1w\xde:\xc2\xb3w\x0c\xb1\xfb`\x8d'\x9e\x9ea\
+\xd7\xc1*\xc7N\xa4\xf5n\x92X\xd8w\xb8\x16\xfd\xdd\
+\xa1\xda\xddkV\x17\xee\xdey\xd5\xc0\x03;.\xe9\xfb\
+\xbb\xd5C\x85\x7fT\xe5k\xde\xe7\x9c\xca3W\x98\xb3\
+{\xb9\xcc5\xd5\xf9\xa5\x10\xc5\xc1\xbd\x22\x0a\xfaK\xa0\
+\xb7\xdb`y\x0f5\x05l\x04\xdd0A7\x0c\xa3K\
+\xad\x1d\x88\x22+\x87\x15\xd7\x11p\x0e\xe3\xa2\xcc\xb4m\
+\xc8QdV\xdf\x16\x90\xe6P\x1f\x1e*\x0eT\xeb\x7f\
+\xdd\xcaa\xeb\xa9s\x8e\xe5\x9d\x1a\xdf\x9e\xf2\xeba9\
+o\xb98\x96C\xce\xcf\xd3H\xedK\xb4\xdaAF|\
+V\xda\xb0\x90\xa0\x0bB\x08\xe0}Lw\xd2h\xe8\xa9\
+)\xee\xe7\xa9\x00\xfa\xa0\xf8D)\xc6\xc2\xb5\xdb+\x5c\
+\xb7\xbd\x8f\xe9\x9ag\xef\xa1\x1a\x0f<6\xc5\xb7vO\
+\x13\x00)\x08\xc7FS\xee\xf9\xe2\xf1\x9d_\xfc\xfa\xf8\
+\xcek/\xe9\xfbo\xb7\x5c3\xf0\xc0\x96u\xc5\x0fz\
+\xc7{S\xd8\xdb\xd4\x0fhrV\x91\xe2\x7f\x22\x0e\xf2\
+\xbb`\xcb\xccz\x0d\x11\x0b\x12g\x98\xa0\x1b\x86\xd1\xb5\
+\xb7\xcel\x14V\x02\x0eg\xe5\xd1\x11i\xd2\x16\xbf^\
+S\xdf\xee\x18\xb92\xd7\x8e?}dHQ\x02\xaaz\
+\xb2^\xb4~\xea\x02P\x93N\x96\xb9\x8d\x9c7/\xe6\
+\x1d\xe8\x1c\xe8\xfe\xb1\x97S\xce\x01\xa8\x88\xb2f\xe1\x19\
+\x222\xeb\xcb\xdd+\xdf\xf3h\x09\xfa\xa2\x04\x85$\xad\
+?\xa8\xe2H\xb8rk\x85+\xb7V\xd8s\xb0\xc6\xa7\
+\xbfr\x82=\xfbjHA \x12fj\x9e\xaf>8\
+\xee\xbe\xfe\xf8\xe4M7^\xde\x7f\xd3\x1d7\xad\xfa\xa9\
+\xe1\xfe\xc2\xdb\xaa\xa9\xfeI\xee\xf2Up\xcd\x0d\x7f\x1f\
+\x0e\x16\xa8\xb57[\x01*6\x82n\x98\xa0\x1b\x86\xd1\
+\xcd\xa6\xb12\x19M1\xec\x87Zl\xe0\x9b\x9c\xe7\xde\
+\xb7\xb1\xaf\x8f\xdb\x99qG\x10\xc4+\x81\xac\xfe\xffT\
+\xd0\xb90V2;\xfb]ig\x13\xbf\xd8=9_\
+\xce4j=(\xe7\x16\xa9\xbdU9\x9f\xbd\xa7th\
+\xe1\xef\xeb\xbe\x90-\x11t\xfc<\x15\xa89Y\x87m\
+\x1bK\xbc\xe9\xdb7\xf0\x91\xcf\x1d\xe7\xeb\x8fL\x22\x85\
+z\xd4w\x8aB\x16\xe0\xab\x0fM\xf0\xf8\xde\x99u\xaf\
+y\xd1\xda?\xbe\xec\xa2J!M\xf9\xa3\xdc\x9d\x03!\
+\x02\x1f\xe7\xeaxQ\xe4\xe3\xc4\xe9~D7\xdb\xbb\xb5\
+\xc7\x105A7L\xd0\x0d\xc3X\xc6V\x8e\xadK\xef\
+\x8e\xd87\x1edlH\x952\xad\xe4a\x95\xb96\xc6\
+l\xd6\xb5E\x96\x84\xab\x08\xa2P\x1f\xb5o\xbd\xc3F\
+\x905\x8d\xcf\xceX.9o\xf5'\x99\x9cw\xa4h\
+z@\xce\x01\xd4\xd1\xb7\xe4.\xf6X\xed\x1aI\xaaD\
+\x91\xf0\xaa\xe7\xaf\xe6\xd0\xb1\x84\x83\xc7\x12$\x92\x93\x9d\
+\x17\x14\x1d\xe3\x93\x9e\xbf\xf9\xd4\x11\xdet\xd7\xfa\xdf\xdc\
+\xbc\xae\xfc\x89\xd4\xebc\x8d~\x7f\xa4\xc2\x89R\xc2\x17\
+6\xee\xca5[AE\x8f\xddx|\xcd\xdfn\x1d\x1b\
+\xfeO\x99\x0bv\xa1z\xc9\xcf-H\x9ca\x82n\x18\
+\xc6rI\xa5\x86\x80\xd8\xba\xf4\xd3\xf1\xcd\x94c\x1b\xe5\
+\x1c`C)\x8bFD9\xd0J\xebBQ\x92\xc8\xcf\
+\x0e\x8f/\xde\xa4t.\xc2\x8b\xe2C;\x1a\x91\xba\xa9\
+\xa8\xae=\xe5\xd619\xbf\xc0\xa6\xb5\xaf\x089\xef\xe9\
+i\xedg\x7fea\xc9Cvqr\x92\x88,\x98\x16\
+\xec\x82yp{\xa5\x5ct\xdct\xd5\x00\x1f\xfb\xdc\xb1\
+z\x94\xf7\xd3\xcb(\x16\xaa3\x9eO}e\xb4\xff{\
+\xbf}\xfd\xcf8\x09?\xac9j\xd0\xa0\x17^|h\
+C\xee\x8c(\xa5,\xfeS/\xfaC\xb0x\xa7\x8e\xb1\
+\xb2\x08\xc1\x99\xa0\x1b&\xe8\x86a,\xb3\xaa\xebl\xce\
+\xf4\x0b\xbe\xcb\x22o!\xb4]\xce\x01V\x87(lm\
+Z\xd0\x05|\x1aS\x1d\xadP\xdcx\x02\x1aL\x0d\x14\
+\x13#\x22D\xad\x07x\xbbvi\x89\xb4\x1c\xe7\xe7\x95\
+\x9cwK\xccs}]\xaba\xf1\x17\xdd?[l\x0d\
+\xfa\xe9\xff2\xbaG\x9a)Wo\xaf\xf0\xd9\x07b\xa6\
+f|}\x9a\xfb\xe9\x14\x1d\xbb\xf7W\xd9s\xa0\xf6\xda\
+\xad\x1b*\xbf\x9a&\xfaL\x8e\xe1pJ\x12\xe1\x0a>\
+\xd7\xc5U\xd1\x87}\xe4?\xe4\x82\xfb^\xbbB=\x83\
+\x17\xe7M\xd0\x0d\x13t\xc30\x96\x97\x80CD\x11\xb5\
+5\xe9\xcb,\xe7\x00\xe2\xa3\xf4\x16\x81/7+\xe8\x99\
+\x87\xc4K\xce\xc5\xe0J\x10%\x86\xd9t|r*\xa8\
+\x5c\xe3\x02\x19\xab\x86\x9bM\xce\xdb\xff5+z\xe4|\
+\xc5\xc9y\xab\xd7i\xf1\x03\x89dSK\xaeA\xef\xe2\
+\xb3\xd4\xd5Sv\x9bU\x05ed\xa8\xc0U[+\xdc\
+\xff\xd0\x04\x14\xe5\x9c+\xa3\x99\xf2\xad\xa7\xa6F.\xd9\
+\xba\xfa5q1~G\x9e\xeb$N\xa9\xd6\xaadY\
+\xd6\xf0\x8c\x05\x05\x5c\x90\xdf\xacD\xe15\x22:hW\
+\xa9'H@,\x8a\xbba\x82n\x18\xc6\xf2\xcb\xa6-\
+\x9bl\xa3x\xb48U:\x84\xe8NU\xde\x99O\xcc\
+\xeb\xa1\xd8\x9d\x00Z\xefpi\x16\x89\x8bL\xb8iR\
+\xc9r\xedW\x0c\x85+\xfa\x93\xe8\xba\x85er\x85\xc9\
+y\xc7\xa7\xb4\xcf\xee\xdf\xed\x1c\xe7\xdd\x94\xf3\x8e\x04\x84\
+\xd3\x16\xbf\xaa\x03\xd3\xdaO\xdd\x1d\xea\xe2\xe4\xb8\xc8\xc2\
+#\xa9\xaa\x02\xeed(F\xa3\x9bO\xe6\xa0\xdcpy\
+?_{tj\xfe\x0fD\xc2S\xfbkL\xa7\xd3\xaf\
+\x9d\xe9O\xfe\x17yRf8%\xab\x96\xd0\xc9\x01\xc4\
+\xe5\x09\x16\xc7\xc3\xa5\xbe\xe9_\x89c\xfd\x1d\xeb\x03\xef\
+\x09j`i\xd6\x0c\x13t\xc30V\x8cv\x0aJh\
+b\xec\xd4\xc4\xbc\x9d\xd2'\xc8\x0b\x15w\x91\xc0\xbe\x86\
+\x7f\x99\xf7\xb8(@\x8b\xe9\xf3\x14!\xf6J\x96\xcd\xa0\
+\xea\x91F\xd7\x5cJ \x88\x7f%\xf4\x97[\x92&K\
+\xa3\xd6&1\xef\xb0\x9c_(\xeb\xcd\xe7Q@\x9f\x0c\
+\xd4\x16\xbb{U\x81\x10u-\xd5\xda\x5c\x14ws?\
+H\xbdr\xf1\x86\x12\x9b\xd7\x17\xd9w\xb0\x86\xc4g=\
+\xbf\x9cp|,\xe3\xc0\x81\xe9go\xdbZ\xba.K\
+\xf8f\x9e\xefw.\xc0\xe0T3\x85\xfd\xbb>\xc8\xb3\
+\x9c\xe8\xf7\xd8U2A7\x0c\x13t\xc30\xf27\x8f\
+-\xb8\xfb\xb2\xc9\xf9,\xab#\xd1\xd7\x02\x7f\xb0\xd4u\
+\x08@!\x05\x92\x1aI\x7f\x84h\xeb)\xda\x82(\xab\
+\x92a\x22\x04\xe7\x1a\xfb\xc5.P\xcc\x5cxc&\xf3\
+e\xfe5979?\x1f\xe4|\xce\x88\xd5\x9e\x8e+\
+\xf5)\xadP.:n\xb8\xbc\x9f}\xfb\xab\x9c=\xcb\
+A\x044\x0b<\xb1\xa7V\xbaj\xcb\xc0wV\x83~\
+3\xf7AD\x09\x9aw\xf9\x0f*A~H\xa2PR\
+\xe4\xb5v\xa5V\xb8\xa0+3V\x0cF\xaf\xe0\xac\x08\
+\x0c\xc3t\xd4J\xa3\xe3r^\xff\xa4\xf0c\xde\xbb\xbe\
+\xdat\x81\x85\xb7\x22>\x80s.wt\xe1\xa5%=\
+\x90\xb8\x94\xaa\xd4HHH\xa8\x91F\xd5y\xb7Dj\
+T]\xf2\x1d^\xc2\x0dr\xce\xf9\x9a\x9cwW\xce\x15\
+\x93\xf3\x0e\xca\xf9\x0a|49\x11[\x83~\x1ai\xa6\
+\x5c\xbd\xad\x8f\xbe\x81\x18\x9do\x02\xbb\x13\x1e}z\x86\
+\xc9\x99\xecn\x87\x16$(\xb96\x9a\xee\xc0\x9eq\xf0\
+\x06\x85\xdfV\xb0\xa8\xac+\x97\x99\x10\x9c\x09\xbaa\x82\
+n\x18\xc6\x0am\xfb\xc9\x5cs_.\x88\x8dy\x1bM\
+\xdd\x97s\x00q\xfe\xaa\xdah\xe5?$i\x89P\x80\
+\x10\xbbs6\xd5\x0cB\xd6\xd1\xde\x14Ap\x91CB\
+\x89\xda\xd1\x11j\xc7\xce\xda\x8e\xae\x86Z\xa5\xec\x9c\xfc\
+b\xd3\xe7\xdbV9W,\x8dZ\x9b\xcb\xcd\xe4\xdc\xe8\
+!|PV\x0f\xc6\x5c\xb5\xb5\x02\xd9\xb9\x8ft\x89\x84\
+\xe3\xa3\x09O>S\xdd\x11\x15xN\x1a\x05rm.\
+\x10\x22Op\xf9\xeb\x8f\x88f5\x1f\xfd\x9c\xf7\xee\xdf\
+\x09|\xca\xae\xd6\x8adB\x9c&V\x0cF\xaf`S\
+\xdc\x0d\xe3\x02\x16\xf5\x0b\x01\xd1\xb3\x05\xbdc\x91\xda\x97\
+\xfe\xda\xe0(\xad\x9a\xf9%u\xf2\xe1\xa8\x90\xed\xad\x07\
+%R\xd0\xfa\xcaV\x0d\x82\xba\x04\x9c\xeb\xfcX\x8c(\
+\x99:\xa6\x8e\x0esF\xec9\x11|\xe6\xe8\xdft\xfc\
+-\xfd\xfd\xd5\x9d\xea\xa5\x0dr\xde\xab\x91\xda-\xc7\xf9\
+\x85#\xe7\xda\xd9\xdf\x96\xf7\xf6t\xf5\x5c\xe8\xd6\xe1p\
+\x8a\xa0\xca\x8dW\xf4\xf3\xc0cS\xe8|K\xb6\x14\xbe\
+\xf6\xd8\xa4\xbb\xe6\xf2\xca\x0f\x88\xd3{\x9b9\x86#@\
+\x88\x9a\xfd\x89\x9f\x15\xe4\xb3>\xc8\xed\xce\x85\xbb@\x9e\
+\x0dz\x89\xc2\xa0@\x09XeWq\xd98\xe2,\xa5\
+\x8da\x82n\x18\xc6\xca\x17W\x9dM\xbduAuK\
+,o\x1b\x5c!*$\xeb\x93\x89\xca\x1fR\xe0;%\
+R\xd4;\x9cS\x90\xfa\x98\xbf\x06\xba\x92_IU\x88\
+\xcb)\xeb\xae\xdb\x0f\xde\xd7\xeb\x82\x02\xea\x11\x91\x1b\xbd\
+\xba\xb7\x05\xefL\xceM\xceM\xce\x8d\x15A\xe6\x95\xad\
+\x1b\xcbl\xddXb\xcf\xbe*\x14\xcezN\xc6\x8e]\
+\xfb\xaa\xec;\x90\xbcf\xfb\x86\xf2[\xd3,<\x93\xef\
+\xa58[\x1b\xa2@\x08\x82\xe2 h3\xa9P\xbe,\
+\x22_\xae\x07\x17\xd4\xd2L\x16\x17\xfb\xe2l\x00\x95\xbb\
+\x11\xfd=k{/G\x83G\x0e\xa8\xb3I\xc3F\xef\
+`\xb5\xd50.pI79?\xed\xaf\x1b\x92\xbe\xd6\
+\xa6ikp\x14\x06\xaa\xaf\x89\xcb\xfe\xbf\xceL\x97\x99\
+<\xbc\x86t\xaa\x0f\x0dQ\xf7s\xe2)\x84\xe0\xc8\x02\
+\xb3\x9b\x92\xf90\xe2\x03\xef\x06\x06s\xc9\x8b\x9e/r\
+\xae\x17\xb0\x9c\xb7y\xad\xbb6Q\xe6\xcd\x88\xb9v`\
+\xe9\xc4r7\xce\xc4\x82z\xcew\xa9\x0b\x91p\xdb\xb5\
+\x030O\x84{\x11\xf0i\xe0K\x0fM\xacR\xa7o\
+\x0cR\x9f\x88\xd4\xc8\x96\x01I\x16\x9d\xfcN\x17\x83+\
+\x08\x12\xb5|\x11j\x0a\x13\x88\x1c \x8e\xde!\x22\xf7\
+\xdb\x95\xec2! \xc3C{e\xeb\xc5V\x16F\xcf\
+`\xbdx\x86a\x92~\x01\x8c\xa4w6\xc7y~q\
+\x11\x80_\x13d/A\xde\xb7\x12\x8aGc\x81@)\
+\x92\xc2{\x80\x1b\xbb\x22\x8a+R\xce[\xff\x9a\x0b>\
+\xc7yn9_\x8e:f\xf4\x22I\x16\xb8f{\x1f\
+\x17o.\xb3w\xdf\x0c\x14\xce\x1ag*8\x1e\xdd5\
+\xcdS\x07\xaa?\xe2\xae\x9d\xf9\x93)\x9f\x8d.\xf5v\
+S\x81\x8dc\xc3\x14&\x8b\x14c\x7f2\xeb\x09\x02\xae\
+\x14\xa1IJ\xf0\xcd\xbf#O\xee\xa9\x01\x85o\x00\xb7\
+\xd9\x95\xec\x22\xce\xc1\xe8\xd8\x83\x8c\x8e\xc1V+\x0e\xc3\
+\x04\xdd0\x0c\x93t\x93\xf3\x05\xe4E\x91\xa8\x5cI\xfe\
+\xbcT\x1c\x0d\xe9d\xe9\xaf\x97\xbd\x94\x84\x8a\x13\xde\x83\
+\xf2\xca\xdc\xe7\xdc\x8d\x91\xf3n^'\x93\xf3\x95/\xe7\
+\xaa\x9d}.,\xf73Y\xc4\xf2\xa0/p\xd9\x0b\x05\
+\xe1E7\x0d\xf3\xde\x83\xd5\x93\x22}\xaa\xdc\xc0\xa7\xca\
+g\xef\x1f\xdb\xfe\xba\x8bV\xbfq]p\xef\xd0E\xea\
+\x8a\x02N\x15\xe7c\x12\xb7@]\x16\xc5E\xb3i\xd8\
+B\xce\xf7\xa4@\x7f\x1cf'k(\x08\xfb\xed\x9av\
+\xbd\x090\xa6*_\xb6\x09)F/aS\xdc\x0d\xc3\
+8)\xe9\x17\xe0\x8b{Y\xe4|\xee\xdf.\x0e\xc5\xb8\
+R\xfb+\x17\xfb\x9f83R[\xb7e\x80MQ\xa6\
+\x1fv\x81\xd7\xe6N\xa3\xa6\x8b\xfeAo\xc9y+3\
+\xadg\xff\x97\xfb\xb0\xdaj\xb95\x18\xa9\xbd\x1br\x9e\
+\xeb4\x96s\xbdyo<\xebL(\xe6'I\x95+\
+\xb7Tx\xd6U\x03h2OD\xf7\x82\xb0\xeb\xe9*\
+\x8f<\x94\xfc\xd4\xa0+\x0c\x17\xb2\x98\xf9\xb6\xe2\xecV\
+\xca\x0a\x0d\x95\xb58\x85\xc8#\x0d?\xab\x05\x0d\x11\x8a\
+\x10p\xf5Me\xca\xae`w\xef\xa1T\xf8\xf8XZ\
+\xd8;\x96\x16\xac@\x0c\x13t\xc30zQ\xd2\xcf\xcb\
+F\xa1\xae\x089\x9f\xcf\x0b\x14\xd4\xbb\xa88<\xfd\x07\
+.\xd2?C\x97#\xca\xaf\xbe\x08\x91\x7f\x11\xf8\xb6\xe5\
+\x1b5_!r\xde\xf47X08\x0b\x06\xd7\xe6\xc6\
+\x99\xadA_\x94\xcc+w\xde\xba\x8a\xd5k\x8ah\xa6\
+\xf3\xb6n\xef\xf9\xb7\x13\x97\x1e<\x9e\xfe4\xe2\xea\xdd\
+gz\xe6\x16\xe6\xb2g\xe4\xa9\x17\xa2\x88S\x5c\x14\x16\
+\xbd>\xf5c\x04\xc0\xa3\xea\xe1\xe4\x16R\xbbz\xdd}\
+\xc1\x89\xf3\x7fR\xaa\xccP,W\xad4\x0c\x13t\xc3\
+0zP\xd0\x01\x09P\x0f\x9b\xe3\xcf\x93M\xb3\x15!\
+\xe7\x8b7!\x00~\x08\x91\xcf\x89\xc8]]\xba\xdc\xab\
+P\xfd\x0d\x0d\xfe\x13\xc0U\xad\xe7879\xef\xae\x9c\
+\xb7R4\xcb\x15\x0c\xce\xe4\xdch\x0f>(\x83}1\
+\xaf|\xfej\xa2X\xd0p\xe6\xf5\x95H\x98\x9c\xcc\xf8\
+\xa7/\x1d\xff\xcf\x22ag\xe4f\xe5z\xb6\xe3C\x9c\
+\x22\xa2\xcdwH\x0bD\x91\x12\xc5\x01U\xa9O\x7f\x9f\
+\xfb+95M\xea\xe4\xf1Nm\xc1\xae^\x17\xed\x1c\
+>\x1d\xfb\xe8\xb3\x15\x1fQ\x09\xa6<\x86\x09\xbaa\x18\
+\xbd\xf92\xab?\x18\x82\x9c\xff'I'\xe4E[\x93\
+\x17\xd1\x1d\x12E\xff(\x22\x1fR\xf49\x1d*\x81\x01\
+\x90\x1fF\xf92\xca\xcf\x03\xc5\xd6G\xce;0=\xdb\
+\xe4\xbc\xb5:\xda\x91)\xed&\xe7\xddzF\xd5e\xce\
+\x86\xd0\x17#I\x03W^\x5c\xe1%\xb7\xad\x02\xaf\xe7\
+T\x11)8\x9e\xdc=\xd5\x7f\xef\xfd\xa3\x7fR\x89K\
+\x95>\xd7\x8f\xc3\x11\xb9\x88H\xe2\xb6U\x0b\x0f\xa8w\
+\xc4N\x09\x04D\xc2i\xf7\xe89\x9b\xb7+\xd75\xbc\
+\xa2oWQ\x0d\xa2\x04\xb1N:\xc3\x04\xdd0\x8c\x9e\
+Fp!\xba@\xe5\xbc\x9b\xc7\x9b\xff\xc3\xa2\xfc\xfb\xc4\
+e\x9fO\xcb\xd1?\x8a\xca\xdd\xa0\xc3uGi\xbe\xc1\
+\xae\xca\xd5\xe2\xf4\x17\x9d\xc8WE\xe4O\x81+s\xff\
+\xc8\x15\x95F\xcd\xa6\xb5wW\xce[\xec|29o\
+\xe2)l,E-\x0d<\xef\x86!n\xbfa\x08\xe6\
+Y\x8fN\xec\xb8\xf7\xfe\xd1\xdb\xef{l\xec\xf7\x0b}\
+\x109%\x8aA\x5c{K\xb7>j\xae=^\xe3\xce\
+\xbb\xd7\xfd{Q\xf9\x1c*\x9c\xdc\x0c\xa3G\xb0(\xee\
+\x86a,\x88\x0b\x11\xc1\xf5x\x87\xbf\x90#\xc7y\x1b\
+m\xbcuyq8w\x17\xca]\x08O\x8b\x0b\x9f)\
+\xf6W?\x83r?\xf04pb\x89g\xfbF\x94\xab\
+\x1c<W\xd1;5\xa4\xb7#\x94\x9b\xfe\x91+F\xce\
+i\xcfu29oku\xefy9\xd7\x0e?\x1er\
+?\xb6\xc4\x0c\xbd\xc1\xea\x91e\xca\xcb\x9f\xbd\x9aZ\xaa\
+<\xf0\xad\x09(\xb8\x93\xeb\xc3E@E\xf8\xc8\xbdG\
+~\xd8\xc5~\xff-\x97\x0f\xfdJ\x12:y\xdd\xa0\x9a\
+\xc5\x94b\xbf\xd0\xe5\xb3\x81\xb1\xeep\x10\xf4\x97\xec\x1e\
+2L\xd0\x0d\xc38O%\xdd\x11\xa4\xc7\x97\xcdu+\
+wv\xa7\xc4E\xd9*\xce\xbf\xa944\xfd&\x0d\xa2\
+\xa0\x07\x82\xe8\x01\x90\x83\xc0(\xa2U\xa97\xfc\xfa\x81\
+\xf5N\xd9\x10\xd4_\x04\x0c\xb9\x05[(\x17h\x1a\xb5\
+n\x8by\xb7\xe4\xfc|\x0b\x06\xb7\x92\xe4|\x19\x98[\
+\xb3\xac6\x1c\xbb$A\xebA\xf5^\xfd\x825DN\
+\xf8\xea\x83\xe3\xe8\xe9\x92\xee\x04\x9f)\xff\xf0\xcf\xc7\x7f\
+\xd9\x05W\xbc\xe5\xba\xa1_\x9c\xa9v\xae`\x95\xd9\xd1\
+ZQ\xf4\xdci\xd5\x91\xd8Hn\xe7\xef\x1f\xf8\xe9\x82\
+\xca3V\x12\x86\x09\xbaa\x18\xe7\xed\xab\xceiD\xe8\
+\xd5\xa5sK\xb6\x85zG^f\xa7\xb8\x0b\xb0Y\xd1\
+\xcd\xcb#/\x17\xa6\x9c\xb7~\xca\xcb5M\xbb\x17\xf7\
+\xed\x92\x9c\xaf`\xf9\xb5\xe5\xe79%=(\xce\xc1\xab\
+^\xb0\x9a\x81\x8a\xe3\xb3_\x1d\xab;rT/H\x89\
+\x84$S>\xf4\xcfG~a\xba\x16\xaex\xce\xf5\xc3\
+?\x1e\x9c\x1c\xf2\x1d\xec\x01QQj\x91'\xc8\xa9\x89\
+\x5cqpQ)s\xf3\x89\xbb\xd1\xa6\xd7}\xa6\xf2\x97\
+I*\xef\xb7\xa9\x0a\x86\x09\xbaa\x18\xe7=N\xa2\xd9\
+\xb41=G\x87\xe6S\x9f\xe7\xf2r\xde\xc8y\x9b\x8a\
+\xfc\x82\x5cs\xbe\x0c2\xab\xcb|o\x99\xa0\xf7\xb0\xa4\
+\xd7\xd3\x9b\xbd\xe4\xb6U\xac\x1b)\xf2\xf1/\x1egr\
+2;9\xe5]\x22!\x04\xf8\xe8g\x8f~\xd7\xc1\xa3\
+\xc9-/\xb9u\xe4m\xfd\x15\xf7\xfe4\xe9\xcc\x8bM\
+T(g\x05\xce\x1a1/\xabX \xf7\x8e=>\x84\
+o\x147n\xfc)'\xb1M?1L\xd0\x0d\xc3\xb8\
+0\x10q=(\xe9\x92\xad,y\xe9\xc5\xf5\xb8\x96\xe3\
+\xbc\xfbb\xde\xc0\xfe\x96\xe3\xbcM\xf5{\xe5\x89\xbd\x9c\
+\x9c,c\x92\x91\xb7\x0a\xd5\x12\xe5\xc6+\xfa\xb9h]\
+\x91O\xdf7\xcaCON\xa1\x01\x88\x05q\xa0\xe2\xf8\
+\xea\x83\xe3\x97<s\xa8\xf6W/\xb9}\xd5\x8f^\xbd\
+\xb5\xf2\x8e,\xc8?\xd6R&;\xf0\x8bfG\xcb\x15\
+\xa7B\x106\xd8U\xea\x18\xc7\x82\x977293\xea\
+b\x13t\xc3\x04\xdd0\x8c\x0bJ\xd2\xcf\x87\xf7\xde\x85\
+&/]*\x1a\x93\xf36\x96\x9f\xc9\xf9\x85*\xe7\xf5\
+\xe7\xac\xd4\xf5\xdc\x1c\xa3)jI`d0\xe6uw\
+\xae\xe5\xb1+\xfa\xf9\xd27\xc7\xd9u\xa0\x86&\xa1\xbe\
+`=\x16\x0e\x1dKx\xdf\xc7\x0f?o\xc7\xa5}\xcf\
+{\xce\x0d\xc3OlZ[\xfeP\xc1\xb9\xbfO\xb3p\
+\xbfB\xadm\xd7R\xc1;a\xd7\xc8\x09.\x1a\x1f\xba\
+\xb1\x94\xc56\xc5\xbd\xfd$\xe2\xa2\xef\xd3L\xbf\x99\x1e\
+\x1f\xb3\xd20L\xd0\x0d\xc30I797y19\
+\xc7F\xce{\xae~\xaf\xdc\x87\x98\xcdpo\x9d\xcc\xd7\
+\xaf\xefU\xdb*\x5c\xbe\xa5\xc23\x87k<\xfa\xf4\x0c\
+{\x0eV96\x961]\xf5\x90)\x0f>4\xc9\x83\
+OL_~\xe5\xb6\xca\xcf\xdd|\xcd\xe0\xcf]\xb2\xa9\
+\xf4h!\x96\xcf\xfb\x10>\x87\xc8\xd7\x80\xdd\xc0x\xce\
+ZX\x9e\xdd\x8a*DN)o\x98\x18\xfc\xf7qp\
+\xcf19\xefH\xa3\xe4G\x9d\xc8GA\x11g\xab\xcf\
+\x0d\x13t\xc30L\xd2M\xceM^\x1a\xdf\xb7[\x11\
+\xf5-\x8d\x9a\xd5\xef\x1e\x95\xf3\xb9\xe7\xab\xd1\x1e\x92T\
+\x11\x81\xad\x1bKl\xdf\x5c&\xcd\x02\x13\xd3\x9ecc\
+\x19GN\xa4\x1c\x1dK96\x96qx4\xe3\x1f>\
+\x7f\x9c\x8b\xd7\x17\xafz\xe9\xed#W\x8d\x0cD\xff\xc1\
+gA\x81g\x80=\xa2<\x09\xf2\x0cp\x18\x18\x03\x12\
+\xa0\x002\x5c\x8c\xfc&\x84-\x8al.E~\xb5\x88\
+\x0e\x00}@q\xb6\xad]\xeeO\x0b\x15\x93\xf3\x0e\xbc\
+\xd5#\xde\x82\xea_XI\x18&\xe8\x86a\x18=%\
+\xe9&/\xe7\xbf\x9c\xb7\xa9\xc8{R\xce\xdb\x5cX\xdd\
+\xa8\xdf\xdd\x0c\x06\xd7cr~R\xd0M\xd2\xdbW\xcb\
+\x15\xd2\xac\xbe\x16\x5c\x04\x86\xfabV\x0d\xc4\x5cqq\
+\x05\x14|P\xd2L\xa9\xa5\x814S*%G\xa8W\
+\x13\x01.\x9e\xdd\x9e/s\x17E\xcf|V\x14\xa3p\
+\xf2\xff\xb9\x05$\xdc\xe4\xbc\xedxQ\xfe\xa3\xc2\x9fZ\
+Q\x18&\xe8\x86a\x18=%\xe9&\xe7\x17\x86\x9c\xf7\
+\xf2\xb4\xf6\xe5\x1c9gy\xea\xb7\xc9\xf9\x12\xcfU1\
+?\xef\xa0\xac{U|8\xb3>8\x07}\xe5\xff\xc7\
+\xde\x9b\xc7Kr\x9d\xf5\xdd\xdf\xe7Tw\xdfe\xf6]\
+\xfb\xbe\xcbF\x8bmy\x91\xe4\x15\x19\xd9\xf2\x02\xc6\x01\
+cc\x82\x17\x08\x06^\xcc\x12\x82\x09\x10\x03Q\x80\x80\
+\x81\xbc\x09\x10BHL\xf0\x9b\x84,\x8eIL^\x88\
+\xb11`\x1b\x8c-Y\x96\x17Y\x9a\x19\xcd\x8c\x96\x19\
+I\xb3/w\xe9\xad\xce\x93?\xfa\xdeY\xa4\x99{\xbb\
+oWUWw\xff\xbe\x9f\xcfX\x96\xa6\xbb\xaa\xfa\xd4\
+SU\xe7[\xe7\x9c\xe7\x09\x80\xe1\xd1{\xba\x05K\xbd\
+\x0b\xe7(\xd8{\x1d\xff\xa8\x9aBH\xd0\x85\x10b\xf8\
+$\xdd3\xf9\xda\xd0$\x83\xeb\xa7\x06\xf4\x10\xaf7/\
+Z\xce\xbd@\xd9,\xa2\x8cZO\x9bS2\xb8\xbc\x09\
+&\xf1\x1b\x84\xb8\xbb\xab\xd5K\x7f\x92*\x95\x07\xb0\xea\
+{i5\xbe\xa4\x06\x11\x12t!\x84XF\xd2q\xa3\
+l\xe3>\x8e\xa7\xbd\x8f\x8c\x0ehdp\xd4\xe4\xbc\xc8\
+\xef\x16=r.9\x1f@|\x8f\x87\x9c\xe3\x10\xb4\x08\
+]\x88g3c\xf0;^I\xee%TO\xd0\xack\
+\x19\x88\x90\xa0\x0b!\xc4\xf2\x96\xee\xe0\xc3\xfe\xc4\xd4\xc8\
+b&\xfb\x1e\x82L\xed+\x96\xf3\xa1\x9e\xd6\xae\x99!\
+\xc3\x80\x12Q\x0b\x01\x98=\x89\xfb\x03`\x7f\x89\xf9\x9f\
+\xe0l?m\xaa\x83\x10\x12t!\x84\xe8\xaa\x7fl\x11\
+\xf3a\xcdp\xa4\xf5\xe6\xe3\x22\xe7\xc3\x9b\x0cN\x95\x08\
+\x8a\x8b\xefAz\x89\x06\x07\xc5\xd8\xf1\x0c\xf0(\xe6\x0f\
+\xe0<ppj\xee\x81\xcd\xed\x0d;h\xb5O8\xae\
+\xebAH\xd0\x85\x10\xa2?Iw:\x09k\x87\xe9\x91\
+*y\x91\x9cK\xce\x15\xdf\xe5 \x04\x19\xba\x18Y\xe6\
+\x81}\xc0v\xc7\xbe\x8a\xc5\xaf\x84P\xfd\x06\x1e\x1f#\
+\x8d\x87\x16'\xe15C[-%$\xe8B\x081\xbe\
+\x92.y\xc9d\xbf\x92\xf3\x9c\xe4\x5c\x95\x08\xc6I\xce\
+\xe1T\x928!\x86\xb9\x1b\x80\xd9\xd3\xe0\x8f\x83=\x8c\
+\xfbC\xee\xf65\x83\xed\xc0\x93f\xd4}\x89{\xb2\xea\
+\x18\x08\x09\xba\x10B\x8c\xa5\xa4\x0f\xa8\x06\xb4\xe4\x5cr\
+^\x88\x9c+\xbe\x87\xd5k\x82\x0c]\x0c\x17\x87\x81\xc7\
+\x81\xed\x98\x7f=\xc5\xbf1Sm>\xb2!]\xf3d\
+\xb4x\xd8b\xecLR\x8fhf\x88\x10\x12t!\x84\
+$=\x0fy\xe973\x99j\x9c\xf7\xbco%\x83\x93\
+\x9c\x8f\x85\x9cw0[\xa8\x8c!D\x09E<5\xdf\
+\x95D{\xc8\xb1\x87\x0d\xdfn\xc6\xe3`\xcf,\xdeg\
+\x1dh\x85\x08\xa9\x1aL\x08\x09\xba\x10\xa2\xb4\x92\x9ez\
+\xdag9\xab\x15vt\x09\xed\xf0\x9c\x97\x03\xfd\xca\x8b\
+\xe4\xbcP9\xef{\x0b\x92s\xc9\xf9p\xa1\x01tQ\
+\xfc\x83\xdaO\x7f+\xb4\x1f\xd8\x07\xf6\x08\xe6\xdbq\xff\
+:n\xbb\xdc|\x8fa\x87ZI\x8cIL\x96y\xf6\
+\x0a!$\xe8B\x88R\x93X\xa0=\x00I7\xfcY\
+]\x85~\xd6\xe3\xf6!\x02^\x80\xec\x9d\xf3c\x83*\
+\xa3\xd6\xbfZ\xf77\xa5}\x85\x07Z\x84\x9c\xe7\x96\x0c\
+nPb^P|\x8f\x81\x9cw\xea\xa0/*\x8e\xca\
+I\x89\xdcH\x81\x03\xc0\x13\xc0Nj\xb5\x87\xbd\xd5|\
+\x04c{\xc0\x9et\xf7\x03X\xc0\x0c<*\x0e\x85\x90\
+\xa0\x0b!F\xf3\x86c\xc9@$=\x1b9\x1f\x82Q\
+\xc5\xcc\xbf?\xae\x99\xda\x87U\xceU\xe3|0\xd7X\
+\xf6\xa8\x0e\xba\xc8\x90y\xe0\x00f\xbb\xcc\xd9\xd5\x0a\xe9\
+\xd7\x83\x87G-\x86\x1dF|:\x86x\xd8\xdc\xb0Z\
+\x15ZM\xb5\x96\x10\x12t!\x84$}\xc4\xe5|\x80\
+?q\x5c\xe5\xbc\xff\x9f+9\x97\x9c\x0f\x163\xe5\xb0\
+\x16=s\x02x\x1ax\xd4-\xee \x86\x87\x0d\xdb\xee\
+!\xee\xc1y\xcaB2k\x0e\xd1\xda\xd8\xd9\xea\x8a\xbb\
+F\xc9\x85\x90\xa0\x0b!\xc6Z\xd2SO\x89\xc5-\xfc\
+\x96\xbc\x8c\x89\x9ck\xe4\x9c\x82\xa7\xb5K\xce\xf3 \x98\
+\xea\xa0\x8b\xb3\x12\x81C\xc0\x93\x86\xedn\x85\xf4\xe1J\
+\x0c;\xcc\xd9\xee\xc6^K\x92}\x9e\xa6\xadhNx\
+\xf6\xea.!\x84\x04]\x08!\x96\x22\xb1\x04\x1f\xc4H\
+\xba\x92e\xe5$\xe7\x19\xedw\xec\xca\xa8\x0d\xab\x9c\x0f\
+*\xbeG_\xce\x01B\xd0\x08\xfa\xf8\xe2\x80\xcd\xd1Y\
+\x1f\xbe\x1b\xd8\xed\xf8C\x18\x8f\xa6i\xb23\xe0O\x05\
+\xf3\x83\x00i\x88$1(V\x84\x90\xa0\x0b!DF\
+7\xa0\xa2\xa7\xbb\x8f\x85\xbc\xe4\xb0_/\xe8\xc4\x0c\xa5\
+\x9c\xf7{\x9e$\xe7\xdd\x7ft\xf4\xc5|\x91Dk\xd0\
+\xc7\x85\xc3,LKO-\xeeL\xac\xf6\xb0U+;\
+\xbd^\x7f\x0c\xe3iw\x9b\xed\xe4\x0b\xd4\xf4s!$\
+\xe8B\x08Q\xa0\xa4\xe7<\xdd=\x95\xbc\xe4)\xe7\x19\
+\xedw\xecF\xce3\x9e\xe9\xa0\xf8\xce7\xce\x0b\xf6\xa3\
+\xa0\x22\xe8C\xc7\x129\xf7[\x0b\x12\xfe$\xb0\xd3\xcd\
+w\x04\xb7\xed\x16\xc2\xa3i\x8c\xfb\xdc\xfc\x19\x83\xb4\x1d\
+R\x12\x0fPQ\xd7\x5c\x08\x09\xba\x10B\x0c\x98\x5c\xa7\
+\xbb\xf7\xbcQ\xc9\xb9\xe4\xbc\xccr\xdeO\x8ds%\x83\
+\xeb\xe7\xd0l\xf9QL\x03\xa6\xd2\xd4\xa1\xcf\xb2T\xca\
+\xe2>|\xa4\xe6G\xcdm\x9f\xc1\x1e`\x07\xd8#\xe0\
+\x8f\x12m7\xc1\x9f\xf1h\xc7-\x9c~\xc7\xb2\x9c\xae\
+5!\x84\x04]\x08!\xb2\xb8\x19\x95\xad\x04[\x19\xe5\
+\xbc\xa8dp\x92s\xc9y\xa6~<\xc82\x83Kl\
+\xa3\x97wbn\xc4X\xc1\xcc\xe0\xdc\xa3\xdb\xf3i\xca\
+G\xaf\xbdd\xeaG\xbe\xbc}\x86z=b\x95\x95\x8d\
+\x84\x87\xa0\x11\xf4\x92\xd2\xc4\xec\x19\xdc\x9f\x04v\x9a\xf9\
+\xceV\x9a<\x5cs\xdb\xb3o\xe3\xd1\xc76\xccM\x1e\
+\x9ej\xd4Z\x9d\x0cmB\x08!A\x17B\x8c\x80\xa4\
+\x17\x9b\xdd=\x0byQ\xa6\xf6\x15\xed\xb7o_\xecg\
+b\xc4\x08dj/T\xce\x87\xf1\xe5Svr\x0eN\
+\x8c\x15\x9e\xd8u5\x1b\xb7=\x0d\xe99\xe5\xb9\xddN\
+y\xff\x95\x17M>\xf9\x8eo\xd9\xfa+\xff\xf5\x93\x07\
+\xc3\x89\xd9\x16V\xe9}8\x5c#\xe8\x03\xe7(\x9d)\
+\xe9O\xb8\xf9\xc3\x06\x8f\xc64y\x04\xe2\x13\xa1\x96\xec\
+\xb5\x18g\x88\x0b\xab\xa7\xbc\x13\x0f\xd1\x1ci\xb9\x10B\
+\x82.\x84\x189\x8a\xcf\xee>\x8e\x99\xac\x87\xbd\xc6y\
+I\xe5\xbc\xc8\xef\xba\xe2\xbb\x189_\xb8/%m\xf6\
+\xee\xb9\x9c\xcb\xae}\x88\xb5\xeb\x8f\x90\xa6\xc99?;\
+\xd7\x8a\xbf\xb6\xed\xbc\xc9]o\xbfg\xf3\xef\xff\xf7O\
+\x1cZ\x7f\xe8H\x13\xab\xf6`\xdcfZ\x83^\x0c\xf3\
+\xc0A:S\xd2\xf7\xe0\xf6\x0d\xc7\x1f\xc5\xfcQ\x8c\xbd\
+\xa4\xe1\x00\x90\x92t\x9eF\xaaZ&\x84\x90\xa0\x0b!\
+\xc6\xf7\xc6\xf4\xec\xe9\xee+\xec\xabw\xb2\xdf2)y\
+\x19\x1d9_\xf9\x8b\x9b\x9cg:(S{\x86\xcdZ\
+.9\xef8\xb3\xd3nN\xb0\xfb\x91\x1b\xb9\xf9\xa5\x7f\
+\x0dK\x08\xba\xb9q8m\x7ft\xe3\xb6\xf0\xd8\xf7\xdc\
+\xbd\xed?\xfe\xe7O\xee\xbf\xe6\xe9\xfd\x0d\xac\xd6\xbd\xa4\
+\x87\x80FcWx\xcf?K\xbb\x1d\x04\x9e\xc1\xd9\x89\
+\xb1\x0b\xe3aw\x7f\x14\x0f\x8fa<\x8d\xf9\x8c\xe1\xe0\
+\xd2o!\x84\x04]\x08!\x96\x94\xf4\x96\xa5\xb4\xfb\x5c\
+\xcbW\x89\xfce\xe2T\x1d\xe2\x12\x1a\xdf\x1b1\xb2\xf2\
+\xf1\x94\x15\xfc\x1e{\xf6\xf7W\xba\xdfs\xec\xbb\xa7\x9f\
+c+\xdco\xbf\x1d`_\xd9/?\xe3K\x06\x10\x1d\
+\xdf\x82\xf3f dr\xbe$\xe7+\xdb\xef\x90\xc8\xf9\
+\x22I\xb5\xc5\xbe=\x97q\xf9\xb5_g\xcd\xfa#\xc4\
+\xa5$\x1dh\xb6\xfc\xbeMk\xab\xaf~\xe7\xeb\xb6\xfd\
+\xe1\x7f\xfd\xd4\x81W?\xf6\xe4|\xd7\x92\x9eh\x0dz\
+\xaf\xd4\x81\xa7\xda!\xeeMb\xd8\x01\xb6\x03\xf3\x1d8\
+\x8f\x82\xed3\xe3\x80G\x8f`*Y&\x84\x90\xa0\x0b\
+!\xc4J\xa9zBp\xa7Y\x89\xb4\xcdO\x8aV\xb7\
+]\xd7\x08$-\xfe\x88\x94?\xcaL\xce\xcf\xe8\xe9\x17\
+\xd0\xd1\xb3\xac\x8e9\x8b\x9f3\xd8\xf6\xb2\xbe\xbed\xa7\
+\x1f\xcd\xb5\x06oX^\xd0%\xe7\xc5\xc9\xb9g\x1c\xcc\
+\xd9o\xde\xcci\xb7&\xd8\xfd\xc8\x0d\xdc\xfc\xd2\xbf^\
+R\xd0\x17i\xb5}\xef\xba\xe9\xe4\x0do\xbb{\xf3o\
+}\xec\xd3\x87\xde\xbd}\xe7\x1c6\x11\x96\xfd\x0dI@\
+C\xe8g\xbf\xa5\x1f\xa1\xb36|\x0f\xb0\xbd\x1d\xc3\xf6\
+J\x88\xbbl\xdd\x86\xdd\xe9\xf1\xc3\x07f\xaa\xcd\x99\xf5\
+\xf5\xa9N\xd3\xe9\x1d\x87\x10B\x82.\x84\x109\xdc\xa4\
+\xa2Qi&\xb4C\xa4\x95D\xda\xa1\xfb\xc1^\xf5\xcf\
+\xc4s{\xf8\x0e0\x9d\x89l\xaa\xc6y\x89\xe4\xdcs\
+i\x92g\x93TZ\xec{\xecr.\xefb-\xfa\xc9\
+\x98k1?\xbf\xa6\xf1\x9e7\xdc\xbda\xe7_|2\
+\xf9\xa5/?r\x02\xaa\xe1\xdc\xc9\xe0\xcdH\x92\xb1\xbe\
+{\xcd\x02\x07\x80\xc7\x08a'1\xee\xb0j\xf5\x11o\
+\xb7\x1fk\x85\xd6\x13\xd5v\xe5\x88a\xa9\x9b\x13\xa3u\
+^\xb3\x85\x04!\x84\x90\xa0\x0b!D\x01\xf8\xe9\xa2\x1e\
+\x8dv\x80V\xe2=\x89\xba\x10\xa7\xc9y6\xb29J\
+e\xd4\xc6Z\xce\x17?\xd0\xdd\x9d\xc4\xcci5'\xd8\
+\xf3\xc8\x0d\xdc\xb4\xccZ\xf4\xd3i\xa5N\xcd\xf8\xe5\xb7\
+\xbcb\xf3\xae\xda\xa4\xfd\xde\x17\xberb\xadW\xec9\
+\x92\xbe8\xf2[Il\xd4\x07\xd0\x9d\xce\xda\xf0\xbd\xc0\
+nw\xdbn\xf8\xce\x90$\xdb\xa3\xa7O\x9a\xfbS\xee\
+\xcc[\xa5\x827[]\xa4\xb5\xd7t\x03!\x84\x04]\
+\x08!\x06$\xea\x9c\x14\xf5f\xe2\xa4\x12u1\xf6r\
+>(1\x1f\x159\xef\xb1\xe3\xb40\x8a~\xc1U\x0f\
+\xb3f\xc3!b<%\xe91\x9e}\xdd\x84\x01it\
+\xa2\xfb\x7f\xb9\xe7\xf6\x8d\x8f\xad\x99\xac~\xe4S_<\
+|\x95\x07\xb0\xb3\xac7\xaf$6*\xd29\x03\xec\xc7\
+\xd9\x83\xd9.\xb7\xf8\x0d\x83]\x1e\xc3\xa3\x86?\x1d\x83\
+\x1f\x08n\xb8\x1bf\xde\xa91/\xd7\x16BH\xd0\x85\
+\x10b\xb8E]#\xea\xa2\x109\x1f\xb5\x1a\xe7y\xca\
+\xf1\x88\xca9tF\xd1O\xccOr\xd1\xd1Kx\xcb\
+uG\xf0\xe6\xa9\xae\xd4\xee\x06|y\xae\xc5\xfe\xe8T\
+\xfc\xb95\x07b\x04\x9a\xf6\xf9\x9b\xee\xa8\xbd:Y\xb3\
+\xee\xc3\x9f\xfa\xcb\xe3\xafIS\xc7N\x9f\xd2nt\xa6\
+\xb8\x97UT\xdd13p\xc3;\x09\xd7\x22\xb0\x1fx\
+\x0a\xd8\x01\xec2\xe7\x1b\x18{\xdc|\x8f;\x07\xf00\
+\xaf\xcaqB\x08!A\x17BH\xd4\x85\xe4|\xb8\xe4\
+\x5c\x99\xda\xfb;\x86\xdc\xcb\x05B;\x1a\x1bW\xcd\xf1\
+\xbd7>\xc9y\xb5*\x9d\x8cn\x1d\xae\x9d\x0c\xbcb\
+U\x85\xaf\xb6Z|a\xb6\xc5\xd3-\xa7\x1d!\xf53\
+w\x7f\xcc\x9bO\xbc\xe8\x9bV\xbdaKu\xe27?\
+\xf6\xd7\x07\x7f`n>b\x95SR^\x09\xa5\x9c\xe2\
+>\x83\xd9>\xabT\x9eh\xc4\xc6\xf64\x89;\xa7\x9a\
+\xb5\xed\x98\xef\xc1\xd8\xe7\xce\xe1@G\xda\xcd5\x10.\
+\x84\x10\x12t!\x84D\xfd,S\xdf\x85\xe4\x5cr\x9e\
+\xa5\x9c\xf7{\x88\xc3-\xe7\x00\xf3\xad\x0a\xef\xb8e\x07\
+\xe7m=\x02\x8d\xea\xb3\x83\x8e\xa9\x00\xb7M\xd6\xb8m\
+\xa2\xca\xe3\xcd\xc8\x97g#\x7f\x9d\x18\xb3mg\xca\xa1\
+\xb2P\xe9\xab\xde\x8c\xf5\xe7_1\xfd\xbe\xa9\xe9\x0b\x1f\
+\xfc\xe3\xbfz\xfa\xd7\x0f\x1elNS\x0d`Fep\
+9\xcfZ\xc0a\xe0\xf1h\xbe;D{\xc4\x8c\x1d\xed\
+\x18\x1eMS\x1e\x9f\x98\xae\x1c\x08\xab\xd74\x9a\xc7\xf7\
+\xd2\xa8\xa6L7&\x16G\xd1\x85\x10BH\xd0\x85\x10\
+byQ\x17\x92s\xc9y\x96r\xee}|l\xf8\xe5\
+<\x8d\xc6\xa6Uu\xdeq\xebvh\x87e\xdb\xf9\x92\
+\x89\xc0%\x13\x09\xb7\xfbz\xbe4\x9b\xf2\x88G\xf66\
+\xa1\xee\xce\x1a\xa0\xd1t.\xd8<\xf5\xbb\xdf\xf3\xbam\
+_\xfd\xd8g\x0e\xfd\xde\xee=s7X-\x90\x04\xcb\
+\xfe=\x8a/\xac\xf1\xee\xd0Y\x1b\x0e\xbb\xc1wb\xb6\
+=\xe2\xdb\x93h{\xcc\xfc\xc9\xd4\xech;Dj\xa7\
+\xad\xafw?5/\xc9\x00s\xcdS\x12B\x08\x09\xba\
+\x10B\xf4 \xeaI\x5c\x5c#\xe9X\xccR\x0a\xbc\xe0\
+_sV\x03\xcdn[F.\xbf/\xaed[1\xa3\
+v\xb3>\xdbDr\xbe\xf2\xfd\x8e\xa8\x9c\x03\xcc\xb6\xaa\
+|\xd7-;\xd8\xb6\xf9\xd8sG\xcf\xcf\xb9[g\x13\
+\x15\xeeZS\xe1U\xab\x9c=u\xe7O\xa8\xb1\xafi\
+\xd4\xddi\xb5\x22kWU>w\xd7\xab\xd7\xbd\xfc\xfe\
+/&\x1f\xfa\xea\xa3s\xdf\x9bQ\x99\xb532\xa5\xdb\
+\xc4\xc4#\xdel\xed\x80\xb8\xdd\xb1\xbd!\x84}\x9e\xc6\
+\x86\x07\xc70\x16}\xdb\x17.\xc3t\xe1\x9f\xf6\xac\x7f\
+g\xe1\xff\x9f\xfe\xefRu!\x84\x90\xa0\x0b!DW\
+\xdd\xf1lf_\xfa\x80\x7f\xc5\xb8\xed\xbb\xffc7\x07\
+_2+\x95\xe4\xbc\x189\xf7|\xe3\xb1@9O\xdd\
+\xd8<]\xe7\xed\xb7n\x87v\xd2\xfb\xf1\xc7N\xa7\xeb\
+\xaa)\xe3G\xd9\xc0\xfe\x8a\xf3\xa5\xf96\x0f\xce\xc2\xc1\
+\x96S'\x1ez\xfe\xb5k\xdeu\xc1\xa6\xc9?Y;\
+\x9d\xfcB\x1a\xfd\xc6.7>Gg4|\x0f\xb0\xdb\
+Bx\xc8\xddw\x11\x92\x1d\xc4\xf8\xb4\xc7x u'\
+Tk\xc4f\x1bwh\x03\xc1\xc1\xddqw\x92E\xe9\
+vg\xc2`U\x80\x89`\x8b3\xeei\x03i\x80\x09\
+\x83`N4\xa3f\xc6\xc4\xc2\xdf5\xbc\xb3\xce>Y\
+\x94\xfa\x855\xe8\xe6\x86-\x5c\x8fA\x22/\x84\x10\x12\
+t!\x84\x10\xe3\x8b\xb9/#\xe9\xbd\xfa\x5c\xc6\xd3\xc3\
+%\xe7\xfd\xed\xbf@9\x07\x98kV\xf9\xae\x9bwp\
+~\xb7\xa3\xe7\xcb\x1c\xd2\xd6\xaaqw\xad\xc6\xabV;\
+\xdb\xe7\x03\x7f;\x1f\xf9\xf2\xd16k\xd7U?\x1a\xaa\
+\xe1\xff4S\x7fo\xc5x7\xf0\xfc\x85\xd3x\xd0\xb1\
+\xa7\x83\xf9\xce\x14vE\xf7\x87\xcc\xd8\xe51\xec\x89\xc4\
+\xfd\xd1\x99\x05HB\xa0J\x8a\x9bu\xa6\xa2\x03[*\
+F\x08N\xac\x185\x02\x17W\x03fF\x1a\x8dU\x15\
+\xb8\xa4\x9a\xb0\x98\x8f}u\xc5\xd9\x9c\x04|a\xad<\
+\x91\x93\x19\xdb\xcd\x0c\x92:\xbeq\x1dD\xa7\xbe\x0a\x9a\
+\xed\x16'\xd2@\xdb\x021\xc2\x8c\xb7\xd8\xdf6\xa2\xc1\
+\xd1P\xe7\xc0|\x8dh\xd00cfA\xdc}A\xe6\
+\xbb\x9e\xec\x22\x84\x10\x12t!\x84\x10b\x0c%=\xb7\
+\x89\x03\x92\xf3<\x9b3\xef\x93\xd9\x8e\xc6\xa6\x15\x8f\x9e\
+/qx\x0b#\xd6\xcf\x9f\x0a<\x7fz5\xc7VG\
+v\xd4Sv\xc58\xf3D+\xfe\x8bci\xfa;\xad\
+\x98\xdc\xe0\x10\xaa\xe6{\xe7[\xd5\x03\xab'\x9aq[\
+\x12\xa8\x9aw\xca\x86\xc7\xc0\xa5\xd5\x0a\x13\x01\x1c'\x09\
+\x81\xcb\xaa\x09\x15\x03\xf7@\x82\xb3\xb5\x12\x08\x96\xe2\xd3\
+\xd5\xceH\xf6\xc9K\xc2N;\x98\x855\xf5\x96v\xa4\
+<\xd8\xa9\xf8Y\xfc\xeb\xce\xb0xg\x03\x06\xd3\x95\xce\
+\xc6\xce\xab\x04\xb0\xc5\xcc\x9c\x01\xc2\xc2\xd0\xfbT\x83\xf4\
+\xf8j\xda\xc0\x5c\xa5\xc1\xa1d\x86\xfd'6\xb0\xb7\xe1\
+\x1c\x88)G\x89\xd4\xdb\x09s\xd11s\xaa\xae\xce\xa9\
+\x10B\xe8\x1e(\x84\x10B\x92\xbe\xa4\xcf\x0da\x8d\xf3\
+QM\x06\xd7\xd5\xe6\xb3\x7f9\xd0h'|\xf7\xad\xdb\
+\xfb\x1f=_F\xd6\xd7\xd5\x8c\x17NTy\xa1C;\
+:\xc7bl\xce\xa6\xf6\xe5\x14X\x97@t#X\xc2\
+\xba`\x9d\xean'\xd7\xf2,\x0cw\xbb\x9f\xe5\xf7\xdb\
+\x12i4\xbc\xfbv\xf3s\x1d\xf7i\x7f\xf7\x9c\x7f\x1a\
+\x09\x90\x981Qq6L\xa6\x5c\xd5N`\x12\xa8\xa6\
+\xcc\xbaS\xafO\xf0\xa4\x07\x0e\xc4\x94\xdd\xcd\xc8\xe1\x16\
+\x1ciw\xa6\xccW\x16\xde\x0b$\xba\x8d\x09!$\xe8\
+B\x08!\xc4\x18I\xba\xe4\xbc\xfcr^\xf0\xa8\xf9\xe9\
+\xcd9QIy\xfd\xf5\x8fCL89\xd2\xfc\x5cV\
+\x03\xf7\x02kW| ~\xea\xfcU\x02l\x0a\x81M\
+\xcf\xe9\xa9\x9d\x96\xcd\xcdN;\xc8\xb3\xcay\xf7\x97\xc8\
+B\x9f0\xd2Y\xd3~\x14\xe7\x00\xf0\x0c\x9d$sO\
+\xd2Y\xe7~\xa2\xbf\x97\x10v\x86\xd4\xaf\x0a\xc6\xaa\x8a\
+\xb1i\xa2\x0a\x95\x04\xeau\xe6[\x09O6#\xbb[\
+\xc6v:Y\xee\xe64\x15^\x08!A\x17B\x08!\
+FM\xd2\xe1\xac\x95\xa1FI\xce\x8b\x10\xf3\x5c\x8f\xbb\
+\x5cr~2v\x0c\xcc\x02\xf8\x92\x82>\x05\xf1\xfb\x80\
+\xe9\x9e\x7f\xb2\xad\xe0\xf8\xedY\xc1\xddw3,X\xb3\
+\x9f.\xfd'\xb7\xdf\x00\x9e\x02\x7f\x1c\xe7A\xe0A\xe0\
+~`\xfb\x82\xd0\xf7w\xca\xa3w\xfe8L\x19\x5c]\
+3\xae\xae\x05\xeeJ\xe1\x90M\xb2}\x22\xe5\xa1\x13\xc6\
+.\xa0\x1e\xa1j\x9d\x19\xf8B\x08!A\x17B\x08!\
+\x86\x96\x93\xd9\xdd\xe7\x97\x17\x19ej\xef\xfe\xa3\xc3\x9e\
+\xa9\xbd\x9b\x91\xe7\xae\xea\x92;\x9d\x11\xe6\xe9\xde\x7fr\
+F\xe7\xce\xc9+n'\x80\xcb\x80\xcb\x88\xfe\xf2\xc5&\
+!\xb2\x07\xc2\x970\xfb$\xf0W\xc07\xb2\x0c\x05\x03\
+6W\x8c\xcd\xb5\xc8\xcbj\x93\x1c\x98v\xb6\xd7\xe1K\
+uc_\xdb\xa9/L\x83\xd7\x14x!\x84\x04]\x08\
+QB\xf58k\xcfl\x12XOg\xea\xe5\x06`\x1d\
+\xb0j\xa1\x03\xb9\xd8\xaf\x89@\x0b\x98\x05f8U\xfa\
+V\x88Q$\x9a\xfb58+\x99\xef.9\x1fI9\
+\x1f\xd8M\xbb\xbcr\xde\x1d\x06\x5c\x8e\x85\xcb\x81o\x07\
+ob<\x88\xdb\xc7\x81\xff\x05<\x98I\x9d\xcb\xd3\xde\
+\x9flI\x8c-\xab\xe0\xa5\x93\x09\xbb[\x81\xbf\x9bs\
+v\xa60\xb3\xf0\x02e\x98\x8bC\x0a!\x84\x04]\x88\
+\xd1b[\xc5+\x97\x03\xd7`v5pu\xb0x\xb1\
+9\x9b\x81-\x81\xb0\x1a\xf3\xea\xb2\xfd0\xf7e:8\
+\x83.3\xb5\xc2\xf7\x06}\xcb\x8b\xad\xe8\xe7\xf5\xdf^\
+\xb6\xc2\xd3\x90E7\xd5\xfa\xf3\xc5\x95|9kaY\
+\xd1G$\xe7\xc5\xbb\xec\x80\xe5\xbc\x8f[K\xff?\xb7\
+\xf4#\xe7\xbdl\xa7\x06\xbc\x08\x0b/\x02\xfe\x09\xf8\xdf\
+\xd1\x9c\xfe/\x18\x1f\xa3\xb3\x86=\xb3\xb6\x0b\xc0\x955\
+\xe3\xca\x8aq$I\xd9N\x9d\x07j\x81\xafz\xa7&\
+{\xc5\x96X\x88 \x84\x10\x12t!D\xc6L\x037\
+\x00/\xf4\x10^\x84\xf3\xfc\x80]\xb1*Nor\xc0\
+B8\x8b\xda\xf5+-e\x90\xf3a\x93\x97\x9c\xf6[\
+\xd4y\x1a;9\x1f\xd4z\xf3q\x8c\xef\xd1\x88\xf3R\
+\xc8\xb9g|\x0e<\xb3sY\xc1\xedv\x9a\xd3\xb7c\
+\xfe\x8b8\x1f\x03\xfb}\xe0o2mK\x87\x0d\x09\xbc\
+8m\xf0\xe2uU\x1eO\x13\xbe`\xceC\x8d\xc8\x09\
+\x87\xca\x82\xac\x0b!\x84\x04]\x08\x915\xd7\xe1\xfer\
+\xf0W\xc7\x18n\x03.\xefXx7=\x8fA\xcb\xb9\
+\xe4\xa58i\xc9\xa8\xb3.9\xcf\xcd;\x15\xdf\x83\x96\
+s/\xf0z\xca#\xces\x94\xf3\xac\xb7\xe3'\xffg\
+=\xe6\xef\xa25\xf1.\xe2\x86O\x80\xff\x16\xd8\xc7\xb3\
+m\xd7\xce\xb3\xf0\x92J\xe0\x92up,\x0d<P\x8f\
+\xdcWO9\xd0>\x95\xa2^\xae.\x84\x90\xa0\x0b!\
+V\xde\xe70n5\xf3{\xc0_\x1fRnq\xe2D\
+\xb1\xd2\x229\x1f>9\x1f\xec\x88\xdcx\xca\xb9f\x86\
+\x14\x1f\xe7\xf9\x1eB\xc9\x9f\x0c\xf9m\xc73<\x9es\
+m+\xad\xbe\x16\xfc\xb5\x18\x7f\x8d\xdb\xaf\x01\x7f\x92G\
+\xf3\xacK\x8cW\xaeJ\xb8c:\xe1\xa1F\xe4\xef\xea\
+\x91\xc7\xea\x9d\xa4r5\x89\xba\x10B\x82.\x84\xe8\x81\
+\xab1\xde\xec\xf0V\x0f\xf6B\xeb\xd4\xf4\xc9\xa7#W\
+t\xf2\xa5\xa2\xc4e\xd4\xe4|\x08\xc4|<\xe5|\x18\
+\xc5\xbc\x87}\x17]\xe3\xbc\xab\xcd\x97aJ8\x03\x8a\
+\xf3,\x7fC\x16\xd3\xdaWz\x1eO\xd6p{9i\
+\xf5\xe5\xc4\xca'\xb0x/\xf0\x99<\xda\xbc\x02|\xd3\
+d\xe0\x9b&\x03O4\x9d\xcf\xcfG\xb6\xb7R\x0eG\
+\xa8j\xfa\xbb\x10B\x82.\x848\x1b\x16\xbcf\x81\xd7\
+\xe2\xbc+z\xfbnN\x96\xe8\xc9QZJ\x9d\x19y\
+\x1c\xe5Er^|\x9c\x0f\xe9\xcb\xa7\x22\xe2;\xb7\xe3\
+V\xa6\xf6\xc1^\xab9\x8f\x9a\xaf\xe4Zp^\x8b\xc7\
+o&\xa6\x7f@\xf4_\x04\x1e\xcb\xeb\x1c\x5c\x5c3.\
+\xae%\x1cM\x03\xdfhD\xfen\xce\xd9\x9bv\xca9\
+\xd4L\xa3\xeaB\x08\x09\xba\x10\xe3M\xa7\xc3\xb0\x89\x98\
+\xbc=\xack\xbc\xa7f\xdc\xe4i\xc8\xa0C\xe9\x99|\
+D#\x8b%\xf8\xee\xc8Oi\x1f\x119/R\x14G\
+uZ{Q\xdf\x1dhB\xb8A\xcby\x01\xef-V\
+z\xaf7\x0b\xb4[\xef&\xf2\x06\xe0\x9f\x02\xbfC\xa7\
+\xdcg.\xc7\xb7>1^:\x9d\xf0\xc2Ix\xb4\xe5\
+\xfc\xed|\x9b\x9d-\xa7\xe1PU\xf6w!\x84\x04]\
+\x88\xf1\xc3\x82\x9f\xef\x93\xfe\xfd\xc1*\xef\x09n\x17c\
+\x94\xa4\xbc\xd4\xb8\xcay\xbfe\xa6$\xe7\xbd\xff\xdc\x9c\
+_\xa6\xa8\x8cZ\x89\xc4|\xb8\xe3\xbc\xff\x9f\xaci\xed\
+]}\xb8\xf3\x1c\xdc\x0a\xf6\xaf\x807a\xfe\xe38_\
+\xcb\xf3\xdcT\x0d\xae\x9b0\xae\x9b\xa8\xf2T\xdb\xf9\xe2\
+\x5c\xe4\xc1z\xcaq\xef\x1cNM\xdd\x15!\x84\x04]\
+\x88\x91g\x8bG\xfeA\xa8\xa6?H-=\xdf\xdd2\
+\xec\xc8I\xce%\xe7\x92s\xc9y\xd6\xf1-9\x97\x9c\
+\x17 \xe7\xcf\xb5\xf5\xbb\xb0\xe43\xe0?Cg4=\
+\xf7su~\xc5x\xd3\xda\x84W\xaf\x0a<\xd8\x88|\
+\xb5\x11\xd9U\xef\x0c\xe3O\xa0\xe9\xefB\x08\x09\xba\x10\
+#\x86O\x82\xbf\xd7c\xfc\x87\xc0\xa5g\xf4Q$\xe7\
+(S{/\x9bU\x8ds\xc9y\xd9\xe3{\x84\xe5<\
+\x9e\xf6\x87\xf2_\xab\xd9\xc9yV?\xb3\xa7kx=\
+f\xbf\x8dq'\xe6\xef\x07\xf6\x17!\xea\xab\x83q\xfb\
+t\xc2\xedS\x09\x0f5\x9c\xaf\xd6#_mE\xe6\xbd\
+\xd3aV\xa7Y\x08!A\x17b\xd8\xb1p\xb7\xe3\xf7\
+B\xfa\x82\x81HK\xee\x1da\xc9\x8b\xe4\x5cr\xae\xf8\
+\x1e\x039_\x14\xf4t\xe1\xcf\xb9\x08e\x91\xf3\x12&\
+\x84[\xc9G\x12\x7f\x1bI\xfb\x16\x9c\xef\xc5\xf9|!\
+\xcf\xed\x85\xe3\xb8a\xd2\xb8a2\xe1\x8e\x96\xf1\xb5\xa6\
+\xf3\xc5Y\xe7p\x0a5\x87*\x1aU\x17BH\xd0\x85\
+\x1821\xb7K\xdc\xec^\x83w\x0eLZ\x06\x91\x19\
+Y\xf2RB9\xcf&I\x96j\x9c+\xbe\x8b\x11\xba\
+A\xc9\xb9w\xf9\x19_\xe6\xb3eHh7\x22r~\
+\xea/\xae\x05\xfe\x9cZ|?\xf0\xef\x0b{\x8e/\x1c\
+\xd3\x85\xd5\xc0\x855x\xd9$|\xa3\x91r\x7f\xdb\xd8\
+\xdb\x80\x86w\xb2\xbf\x0b!\x84\x04]\x882{\xb9C\
+Z\xe1\xdd^I\xee58\x7f\xa0\xd2R\xc86$/\
+\x92s\xc9y\xa6\xfb-\x22\xbeKY\xe3\xbc\xecr^\
+ \x92\xf3\xb3\xb1\x9a\x89\xd6\xbf\xc3\xed\x0a\xcc\x7f\xb6\xf0\
+\xf3\xe1\xb0&\x81\xdb\xa6\x13n\x03\x1ek&|n\xde\
+\xd9\xd5\x8a\x1c\x88\x90H\xd4\x85\x10\x12t!J(\xe7\
+p\x91{\xfcu7\xff\x8e\xa5;\x22\x83L\x92\x95\x93\
+4\x15!/J\x06W\xa0\xb0\x8c\xb3\x9c\x8fx\x99@\
+Mi/\xa1\x98\xe7\xb4\xde<\xebv\xf1\x8c\xdb\xb7\xd7\
+e)\x9d\xc4\xaa?\x83s1\xf0\xfd@c\x10\xa7\x09\
+\xe0\xd2\x9aqi\xad\xca\xd1\xd4\xf9\xcc\x0c\xecj8\x8f\
+\xe24\xdc\x99B\xd3\xdf\x85\x10\x12t!\x06\xdf\xbd2\
+\xde\xd0\xac\xc6\xdfY\xe88\xe4\xd8\x0f\x94\x9cK\xceK\
+,\xe7\xaaq>\x84\xf1=\xaer^\x9a\xa7G~\xdb\
+)\xb3\x9c\xf7\xf5]\xfb\x1e\x8cM8\xef\x00\x8e\x0d\xf2\
+\xb4\xadO\x8c7\xae\x83v\x1a\xb8.\x99\xe6\xd1J\xc2\
+\x13Mh/L\x7fWMu!\x84\x04]\x88\xc2\x1f\
+\xd2\x9e\x90$\xff\x14\xf3\x0f\xf8\xb9^\x9a\x97BZr\
+\xd8\xff\xd0\x8c,\x8e\xa9\x9c\xf7\xdd\x1c%\x95s\xc5w\
+\x86r\x9e\xe3\xb4\xf6\xd2\xcb\xb9\xa6\xb5\x17\xfa\xb2\xa0\xeb\
+\x8ft{\x0c~\x0f\xf0?\xc1\xde\x0a\x1c\x1c\xf4y\xab\
+\x04\xe7[|5\xacq\x9e\x98r\xbeT\x8f|y>\
+2\xeb\x90\xb8:\xdbB\x08\x09\xba\x10Eq\x9e\xc1\xef\
+\xb9\xf1\xc6sNh+M\x195%\xcb\xea\xed\xa3\x83\
+Zo>hiQ\xa6v\xc5\xf7\xa8\xcb\xf9\x88Ok\
+\x1f\xea\xf5\xe6=\xc7\xf4+\x08\xfeq\xe0\xcd8\xfb\x07\
+?\xaf\xbcsP\x17W\x8d\x8b\xab\x09\xaf\x9c\x0e|\xa5\
+\x1e\xf9\xfc\x9cs(:\xeePS\xbfI\x08\xd1\x05\x9a\
+}#\xc4J0\xbf\xd5i}\x1axc\xb9\xa5%\x87\
+N\xb8\xe4Er^\xaa8w$\xe7\x92s\xc99\xc3\
+T\xe3<\xcb\x98~\x09\xed\xcaG1\xd6c\xb1<\xa7\
+\xd7a]0\xee\x5cU\xe1G7Ux\xe7\xba\x0a\xdb\
+*F\xcb;\xd9\xdf\x87zU\x86\x10\x22w4\x82.\
+D\xefv\xfeF\xcc?\x0cl*\xbf\x9ck\xe4|0\
+\xf2\x229/6\xce\x15\xdf\x92\xf3!\x93\xf3\x81\xc6\xee\
+\x00\xda\xc5\xf3\x8ai\x00\xee\xc0\xd3\x8f2y\xfc[\x99\
+\xddp\x02/\xd7\xd8S\x15\xe3\xc6J\xe0\xba\xf5\xf0p\
++\xe5o\x1bm\x9eh9u\x87\x04%\x94\x13BH\
+\xd0\x85\xe8\xd3\xcdy\x17\xf0\xbb,5Sm\xeck\x9c\
+\x0fA\x99\xa9\xcc\xe5ePe\xd4\x16\xbe\xafL\xed\x05\
+\xc6\xf78\xcb\xf9\x80\xe3|T\xe4\x5c\xd3\xda\xb3\x94\xf3\
+\xc5\xbf{5\xf5U\xff\x1e\xfc\xbb\x80v\xe9\xfa\x0e\x0b\
+2~c-\xe1\xc6Z\xc2\xbe\xb6\xf3\xf9f\xe4k\x8d\
+\x94#\xeeL\x9a4]\x08!A\x17b%\xcf\xd7\x9f\
+\x00>\xd4]\xe7a\x98k\x9c{>\x87$9\xcf\xff\
+<I\xces\x8e\xefq|\xf9T\xa28\x97\x9c\xa3i\
+\xedK\xfceL\xde\x0a~\x00\xd2\x1f\x84@\xd9F\xd2\
+O?\xd4\x0b\x82\xf1\x96\xa9\xc0\x1d\xd5\xc0g\x1bm\x1e\
+n\xa7<\xe5N\xd0:u!\x84\x04]\x88.\x9f\xa7\
+\x1e\x7f\x06\xb8w r<h\xe9\xd3\xc8b\x09\xa5%\
+\xa3&\x97\x9c\xeb\xe5\xd3H\xc7\xb9\xe4\xbc\xa7v\x19f\
+9_\xc4\xfc}8\xbb\xc1\x7f\xad\xf3W%\x1e\x99v\
+gkHx\xcbt\xc2\x89\x18\xb9\xaf\x95\xf0\xf5\xb6\xb1\
+\xd7;\xb7\x8b\xaa\x06\xd5\x85\x90\xa0\x0b!\xceN\xe2\xf6\
+\xc1H\xfc\xf9|\x85\xa5\x8b\xef\xab\x8cZ\xff\xfb-B\
+\xceGu\xbd\xf9\xc9}\x0e2\xce\xc7\xb1L\xa0\xf7\xf1\
+\xb1\x11\x189/J\xcc=/\xcf\xf7\xec\xb6\x91\xe7\x0b\
+\x8b\xc2\xe4\xdc3:\xe4%\xb6\x13\xfcW\x88\xbe\x13\xd2\
+\x8f\x0d\xcb\x02\xef5\xc1x\xd5D\x85\x97O\xc0\xce\xb4\
+\xc5'\xaa\xc6\x13m\xc7\x16\xea\xa9\x0b!$\xe8B\x88\
+\x05\xcc\xed\xa7\x12\xa7\x0b9\xcf\xb9\x03.9\xcf\xa1\x89\
+%\xe7E\x9cb\xc9y\x01r\x9e\xdbI\x1b\x93dp\
+\xde\xe5\xdf{\xf1\xd7kvM[\x965\xe7\x85\x84p\
+ \xc4\xdf\xa3b\x8f\x10\xfd!<\x1d\x9a>Gbp\
+m\x02W\xd7\x8c/7\x8c\xcf\xcc\xc1\xbe6D4\xa2\
+.\x84\x04]\x88R\xdar1O\xa7\xc5ek\x1e\xfd\
+\x87\x0d~e\xf9\xceC\x192XK^$\xe7E\xc8\
+\xf9\xa0\x12\x1f\x0ea|\x17e'E\x8f\x9c\x0f\x22A\
+\xe5 \xe5|\x80\xd7\xebh\x8d\x9c\xf7\xb8\xb3\xfeG\xe0\
+7\x83}\x04\xab\xbd\x12\xea'\x86\xad\xbb\x13\x80['\
+\xe1\xa6\x1a<\xdar\xbe\xd00v4\x9d\xe3\xeeLI\
+\xd4\x85\x90\xa0\x0b1\x96\xef\x02\xe0;\x81\xffWr^\
+F9\x1f\xb7\x1a\xe7\x9eM\x93\x0fm\x195\xc5w1\
+\xf1]\x229/|\xe4<\xa7!n\xc9\xf9\xca\x0e<\
+\xab\xed\xc4x+4\x7f\x9d\x10\xbe\x9f!\xcd\x92\x9e$\
+pM\x15\xae\x99\x86\xbdm\xe7\xff\x9cpv5\x22\x0d\
+\x87\x09\x89\xba\x10\x12t!\xc6\x06\xf7W\xba\xf3\xef\xe9\
+\xbc\xc4\x96\x9c\x8f\x8c\xbc\xe4\x15/\x05\x1d\xccP\xcay\
+\xbf\xbfK\xf1]\xac\x9c\xfb\x00\xe3|\x18\xe4<]\xf8\
+3\x80\xfb\x8f\xe4|\xa5\xd7\xe3\xf7\xe1\xe13\x90|d\
+8\xfb#\xa7\xfe\xef\x85\x09\xbc{=<\xd3r>q\
+\xa2\xcd\xc3\xad\x8e\xa8W\xd5k\x13B\x82.\xc4\xc0X\
+\x9doiS\xc3\xa9\xcf\xa7\xd7T\xd3\xda\x7f6l\xba\
+\xdcr\x9e\xf1\xf4p\xc9KN\x9d\xdcA\xd6~\x1e\xb4\
+\x9ck\xe4|\xb8\xe4\xbc\xdfC\x1b\x87\x91s\xa7\xb3\x1a\
+x\x89\xa1\xcbLJ{\x8dR\x9d\xf3,v\xe3\xfdm\
+\xd3\xd3\xdf\x84\xfa\xdf\xd0\xaa>\x8a\x95%\xb3\xff\xca\xd9\
+\x06\xbcs\x0d\xeci9\x9fl\xc3\xa3mH\x1d*\x06\
+\x1aT\x17B\x82.D\xa1\xd8l\x8e\x82n\xd0J\xa7\
+\xd6UC\xfcO\x06\xe7\x0dLZ\x0a\x19\x8d\x1day\
+\x19\xb5\xf5\xe6c)\xe7CX&\xb0\xc8dp#W\
+F\xcd\xb3/\x17\x96{|\xe7E\x99\xca\xa8\xf5\xfb\xbc\
+\xca\xa9\x8c\xdaJ\xb6\xe7l\xc2+\xbfE-\xdcC\xe7\
+\x0d\xcbHpY\x15\xdeK\x85\xddS\xf0\xc9\x99\x94]\
+M\xa7\xa9:\xeaBH\xd0\x85(\x94\xb9|\xdf\x0d\x87\
+\xaa\xffk3^0\xbar>\xe2\xf2R\x94\x9c\x17\xf9\
+]\xc9yA\xde;\x04\xc9\xe0FU\xce\x8b\xfc\xee8\
+\xcbyY\xcfM\xder~\x12\xbb\x9b\xe8\xef\xa3R\xfd\
+\xedQ\xeb\x1a]>\x01\xef\xa9Ux\xac\x15\xb9\xaf\x1e\
+yp\x0e\xe6\xdd\x99F#\xeaBH\xd0\x85\xc8\x9b\xa9\
+\x89|\xb6k\xe0\xee?f\xf8wI\xce3\xde\xef\xd0\
+\x96\x99\x1ap\xedg\xc9\xf9p\xc4w\xdf1>\xcc5\
+\xce3\xda\xf7\xd0'\x84\x1b\xb4\x0c\xe7q>\x0b\xba\x8e\
+\x0b\x91\xf33\xee\xa9\xbfHm\xf2Oi\xcd\xef\x1a\xd6\
+\xa4q\xe7\xfa\xdd!\xc0\xe5\x93\x81\xcb'\x03/\x9a\x0a\
+|q\xdex`\xc6O\xaeQ\x97\xa8\x0b!A\x17\x22\
+\x17b\x92\x93\x9fG\xeet\xf8\xe5\xfc:t%\x93\xf3\
+\xb1H\x067\x9ee\xd4V$\xe7E\x95Q+J\xce\
+\xb5\xde|\x84\xe3|\x90e\x02\x0b\x92\xf3\xb2Ok\x1f\
+V9\xef\xfc\xfbF\xe6N|\x08\xf7\xb7\xe0#3\xd3\
+\xfd9\x5cf\xc6e\x93p\x939\x9f\x9e\x8f\xecI\x9d\
+\xb6\x1b\x93\x09B\x08\x09\xba\x10\xd9\xd2NC\xe6\xdb4\
+\x8b\x1b\x12\xfc\xdf\x02\x13\xd9\xcby\x093\xb5\x17\xf5\xdd\
+\xa1\x95\x17\xc9y.\xe7L\xc9\xe0r\x90\x98\xf1\x8d\xf3\
+\xde\x7ffY\x13\x83i\xcdyqr\xbe@\x8c\xdfF\
+H\xde\xc2\xd4\xea\xff\xc1\xf0\xe7\x8b[\x92k\xa6\xe1\x9a\
+\x0d\xf0P\x13>;\xdbd\xe7|\x8b\xaa\xa3\xe1t!\
+$\xe8BdH\xb3\x91\xb5\x9e\x13\xaa\x95_\xc3\xb8\xb6\
+\x98N\xf1\x80\xe5\x5c#\x8b#+-\xca\xd4\x8ef\x86\
+\x8ct\x9c\x8f\xda\x94\xf6,\x8f+\x0b9/\xf0:\x1e\
+\xa4\x9c/\x12\xc2/\x11\xe2'\x89\xf1\xf8H\xf7\x99\x16\
+\x9a\xe1\x86\x9aqC\x05\xfe6\x81\xbf\x99u\x9e\x5c\xe8\
+\xfcO \x84\x90\xa0\x0b\xd1o\xb0Z\xb6#\xe8\x1e\xec\
+\xdb\xcd\xfc=\xe5\x93\x96\x1c\xf6/9_\xd9~%\xe7\
+9\xc5\xb9*\x11\x14\x17\xdf\x92\xf3\xd2\xcb\xf9@G\xce\
+GI\xce\xbb\xd8\x86\x19\xa4\xedk9\xd1\xfc\x11\xa2\xdf\
+;\x1e\xbd\xa7\xce\xb0\xf9K\x83\xf1\xc2U\xc6g\xa2\xf1\
+\xa5yxf\xa14[@\x08!A\x17b\xa5\xc1\x9a\
+T\xb3\xd9\x90A\xd2L\xb76*\xfc\x86\xe4\x5cr.\
+9\x97\x9c\x8f\xbe\x9c\x0fk\x9cK\xce\xf39\x9fc*\
+\xe7\xa7\x13\xc2\x8f\x81\xff!\xee\x8f\x8f~\xef\xc9N6\
+Q\xd5\x9cWW\x02\xafX\x0d\x9f\xa9;\xf75a\x9f\
+\xc3$\xa0%\xeaBH\xd0\x85\xe8\x994\xc9\xae\xc3\x15\
+k\xf6+\x98_2Zr^@gMr\x9e\xadd\
+J\xce\xfb\xdb\xaf\xe2{\x84\xe3\x5cr>\xfar\xee\x19\
+\x85\xf4\x8a\xb6\xb3\x11\xb3\x7f\x0c\xfe\x03\xe3\xd8\x9fJ\x0c\
+^9\xed\xbch\x12\xfe\xac\x01_\xad\xc3\xecB\x0du\
+-Q\x17B\x82.D\xf7\x0f\x94\x90\xcdD\xac\xe8\xfe\
+\xdah\xf1{\x9f\xfb\x5cW\x195\xc9yA\xd2Rt\
+2\xb8\xa2\xe4\xbc\x94\xeb\xcd%\xe7\x03\xbd\x1fI\xce%\
+\xe7\xe5\x93\xf3\x0e\xc6\xf7\x92T\xfe5\xc1\x1ed\xd43\
+\xc6\x9d\x83U\x06\xdf>\x09w\xac2>\x15#_\xab\
+G\x9a\x1e\x98\x92\xa5\x0b!A\x17\xa2\x1b\xda\xad\xfe\xcb\
+\xa2\x18>E\xe2\xbf\xda\xf9\xbf\x05\xc9y\xee\xdb\x18\xc6\
+)\xbf\xe3(\xe7\x03\x1a5\x1f59/\xf2\xda\x1c\xd5\
+\x91s\xc9\xf9\x0a\xf7\xeb\xd9l[\xd3\xda\x07/\xe7\x00\
+\xd1&\xa8\xd6\x7f\x8aUG\xdfN\x1c\xef\x95\xd8\xdb\x0c\
+\xden\x91\x9d\xd5\x1a\x9f9\xbc\x96G\xda,L\x89W\
+\xdfS\x08\x09\xba\x10K=\x9b\xad\xbf\x87\xf1Bu\x91\
+\x1f6\xe7\xa6B;\xb2E\xae9/J\xce\x8b\x94\x87\
+\x22\xe4\xbc\xd4\xe5\xee\xb2j\xeaa\x94d\xcd\x0c\xc9|\
+\xffE\xdd\x8f\x86N\xce=\xef\x0bPr\xde\xcfy\xca\
+\xfa:q\xc0\x1c\x9a\x95o\xa7\xb1\xe5\x05\xe0\xf7\xab\x97\
+\x05W\x19\x5c\xb5\xd6y\xa0\x09\x9f\x9ew\x9eN\xa1f\
+\x9a\xf6.\x84\x04]\x88s\x10B\xdf#\xe8\x17\xbb\xdb\
+O\x8dl\x8ds\x95\x99*\xb7\x9c\x0f\xe5z\xf3.\xbe\
+\xaf2j+\xdb\xb7\xca\xa8\x95D\xcc\xf3\xc23\xda\xdd\
+\x98\xcby\x1e\xd7\xc9\x19\xb1c5\x8c\x9f\xc0\xec\xed\xea\
+e-b\xdc2\x01\xdfT\x83\xbf\xae\x1b\x9f\xae\xc3\xbc\
+\xc3\x84,]\x08\x09\xba\x10g{h\xf4\xf5Lv~\
+\x1ag\x93\xe4\x5c5\xce%\xe7\x92\xf3r\xc5\xb7\xe4|\
+0\xf1-9\xcf\x5c\xaas\xab\xde\x90\x87\x9c\x9f\xe4-\
+X\xf5y\xa4\xe1k\xeag\x9d\x22\x01^5\x017$\
+\x91\xcf\xcc\xc1WZ0\xef\xde\xb5\xa8/\xceKi/\
+\xfc{{\xe1?LJ\xf4\x85\x90\xa0\x8b\xd1\xc1\xfb\x10\
+t\xc3o\xc2y\x97\xe4|\x90#\x8b\xc5\xf4\xbf$\xe7\
+\x05\x9d\x08\xc9\xb9\xe4|\xa8\xe5\xbc\xa0)\xed\x92s\xca\
+9r~\x06\x13\xa4\xad\x1f\xa16\xf3\xfd\x84\x14M\xe8\
+>\x93m\x93\xf0\xd6\xd5\xc6\x1d\xa9\xf3\x7f\x1a\x91\x1d3\
+\xabh\xba1y\x16\x19o-\xe4@m\x02\xed\x85v\
+\xde\x1a`\x0a\xb8\xac\x06\xb3\xed\xc8\x03\xad\xa0\x16\x16B\
+\x82.F\x86\xb8\xf2\x87\xb3\xc3?\x06&%\xe7\xc3&\
+/C\x9c\x0cn\xa0r\xae\x1a\xe7\xa3\x1f\xdfY\x89\x9c\
+\xa6\xb5\xf7\xfe\xfd\xa5\xb6a\xe3'\xe7\xb9\xd78\xef\xfb\
+f\xba\xfcv\x82\xbf\x8d5'~\x19\xd8-A?;\
+\xe7\x19\xfc}\x8b<Z\xab\xf1\xd1c\x93<\xd3\xea\xb4\
+\x94\x01\xd3\xd6I(wqblI\x9c\xcd\x09l\xa8\
+M\xb2\xad\xd2fc\x92Rq\xa0\x128\xd8\x8c\xdc\xdf\
+\x0c\x04\xadk\x17B\x82.F\x03\x0b+M.c\xb7\
+\xb9\xf3\x16\xc9\xb9\xe4\x5cr.9\x97\x9cK\xce\x0b#\
+\xcb\xb6\xc9\xba\xb4`!\x99\xdaK0\xad\xbd\xdbj-\
+nk8t\xd1\xbb\xc1~N\xbd\xad\xa5\xb92D\xde\
+\xbf:\xf2\x85\x04\x1a\xd1\xd9Z\x81m\xc1Y\x15`\xb5\
+\x1b\x1d\xfbv\xf0*\x84\xc8\xc9\x14\xbd\x0e\x0dW\xfb\x09\
+!A\x17#\x85{\xefI\xe2:\x89Z\xc3\x07\xfa\x8b\
+\xf5Agj\x97\xbc\x0c\x87\x9cg\xd5\x9f\x1cF9G\
+\xf1]\xb8\x9c\x97\xe0~$9\x1fN9\xcf-\xae3\
+8\x86,\xaf\x95^K\xa9Z\xfaNb\xf2!\xf0c\
+\xeaq-A\x0a\x13\x04\xee\x9c\x00,v\xfe,N,\
+q\x86 G\x84\x10\x12t!\x06\xda\xdf1\xec6\xe0\
+\x8d\xb9\xedu\x10\xe5\xb9\x8a(3\xa5L\xed\x05\x0a\xcb\
+\x10\xc8\xb9+\xbeW\xb4\xef\xa2\xd7\x9b\x17%\xe7^\xc0\
+\xbda%\x82\xd5\xcf~=\xa3\xc3.\xaam\xf2\xf8\x9d\
+\xa5\x9a\xd6\x9e\xdbz\xf3\xa5\xb8\x94\x10\xdfB\xb0\x0f\xab\
+\xc7\xd5}/\x8bh\xc5\xe5\xa8\x11B\x82.D\xb9h\
+V\xba\x1fA\xb7\x85>x5M\xde\x1fV\x1c\xe7\x92\
+\xf3\x5c\x1959\xef\xbb9J,/\x8a\xef\xec\xe46\
+/\x09+\xfdK\xa8\x12\xc7\xa8\x13\x17\xe6\xe2.\xfdT\
+y\xce\x08\xe19\x1e>Y\x1d\xdf\xd0\x95Q\x1bj9\
+\xef\xdc\x1b*\xc9\xbbH\xaa\xffaES\xf6\xc6Q\xce\
+=Bl\xa8)\x84\x90\xa0\x8bq\xa5\xda\x98\xe8\xed\xd1\
+\x91\xc4\x1b\xcd\xfd\xdb$\xe7E\xca\xf9\xa0F\x16K\xf0\
+\xdd\xa2\xa7\xb5\x17'/\x8a\xefL\x9a\xb5\xa0\x11\xd2\x5c\
+_\x0e\x14\xb8\xefbg\x86D\xcc\xdb\xdd\xf8H9\x9b\
+l\x94\xe4<\xabv[\xc1\x86\xcd M_J;\xbd\
+\x15\xfc>\xf5\xba\xba\x94t\xd3\xe8\xb9\x10\x12t1\xb6\
+\x1c\xfa\xda\x85]>.\x9c\xb4]a\xdd\xe5\xfb\xdf7\
+\xb5\xf9\xc4\x94\xa7a\xb8\xe5\x5c\xebqW\xb6_\xd58\
+/\xa1\x98+\xbe3?\x06%\x83\xcb\x22\xbeS\x9c\xf6\
+\xb2\x9f-U\x09\xc8Q\x94\xf3\x01\x8d\x9c?\xbb_l\
+\xfeN<J\xd0\xbbnw\xe5c\x17B\x82.\xc6\x96\
+\xcd7=\xd6C_\xdc\xce\xb3h\xdf\xd9\x9b\x9c+S\
+\xfb\xf0\xca\x8b\xe4\xbc\xf88W|K\xceGB\xce\xa1\
+S\xb6\xb9^\xa0\xd1d\xd4l\x92\xf3\x8c\xe5|\xf1\xfb\
+o\xc1\xc2\x07\x81\xa3\xeay\x15q\x8f\x15BH\xd0\xc5\
+\xd0\x12b\x0foi\x8d\xb7y\xe2\x9b3\x9d6\xabL\
+\xed%\x93\x97\xe1M\x087\xbcr\xae\x97O\xb9]\xfe\
+\x92\xf3A\xc6w\x03\x98[\xeak\xd1\x8d\x98\xf7H\xa1\
+\x17\xb9=Mk_\x22\xe6/\xc2\xb8\x0b\xf7\xff\xa6\x9e\
+\x97\x10B\x82.D6L:\xbc{x\xe4\xdc\xfb\xdc\
+\x9c\xa6\xb5\x17~\x9e4\xad]\xf1\x9d[|g!\xe7\
+*\xa3\xd6c|7\xb08\x7f\xae\xbfM=\xb0e\xf5\
+,\xdbV\xcfu2V\x0f\xe4\xde\x95\xe53+\x0b9\
+/A\x19\xb5|\xe4|\xf1\xde\xf16\x1c\x09z/h\
+\xa6\xbb\x10\x12t1\x8e7\xff.\xef\xfe\xce+\xc0\x9f\
+/9\x97\x9c\xe7\x82\xe4\xbc\xc0\xf6\x1bW9\x1fT\x9c\
+\xf7\xfb\x12jh\xe3\xfb\x04n\xe7\x16\xf4\x18\xd80\xd9\
+d\xe3t\xbd\x8f\xf5\xb6e\x90s\xcf\xe8\x90GI\xce\
+\xcf\x15\xf3\xf6\x1a\xb0\x8b\x81'\xd4\xf9*\xe0~-\x84\
+\x90\xa0\x8b\xe1\xa4\xd6H\x97\x7f<\x184k\xe1\x9d\xc3\
+!\xe7\xfdl\xae\xdf\x8e\x8dF\xce{\xde\xf7\xa8\xd68\
+\xcfM\xce\xf5\xf2i\xf8\xe2|,\xe5\x1c\xe0\xa0{h\
+\x9d;\x9c\x02i\x0c\xb8\x1b\xb6\xa2\x8c\xd5e\x199\x1f\
+\xa0k\x95v\xe4\xfc\x9c\x9bY\x07\xe9\xb7`\xfe\xfb\xea\
+}u\x89\x19\x90\xa8\x1d\x84\x90\xa0\x8b\xf1\x12\xf4e\x9e\
+\x0d\x9d\x07\xec\xc5\xad*\xf7,?\xc81\xa6\x99\xda\x8b\
+\x92\x97Q\xabq>\xaar\xae\xf5\xe6\xc3!\xe7\xa3\xb6\
+\xde\xbc|\xf1\xbd\x7f)\xf16\xf3\xae'p\x95S\xce\
+\x07\xb8\xde<\xebk\xc5\x0b\x8ay7\xa8\xa6o\xa6\xd2\
+\xfa}\xcd\xdd\xee\x92\x18 \x95\xa0\x0b!A\x17cE\
+s\xcd\xf2\x19\xd9S\xec\xdb\xdc|\xbd\xe4|\x80\xf2\x22\
+9\xefO\xcc%\xe7\x03\xa2\xc4#\xe7\xa3\xf6\xdd\xb2\xc5\
+\xb7\xd9^\xc2\xb9\x9f/FB\xb4\x84S\xa2f\xfd\x1f\
+cY\xa7\xb5\x8f\x93\x9c/\x859\xb4\xabw\xd0\x9c\xd4\
+4\xf7\xae\x9at\xb1\x1ezT[\x08!A\x17\xe3\xc4\
+\xfc\xe1\xa9e\x9e\xa7n\xc9\xfa\xfa\xdf\xa3\x9awgE\
+r>\xf0\xefJ\xce\x87C\xce\x0b\xfb.C:3$\
+\x0b\x91\x1b|\xe2\xc3\xd2\x09V\x8f\xf1\x1d\x9c\xc7h\x9f\
+[,\xda\xcd\x84\xe7m>\x8cM\x00\xed%\xbbM\xc9\
+\xa9,rZs^x\xf2\xc4\xecc~=I|\x0d\
+\xf0\x07\xea\x81uI\xd4:t!$\xe8b\xachT\
+\x97\x1a\xe1pb\xbbr\xe3\xa45oK<\x9e\xe5\xb9\
+\xab\x1a\xe7\xb9w\x844r\xde\x9f\x9cg\x9d\x8dx\xd0\
+r\xae\xf5\xe6#\x1c\xe7\xa3S&\xd0\x80\x13\xd5\xd6\xa3\
+\xad\x109\xd7,\xf79\x8b\xd4\xd6\xcc\x82\xa5\x9di\xbc\
+\xe7\xa6\x8a\x91d#\xe7\xa3T\xe3\xbc\xef\x1bj\xb6\xf7\
+F\xef\xe9\xfer7Q\x82\xdeS\x13\x075\x83\x10\x12\
+t16Lo\x98Y\xee\xc1\xf0f\x8fV\x93\x9c\x8f\
+\x82\xbcH\xce%\xe7e\x8e\xef,{\xb3\x92\xf3\xbc\x9b\
+s\x99\xbfl\xb6-\xdd\xd3\xb2x\xceu\xe6\xed\x10h\
+\xf8\x82\xcd\x87%w2\x8d{\xad\xf88\x1a\x079\xcf\
+\xa8Mz\xdf\xde\x1d\x98m\x00?\xa2^X\x17\xd8i\
+\xcd\xad\xa5\xfbBH\xd0\xc5\x18\xd0Z:\x96=\xd8\x9b\
+V\xf4t\x97\x9c\x8f\x88\x9c\x0f\xb2\xf6\xf3\xa0\xe5\xbc\xc0\
+\xd16\xc99J\x087\x089\xcf\xe7\xe5\x93\xc33[\
+\x1b\x13\x8f\xdb\x12B1\xd7\xacp\xe7\xa6\xe3\x10\xe3r\
+q\xb7\x0e\x98\xea\xbf\xe9\x864!\xdc \x96\x80\xe4\x7f\
+o\xbf\x90\xc4^\x82\x85?U\x15\xb1.\x05=up\
+\xadE\x17B\x82.\xc6\x82hK>\x7f\xaf7\xb89\
+{9W\x99\xa9\xe2:c\xc3\xbd\x0ew<k\x9c\xeb\
+\xe5S\xb1q>\x8er\x9eo|\x9b\xf9\xa3\xed\xc0\xb1\
+\xa5|\xa3\x958k\xa6\x9at1$\xb8\xee9\xfd\xaa\
+B\xcb\xa8iZ{\xc6r\xbe\xf0\xdd\xf4.<\xfdS\
+\x0d\x09\xf7p\xde\xccT\x16]\x08\x09\xba\x18\x07,V\
+\xce\xd9\x81\xf2\xe0\xaf\x85X\xcbV\xceszp\x8d\x8a\
+\xbcH\xce%\xe7\x92s\xc9\xf9p\xcb9\xad\xf9\xc9/\
+\xc7\x18\xce9\xbd=\x8d\xc6\xf4D\x8b\x0b\xd7\xceB\x1a\
+:\xd9\xaa\xcf\xbd\xc5UX\x1c\xd03F\xd3\xdas\x91\
+s\x00\x8f/\xc7\xbd\x02\xb4\xd5\x13\xeb\xb6\xc3\xa6\x97\x19\
+BH\xd0\xc5X0u\x8eG\xa3\x815j\xfe\xfa\xf6\
+b\x95\x8f\x81\x8f\x9cK^$\xe7\xa3,\xe7\x03\x9a\x19\
+2\xaa5\xce\x8b\xbc\x1fI\xce\x9f\x15R\x86\xd5Z\xf7\
+%\xe9\xb9\xb3Z\xc5\x18X;5\xcf\xa6\xe9\xfa\xc2f\
+\x97\x98\xbak\x9cwr\x94\xd53\xfe\xbd\x1a9\x1f\x8c\
+\x9cw\xb2\x9e\xddH;\x5c\x09<\xa2\x9eX\x97$t\
+\x92\xc5i\x14]\x08\x09\xba\x18m\xe6k\xe7|y}\
+)f\xb7u%\xe7E\xaf7\xefis\xca\xd4^\xf8\
+y\xea\xb7\xb2WY\xe5E\xeb\xcdW\xb6o\xad7\xef\
+o\xdf%-\xa3\xb6\xd4c%V\xdb_\xa2z\xee\x0f\
+\xd4[\x09W\x5cp\x88\x89\xe9&\xb4\xc3r#\x83\x97\
+\xe6r]\xe4.\xe7%)\xa3V*9?\xed\xcb\xc6\
+$1y\x19n\x8f\x9c3\xd5\xbf8\xad\xe9\xacS\xf1\
+@\xd9\xdc\x85\x90\xa0\x8b1\xe0\xdc\xfd\xa2;\x80\xd5\xa5\
+\x93s\x8d\x9a\x8f\xac\x9c{\xdf#M\xaaq^\xfe\xf8\
+\x96\x9c\x972\xbe\xb3\xfd\xee\xf6ZLv.\xf5\x81f\
+\xbb\xcaK/<HH\xda\xd0\xae.\xb3\x0f\xbbp\xe9\
+)\xf0e\x94\xf3\xac\x9az\x94\xe4\xfc,\x9b\xac\xb5_\
+\x8e\xf1au\xc4z\xe8\xb0\xb9\xa6\xb9\x0b!A\x17#\
+\x8f\x9fc\xe4\xc2\x9c\xbbJ9r>\xf2\xf22\x9er\
+\xde\xff\xcf\x1d\x91\x1c\x01\x9a\x19\x229\xcfK\xae\xf2\x96\
+\xd5S\x0e\xf19\xf0%\xeb\x83Ds6M7\xc0\x03\
+\xcb\x0e\x09:\x97\x0c\x9f\x9cg1\xad}DG\xceO\
+\xffOn/\xc4\x99\x04\xea\xea\x8du\xef\xe8B\x08\x09\
+\xba\x18yC\xf7\xb3\xdd\xffW\x03\xb7\x0fN\xceG<\
+S{\xe6\x9d\xb1aM\x92\xb5\xf8U%\x83S|\x8f\
+\xb2\x9c\x8fW|\xa7\xf8'l\x99\x10\xac%-.X\
+7\x07\x96@\x08K\xc9\xc8*R\xbf\xb4\xbb\xb8-\xf0\
+\xf7\x96yZ{\x1e/.\xf3\x90\xf3\xce\xf9\xbd\x9a\xd4\
+\xae\x00\x1eRg\xacK\x125\x81\x10\x12t1\xf2\xd8\
+\xd9\x9f\xbc\xcf\x03\xbbb\xe5\xfd\xa0\x8c\x87R%/9\
+\xc9\xb9j\x9cK\xce%\xe7\x92\xf3L\xcf\xd7~\x9c\xcf\
+-\xb5\x85F\x1a\xb8v\xf31\x9e\xb7\xed 4l\xb9\
+\xda\xce\x17\x02[\xf3\xfd\xbdY5mI\xd6\x9c\x0f\x8b\
+\x9cw\x98\xa0\x12_ A\xef\x85\xa0$qBH\xd0\
+\xc5\x18\x18\xfa\xd9x)~\x8e\xbfQ\xa6\xf6\x92\xcaK\
+1\x9b\x95\x9c\xa3\xf8\x96\x9cK\xce\xcfq=Wc\xf8\
+T\xcd\xc3A_\x22\xe9WlU\xb8t\xf5\x1c\xd5\xa9\
+\x16\xb4*,\x99\xc1\x1d\xbb\x9c\xd4V\xe5{=+!\
+\xdc\x80\xe4|\xf1\x1c\xbf\x04\xb3\x8f\xa83\xd6K\xa7M\
+\x86.\x84\x04]\x8c4\xe19\xf3\xa5\x0c'\xde\xe1+\
+\x12\x89!,35\xb4\xf22\xe02j\xa3\x9a\xa9=\
+'y\x19\xd8z\xf3\xa1\x97\xf3a-\x178~\xf1m\
+\x80'\xe9\x7f'\x86%\x97\xc9:p\xc7\x8d\x87`U\
+\x15\x1a\xd5\xa5=\xa4\x9e\xdeD;.\xb1\xee\xb6\xa0\xdf\
+;T5\xce\xcb\x90O\xa4\x87\xfe\x83s3f\x81\xa5\
+\xdf\xd4\x88\xd3\xdb\xd2\xd1Zt!$\xe8b\x94\x89\xa4\
+\xcf\xfeOkq\xbb\xb5\x90\x0e\xe9J\x1e\xe6\x92\xf3r\
+H\x8b\xe4\x5cr.9\x97\x9c\x9f\xf6]s{,\xb4\
++\x9f\x5cj\xf4<\x8d\xc6\xba\xc9&/\xbd\xf2\xe9N\
+Wi\xa9\xde\x92\x19\x98\xdd\x9c\xcf\xef\xcd\xaaYK \
+\xe7Yo\xa7H9\xefp\x1d-\xb6\xe2<\xad\x1eY\
+\x97\xa8\xd4\x9a\x10\x12t1\xda\xb4\xe7jg>H\x83\
+__\x99j_|\xc6C\xb5\xb4\xd27\x8e\xf22\xc8\
+5\xe7h\xe4\xbcP9g\x0c\xe3\xbb$q\xbe\xa2\xcd\
+\xf4;\xcdy\xb8\xcb\x04\xa6\xe6\xff\xcd\xdc\x8e/U\x06\
+j\xbeU\xe1\xb6\x8b\x0er^8\x0a\x07\x02K\x0e\x03\
+:U\x02\xcf?\xfbG\x06\x99C\xa2d\xdb\xc92~\
+| \xbfe#\x95x=\xe6\x12\xf4\xae\x9b\xd94\xcb\
+]\x08\x09\xba\x18e\xc2\xe9\xafb\xcd\x88\xd1o\x81v\
+\xd2\xfd\xb3V5\xce{\xfbh\x0e\xfb\x1e\xd5L\xed'\
+\xf79de\xa6\x86:\xbe{\xd8\xb7\xca\xa8\xf5\xb7\xdf\
+\xa2\xca\x04\x16\x13\xdfu3\xff\xc3\xf6Ds\xc9\xcf\xd7\
+\x89\xdcy\xfd\x13P5\x88\xcbv\x95\xae\x80\xf4\xca\x81\
+\xc9\xf9\xb8Mk\xcf\xfa\xba\xede\xb3\xe6\xb7\x10\xfc\xd3\
+\xea\x91uID\x82.\x84\x04]\x8c\xb4\xa0O\xcf?\
+K\xd8\xedE\xdd\xbf\x9d\x1dGy\x91\x9c\x17\x22\xe7\x9e\
+\xeb\x89\x90\x9c\xe7\xd2\xe8# \xe7E}wXk\x9c\
+\x9f\xe3\xbb\xee\xfc\x19\xd8W\x97\x98\xddN\xf4\xc0\xa6\x89\
+&w\x5c\xf2\x0c\xa4\xa1\x9b\xfd\xdf\x02LI\xce\x0b\x90\
+\xf3\xe2\xa7\xb5\x9fIj\xb7\xd0\xd6\xbc\xed\xde:o\xa9\
+\xda@\x08\x09\xba\x18U\xdc\xcfx(V\x0cn\x92\x9c\
+\xe7\xd1\xb9\x93\x9c\x0f\xac\xf3)9\xcf\xf8\xa6Q\xb0\x9c\
+\x17\xf9\xdd\x22\xa6\xb5\x8f\xde\xcb'\xaf\xc0o/\xb7\xc9\
+z;p\xd5\xe6\x196\xaf\x99\xa1\x93\xfad\xd9\x9c`\
+w\x0e\xe4\xf7J\xce\x8b\x95s\x00\xf3k\x091\x01d\
+\x9d\x85\xdfG\x84\x90\xa0\x0bQ:\x82\x9d\xdeI\xb2\x0b\
+<\xda\xd5\x92\xf3,;w\x83Zo\xde\xcf\xbe\xb3)\
+\xb3\xa3\x1a\xe7\x8a\xefr\xc7y\xbf\x922\xace\x02\xb3\
+\xbd\x7f\x9b\x87O\xbb\xdb_,\x97T\xba\xd5\xae\xf2\xe6\
+\x1b\x1f\xa3RkA\xa3\xb6\xdc\x8e\xaa\x18w\x14\xfe{\
+\x87F\xce3\xbaO\x95A\xce\x1d\x08\xf1J\xb6\xec\xdb\
+J\xd2~j\xa9\x1c\x06\xe2\xe4\x0b\x0d8x\x1e4\xa6\
+\xd4\x16BH\xd0\xc5(Rmt\xc2\xd5\x804\xf8\xf5\
+\xed\xc4\xd7\xe6\xd3\xb1\x93\xbcdFi\x93d\x0d\xbb\x9c\
+\xa3\xf8.C|K\xce\x87G\xce\xc1\x8fN\xd5\xff9\
+\xcb\x0c\x87\xa7\xd1\x98Z=\xcb\x8b/{\x1a\xd2J7\
+%\xa2\xae\xeb\xfc\x19%9/C2\xb8\x92\xc9\xf9B\
+\x10\xe1a\x03\xfb/\xbc\x12xJ\xbd\xb2\xae-\xbd#\
+\xea\xaa\xb7&\x84\x04]\x8c\x1env\xf2\xd9\xeap\xe3\
+\xb9\x9f\xb2\x92\xf3\xe2:c\x83\xcc`=\xe8i\xed\xa3\
+#/\x8a\xef>\x8eAr^\xfa\xf8\x0e\x0e'j\xad\
+\xff\xbdc\xdd\xf1O\xc4\x85:\xe8\xe7\xf2\x08oV\xb8\
+\xeb\xc2C\x5c\xb8a\x96\xee\xd6\x1a\xdb+ \xd6\x0a\xfb\
+\xbd\x92\xf3\xc1\xc8\xf9\x19Q\x12\xae\x03>\xab^Y\x01\
+\xcf\x0d!$\xe8B\x94\x9bv%\x9e~\xbb\xbf9\xf7\
+\x8e\xdd\xa8\xc9\xcb\xa8\xad7/Z\xce\x8b\xccD\xac\x1a\
+\xe7%\x92\xf3a}\x09\xa52\x81'\x9b\xcfC\xa3\x11\
+\xc3\x077\x9d\x98\x22,1-9\xbaQ\x0d\xce\xaf\xde\
+\xf0\x18D\xef\xfcY\x8e\xe0\xf7\x0c^\xce=\xa3&\x1b\
+%9\xcf\xaal\xe4\xd9\xbe\xe4\xd7\xca9{@\x03\xe7\
+BH\xd0\xc5\xe8\xe2\xa7\xd2\xee&8\xd7I\xceK(\
+\xe7E~w\x10\xa5\xd4\x86V^\xf2\xdf\x9c\xe4<\xf3\
+\x86\x93\x9cgp\xff6s\xda\x1e\xfeu\xed\x99\xad_\
+\xda\xb6\x8cD\xcc4\xaa\xdc~\xc5>n\xbe\xe0\x18\xa4\
+\xb6|\x0f\xc9\xb9\x14\xe7e\x83\x95\xf3\xac\x9aLr\xde\
+\xd5\x97\x0cH\xb9\x8e\x96I<{\x11\xf4\x8a\xdeh\x08\
+!A\x17\xa3)\xe8'E\x9d-\xc1\xb9\xa2\x1c\xf2\xd2\
+o\x12\x1d\xcf\xfb\x00\x8b\x95L/`\xbf}\xf7#%\
+/\xc5\xc4\xf7\x88\xd68\xcf=\xce\x0b\x96\xf3Q\x9f\x19\
+\x12mOb\xad{Wo>\x00K\x8e\x9e\xc3\x04\xc6\
+\x8f\xbf\xf930\xd9\x82V\xb2\xbct\xb4\xc3]4\xc3\
+\xdas\x8a\x9a\xa6\xb5\x8f\x96\x9c/\xfeg\xe3Rj>\
+\x014\xd43\x13BH\xd0\xc5X\xb3\x98\xc4\xdd\xe0\x12\
+\x8c\x0d\xe3+/*\xa3V\x98\x9c\xab\x8c\xda\x90\xc5\xb7\
+\xd6\x9b+\xbeO\xfb\xd7\x10\xa95\xab?\xb6\xaa>y\
+\xc8m\xe9\xfd\xcc4\xaa\xbc\xfe\xa6\x9d\xdcz\xfe\x018\
+\xdae\xc6\xe9$~\xe7P\xc9y\x1e/\xb3\xc6I\xce\
+\x17\xff\xca\xb9\x18\xf7\xcd\xc0^\xf5\xcc\xba\xed\xc0i\xba\
+\x81\x10\x12t1\x92\x84\x85\x0e\x96\xc3U\x8e\x05\xc9K\
+\xd1\xf2\xa2\x1a\xe7\x92\xf32\xc7wV\x0c\xf7K\xa8b\
+\xc5\xaa\xbc\xc9\x0e-D\xea\xc7\xd6\xff\xdb\xf6\xe4\xfc\x1f\
+7\xd7\xcc.=z\x0e\xb4&\x9b\xbc\xf6\x85; \x84\
+\xeezFn7\xc0by\xb5\xa2\xe5<\xe7\x17Q\x92\
+\xf3\xa5\xff\xcaX\x83\xd9\x85\x12t!\x84\x04]\x8c=\
+\xf1\xd4P\xc5\xd5\x92\x17\xc9y\xf9\xe5\x5c\x99\xda\x8b\x95\
+\xf3\x1c\xa7\xb5+S{\x0e\xa74\xc7\x91s \x89\xe1\
+k\xd3n?9_\x9f\xa2\xd9\x9c8\xe7\x96\x0c8Q\
+\xaf\xf1\xed\xb7l\xe7EW\xed\x85F\xf5\xd4t\xad%\
+\xb1\xbf\x87394r^\xcai\xed\x9e\xd1\xe1\x14(\
+\xe7\x1d\x12\xcc.\xc5\xf9\x82zf\x05<W\x84\x90\xa0\
+\x0bQf\x16\x05\xdd\xaf\xcbT\x9a$\xe7YtXF\
+P\xce\x875\x19\x9c^>I\xceG5\xbe\xbb\xbb\x7f\
+\x1b\x9c\xa8\xb6k\xdf\x9b$\xe9\xb1d\x99\x99\xb51\x1a\
+\xd3S\x0d\xde\xf3\x92G\xa0]\x83\xd8U\xb7h\x15\xb4\
+\xde\x9e\xdbo\xf6<\xce\xf7\x98\xc8\xb9\xe7\x10\xd3gM\
+\xe4\xce\xc5r\xce^\xbao\x9a\xe2.\x84\x04]\x8c\xe6\
+\xfd\xbd\xd2\x06\x08\xde\x0e\x97H\xce\xcb.\xe7\xaaq.\
+9\x97\x9cK\xce\xf3:_Ko.&\xe9\x0f\xb7=\
+\xbd\xdf\xa7\xe6\x09K\xa4\xda6\x9c\x13\xf5\x09~\xe4\x15\
+\xdf\xe0\xea\xcb\x0fB\xbd\xd6]\xaf(M\xef\xc1\xb9&\
+\xf3\xdf\x9c\xdb\x8c\x83\xac\xae\xf32\xc4}\x81r\xbe\xf4\
+\xf9\xb8FY\xdc{\xee\xc5\xa9\x09\x84\x90\xa0\x8bQ\xe3\
+\xd8\xcemX\xf0\xb5\xab.8|Q\xa8\xc6\x82\x13\x99\
+K\xce%\xe7e\x96\x17\xbd|\x1a\xaf8\xd7\xcb\xa7s\
+\xca9\xdc\x9b&\xf1\x0fgk\xb3\xcb\xaa\xc2\x5c;\xe1\
+\x8a\xf3\x0e\xf1\xd6;vAX\x03\x93\xb6\xfc1X\x80\
+\xfa\xec?\xa0\xe5\xa7F\x05\xcb\xbaV<\xcbk\xa6\xc8\
+l\xffe\xd8\xce\xb2\x9b\xb7\x8b5m[\x08!A\x17\
+cOm\xcd<\x98o\xb0\xe0\x1b\x8b\x93\x97q,3\
+5\xbce\xd4\xbc\xef\x8e\xac\x92\xc1I\xce\x0b\x8a\xf3Q\
+\x93\xf3\xa2\xe2{\xe9\xcd}8\x1a?\x07`\xbe\xb4l\
+\xb7\xdd\x98\x0em\xfe\xe9\x1d\x0f\xb0.\xee\x87\xa3Iw\
+\x03|\x96\xbc\x14\xb3\x97c6De\xd4\xb2\x92\xf32\
+$\x83\xeb\xf7\x9e\x97\x85\x9c\x03\xf86\xdc\xaa@K\xbd\
+3!\x84\x04]\x8c-\xd3[\x8f\xe3p\xb1\xa7a\xd5\
+\x8a\x05{h^x{\xf9\xbe+9\x1f\x0ey\x91\x9c\
+K\xceG5\xbe\x97>m\x7f\x8c\xf9\xfb,t>\xb4\
+\xb4\xa0;\xf3\x8d\x84\x7f\xf4\xba\xc3\xbc\xf0\xb6ih^\
+\xd5\x85\x9c[g/\x07\x9f\xfaQ\xda\xad\xca\xd2_\x90\
+\x9c\x97[\xce=\x8b&?\x0fX\x0d\x1cQ\xefL\x08\
+!A\x17c\x8b\xb7\x130.Z\xb2^Nf\x0f\xf2\
+q\x94\x971)/U\xb4\xbc\x14\xf9\xddQ\x9a\x19\x22\
+9\xef\x7f\xbfc \xe7\x16\x22x\xf8\xdf\x16\xe2\xdbc\
+\x926\xc2\xc9\xcf\xdb95{\xa6Y\xe5e\x17\x1c\xe2\
+\xdd\xd7\xdf\x07\x07\xac\xfbG\x0a\xdcJL\xbfu\xfc\xe4\
+<\xa3k\xae4#\xe7Y\xfc^_K\xb0\xf5\x12\xf4\
+.\xd1\xf2s!$\xe8bD\x05\xbds\x83\xbf\xa8\xd4\
+r>\xb4e\xa6\xc6\xb5\x8cZ\xce\xb2\xa92j+\xdb\
+\xb7\xca\xa8e$j\xa3\x1d\xdf\x16\x22\xf5\xa3\xeb\xffW\
+Rk\xbd\xa3\xb6zf\xbe\x9b-7\xd2\xc0\xc6\xe9\x06\
+?\xf7\xea\x07\xa90\x0f\xcdJ/\x87\xf5\x01\xdcjc\
+!\xe7d\x1cCe/\xa3\xd6\xfbvV\xe1\xf1|`\
+\xb7zg]6Y\x08j\x07!$\xe8b4\xef\xf0\
+\x5c:\xba\xf2\xb2\xd2CT\x8d\xf3\xe2\xe5E5\xces\
+\xeb\x18K\xce%\xe7]\xcay\x05\xfec\xfd\xe0\xe6\xf7\
+\xd66\x1e\xa9\xd7\xd6\x9cXv\xcb\xd1\x8d\xe8\xc6?\xba\
+\xfd\xeb\x5c\xbd\xed\x104j\xbd\x1c\xd8\x9d\xc0[\xc6B\
+\xceK7\xad=g9_\xd9=4\x80mS\xbfL\
+\x08!A\x17c\x1e\xac\x91H\xd8\x1a%/\xf9\xf7t\
+$\xe79v %\xe7c'\xe7E}w\x5c\xe4<\
+I\x99\xd9w\xe1\x876\xae=\xf6S!\xa4\xd1\xac\xbb\
+}\x9ehTx\xffK\xbe\xc1\x1bo\xda\xd9)\xa9\xd6\
+\xf5\xb1Z\xc0\xf9\x05 \x19\x1f9\xcf\xe8\x9a\x1b\xadi\
+\xed\xcf\x0a\x0b\xdb\xa4\xfa\xdeE=G\x84\x90\xa0\x0bQ\
+J\xda\x04\x036w\xfd\x94U\x99\xa9\x95\xed7Wi\
+\xf1l\x9a\x5ce\xa6\x14\xdf\xa5\x8e\xf3~\x05E\xf1}\
+\xd6\xcd\x99\x83[\xc3\xcc\x7f|\xee\xc0\x96\xdf\xd9\xb0z\
+\xb6\xab\xb5\xad\x06\x1ckTy\xd5\x95\x07\xf9\xbe;\x1f\
+\x03_\x0b\xd5.\xc5\xca\x0cZ\x8d\xb7\x11\xd3W\x9d]\
+\xc6\xca$\xe7\x9e\xd1)\x18\x93i\xed\xfd\xdeC=\x9e\
+\xa7Jk\xbd\xa2\x17\x1aBH\xd0\xc5\xa81E's\
+j\xc6\xfd[\xc9y\xf7\x9b\x1dd\x06\xebq\x95s\xbd\
+|\x92\x9cK\xce\x01H\x93\xddn\xf1\xfb\x1c\xfb\x94\x85\
+\xd8\xd5~\x0d\x98o'\x5c\xb5q\x86\x9f\xbd\xf3+T\
+\xdb)\xb4\xba,\xa9\x86Cho\xc4\xfd\x9f\xe5'\xe7\
+%\xa8q.9_\xe9v\xce\x97p\x0a!$\xe8b\
+\xbcq\x9b6\xf3\x8d\xbe\xd2\xce\x9d\xe4e\x80r\x9eQ\
+\x93\x0f\xed\x9a\xf3,\xaf\x03\xc5w\xfe\xed'9/\x9d\
+\x9c[\xfcx\xfd\xe0\xb6\x1f\x9c\xd8\xbc\xff\xc9^\xf6Y\
+O\x136M\xcd\xf3\xbb\xaf\xfbs.Zs\x02\xe6*\
+\xdd\x1f\x97\x05\xa8L\xfd<\xc6e\xf9\xc8yV\xa7k\
+\x94\xe4<\xab\xf6\xcbY\xce\xdd\xc0\xda[H\xeaH\xd2\
+\xbbm\xc7\x00\xe9\x94\x9aB\x08\x09\xba\x18\xa9\xdb{\xf0\
+\xb58SK>8\x8b\x90\x17/\xa03|\xce\x8f\x8d\
+o\x19\xb5\x9e\xe5\xdc\x0bx\xa9\xb1\xec_\x0f\xe1\xb4\xf6\
+\xa1\x8d\xef\xac:\xe6}\xfev\xcf\xb9\xdd\xc6M\xce\xcd\
+g\xd2V\xed\x9fX\xa5\xf1/\xdc\xad\xa7\x1d\xa6nT\
+B\xe4g\xef\xfc*\x17m\x9e\x87\xc6\xf49W\x91\x9f\
+\xf5\xd0\xcc_\x8d\xf1\xbe\xbe~\xf3X\x8c\x9c{F\x87\
+34#\xe7\x0b\xd7z\xb2\x91\xf6*u\xce\xba\xc5\xd0\
+\xcb\x0c!$\xe8b\xd4\x08\xce\x06gQ\xd0\xfbM\x1c\
+\xb3\xd2\xce\xd1\xb0\x96\x99\x1a\xc6$YC \xe7E~\
+\xb7\xf45\xceK\x9c\x0c\xae\xab\xcd\x0f2\xceK*\xe7\
+\x83N\x06\x07\x7f1\x97\xa4?^m\x84\x07\xad\xc7}\
+\xa6n\x1c\xab\xd7\xf8\xc0\xcb\xbe\xc6k\xae\xdf\x0b\xf5\xb5\
+\xd0K\x95'\xf3\xf5\x84\xf4\xb7\xce\xec'\x8d\x90\x9c\xe7\
+q\x8f\x1c\x079?\xf3?\xaf\x07\xab\x00m\xf5\xd0\x84\
+\x10\x12t1\x96\xb8\xb3\x01\xa32\xb0\x8e\xb4j\x9c\xaf\
+l\xbfE\x8f\x9c\x17)]\xa5[s>\x8ce\x02\x87\
+]\xce\xfb\xdd\xc4\xb8\xcd\x0c\xe9\xea\xbbO\xe3~/\xc1\
+~\xd7!\xede\xebFgZ{\xc5\x22\xbf\xf2\xda\xfb\
+\xf9\xf6\xebv\xc3\x5c\xad\xb7\x81;s\xb0\xf8k\xc0\xf5\
+\xd9\xff\xcc\x92\x8c\x9cK\xce\xb3h\x93u\xe0\x93\xc0\x8c\
+zhB\x08\x09\xba\x18Kb\xc2\xfa\x10%/\xe3\x22\
+\xe7.y\x19\x92\xf5\xe6=\xec{\xe4\xca\xa8-|_\
+r\x9eU|\xb7\xdc\xfc\xdf\x05\xb7_v\xe7\xf1\x95\xec\
+a\xaeUa\xf3t\x9d\x9f~\xc5Wx\xed\x8d\x8f\xc3\
+l\xd2Q\xfc\x8aw\xd6\x0dw#\xe7!~\x0f\xf8{\
+\xb39O%\x94s\xcf(\xeeGN\xce{\xde\xc6\x1a\
+,H\xd0\xbb\xc5\x00\xa2\xdaA\x08\x09\xba\x18\xa9{{\
+d\xe3\xf0\xc9\xcb \x93e\x8dk\x8d\xf3~v\xdeo\
+28\xd58/.\xbe\x879\xce\xb5\xde\xfc9~g\
+\xfcqlT\x7f)\xd4\x9a_\x5c\xe9\x1ef[\x15\xae\
+\xdd|\x8c\x7f\xf1\x86/s\xc9\x86\xfdP\x9f\x00_\xc8\
+\xf6^\x01\x1a@\xd5\xcfr\x10v\xea\xdf\x9b\xc9\xcd$\
+\xfe/\xb3\x89\xf1\xac\xceyV\xd7:\xd9^s\x9e\xc3\
+\xb5;\xd0\x91\xf3\x9e\xb71\x85%\xcaz\xd6\x93\xa0\xab\
+.\x9d\x10\x12t1Z\xf7v\xf7\x0d\xa7\xf7\xa3$/\
+yuV\x86Y\xce\x07\x99\xa9]r.9\x1fU9\
+\xcf\xf8<\xf9\xe9\xf7u\xfe\xb4\x9d\xc4_\x8f\xc6\xa7\x92\
+\x18V\xb4\xf5\xe8\xc6\xf1z\x8d{\x9e\xb7\x93\x9f\xbf\xe7\
+\xb3L\xc7M\xd0\xac\x9e9\xad=\x89\x10\x13\xb0\xf8\xac\
+\xe9\xee\x06I\xa3sP\x8d\xc9\xcd\xd4\xda\xff\x09X\x97\
+m\xf3\x96@\xce\xb3\xde\x8e\xe7\x17\x13\x83\x91\xf3\x15\x1d\
+@\x8d\xd8Z\x07<\xa1\x1eZ\xb7\x82\xae$qBH\
+\xd0\xc5\xa8\xdd\xdc\xd7K^\xf2\xec\xac\xa8\xc6\xf9\xca>\
+2\x84\xeb\xcd\x87^\xce\x875\xce\x15\xdf\x0b\xff\xa9\x81\
+\xf3q7~\x0b\xec\xaf\xfa\xe9\xef\xcf7\xabTZ\x09\
+\x1f|\xc5\x97\xf9\xae[\xbeNRk\xc1\xcc9R\xb5\
+G{\xd6\xa0\xb9\x81\x07\xa86\x80X\xa31\xf5\x11l\
+q\xddy\x89d8\x93\xeb=\x8bc\xc9q\xe4|`\
+r\xde\xd76j\xc0\x1au\xce\x06q\xee\x85\x90\xa0\x0b\
+Q\x16\xd6I^\xca(-\xd9lFr^`\xdfE\
+r>\x808\x1f\xefL\xedf\x0e\xd1\x9et\xf8o\x18\
+\x7f\x80\xf3\x95~C\xf8\xd8\x5c\x8d\x9b.\xdb\xc7\x0f\xdc\
+\xfdY\xee\xbey;\xd4\x03\xa4=\x8e\xc2\x9bCZ\x05\
+\xd2\xdf&\xf8\xdd\xfd\xc7xV\xe7<\xb3\x1bk\xb9_\
+4d=r^\xe8\xfb\x10\x0f\x80\xea\xac\xf5\xd2\xa6\xae\
+\x11t!$\xe8b\xd4n\xeek\xba\xfd\xa0\xe4\xbcH\
+i\xf1\xc1dj\x1fk9\x1f\xd7i\xed\x03\x8e\xf3Q\
+\x93\xf3b\xbe\xdb4\x8b\x9f\x9b?\xb2\xe1\xff\x9b\x9c\x9a\
+\xff\x9f6\xd18\xe4}Ls5\xa0\x99&\xcc4&\
+x\xe7-O\xf2\xd3o\xfas&\xd7\x9c\x80\x99i\xf0\
+vo\xd7A4\x88\x01\x98\xf8\xe7\xb8\xbd\x17\x8b#,\
+\xe7\x83\xaf\xc8Q>9\xcfd\x89\xcc*\xcd\xda\xee\xe1\
+\xe2U\x8e8!$\xe8b\xd4\xfc\x9c\xd5\x96\xf3\x0e\x0a\
+\xe9\xd0*S\xfb\xb3\xb6\xa0L\xd6\xc5\x88y\x81\xc2V\
+\xa4\x9c\x17\x15\xe7Y\x0a@\x19\xe4<\xff\xf8\xfe\xb2\xb9\
+\xfd\x0f\x0b\xf1cf|\xad]\x9f\xc0'\x1a}\xb9L\
+t\xe3h\xbd\xc6U[\x8f\xf1c\xef\xf9\x1f\xbc\xf3\x9b\
+\xb7C#B\xbd\xb6\xf2Cu~\x01\xf8G\x8b\xffR\
+\x1e9\xf7\x8c.\x97\x92Nk/k\x19\xb5^\xee'\
+\x06\xb4l\x9a(C\xefZ\xd0O\xff\xa7\x10B\x82.\
+F\xe2\xde\xbe*?y)\xa8\xccTQ\xdf\x1d\xd5d\
+pE\xb5\xf9\xa8\xc9yQ1:\x88\x1a\xe7\xa5\x95\xf3\
+A\x8aU\xc1\xf1m\x0en\x0d\xf0\x07\x92\x18\xfe\xac\x95\
+\xa4\x7f\x06\xdc_\x89\xe1\xe4\x90\xb6\x99\xf7\xf5kf\x9a\
+U,\x1a\xefz\xd1#\xbc\xf7%\x0f\xb1y\xd3qH\
+7v\xa6\xb4WV\xb8\xd1\xc4\x7f\x9e\xa4\xfdOz~\
+yU\xc8\xc8\xb9\xe4<\x9f\xf6\xcb0\x89\xaa\x03\x81i\
+\x09g\x8f}-\x97\xa4\x0b!A\x17\xa3D\xad\xb8\x1e\
+NN=\xab\x22\xa6\xb5\x8f\xb2\x9cg]\xbfw\x1c\xe4\
+|Tk\x9cw\xb5\xf9a\xcc\xd4>Tr\xbe\xdbB\
+\xfc|sn\xd5_\xd4B\xfb\xb3T[\x0f\x87\x8c\xd7\
+\x98\xd6\xdb\x09\xb1U\xe1\x8ek\xf6\xf2\x1do\xba\x9f\xbb\
+\x9e\xb7\x03\x9a\x09\xccMB\xad\x8f}\x19\xbf\x0a\xfcd\
+\xcf\xbf{h\xa6\xb5k\xe4<W9_$\xf8*\xcd\
+\xdb\xee\x81\x15Vj\x10B\x82.Dy\x99(\x9f\xbc\
+\x0c\xa8\x136\xf4\xd3\xda\x8b\xf8\x92\xe4|d\xe5|d\
+\xcb\xa8\x95Z\xceg\x80\xdd\xc0\x03\xc0\xdfx\xb4/b\
+\xf6\xb0Y:\x17\xdbU\xa8\xa6\x99\xde2\xe7[\x15b\
++p\xed\x85\xfby\xdf\xdd\x7f\xc7=7\xee\x85\x8a\xc3\
+L\xads\xac+w\xf3\x09\xe0\xb7\xc1\xde\xd3\xff\x0b\xd6\
+>\xcfY)\xa7\xb5g5k\xa4l5\xcesz\xd1\
+\xe76\xa5\xe1\xe0.1\x94$N\x08\x09\xba\x18\x0fA\
+\x1f\xc7dYc6r\xae\x1a\xe7C\x16\xdf\x92\xf3\xe2\
+\xe3\xbb\x1f9\x7f\xce_\xd4\x81\xc3\xc0n\x83\x1d\xd1\xfc\
+k\xc0\xd7#|=\x89a/\xe6\xcf\x1d.\xb4l\xde\
+\xa0\xb9\xc3\x5c\xab\x82y\xe0\xb6K\x9e\xe1\x0d\xb7>\xc9\
+=W?Bm\xd5,\xccn\x80~\xdf\x01\x18\xdb0\
+>\x0c\xbc.\xbb\xe6\x1d%9\xcf\xeapFI\xce\x97\
+\xdd\xf6\x84\xbafB\x08\x09\xba\x90\xa0\x0f\xbd\xbcH\xce\
+%\xe7\xbd\x7f\xd7\xbaS\xb08\xd8\xf8\xf61\x8e\xf3R\
+\xc6\xb7-\x5cz-\xa0\x0d4\x0c\xe6\x80Y\x87\xa3\xc0\
+\x01\xdc\xf6c\xbe\x17\xf3\xdd\xc0\x93`\x8fG\xfc\xa9\xc4\
+9\x110\x22\xf9/ j\xa5\x81\xb94a:\x06\xee\
+\xbct?\xdfr\xfdc|\xeb\xf3\xf6\xc0\x86\x00G#\
+4jY\x84\xd4\x8b\x98j\xff\x07XA\x9d\xf3\xdc\xd7\
+L\x8fRB\xb81\x199?u\x85M\xaak\xd6%\
+\x86&\x1b\x08!A\x17\xa3-\xe8\xe36r>\xe0u\
+\xb8c)\xe7\x19\x8fhv\xbf\xb9y\xf0\xfdn\x1c2\
+g\xbf\xb9\xedk'\xe9\x81\x14?2\x11+\x87\x9dx\
+\xcc\x8dYK\x93\xd9X\x0ds!\xb6\xdb8\x11H1\
+\x22^\xd0\x1cB?W\x0f\xac_\xe2`\xe5\xbc\xc8\xef\
+Z\x16\xed\xe6\xdd\x5c|-\xc7\x9aF\xac'\xb1r\xc2\
+`\xbe\x99\xa4\x91\xe8X\x0c\x90,f0/\xae\xf7\x1c\
+\xdd\x98o%x\x0c\x5c\xb2\xe5\x08/\xbat?\xf7\x5c\
+\xfd\x14/\xbe\xf4\x19HZ\xd0\xaaB\xbd\x0a\xde\xccB\
+\x0c\xdeK\xe4\xd7\x81\xb5\x9a\xd6\x9e\xdf}~h\xe4<\
+\xcb{\x89\x04}\x05\xf7;!\x84\x04]\x8c`\xbcJ\
+\xce%\xe7e\x96\xf3\xae;\xa9\xc7\xe9\xac\xe9\xdd\xe9\xf0\
+5s\xb6\xbb\xf9\x1e\xdc\xf7\x1av8V\xc3\x89\xa4\xed\
+\x98C\x1a\x22M\x22\x93\xb1r\xe6\xa6L=\x1e1<\
+\xa4\xd1\xa87+\xb4c`\xc3d\x93\x17^r\x80\xdb\
+/\xdd\xcf\xb7\xdd\xfc\x10\xab&S @s\xa23\xd6\
+\x9fEl;\x9b\x09\xf6\xab\xd4\xe2\xbbVtI\x8f\xcd\
+\xc8\xf9\x18\xc99\x99\x9fS\x09z/\xa7\xc4\xd5\x0cB\
+H\xd0\xc5\xa8\x11$\xe7\xbdlRr>p9?\xf3\
+_\xf7\xe0\xfe%\xe0\xf3\x1e\xecK\x16\xfda\xc3\x9e\x8e\
+\xd6\xdd\xcaZ\xa9\xb8\x18\xb6\xbext#M\x03\xcd\x18\
+\x98iT\xd9\xb4\xa9\xc5-W=\xc9\xf3\xcf?\xca+\
+\xaex\x9a\xab\xb6\x1e]\xf8d\xbb3\x8d=XF\x1d\
+x\x03x=\xee\xbf\x09\x5c\x93\xcd}\xbc\xcf\xfb\x83\xa6\
+\xb5\x97C\xce\xb3|\xa9\xdd\xf9hUW\xbb\x10B\x82\
+.\xc6\xb9\xcb\xb72GQ2\xb8\xc2;l>>e\
+\xa6\x96\x0a\xbb\xfd\xd1\xfc\xef\x12\xc2\xa7\xcc\xfd3\xe6\xe1\
+\x91\x18\xdb\xb3\x9d(\x96n\x8b\xd1#\x8dF\xbbUa\
+6\x1a\xd5\x10Y\x1d\x22[W\xcf\xf1\xe2K\xf6s\xc3\
+\xab\x1e\xe4eW?\xcey[\xf6C{M\xa7~y\
+s\xa1\x0bRie\xf9f\xe0|b\xfb\x17p\xfb\xbe\
+\x15_\xd7Y\xcayne\xd42\xbcOf)\xe7\x9e\
+\xd1vV\xbc\xbd\x82\x9e\x9b\xae~\xb4\x10B\x82.\x04\
+@\xef\x054\x07ZFMr>>r\xee\x8bI\xdc\
+\x9e4\xf3?\x8f\xf3\x13\x1f?zx\xedg'.}\
+\xe2\xc0tkZW\xae\x18\x19\x1cHc M\x0d'\
+\x90\xa6\xd0hVqO\xd9\xb8j\x9ek.8\xcc\xd6\
+\x0d\xc7y\xcdUOq\xe5\xc6\x13l\xac\xd4Y\xb5\xa6\
+\x0e\x09\xe0\x11Z\x094s\x18t4\xaf\x12\xab\xefa\
+~\xdd?\xc6[\x17\x8f\xa4\x9cg}\x9f/\xbb\x9c\x97\
+\xf5\xb9\xf9\xdc\xfc\x9dB\x08!A\x17cKo\x0f\xc2\
+\xa1-35\xbcr\xde\xff\xcf\x1d\xb2$_\x80\xe13\
+\xc0'f\x92\xc6\x1fM\xc5\xca'-\xda\x11\x8b\x81\xd8\
+\xd2\xedU\x0c\x07\xd1\x17\xd3+w\xfe4c\xc0R\x08\
+f\xb4pZ1\x10\x81j\x0cT+)[W\xcf3\
+Um\xb3v\xa2\xcdu\xe7\x1d\xe6\x86\xcd3lY5\
+\xcb\xb5\x9b\x8f\xb2e\xe3\x89\x8e\x88\x87\xd0\x19%o\xd1\
+\x11\xf2`\x9043\xeeu,<\x12bx3\x84\x9f\
+&\xd8\x8b\x89\xe1\xb4\xeb9\xabL\xed%\x90\xea\xac\xef\
+\x93\x9e\xf1o\x19\xbf\x91\xf3E4\xc5]\x08!A\x17\
+cM\x229/\xb7\x9c{_\xa3U\xc36r\xee\x0f\
+a|\xa4\xd2\x0e\xff\x05\x8b\xbb\x1b\xd5\x16\x93\xb1rZ\
+b\xee\xe2\xb3\xe1,\x8env~R'+w3=\
+{\xea\x86\x88\xf5\x17\xbf\xb9\xfd\xbc\x12dq\xf7\x1c\xef\
+\x19E\xb5\xd7\xe9\x87\xe6\x9d9\x1eF\xa4\xb2\x10\xa3\xcd\
+$\xe0\xd1\xa9b\xac\x9en\x80E\xc0\x88n\x5c\xbdq\
+\x86u\xb5\x16\xc4@\xad\xd6\xe2\x96\x0b\x0e\x11\x81\xd5\x95\
+\xc87\x9dw\x90\x0b\xd7\x9d`\xddt\xab\xd3\x81\x98l\
+-\xc8\xb8C;\x80\x07h&\x90\xd8\xe2B\xf4\xfc\xc6\
+\x18\xbd}7\xceO\x10+\xdf\xfc\xdcs1`\xa9\xce\
+r\xc9S)^b\x16\xb8\x9d\xb2\xca\xf9\xd9\xd1\x08\xba\
+\x10B\x82.Dy\xe5|Pk\xce\x07\x9f$h\x9c\
+\x92\xc1\x99%\x7f\x19\x89\xbf\x9b\x90\xfe\xafh6\xbfX\
+\x9d\xcar\xee\xa7-&\xc0m\xc7@\xea\x86\xc5\x84z\
+\xb3J\x92.L\xafw\xa8U\x22\x9b\xa6\xe7!v\x84\
+,\x09\xceu[\x8fRM\xd2\x8e8-l\xa9\x1d\x8d\
+\x1b\xcf;\xcc\xe65\xf3\x10\xbb(N\xeb\xbd4_\x1c\
+\xc05\x9f\x97\x9c\xc5Bn%\xfdm\xa8\xb7\x97Sa\
+!\x95G4'\xa6\xc6\xda\x89\x167\x9cw\xf8d\x8a\
+\x8f\x08\x9c\xb7z\x9ej\xad\xdd\x89\x8d\x00T\xdb\xa7\xb6\
+\x93:\xa4F'g\xa7A\xa3\xda\x11\xf4\x18\x17\xde\x09\
+\xe5~\xfek\xc0\x9bp~\x88f\xfd\x95g\x0f\xdd\x01\
+\x8e\x9c\xe7\xb6\xe6\xbc\x0c\xc9\xe0\xce\xb2\x81\x81\x8e\x9c\xf7\
+\x9bT.\x938Q?Z\x08!A\x17c\xcd\xf2\xd9\
+\xae\xc7\xae\x8cZF\x9d-\xc9\xf92V\xee\xe0\xfc\xb9\
+9\xbf\x19*\x13\x7f\x9az#w\x0fM\xddh\xb5\x03\
+!\x85\x13\xd1 i1\x99\x066\xaf\x9ecj\xb2N\
+%V\xb8\xfe\x82\xe3\x5c\xbd\xf90\x97o<NL\x13\
+\xa6kM\xae\xddr\x14Rp3\x829kV\xd5;\
+u\xae\xe3\x82\xa0\xdb\x82H\x85\xf441\xb7\x0c=u\
+\x90\x82\x9e\xf51\xf4)\xe8>\xe0c\xe8\xe6\xf8\xdc:\
+S\xd1\xcf\xd8\xe5\xe2\x7f\xb3\xce]7VO{\xf7\x11\
+;_4\xeb|\xb7\x88\xf1\xc3\xcel\x94\x8bp\xbe\x03\
+\xf3w\x01\xcf\xcb\xe4\xda\x96\x9c\x0f@\xce\xcb\x90\xa9=\
+\xcb8\x11B\x08\x09\xba\x10\x92\xf3\xac\xf7-9_\x92\
+\x10\xe2\xe7f\x9f\xd9\xf4K\xb5\x8d\xc7\xfe\xffJ\xd2\xce\
+O\xc8\xa3Q\x8f\x091v\xa4i\xfdT\x8b\xab7\x1f\
+\xa5\x86\xf3\xbc\xcb\xf6r\xf3E\xfb\xd8h\xd3\x5c\xb4n\
+\x8e5\x1b\x1e\xc3\x1a\xebH\xaa@\xb28\x85\xdd \xa6\
+\x10+\x9d:\xd2aah\xbf\x9dt$\xcb\x9f%\xe8\
+\x16N+\x8c A\x1f[A_\xee3\x83\x9d\xc0\xbb\
+\x9a\x98\xbc\x92\xb6}'\x91\xd7\x83o\xcc\xec\xda\x1e\x1a\
+9\xcf\xe8\xe2(\xcd\xc8y\xce\xbf\xb7P9w\xa0\xbb\
+2\x99B\x08!A\x17\xa3J*9/\x87\x98\x8f\x89\
+\x9c\xef\xc1\xb97\xc0\x87cc\x22\xbagk*\xd1\x8d\
+4&4bgr\xfc\xb6U\xf3\xdcv\xde\x11\xae\xdc\
+t\x8c\xab6\x1f\xe7\x96\x0b\x8ep\xc9\xa6#\xe0\x09\xac\
+:\x0e\xb1\x01\x8dm\x1d_\x0b\x11\x92\x08\xcd\x89\x05A\
+_0)\xb7\xce\xc8f\xecB\xba\x85('\xab\xc1^\
+\x82\xfb\x1b\x99k\xdf\x83'W\x92VXXH_\x94\
+t\x95D\xceU\xe3<\xfb\xedd\x11'g\xfcE\xd4\
+%+\x84\x90\xa0\x0b!9\xcf\xa0\xcdFT\xce\xfb\xed\
+xw\xa6\xd2F\x08\xbf\x15\xa3\xdf\x1b\xe0\xc0i\xff=\
+\x13)o\xa4\x814\xad\xb0\xba\xd2\xe4\xa2\x0d\xc7\xb9\xeb\
+\xea}<\xef\xc2\x03\x5c\xb7\xe9\x04[7\x9d\x00kw\
+F\xb7[\x95\xce4c\x0f\x9du\xbe,\x94\xa82\xef\
+\x88\xb8K\xc0\xc5H`\xb8]\x09\xf62\xdc^\x03\xf1\
+\xe5\xc0e\x9d\x19!\xdd\xe6\x14\x90\x9c\xe7#\xe7Y\xfd\
+\xb4\x91\x95s:7l\xd1\xcb\xe5.\x84\x90\xa0\x8b\xd1\
+\x22\xcdN\xcc\xc7Q\xce\x074\xa5}H\xe4\xdc\x0c\xd2\
+f\xed\x01\xb3\xf0cL\xb4\xfe\xea\x94\x1c\xf4\x19e\x0e\
+\x8dv\x82\xa7\x09S\xd567n9\xc2\x9bo\xde\xc3\
+\x0b.;\xc6\x15\xd3GI\xaa\xed\xce\x88x\x9at\x04\
+\x9c\xd3\x12p\x99fO\x8a\x91c\x0dp9p3\xf8\
+\xcb \xbe\x98\xb4v-0\xb5\xe4e\xaai\xed\x03\x90\
+\xf32Mk/\xed\x9as\x8d\xa0\x0b!$\xe8B\x82\
+^\xa8\x9c\xab\x8cZ\x7fr>$e\xd4\x0c\xa3\x1e\xea\
+\xbf\xe1\xad\xc9\x0fV\xa8\xceT&\x9b}\xf7E\xd3h\
+\xcc4+L`\xdc\xb0\xed\x08\xaf\xbd\xfaI^u\xdd\
+\xe3\x5c\xb2f\x0e\x9bn\x80\xad\x86\xb9\x08\xcdJG\xd0\
+\xb1\x85u\xe3B\x8c\x8c\x88o\xc1\xb8\x04\xe3j\xf0\xe7\
+\x11+\xd7\xd3\x5c}\x1d\xee\x17\xd2y\x0bU\x9cT\xe7\
+.\xe7}OK\xca\xc8\x825\xad=\xdb\xe7\xfdr\x7f\
+\xe9\x1aA\x17BH\xd0\xc5X\xd3\xec_\xceU\xe3\xbc\
+09\xcf\xaa\xe3\x9a\xb3\x9cG\xfc\xa9$\xc4\x1fjZ\
+\xfbc\x89E\xac\xcf\x97?\xcd4\xd0lTYUM\
+y\xf5\xf5O\xf0}7=\xce\xf3\xb6\x1e\xc1\x92\xb4#\
+\xe2\xadJg\xcaz%\x01\x1f\xf8\x08yB\xa7lU\
+\xa5#LB\x9cq\xf1\x84g\xfd\xa9,\xc4\xcb$\xb0\
+\x1aX\x0f\xac\xc7}=\xb0\x0d\xb8\x88\xd4\xce\xc7\xec<\
+\x22\x17\x01\x1b\x086}j\x8b\xa7\x97\xf4+\x83\x9c\x97\
+\xa0\xc6\xb9\xe4\xbc\x1cr\xbe\xf2mH\xd0\x85\x10\x12t\
+1\xe6\x82.9\x1f\x0e9\xcf\xba\xc3\x99K\x07\xde1\
+\x0f\x9fuK\xdf\x95\x9a\xef\xec\xb7\x8ey+\x0d\x9ch\
+T\xb9z\xfd\x0c\xaf{\xe9N\xbe\xed\xc6\xc7\xb9`\xc3\
+\xa1\xce\x9a\xf1V\x15\x9aU\xa8\xb4\x8b\x5c;\xbe\x118\
+\x7fA\x9c.\x05?\x1f8\x0f\xd8\x02l\xc0\xc3z`\
+\xd5\x82lUO+\x94\xfe\x5c,\xc3k\xac\x90i\xc6\
+Y\x85\x9ae\xb0\xbd~\x0f\xd0\x06']\xe6\x01Hp\
+:\xff\x84*f\x93`\x09\x90\x9cr\xed\xd3\x12\xb8u\
+\x15\xdfe\x199\x97\x9c\xe7\xd3~cUJm^]\
+\xb3\xdeneB\x08\x09\xba\x18%\xdc\x9b\x83\x91\xf3\x9c\
+$Sr>\xb8\x0e\xbc;n\x13\x7f`\x16\x7f\x18\xda\
+\xb3\xfd\x9c\xddv\x1ah\xb6\x03[64\xf8\xee\x17>\
+\xc6\xbbn\xdd\xc1\x9a\xcds\xd0\xae\xc0\x89jg\xd4<\
+s)?\xe3\xf7\xad\x05\xae\x02\xbf\x06\xb7\xe7\x03\xd7\x12\
+\xb8jA\xcc\xb7,\x08\xd62\xf1\xe0\x19\x84_Y\xe4\
+\x5c\xd3\x953\x91\xf3AH\xd7\xb2\x1f\xf1\x8c\x0ey\x94\
+F\xce=\xa3\xc3\x19\x928)\xbe\x8c\x9a\x04=\x97\xc7\
+\x96\x10B\x82.F\x85\xd6p\xc9\xf9\x80\x93\xc1\x8d\xa5\
+\x9c{\xb7{\xf8\xc5\xd8\x9a\xfc`\x98\x98_q\x8a\x9f\
+\xe8\xc6l\xab\xca\xf9SM\xbe\xf3\xd6\x1d|\xc7\xed\xdb\
+Y\xbbj\x1ef*P\xafe,\xe5'\x8bV\x1b\xf8\
+e\xa4S7\xe3\xe1v\x8c[\x88\xf1:\xe0||a\
+|\xc23j\xefBG\xe2$\xe7\x92\xf31\x92\xf3<\
+rsH\xce3\xbequ\xbd\x1d\x09\xba\x10B\x82.\
+\xc6\x9aF\xb1r\x9e\xd3\xc3]r>\xc8\x0e\xbc\x03\xff\
+\x0f\xceo\xf75\xa7\xb1Ua\x8a\x16o}\xfe.~\
+\xe8\xce\xaf\xb3e\xcd\x5cg\xd6o\xa3\x9aCN_\xbf\
+\x90X\xbb\x0d\x0f\xaf\xc1\xe2\xed\x10\xaf\xa1\xb5v:\x9b\
+s\x9d\x95\x9c\xe7\x5c\xfe\xae09\xcf\xea\xb2\xd7t\xe5\
+l\xaf\xed\xac\x0e\xb9$#\xe7Yog\xdc^\xe2d\
+\xf5\xddl\xe2D\x82\xde-\x9a\xe2.\x84\x04]\x8c\xe4\
+\xbd}\xbe\xb7\xc7\xaf\xca\xa8I\xceO\xff\x88\xb5\x81\xf7\
+b\xfe\x1fVz\x84\xed\x18h\xb7\xaa|\xd3y\x07\xf8\
+\x87\xaf\xf94\xb7^|\x1c\xda\x13\x9d\xf5\xe5U\xcf\xac\
+^:p\x03\xf0\xcd`\xf7`\xbc\x88vmC'7\
+W:b\xd25\xc0\x11o\x8d\x9c\x0fI\x9c\x0c0S\
+{nqR\x96\x1789\xc7\xc9P\xae7\xef\xb1\x01\
+\xcc\xeb\x18\x9a\xbe\xdd\xad\xa0\x9b,]\x08\x09\xba\x18)\
+\x22>\x17\x08]\x08\xa4\x92\xc1I\xce\x9f\xd3\x89j\xd3\
+\x0c\xefv\x0b\x1f\x09\xb5\xd6\x8a\x8et\xbeYa\xf3\x9a\
+\x06?}\xd7_r\xf7u\x8fa\xd3\x07an-x\
+\x92U\x88_\x85\xf1&<\xbc\x15x\x01\xe6\xb5e3\
+^\x8f\xbd\x9cg\x15nJ\xf4%9\xcf\xfb\xd9\x90\xd5\
+y\xcdq\xf4\xde\x07y<\xc3(\xe7\xc0\xfc\xe4,\xed\
+\x8a\x0c\xbd\xdb\x06\xab\xb44\x92.\x84\x04]\x8c\xd6\xad\
+\xdd\xe6<\xcb\x87`Qr^\xea\xef\xf6!\xe7^\xe0\
+\xf1\xf7\xd9\x817\x0f?@\xf0\x8fXHq\xefm\xb8\
+#\xbaqln\x82;n<\xc4?{\xf3\xe7\xb8b\
+\xeb\x11hNv\xca\xa5\xf5\xcf:\x82\xbf\x1e\xe3\xbb1\
+\x7f\x05\xce\xaa\xae\x1bAr\x8e\xd6\x9c\x0f@\xba\xca8\
+\xad}\xa8\xe4\xdcs\xfe\xbd+\xd8\x80\xe7p \xa3\x99\
+\x10\xee\xb9_\xb1t\x86\xe0\x92\xce\xae\xdb+\xa2\x8a\x9e\
+BH\xd0\xc5h1\x93\xdf\x83Z\x99\xdaK)\xe7\x19\
+t\xa8<\xb1\x9f$\xe5\xdf\x99\xd1\xd3\x14t\x03\x1a\xed\
+\x84Z\x12\xf9\xd1{\xfe\x96\x1f\xfc\xe6\xfb\x98\x9an@\
+\xa3F\xff\xbd1\xbb\x9e\xb4\xfdN\xcc\xbf\x13\xe3\x8a\xf1\
+\x91\xae\x01O3\x1e\xa7D_e\xcfK\x90U\x9c\x94\
+]\xce\xb3\x8e\x93\xb2\xcb\xf9\xd0Mk\xef\xf3^2\xd1\
+\x9e\xd5\xe8y\x0f\xc4\x00\x8d\xa0\x17\x1aBH\xd0\xc5\xc8\
+\xe0v\xe2\xdc\x825\x8c\xc9\xe0\x86]\xce\xcb=j\xbe\
+ \xd9\xbf\x11\x93\xf0!K{\xcf\xdcv\xacQ\xe3\xda\
+M\xc7\xf8\xe0\xeb\xbf\xc0\x0b\xaex\x0a\x1a\x094\xfb\xbe\
+e\xde\x81\xf1C\xc4\xf0\xad\x90N\xae\xa8\x11\xc6%\xd1\
+W\x99\xe5<\xebk\xb8\xecr^\xd2\xeb{\xec\xe4<\
+\xeb\xf32\xf6r\xde\xf7\xcfw\x9c\x13\xb2M\x06w.\
+\x84\x90\xa0\x0b1`\xcc\x8fd\xff\xa0\xce\xe9i!9\
+\x1f\xfcC\xdc\xf8\xe3\xa4\xe6?\x19,\x85\x89\xc5\xc1s\
+\xefT?s\x07\x9a\xc4\xe6Yv\xed\xc6\xf1z\x8dW\
+_\xf5$?s\xd7}\x5c\xb4\xf9\x18\xcc\xd7\xfa;(\
+\xe35\x04\xff\x87x\xb8\xbb\xafF\xd0\xc8y9\xe4\xbc\
+\xec\xf5\xab\x19\x838\xd1\xc8\xf9\x10\xcby\x81\xcf\xce|\
+\xe3\xa4\x05\x9cP\xe7L\x08!A\x17\xe3l\xe8\x87\x9f\
+\xfb@\x1d\xb7L\xed\xc3.\xe7\xc5t\xdec;|\xdd\
+\x92\xf6{\xdd\x89\x1d\x19\x7f\xf6\xe1;X\xebd[,\
+\x8e\x7f\xa4\xd1h\xa6\x81\xef\xbe\xf5\x11~\xfaU\xf7\x11\
+*\xb1S:m\xe5\xdc\x0e\xf6\x01\xf07\xf46\xc8\x22\
+9\xcf\xe4z\x95t\x0dI\x8c\x94M\xceG-i\xe0\
+\x90\xc4\xc9\xb0Lk?E\x13\xa2\x04\xbd\xa7\x06\x94v\
+\x08!A\x17\xa3\xa5\xe7\xd8\x913\xc5r\x18\xe5<\xa3\
+\x8e\x96\xe4\xfc\xdcq\x12\xe2Lkv\xdd\xdf\xaf\xad\x99\
+9\x946\x96\xfe\x9e\x19\x04j$\xde\xa6\x19\x03D\xe3\
+g^s\x1f\xefx\xcd\x17\xa0>\x01\xad\x15fh\x8f\
+\x5cI\xe4g1\x7f'\x90\xf4\xd5NeM\xe0\x94g\
+\xdc\x97Q\xce\xb3\xbe\x7f\x94fDTr\x9eO\xbb\x8d\
+\x92\x9c\x17\x10'\xc33\xad\xfd\xf4\x1b}\x9dJcF\
+3\xdc{h\xc4f\x00\xd5\xa5\x13B\x82.F\xe9\xd6\
+~\xfa\x9b\xeaa\x95s\xad9\xcfU\xce\xcd\x01\xff\x89\
+\xe9\x0ds\xf7\x13\xbb\x1b\xf9\x0e\x18\x8dv\x85\xcd\xab\xe6\
+\xf8\xb5o\xfb3\xee\xb8\xfc\x19\x98\x9f\xa03\x17\xbeG\
+\x8c\x09\xe0\xfd\xb4\xf8\x00\xf8\x86\xde;nC6]y\
+\x18\xeaNg\xb5\x9d\xb2\xd7\xaf\xcer;c-\xe7Y\
+\xcc\xb0\xd0\xc8yy\xe5<\xcb\x19\x16v\x8c\xf6\xe4\xbc\
+\xd6\xa0\xf7\xd2\x96\x92s!$\xe8b\xd48\x0eD\xf0\
+\xeekt\x8c\xc4\xb4\xf6\x01\x89yQr\x9eUg\xca\
+\x9cvs\xe2\xbfW*\xe1\xf7\xbc\x87\x0eS3\x0dL\
+\xd7R\xfe\xcd\xb7~\x81\x1b.~\x06\xea\xb5\x15\xfcF\
+\x834\xdeN\xe4\xd71^<\xb8\xcetV\xd2\x95\xf3\
+9\xcfS\x96$]\xe5\x90\xaee?\xe2\x19\x1d\xb2\xf2\
+\x12t\xd5&e\x8c\x93<^jg\x19'\xcb\xdfK\
+\x8e\x00s\x12\xce\x1e\x9f\x95B\x08\x09\xba\x18\x1d\xdc9\
+j\xe6\x0d`\xaa\xf0N\xfa\x10\x97Q+M\x873O\
+9\x07B\xf0}\xc7\x9f\xde\xf8\xfe\xf9C\xeb\x09I\xda\
+\xd5w\xa2\x1b\xf3\xcd\x0a\xbf\xf1\xee\xff\xcd\x0d\x97>\x05\
+s\x93\xbd\xffD\xa3\x06\xf1g\x88\xfe\x01\xa0\x96I;\
+\x8dK\x16\xee\xa1\x91\xf3\x8c\xdaSr>\xe0\xf3Pf\
+9\xcf\xeap\x860\x7f\x05y\xc7In\x81x\x04,\
+E\x08!$\xe8b\x5c1\xb3#\xe0\xf3\xcb\x0a\xba\xe4\
+\xfc\xb4-\x8c\xc1\xc8\xf9\xe27\xda\x95\x9f\xdcx\xde\xa1\
+}\xbe\xedH\xd7\xdf?6?\xc1/|\xf3}\xbc\xe3\
+U\xf7\xaf@\xce\x1d\xcc\xaf'\xe5\xdf@\xbcs\xb0\xd2\
+\xd5o\x9c\x0e\xee\xbci\xe4\xbc\xe88)\x83\x9c+!\
+\x5c>q2Dr\x9e\xf5\xac\xb3\x81\xcc\xb0\xb0\xa3\x84\
+\x80\xe8\xa1Q\xa3ZA\x08\x09\xba\x181A\xf7Yw\
+N\x00\x1b\x0b\xeb|\x8d\x9b\x9c\x0f|\xbd\xf9\xca\xf6m\
+\x1e?\x0e\xe9\x7fJ\xab\xad\xee>\x0f\xcc6+\xbc\xe1\
+\x96]\xbc\xe3\xf6\xafB\xb3\xd6\xeb\x0e\xa15\xf56b\
+\xf2/\xf1\xb8e4\xe4\xbc\xf8\xf3&9/2NF\
+)[\xbb\xa6\xb5\x0f\xad\x9c\x0f\xddz\xf3\xa5\xb6\xe3\xcf\
+\x105\x80\xde\x1bz\xa1!\x84\x04]\x8c\x14\xee>\x07\
+\x1c\x04.\xcd\xdc\x87%\xe7%\xa9q\xbe\xa2}\xcf\xb8\
+\xfbO\x05s\xba[\xdf\xe6\xcc6\xab\xdcr\xe1A\xfe\
+\xd9\x1b?O\xc5\x1c\xd2^;\x0d\xf1\x17I'~.\
+\xd3\x17\x19\x92s4\x22*9\xcf\xed~\xaei\xed\xe5\
+\x8a\x932>Kz\xbf'=\xa15\xd5B\x08\x09\xba\
+\x18sB\x1b\xfc`w\x9d\x11\x8d\x9c\x0fTJ\x8a\x93\
+s\x80\x7f\xe5I\xf2\x8dv\x17\x1f4:I\xe1\xd6N\
+\xb7\xf8\xc5\xd7\xddO\xa5\x12{-\xa5\xb6\x1a\xf87D\
+\xde>x9\x1fB\xe9\x92\x9c+N\xfa\xda\xd5(\x8d\
+\x9c/|?\x8f\x8c\xfe\xe3\x90\xad=\x9fgI\x8f\xcf\
+3\xdf\x87+A\x5c\xf7\x18z\xa1!\x84\x04]\x8c\x18\
+\xd5\x16\xc4\xc0\x91v\xa53\xc3\xb8|r>\xf8N\xfd\
+\xa8\x97Q;\xcbw\x9f\xf0\xe0\x1f\xa2\xcb\xc7~th\
+\xbb\xf1\xb3\xaf\xb9\x9fK\xb7\x1d\x86F\xb5\x97\x9dm\x05\
+\xfe\x08\xe7U\x92\xae\x12H\xb5\xd6\x12\xe7x/\x1b\xe0\
+\xf5]\xc6\xe4\x83g\xfdj\xc1U\x0er\xbb\x97\x14\x10\
+'#5\xad\xfd\x0c\xdf<(\xdf\xec\xb1\x9d\xf5>C\
+\x08\x09\xba\x18-Z\xb5\x08\xb0\xef\xa4\x9c\x17\x95\x0c.\
+w9\xcff\x0d\xe2\xf8\xc9\xf9\xffm\xef\xce\xe3e;\
+\xeb:\xdf\x7f\x9eUU\xfb\x0c\x99'\x22\x04:\x036\
+-\x08\x84\x04e\x0eh\x80\x04\xb1Q\xd4+aV\x04\
+m\x94\x8bC\xa3\xf7\xe5\x15\x11D\xd1\xab\xb6\xe2l\xcb\
+U\xe0:+\xa2\x88\xa8\xd0\x22\xadb \x10\xc2\x14\x02\
+!\x13!@\xc8\x9c\x9cy\xef]U\xebw\xff\xa8}\
+N\xceI\xce\xde\xbbj\xd7\xb3\xaa\xd6Z\xf5y\xbf^\
+\x87\x90\x9c\xaaU\xab\x9ezj\xd5\xf3]\xcf\x04\x05\xfc\
+*%w\x8d\xfb\xf8\x95\xd5\x1e/y\xec5<\xebQ\
+7\xc0jo\xf3sN\x87\xf6l}0\xa4w\x11<\
+\xb6\xb6\xa1\xcbp>\xe7p\xde\xa0\xb9\xc4\x8b\x10\xcek\
+{\x9c\x8a\xeaI]w~hk8\x87U\x22}\xd5\
+\x96\xd9\x1c\xaa\x9ad@\x97jtm\xef\x17\x90\xb81\
+u\xcaj\x1bM\x86\xf3F\x84s\x88\xeb\x22\xe2\xad\xe3\
+\x9e\xe7r\xbf\xcb\x99'\xef\xe1\xc7\xbe\xe9\xd30\xe8B\
+\xa4\x0d\x93?\x050\xecC\xf4\xce\x00\xdeCp\xee\xfc\
+\x1b+\x86s\xc3yS\xeaI\x8b\xf69\xcf\xdds^\
+\x9b\x15\xfd\xed9\xdf\xf2qR\xdaK*n\xb3e6\
+AY\x87\x0b\xeaI\x06t\xb5\xce\xae/\x9eNo\xc7\
+\xea\xad\xc7\x9eq\x07Q\xa6\xea\xc3yC\xf68\x8f\xa9\
+\x1a\xc2\x8d\x1c\xd6ND\xd0\xe9\xed\xf8\xf5Ng\xdb\x9e\
+\x88\xcd\xf7m\x19F\xc1\xb6^\xf0\xdag\x5c\xca\xd2\xd2\
+\x00\xfa\xdd\x8d\xcf\xb9\x03\xf4\x80\x95\xd5\x072\x5cz\x0f\
+\x11\xe7N\xfb)\x19\xce\xe7\xd8\x98\x9eE8\xaf\xfb\x5c\
+\xe2\xba\x0ek\xaf\xeb\xfa\x06\x86\xf3\x19\x5c\x93\x1a\x5cO\
+\x22n%\x95\xf7\xd82\x1b\x93S\x01$\x03\xba\xda\xe9\
+\xc4sn\x06\xf8j\x94\xf7]\xae\xdbp^Y\xc0\xde\
+\xeas\xa3\xda\xd7M)\xdd\xd8\x1f,\xffq\x7f\xb8:\
+\xd63\xf6\xf7\xbb\xfc\xd8S\xae\xe2\xf1\x0f\xfb2,\x8f\
+=\xef\xfcx\x06;\xfe\x12\xe21\xb5\x0d]\x8b\x12\xce\
+\xb3\xd7#\xf2\xae\xc2\xdd\x84\x85\xbe\xea\xf8\xfdnL8\
+o\xd3\xa2\x81\x86\xf3L\xf5\xe4\xcb\x94\x1c\xb0e6\xe3\
+K\x93d@\x97jv}O\x09Fs\xd0\xf7\x03\xc7\
+\xb8R\xfb4o\xb7\xb9\xe1\x1c \x15\xc5[\xbb\xa4\xdd\
+\x9b\xad\xa0\x9b\x12\xec^\xee\xf1m\x0f\xff\x22?\xf0\x94\
+O\xc2\xca\x98\x97\xbc!\x1d\xe0mDq\xc1\xd6\xef\xfc\
+/\xf0p\xe5\xdc\xe1\xbc\xee\xc3\xda\xeb\x1e\xcecV\xef\
+\xc9p>\xb3pNM\xaf%\x8d\x0b\xe7[.\xd7\xaf\
+\x1e\xb9Z\xad\xc6h\xc4Y\x06\x92\x01]m\xb36\xaa\
+\xfd\xaeNp7\xc41\x86\xf3\xc5\x0c\xe7\xc0n\xca\xf8\
+\xe3q\x9e\xd5\x1f&N\xde\xb9\xcc+\x9f\xfci\x88\x12\
+\x18\x8e1\xd4\xae\x80~\xf7\x97\x18\x0e\xbes\xb4H\x5c\
+\x86r\xaab\x01\xa7:\x87\xf3\xa8\xd9q\xaa\xfc\x1e\xd4\
+y\xa1\xafF\xeeq\xeev{\xd5\xd4\x13\xc3y\xdez\
+\x92\xae\xb5WX\x92\x01]\x0b\xaf3\x5c\x0bg)\xbe\
+\x0c<x>\x81gQ\xf78\x9f\xebbp\xf7\xf9\xd7\
+\xf4.(n\xdc\xb4\xf9D\xb0\xbc\xda\xe3\xbb\x1ey#\
+g\x9fv\x0f,o\xdb8\x9c\xc7\xda\xfft\xe2%\x14\
+\xc3\xd7l}\xd2\xdc\x0c\x86\x19GS>\xbb\x16\x87\xf3\
+\xd6-\xf4e8\xaf_8_\xd0=\xce\xab\xb8&\xe5\
+\x9fj\xf3\x05\xe7U\xcf\xe1gQ2\xa0K\xf5R\xf6\
+W\x80\x18\x16\xdd\xdeW\xe8t\xd8lx\xb3\xe1\xbc\x8d\
+\xe1\x9c\x92T\xbe5\xd8|a\xb8\xfe\xb0\xe0\x01\xc7\xed\
+\xe1\x95\x8f\xff$\xac\xa6\xd1\x0a\xb2\x1b\x9dNJ\x90\x8a\
+G\x12\xfcVm\x1b\xd4\xd1\x80\xcf\xae\x8e\x0b\xc2\xb9\x7f\
+u\x85\xef\xa9n\xc3\xda\xdb\x12\xce\xa9\xf6Zb8\x9f\
+\xe6s(\x89\xb8\xdeV\xd9$\xbc\x9b!\x19\xd0\xd5J\
+\xbd\xde\xb6\xd1oc\xe2\x86r\xa6\xe1<Ccm\x1e\
+\x8b\xc15:\x9c\xaf\x1bt\xafLe\xfa\xd08G\xee\
+\x0f:\xfc\x9fO\xfc\x14'\x9dp\xf7\xe6{\x9e\x93 \
+\x15;(z\x7fHp\xc2B\x84\xae\xba\xce\x01v\xa1\
+\xafv\xd6\x13{\xce\xe7PO\x0c\xe7\x95\xd4\x93\xc4.\
+:\xe9&{\x85'Pb/\xbad@W\x1b\xdd\xd9\
+\xddM\x10,E\xef\xfac\xcb\x9d\x13\x84\xd69\xefq\
+n8\xcf\x15\xce)\xca\xf4W\x89\xd4\xdf4\x9c\x0f\x0b\
+\xce:q\x1f\xff\xf5Q_\x02v@w\x83\xbb\xf7\x91\
+\xa0\xb3\x0a%?M\x99\x1e\xb7\xb5\x85\x7f*\x1e\x0a^\
+\xf7p^\xb7\x90o\xe82\x9c[O\x9a\x15\xce\xab\xb8\
+&UUO\x22\xbe\xc40\xee\xb4U6I\xd9%\xec\
+E\x97\x0c\xe8j\xa1Nt\x81\xa0\x88\xce\x04C\xcbr\
+5R\xe6\xf4\x9bf8?\xfc?\x1d\x182|\xe7f\
+\x87O\x09\xf6\xac.\xf1\xdf\xcf\xff<K;\xfa\xb02\
+\xc6\xb6j\xd1}\x22\x14\xaf\xc9\x12\xce\x17e.q\xee\
+\x86p\xa5\xc3\xda\xdb\x12\xbar\xbd\xdf:\x84\xf36\xad\
+\xe8\x9f\xab\x9e,\xf0\x9cs\x1aTO\xcat#\xc3b\
+\xc5V\xd9\x98R@7\xecA\x97\x0c\xe8j\xa3\x13\xcb\
+cH@\xa4\xb8~H\xec\x07vV\xd7\xb8h\xe0|\
+\xf3C\xafY\xf1\x9c\xd2\xd9\xac\xd4~\xb4C]\x1e\xbd\
+\xf4\xf9\xcd2\xf4jYp\xd6\xe9{x\xe6\xd7\x7f\x09\
+\xca\x02\x8a\xcd\xce)\xf5(\xbb\xff\x03\xd86\x9f\xd0\xe5\
+\x1e\xe7\x86\xae\x96\xd6\x93\x85\x08\xe7\x0dY\xd1\x7f\xa6\xe1\
+<2\x9dr\x0dn\xf4\x1d\xad\x9et\xd2g\xe8\x986\
+'*\xc0\xd2R\x90\x0c\xe8j\xa5\xe1\xc1+|p\x1b\
+\xf0\x15\xe0?O\xfc\x8b\xdf\xd6\xc5\xe0\xda\x1f\xce!\xf1\
+\xf7E\xb9\xf1\x10\xb9\x04,/o\xe7\xa5\x17~\x88S\
+\xcf\xb8\x06\x0el\xdf$\x9b\x97\xb0z\xfc+X9\xfe\
+I\xa42\xff9W\xf8Q\x18\xce\x0d\xe7\xb3\xad's\
+\x0c]\x8b\x16\xce\xab8N\x8ez\xd2\xb8m\xd4\xa6\xfe\
+1>\xca\xf5 \xa0\xd7\xb9\x92Na\x8f\xf08\x12\xd0\
+\x1fB9\xb4,$\x03\xbaZYY\x0f\xce#N\xec\
+\x1b\x0e\xe2\xc6\x88\xf5\x02\xfa\x22\xefq\xde\xd2p\x0e+\
+eY\xbew\xb3#\x0d\xca\x0e\xa7\x9fx\x1b\x17=\xe9\
+\xefa\xc7.\xd8^l\xfc\xba+'\x9e\xc2\xde\x07\xfd\
+\xd4\xe4C\xdb\x17|X{ey\xa2ms\x89\x0d\xe7\
+\xb5\x0b\xe7U\xac\xe8\xbf\x087qb\xae\x17\x86z\x84\
+s\x80\x94\x06\xac\x0c>k\x8bl\xc2\x90.\xc9\x80\xae\
+v*\xcb#~1\xaf\x06\x9ei8\xaf  \xd7/\
+\x9c\x03|6Q\x5c\xbd\xd9\xd1\x96\xfb]\xbe\xffQ7\
+qj:\x13n[\xda\xb8a\x90\x06@\xf9\xc3D\xe7\
+\xc1\xa4a\x15\xe7\x5c\xf3\xd05\xe7\x86\xb0=\xe7\xed\x0b\
+\xe7u_\xe8+w8o\xd5\x8a\xfe3\xfc\xfdlL\
+\xcf\xf9Q\x8f\xf1U\x22\xdd4Z\xf4Lc\xe98\xbe\
+]2\xa0\xab\xc5\x09\xfd\xde\xea\x9aR\xf9\xa9#\xf7\xc2\
+v\x8f\xf3\xd9\x87\xf3\xec{\x9c\xaf\x9f\xa5\x89\x7f/\x12\
+\x83\x0d\xabG$\x8e\xdf\xde\xe7[\x1ev+\xec;\x1d\
+\x06\x9d\xcd^\xff\x81D\xfc\xd0\xf8\xe1|\x81\xe7\x12\xe7\
+\x0eK\x86\xf3\xfa\xd4\x93\xba\xae\xe8_E=\xa9M\x1d\
+\x99A\xd96n\x1b\xb5F\x84s\x80k\xe8\x0e\xef\xb1\
+A6I\x99&\x88\xc2r\x90\x0c\xe8je>gx\
+\xf8\x8f\xe8\xe7\x18-;RL\xdfn0\x9cW\xde\x86\
+\x9c\x22\x9c\x8f\xfe\xbe\xf8\xc0f\x0fY\x19t8\xf7A\
+wr\xe6I\xbba5Alr\xd7>\xf1\x83\x14\xe5\
+\xa9so_76\x9c\xe7z\x9f\x0ek\x9f[8\xaf\
+k\xe8\xaa\xb4\x9e\xd44T\xe7\xac'3\xbd\xaf\xd2\xd6\
+9\xe7\xeb\xba\x82\xd2\xde\xf3\x89X\x5c\x92\x01]-\xbe\
+\xc6\x1f\x99\xb7\xae\x8b\x82\xbb Nmj0on8\
+\xafl\x1b\xb5u>\xf8tO\xa2\xf8\xf8Fe\x95\x80\
+~\xd9\xe1i\x0f\xbd\x99b\xc7\xca8[\xab\x9d\x0c\xe9\
+\xfbj\xd1\x98\x9ei8\x9fsXZ\xb4\x85\xbe\x1c\xd6\
+^\xa3\xd0\xe5\x1e\xe7\xf9\x8fS\xa7z2\xabkI\x5c\
+n\xe04\xa1K\x06t\xe9\xd05\xfe\x88\xa1\xc8w\x02\
+\xd7C:un\xe1|\xeaf\x9a\xe1|\xcc\xc3}\x8e\
+Nq\xf3F\xeb\xb8\x95\xc0q;J\x9ev\xce\xad0\
+\xe8\x8e3\x9c\xee\x12R\x9ca\xe8\x9aQCxV\x0b\
+8\xd5%\x9c\xd7u.qUa\xa9\xf6\xe1<\xd3{\
+1\x9cg\x0e\xe7\x8d\xbb\xd1\xb7L\xea|\xda\xc6\xd8$\
+JW\xbb\x97\x0c\xe8j\xb3\xd5\xe2\xf0\x80\x1e\xc3\x22\x8a\
++\xbbt\x1f?y\xd0\x9d\x7f\x83~1\xe7\x9co\xed\
+pE\xd1\xbf\x9c\xb4R\x92\xd6\xbf\x0b\xbf:(x\xe4\
+\xe9\xbb9\xfb\x81{!\xb6\xc1\x86\x1d\xe8\xa9K9x\
+\x19e\xc9\xc6w\xf6\xdb6\xe7\xbc\x06\x0d\xe1Z\x1d\xa7\
+A\xfbW\xcf\xa3Lf\x1d\xbc\xa2%eRy=i\
+K8\xaf\xc95i\xb2\xdf\xd5\xeb\x89\xf2&[c\x92\
+\x0c\xe8\xd2\x9am\xe9\xbe{Z\xc7\xe5e\x0c_QY\
+\xc3b\xbd\xe7N\xdd\xa13M#\xb8\xc2\x86\xe6\xacV\
+j\x9f\xe0p)\x95\xec\xfd\xea\x03.\xef\x1f\xd8N\xda\
+\xa0\x0b}\xdf\xf26\x1ev\xe6G):{\xe1\xc0f\
+\xab\xb7\xf3D\x22=\xb6U\xe1\xbc\xces\x80+Y\x85\
+\xdb\x85\xbe\xb6\xf4\xe0\x5c\xf5\xc4a\xeds\x08\xe7\x0ek\
+\x9f\xff\x14\x99\xb8\x02\xcae\x87l\x8f[\xb8\x89\xcd\x96\
+\x09\x92d@W\xd3/\xf7\xe5\xfdV\xdb\xfe\x140\x04\
+:M\x99s\xbe\xf0\xe1|\xe2\x86d\xf4\x87\x83\xceU\
+\xc3~\x8f\x94\x8e\xbe\xe8[\x04\x14\xc3\x82o>\xf7v\
+8a\x09\xb6/m|\xd8=\x83\xe73\xdch\x0c|\
+\x03{\xce\xeb\x18\xce\x1d\xae<\xc3p>\xc3\xb0\xd4\xba\
+\xd0e8\x9fm8o\xf0\xfa\x15\x83\xde\x7f\x18\xce'\
+P\x94P\x0c-\x07\xc9\x80\xae6;J\x07\xeau\x91\
+\xb8\x85`ks\x89g\xd8P\x8b\xa9\x1b\xae\x8b\x18\xce\
+\xa1\x8c\xe2\xd6c\xce\xba\xe5\x86T\xc4\xba\xcf\xef\x0f\x0b\
+\x1e|\xf2>\x1e\xff\x98\x1bF[\xabm\xb4\xe7jp\
+\x1c\x11\xcf>ts\xbf\x0d\xe1\xbc\x8eCH\xeb>\xe7\
+|Q\xf6\xafn\x5c8\xcf\xf5\xb1\xb4)\x9cS\xfd\xb5\
+\xa4q\xc3\xda\xe7RO\xfa\x14\xc3\x8f\xd8\x12\x9b\xa4\xd1\
+\xb6\xf6\xc79\xe8\x92\x01]\xed\x15\xa9s\xdf\x8b\xff\x9d\
+)\xca\xcf\x04\xe5\x19\xd5\xfd\xb2\xbb\xc7y\x96\xd7\xddb\
+C\xb2Hq\x03e\xec\xdeh[\x9b\xb2_\xf05\xbd\
+\x15z\xf7\xacB\x99F{\xae\xae\xef\x02:\x9c5V\
+8_\xb4\x85\xbe\xa2\xaa\xe3\xb8\xc7y\xfe\xb0\x94\xe3;\
+\x9e+t\xb5iE\xff\x05\xac'\x91\xa1\x8e-F=\
+\xb9\x9e\xa2\xbc\xd6\x96\xd8D\x8d6\xcb@2\xa0\xab\xf5\
+\xd7z\x86\xf7\xff\xa1\x8d\xf80pqU\xafh8\xcf\
+W\x8c\x13\x87\xf3\xee\x90\xbd7\x9fv\xdd\x1d\x9f?'\
+\xd2\x06\xbd\xe2+\xab]^\xf5\x8aw\xc3\x8e\x15\xd8\xbf\
+\xfd\xa8C-\x0e\xf3\xec\xa3w\x9d7,\x9c\xe7~n\
+Ty\x9c\xb6\x84\xae\x5c\xef\xb7\x81+\xfa/D8_\
+\xb0\xed\xf6\xaa\x98\x16V\xf7E\x03\xa7\xab'\x1f\x86t\
+\xc0\x96\xd8\x9c~\x0b$\x03\xbaT\xd7\x0b\xfe\xd1\xae\xf8\
+\xe9\xb2\xa3\xff\x12\xd8s>\x9fp>\xfd\xb0\xf6\x83\xca\
+a\xc1\xf6\x93w]\xf3\xc0\xf3\xaf\xdap\xda\xdfr\xbf\
+\xc3c\x1fy\x03\x0czl\xb4\xd2;\xb0\x0d\xf8\xe6\x99\
+\x87\xf3\xba\x7f~Q\xb3\xe3do\xe0-\xd8\x5c\xe29\
+T\xc7\xe6\x87\xf3\x5c\xa7\xd3\xa6\xf5+r\x9drM*\
+\xe2\xf4\xf5\xe4\xfd6\xc2$\x19\xd0\xa5\xfb(;\xe9h\
+\xbf\xb9\x9f*J\xeeJ\xc1\xc9YC\xe6\xd4m\x81\x05\
+\x1f\xd6\x9e\xa5\x87'\xc1\xd2\xf0\xfab\xfb\x81u\x1f2\
+\x88\x823v.s\xce\xa9\xbb\xa0\xdfa\xa3\xa1\xf0\xc0\
+#(\xe2a\xed\x0d]\x0ek\xaf&\x9c;\xac=\xdb\
+\xb5\xa2\xce=\xe7U,\x00\x9a\xb3\x9e\xc4,\x8f3\xc7\
+u\x09r\xd7\x93<\xebW\xec%\xc5\xa5\xb6\xc2&\x91\
+\xecE\x97\x0c\xe8Z\x88\xcb}y\xd4\x9f\x80[S\xa4\
+OB\x5cX\x97\x86Zm\xc3y\x8d\x17\x83[\xef/\
+Sp3\x1b,\x02\xdb_-8\xefk\xef\xe4\xa4\xd3\
+\xf6\xc3\xea&\x97\xb3\x92'0<\xfc\x9a\xd7\x90\x05\x9c\
+\x1a\x17\xces\x95[\x9b\x86\xb57\xb0\x9e,\xda\xb0\xf6\
+:\x87\xf3\x99\x86|\xc3\xf9Q\x0e\xf4q\x22\xdc\xff|\
++!]\x92\x01]m\xbf\xd4\xaf\x97(\xe2\x7fC\xba\
+p\xde\x0d\xb5\x98\xbaA\xd2\x92=\xce\xf3=w_\x91\
+\xca\xdb6zX\xa2\xa4\xc3p4\xfd\xa1\x8c\xcd\xda\x09\
+O\xce\x1f\xce\x1b\xb6\x7fu\xe5\xe1\xdc-\xb2&*\xd7\
+F\xeesN\x8b\xeaI\x8e\xc3,\xe8\xb6\x8cu\xbd&\
+\xe5\x0f\xe7@\xf9\xbe\xad\xff\xc0/h07\x9bK\x06\
+t-\xc8%?b\xbd\xdf\x82\x7f\x8d\x88u7\xce\x9a\
+Ec~~\xbd\xe65\x0a\xe79\x1b\x91)\x88ag\
+O\xb9\xb2\xfd\xaeT\xac\xff\xd8r\xa5\xc7\xd7\x9e|`\
+4\xf7<\x15\x1b\xb5\x17z\x0c\xcbs\xdb5\x5cy\xce\
+=T.\xf4\xd5\xbez\xb2P\xa1\x8b\x96m\xb7W\x97\
+m\xd4Zw\xa3o\x00\x9d\xf7n\xb2\xf8\xa82~|\
+\x92\x0c\xe8j\x87O\x03_\x02\xfeSc\xc2y\xb6_\
+\xb2\x16\x86s\x80H\xa4\x14\xfb\xa3\x18\xacl\xf4\xe8!\
+\x1d\xce8n/\xf4K\x18lx\xdc3\xd7\xfe\xb4$\
+t\xe5\xaa.m\xdb\x22\xcbp^M\x05\xaa\xc9*\xdc\
+U\x5c\xbbZ\x11\xce\xa7}\xbbu\xbb\x89S\x9bp\x0e\
+\xc4gHq\xa5\xcd\xacI\x8a\xce\xees\xc9\x80\xae\x85\
+Q\xae\xdf\x90\xd9\x9dH\x97N\x1e\xd0\xe7\xdds^q\
+\xab\xab\xa9\xe1\xfc\xa0\x14w\x17K\xfd\x95u\x8f\x14\x89\
+\xe3\xbaCN?n\x0f\x94@l0Y=\xa5\xaf\x05\
+\x8ekO8\x9fc/\x95\x0b\xc2\xb53\x9c\xb7\x7f\x15\
+n*\x1baQ\xd7\x9d\x1f\x1a\x19\xce\xa3^\xd7\x92(\
+\xde\x07\xd1\xb7\x056\xf6\xef\xf6Z\xc1\x19\xd2\xa5i\x14\
+\x16\x81\x9abHy\xd4?\x03JJ\xe2\x9f\x9a\x15\xce\
+c\x8a\x17_\x80p>r\x0f0X\xef/\xcbH\x1c\
+\xb3\xd4\xe7\xcc\x13\xf7\xc3\xb0\x03Q\xac\xff\xa7L\x8fh\
+O\xe8jI8\x8f\x9c\xa1\xab\x01\xe1<\xa8\xef\xb0\xf6\
+\xdc\xdb\xf6URO\x82l\xc3\xda\xe7\x1e\xce#S=\
+\x89\x16\x85\xf3\xa0v\xe1\x1cJ\x88w\xdb\xfa\x9a\xa4\xf8\
+\x0c\xe6R\x0e\xf6\xa0\xab1\xca\xa3-\xe3\xce\xe8>\xed\
+\x80\xf2\x83=\xba\xbbS\xa4\xe3\xc7n\x15\xb8\xc7y\x9d\
+\xc39\xc0\xdeb\x83\x1f\xfb\x88Qc`\x18\x8c\xee\xda\
+o8G0=\xac\xf9\xe1<W\x95i\xe9p\xe5\xba\
+\xf7\x9c\xd7\xf1{\xde\xa89\xe7\xd9B\xd7\x9c\xc3y=\
+\xaa\x8f\xc3\xda7\xa9'\x91\xa0;\xb8\x92n\xf91C\
+\xe7\x04\xe1\xbco\xbf\x9fd@\xd7\x82U\xd6\x0d\xab\xeb\
+\x17\x89\xf41\xe0B\xc3y+\xc29\xc0\xeap\x83\x86\
+\xd10\x12e\x99\x08\x12\x1c\xfa\xb3^>\x8f\xb3\x9b\x1f\
+\xcek\xb0\xf8R\xae\xe3\xe4\x9cs^\xf7\xfd\xabs\xd7\
+\x93\x99\xac\xd4^\x83z\xd2\xca\x15\xfd7x\xe2\xc2.\
+\x08W\xd3z\x92\x02\xfa\x9dw\x11\xb1\xea\xa2gc2\
+\x9bK\x06t-\x9em\x1b\xdf\x99\x0d\xe0\x1f\xfa\xdd\xb8\
+\xb0\xcaF\xda\xe2\x85\xf3i\x1b\xa5[\x1fJ\x1dQ\x0e\
+(\xd7\x7fH\x7f\xd0\xe1\xa1\xa7\xee\xe1\xe4n\x07\xf6\x1d\
+\xb7\xd1\xd0\xba.\xdb\xf7\x9dA1d\xf2yq\xb9\x16\
+p\x9a\xf1\xe7\x175;\xceQ\x9f\xea*\xdc\xf9\xeaH\
+\xae\xd0\xe5\xba\x04c\x95I]o\xe0D\x86:\xb6p\
+\xf5d\x9d\x1b\xf7\x89>\x9d\xde\xdf2\xe89\x9dz,\
+\x09\x86\x03F\xbf\xb3\x92\x0c\xe8Z\x18\xc3\x0d\xb6\xdbJ\
+@\x99\xf8G\xe0M\xc0\xf6Z\x84\xf3\xdca\xa4\xeaF\
+{m\x9e{\xf0\xf9\xa9\x13\x1bl\x9dV\xd2e\xc7\x8e\
+>\xdd\xe3\xef\x86\xfe\x86\x97\xb2S\x08N\x99|\x98b\
+\xc3\x86+\xd7=\x9c\xe7\xae[u\x0f\xe73\xab#\xb9\
+\xc2y\xaeSoS8\xcfU~u\x08\xe7s\xba\xfc\
+\xd5\xbe\x9e\xacs\x98a\xf1!(>=\xba[l\xfb\
+k\xf3|\x1e\xd0)-+\xc9\x80\xae\x85S\xa4\x8d\xe3\
+\x1c|>\xc1\xe5%qA\xeeVFm\xc3\xf9,\x9f\
+\x1b3x\xdd\xc3\xf7\xbaO)E\xda\xe03/\x12%\
+\x09\xca\xb4\xd9K\x9e\x04\x9cP\xbb\x06u\x15\xe1\xbcn\
+!\xbf\xaa\xefC\xabz\xce\xa7\xfd\x08\xdd\xbf\xba\x9az\
+\xd2\xa6\x9e\xf3\x5c\xf5dAFX\x94\x05\x9c|\xd7\x1f\
+\xd3[\x0d\xc2q\xdb\x9b\x87\xf3\x12\x0e\xec\x84=\xc7\xe1\
+~\xf1\x92\x01]\x0bfO\xe7\xc0f?\xb5\x91\xe0]\
+\xc7\x0ew\x5c\x10\x99Vv\x9e\xdf\x90\xf61\x9e\xdf\x8e\
+\x95\xda\x8f\x1e\xce'yJ\x0c7{\xd9\x13H\x9d\x1d\
+\xb3\x0f]s\xf8\xfc\xea\xb8 \x9c\xe1|\xba\xcf\xd9a\
+\xed\x86s\x87\xb5Ws-Y\xef0)ne\xdf\xce\
+w\xb3\xd4\xc5\xf1\xedc\x96\xe7\xb6U\x8bA2\xa0k\
+\x11\x1d\xbf\xbb\xbb\xe9On7\x8aw\xf7\x8f\x897\x92\
+\xe2\x98\xacm\x81\x19\xe4\xd3<\xe1\xae\x91\x8b\xc1m)\
+\x9c\x03l\xeb\xae\xcd+\xdfh\xf8zJ'\xb56t\
+\xe5\x0e\xd5MY\xc0\xc9p\x8e\xc3\xda\xab\xac'm\x09\
+\xe7\xb9N\xb9&7qf\x11\xce\x01:\x83wR\xa6\
+\xdb9\xb0\x03\xc7l\x8fS\xa4\x09:a\xef\xb9d@\
+\xd7\x22:n\xe7\x036\xfd\xdd-\x8bt\xdd\xa0\xb8\xe7\
+_\xa3\xec\x7f\xeb4[\xa3\xc4\xd4\xe1f^{\x9c/\
+N8\x1f\x94\x89\xf3\x1f|\xc7\xe8*6\xdcp\x18\xe2\
+\xf1\xad\x0e\xe7u\x0b\xf9\xad\x0e\xe7\x0d\x5c\xd1\xdfa\xed\
+\xed\xac'9\x87\xb5\xd7u4O\xf6z2V\x1d\x19\
+@\xf1V\x0eM\xaf\xb2\x07}S\xc5\xd0\x1b\x19\x92\x01\
+]\x8b\xea\xae\xe1\xed\x9b?\xa8\x84\x94\xf8\x8b\xd4)\xbe\
+u>\xe1\xbc\x05+\xb57 \x9c\x1f\xba\x80\x15c=\
+\xff\xf8\xd6\x85\xae\xdc\xa1\xda\xd0\xb5`\xe1\xbc&\x8b\x06\
+V\xb9\x0a\xf7\x5c\xea\xc8\x0c\xea\xc9\xc2n\xa36\x93p\
+\x0e\x89\x0fP\x16Wl\xb4\x83\x88\xee\xa3caI\x06\
+t-\xeeo@\x1a\xfbN\xf6?E\xf0U\xe0\x81\x86\
+\xf3*\xc3\xf9\xb4\x8d\xf3\xe9\xef\xb8\x8fy\x88c\x0d\xe7\
+\x8b\x1a\xce\x1b\xb6\xc7y]\xc3y%\xdf\xff\xcc\xe7\xb3\
+\x08\xe1|\x16\x9fK\x9d\xc2y\xee2\xd9\xec\x10\x91\xe0\
+\xd8=o\xa1;\xb0\xc15\x8e\x14\xb0\xb2\x03\x96{\x96\
+\x85d@\xd7\xa2\x8a\xf1\xe77\xdd\x09\xfc\x0d\xa4W\x19\
+\xceg\x11^\xe6\x13\xce'\xd0\xab\xe2#\xa9W8w\
+\xa1\xafv\x87s\xf7\xaf\xde\xf0\xa4r\xd7\x93:\x86s\
+{\xce\xab\xff|S\x5c\xc9\xbe\x9d\xefq.\xf5\x04\x01\
+}\xa9\xef,\x00\xc9\x80\xae\x85\xfe-\x98h\xb7\x93\xf8\
+\xa3\x88\xf4J\xa03\xde\xcf\xf7V\x1b$\xae\xd4>\xff\
+`\x1e\x9b\x9dS\xef\xfe-\x88\xb6\xf5\x9c\x1b\xce\x0d\xe7\
+8\x5c\xb9n\xf5$fy\x1c\xeb\xc9T\xf5$\x12\xa4\
+\xf8m\xa2Xq:\xf5\xb8\x8d\xb2\x12\xb7\xa1\x93\x0c\xe8\
+Zp\xc3Ng\xec\xc7F\xe2c\xc5\x90\x0f\xa5\xf2\xf0\
+=\xd1\x8f\xf6\xf3=\xc7\x80d8\xcf\xd5J`\x93[\
+\xf8\x9dv\x87s\x87\xb5\x1b\xce\xa9\xef\xe2\x83M\x09\xe7\
+s]\xd1\xdfp>\xd7kI$\xe8\xf5\xbf\xc0\xd2\xea\
+_0,\xec\x11\x1eG\x99`\xd0\xc5\xc5\xe1$\x03\xba\
+\x16\xfe\x07a\xa2\xc8V\xa62\xde\x02\x5c\x905\x9cW\
+\x15\x92\xdb\x1e\xce\xe7+\xb53\x9c;\xac\xbd\xdd\xe1<\
+\x97\x16\xee_\x1ds*\x93J\xc2\xf9\x8cVj7\x9c\
+o\xf2+Q\xfe\x16'\xdc\xbd\x9b2\x19\xd0\xc7\xba\xa1\
+1\x80\xdb\x1f\xc04\xbb\xe5H2\xa0\xab\x05:\x83\xc9\
+~\x08\x22\xa5\xbf#\x957\x00\xe7d\x09\xe7\xb9\x1b\x0f\
+\x8b\x12\xce\xa3.\xc1\xbe\xa1\xe1\xbc\xae{\x9cg\xfbN\
+\xb4q\x15\xee6m\xa3\x96+\xd0\xb6iE\x7f\xc3y\
+\xabn\xf4\x15q\x03\xfd\x1d\x7f\xc8\x97\xcf2\x9c\x8f\xa3\
+,\xe0\xd8{Fs\xd0\x0d\xe8\x92\x01]\x8b^[W\
+'zx\x22\xf6\x10\xc5\xdb\x22:?g87\x9c\xcf\
+?\x9c\xd7d\xf5\xecE\x08\xe7s\xaf'3z/\xf6\
+\x88\xce!\x9c7l\x8fs\xc3\xf98\xbfSo&\xf5\
+w\xdb\x22\x1e\xf7\x86F\x07\x8a\x18\x0ds\x97d@\xd7\
+\x82\xff&L\xbc1i\x10\x91\xde\x1a\xf0\xa3\xc0)\xf3\
+\x0d\xe7s\x18\x12\xdd\xe8p\x1e\x8c\xdf\x95\x11\xe4\x1b\xc6\
+[\xb3p\x9e\xa3!\xdc\x84\xd5\x95\xeb\xdcs\x1e\xb3\xfc\
+\xae\xb7h\x8b\xac\xdcku\x18\xce3\x87s\xa7\xc8\xac\
+\xb9\x1a\xd2\xdb\xed\x09\x9e\xc7w[\x92\x01]\xcd\xb7\xba\
+c\x0b\xa1\x9e\x9b)\xca\xff\xaf,\xe2\xbf\xbb\x8dZ\x93\
+\xc2y\xdd\x1a\x18\x86\xf3J\xc2\xf9\xa2\x0cW\x1e\xeb!\
+\xf6\x9c\xd7\xbf\x9e\xb4%\x9c\xe7z\x9f-\x18\x85\x13\xe5\
+\xcfA\xdak\x03kL\xe9\xd0\xffH2\xa0K\x10\x9d\
+\xc1\x96~\xba\x03~\xaf$~ \x91\x8e]\x9cp>\
+\x83\xb0\xd1\xd4p\x9e\xfb\x9c\xaa\x18\xf9\x10U\x95K\x8b\
+CW\xee\xe3\x18\xce\x0d\xe7\xd9Bu\xdd\xc2y\x9b\x86\
+\xb5Ou\x98\xff\x80\xce_\xda\xba\x9a\xa0\x90\xc3\xees\
+\xc9\x80.\x1d\xe6\xb6\xed\xfb\xb6\xf8\x93\x12\xd7\x1d7\xd8\
+\xf1G\xdb\x07\xdd\x1f\x8a\x14\xe3>\xa9\xc1\xe1\xdc\x9e\xf3\
+Z\xdc\xa8hm\xcfyM\xc3\xf9\x5c\xf7\xaf\x9eQ\x85\
+t.\xb1\xe1|\xaa\x87:\xac\xfd0\x03\xe0\xb5$\x86\
+\xb6\xae\xc6\x94\x0a(-.\xc9\x80.\x1d\xe6\xd8\xc1\x8e\
+\xad=1A\xa7\xe4\xd7\x82x\x09p\xdc\xf8\x0d\x91\x16\
+\x84s\x83\xf9\x16_\xca=\xce\x0d]5\xab'\x86\xf3\
+\xe9>\x17\xc3\xf9\xfc\xaeIU\xd5\x93i\x0eQ\xa6\xb7\
+\x13\xf1\xefN\xa8\x1e\xb7\x1d\x15P\x148\xbc]2\xa0\
+KG\xe8\xf5\xa7\xfa)\xbf>\x0a\xde\x9a\xe0G\xe6\x1e\
+\xce]\x0cn\xf6\xe1\xbcq{\x9c\x1b\xba\x1a\x1d\xbaf\
+\x16\xce\xed\x11mw8\x8fL\xa7\xdc\xd2\x9d\x1f\xb6\xaa\
+(o\xa3\x887P\x166\xac\xc6\x09\xe6e\xc1\xbde\
+5\xc9\x02\xae\x92\x0c\xe8j\xbd\xa2\xd3\x99\xb6q\xf0?\
+ ^\x04\x9c\xda\xfap>\xab\xe7\xd6!\x9c\x075\xea\
+\x04\xa9S8\xcf\xf5V\xea\xd2sn8\xaf\xa6\xdcZ\
+\xbe\xdd^\x1d\xebIT\xf0\xc1/D\xcfy\x86z\x12\
+\x09\x8a\xfe\xeb8\xe9\xae\xaf\xb8r\xfb8\x01\x1d\x88\x02\
+n{\x80\xc1\x5c2\xa0K\xf7\xd7\x19\x96S\x1e!}\
+9\x12o.\x13o\xaa4\x88\xcc\xa2\x01\xb5\xd1\xf3\xed\
+9\xaf\xee\x9c\xec9\x9fS8wX{\x96\xcf\xd7p\
+\xde\xbep\xde\x98E\x033\xd5\x93i\x0f\xd1\xe5}\xf4\
+N\xf8\x03\xf6\x1eo\xa3j\x1c%\xb0\xe3VH%\xd0\
+\xb1<$\x03\xbat\xa4a1}X\x08\xf8\x9dD\xf1\
+2\xe0k+i`\x1a\xce\x0d\xe7\x86s\xc3\xb9\xe1\xbc\
+]\xe1<fy\x9c9\x86\xf3\xec\xbf\x135\x0a\xe7\x00\
+\xa9\xbc\x87H?\xc2pP\xa2\xf1\x8a\xbd\xb74Z\x1c\
+N\x92\x01]:\xfa\x8f\xeb\xf4\xc3\xab\x12\xecJ\xc4\xcf\
+D\xa4?\x9b\x7f8\x9fg\x83\xb4\x01\xe1|fS\xdd\
+\xda\x14\xces\x15\x85\xfbW\xd73\x9c\xe7z\x9f\x86\xf3\
+\x99\x07\xda\xa8\xc19\xcc\xb2\x9e\xccr\xc1\xd5q\x8f\x13\
+\xc5O2\x8c\xcf3\xe8\xa3q\x94k\x0b\xc3I2\xa0\
+K\xeb\xfd\xbc.\x0d\xf2\x1c'\xf1\x97i\xb5\xf72\x86\
+<s\xf1VjoP8\x9fM\xad\xaaA8\xb7G\
+t.\xa1+j\xf8]\xaf\xfbp\xe5COo\xdb\x0d\
+\x9c\x1c\xf5\xc4=\xce\xf3^K2\xd7\x93\x14\xef\xa4L\
+\xbf\xef<\xeaI\x18\xce%\x03\xba\xb4\x89m\x9dS\xf3\
+\x1c(\xa5r\xd8Y\xf9\xbf\x06\x83}\x97\xa6\x94v6\
+:\x9c\xcf\xec\xb9\xf3\x0a\xe7\x1b5\xa6\xa6mh\xcd\xe1\
+34\x9c\x1b\xceg\xf5\xdd\xadt.\xf1\x02\x84\xf3\xc6\
+m\xa3f8_\xf78Ey\x13\xa9|5\x83\x8e\xf9\
+|\xfc\x1b\x1a\xee@'\x19\xd0\xa5\xcd\xad\x1c\xb8'S\
+@\x07\x22>\x99\x82_!\xf1\xfaF\x87\xf3\x9c\xfbz\
+\xd7.\x9c\x97k\x7f6RVwNu\x1df\x5c\xdb\
+\x06\xb5\xe1\xbc\x9ar\xabI\xcfyU\xd7\xb0\xc6\x87\xf3\
+i\xdfn\xddFX\xb4,\x9cGZ\xa5\xd7\x7f\x19+\
+\xdb\xbeJa\xe2\x1c\xaf\xd8\x0a\x88\x12\x13\xbad@\x97\
+6\xd5[\xce\xd9\x8aH\x00\xbf\xdc\xef\xc5sSJ\xe7\
+fk\xd1\xb8\xc7\xf9\xd6^\xfb\xa8\x0f\x1b\xae\xfd\xd9\xe8\
+I\xc3\x19\x87\xf3\x16\xf5\x9c\xd7m\x01\xa7\xa6,\xf4\x95\
+\xfb\xbb\xde\x98U\xb8\x17dX\xfb\xc2\xf6\x9c\xb7\xb5\x9e\
+\xa4\xd7\xd1_\xfa\x00\x9d!\x1a\xd3\xb0\xbb\xf5{\xdf\x92\
+\x0c\xe8Z,\x83m\xbd\xdc\x87\xdc_\xa4\xf4\xaa(W\
+?\x00,\x19\xces\x86\xf3i\x1b\x9e\x87\x1aW\x1b<\
+1Us^\x86\xf3\xd9\xd4\xaf&\x87sCW\x83\xc3\
+\xf9\x0cFW8\xac\xbd&\xf5$\xfe\x84b\xf8\xcb\xa3\
+\x9et\xdbPcq\x0a\x80d@\x97&\xaa\xacE\xf6\
+\x80N\x10\x97\x96\xf0K\xa4x]D2\x9c\xd7*\x9c\
+\xe7\xff\xb4g\x967s6\x84\x9b0\x5cy\x11V\xe1\
+\x1e\xeb!m\xdd\xbf\xba-\xe1\xbc\x1e\xd5\xc7a\xed3\
+\xa8').#\xf8\xa1\xd1\xfe\xdd\x18\xd0\x0d\xe6\x92\x01\
+]\xaaB\x7fuO5\xb1-:\xbfP\x0e\xb7]\xd8\
+\xdb\xbe\xf2\xe4\xfb\x87t\xf78\x9f]8\xaf\xb2\x055\
+\x87\x1b,\x95\x84s\xf78\x9f\xe8\xf3i\xe46j\xd6\
+\x93M\xdf\xcb\xc2\xf7\x9c\xb7m\xfd\x8a\x8c\xf5$\x05\x0c\
+\x8b\x1b);/\xa4;\xd8\xc3\xb0c\xe3i\xac\x80\x1e\
+P8\xae]2\xa0K\x13\x1a\x96\xf9\x7fhS\x0a\xfa\
+\xfb\xb7-/\xdfy\xda\xcbOz\xe8\x97.%8\xa5\
+\xaa<j8\xaf\xaa\xa1\x18\xcc\xb5\xd7}\xac\xa7\xd8\xd3\
+UM8\xcfU~m\x0a\xe7m\xaa'\x86\xf3v\x87\
+\xf3*F\xe1\xa4;\x89\xe2\xbb(\x8b/\x8cV\x22\xb7\
+kX\x92\x01]\xaa\xcc\xbe[\x1eX\xdd\xc1\x13\x9f\x1f\
+,o\xfb\xe1\xee\xb6\x95?\x1d\xf5\xa2\xcfa\x7fl\xc3\
+\xf9|\xd4q\xf5\xec\x99\x0e\xfdor8\x8f*+@\
+\x03\xc3y\xdbFX\x18\xce\xab)\xb7\x96\xee\xfc\x90b\
+?\xabK/\xa2\xdf\xfb8\x04\xf6\x9eoVt\x09\xba\
+\x03XZ\xb5,$\x03\xba\xb45\xc7?\xe0\x9eJ\x8f\
+_t\xe3\xcf(\xd3\xf9\xa4xM-\x82y\xdb\xc2y\
+\x1dC\xe7B\xed_\xed\xb0v\xc3yS\xeaI\x9bz\
+\xce#\xd3)\xdbs\xbe\xc9\x9b\xeb\x13\xe9\xa5\x0c\x8b\xf7\
+1,\xb0\xf7|\xcc\x80\xee\xb0v\xc9\x80.M#\xed\
+\xdc_\xedoU$\xca\x18\xfe\xdfE\xa4GB\xbax\
+&a,\xcb\xe1\x1a\xb2\xc7y\x9d\xc2yc\xe6\x9c\xe7\
+\x0a\xe7\x99\x0a\xcca\xed5\x0d\xe7\xb9\xca\xcdpn8\
+\x1f\xe7X5\x0b\xe7)\x06\xac.\xbd\x8cb\xf8N\xd2\
+\x11\xff\xdd\x86\x93$\x03\xbaT\xa5\x92\x8a\xf71M@\
+J\xfdr\xa5\xfc\x9e\xa2\xdb\xf9\x00\xf0\x88\xca\x1bPY\
+\x1b\xa45\x0d\xe7u\xeb9\xaf\xeb\xea\xd9\xf6\x9cO\xf7\
+\x01.t8oS=iK8\xcfu\xca5\xe99\
+\xafk8\x87UH\xdf\x0b\xc5\x9f\x83{\x9dK2\xa0\
+K\xb3\x95f4\x9f\xac\x1b\xb7F\x91\x9e_\x94\xf1/\
+\x01\xa7U\xd2\xc8\xce\x12Z\x9co^\xbfp\xee\xea\xca\
+c\x95kc\x87\xb5;\x5cyF\xa1k\xce\xf5\xa4M\
+{\x9cO\xfb[Q\xa7k\xc9\xfd\x0e\xb0\x9fH/\x85\
+x\xa7\xdb\x84Ij\x93\xc2\x22Ps\x02z\x9a\xcd\x9f\
+^\x01\x05WB\xbc\x80`\xbf\xe1\xdcp\x9e\xfd\xa3_\
+\x98p\x9e\xab\xdc\xea2\xe7|N\xe1<\xc8?\x5c\xd9\
+p^Q\xddmc8\xa7&\xd7\x92#\x0ep'\xc1\
+s\x09\xdei\xe3HR\xdb\xd8\x83\xae\xe6\x18\xcc6\xe0\
+\xc5\xa8\x07\xfd{SJ\x7f\x0a\xf4\x0c\xe7s\x5c\x85\xb8\
+\x11\xe1\xdc\x85\xbe\xea\x1d\xba\xea0\xac\xbd\x0e\xc3\x8c+\
+8\xce\xa2\xd5\x93:~.Q\xd7zRI8\xbf\x9e\
+\xe0\x12\xe0\x0a\x1bF\x92\x0c\xe8\xd2\x1c\xa5Y\x07t\x12\
+\xa9\xe0\x1d\xe5\xb0sL\xd1)\xdfz\xe4\x92\xb0\x86\xf3\
+\x99\x85\xce\xcd^k\xaam\xd0\x1d\xd6\xbe\xee9\x18\xce\
+\xb7v\xe2\x8d\x18\xd6\x9e\xe9\x06N\xab\xea\x89\xc3\xda\xf3\
+^K*\x08\xe7\x91 \xc5\xa5$^Hp\x93\xad\x22\
+Im\xe5\x10wi3e\xf1vH\xaf\x1c\xb5\x12\xa6\
+J\x83\x86\xf3ZqX{5\xefsA\xc3yP\xff\
+U\xb8#s\xe5pX{\x8b\xc3y\xaeP\x9d\xeb\x03\
+H\xb0}\xf9mt\x06\xcf\x02\xc3\xb9$\x03\xba\xb4\xb8\
+\x02\xba\xc5\x80\xa2\x8c\xb7\x00\xaf`\xcb\xcb\xc4\x86\xe1\xbc\
+\x95\xe1\xdca\xed\x86s\xea\xbbm\xdfQ\x9f\x9ai\xb8\
+r\x9d\xebId\xaa'\x0b\xdds^\xaba\xed\xcb\x04\
+?\xcaq\xbb\xbf\x8f\x14{qE8I-\xe7\x10w\
+i\xfc\xa6\xc2[\x13,\x03\x7f\x08l\x9f]6\x9c\xa6\
+\x81o8\xafUXrX{\xfb\xc2y\x9d\xeb[\xb6\
+:Rq\x99D\x0d\xeb\xc8\xcc\xc2yM\xd6\x13\xa8\xef\
+\x8d\xbe\xab\xe8w\x7f\x90\xde\xf0\x83G\xcc2\x93\xa4\x16\
+\xb3\x07]\x9a\xac\xdd\xf0g\xc0w\x00w\x8f\xdf\xd0\xd8\
+j\x00\xca<\x9c\xbeQ\xe1<\xea\xf4\x99O\x7fn\xc1\
+b\x85\xf3-W\xdd\x5cs\x89c\x8a\x87\xccqX{\
+\x15\xab\xb5\xe7\x0e]\xb5\xa8'm\x09\xe7S\xbc\xcf\xa8\
+\xdb\xb5$W8_\x93\x02\x06\xdd? zO#\xd2\
+\x07m|H2\xa0K\xda\xa8\xdd\xf0^\xe0b\xe0\xba\
+Z\x04\xe4\xfb=5f3\xac\xbd\x8a\xd0YY8\xdf\
+b\x12\xa8ld@\xcb{\xces\x1fgf\xf7k\x5c\
+\xe8\xab\xba\xd0\x15\x19\xde\xda\x06\xdf\xe3F\x86s\xa7\xc8\
+\xacs\x9c\x1b\x19t\x9eG\xd9\xf9~\xca\xe2NR\x9d\
+\xa7KI\x92\x01]\xaa\x8b\xcbS\xe2\xc2\x94\xf8\xd7\xb1\
+\x1b\xa39V\x13\x1e'\x9c\xcf\x22\xc4F\xa6\x00<\xbf\
+$6\x9b\x86\xf0\xa2\xed_=\xd7\x9e\xf31\x1f\x5c\xc7\
+9\xe7\x86\xf3z\xd4\x91\x99\x0ekoK8\x0f\xf2\x0d\
+k\x8f\x00~\x9fHO \xd2;lfH2\xa0K\
+\x9a\xd4\x97:\x9d\xe2\xd9\xa4\xf4\xdb\xf9\x1a\xa3\x8b\xbc\xc7\
+y\x0b\xc3y%\xa1+S8\xafb\xb8r\xce\xcf=\
+2\x7fwr\x0ek7\x9c\xcf\xa1\x9e\xb4%\x9c\xcf\xf1\
+\x9aTI8\xcf\xf4~Sy)\xdb\x96\x9fAQ\xbe\
+\x92H\xb7\xda\xbc\x90d@\x97\xb4\xd5V\xc5\x01H\xaf\
+.\x0a\xbe\x0f\xb8{1\xc3\xb9=\xe7\xd5\x7f\xbe[N\
+\xad\xb3\x09]\xb9\x8f\x93{\xad\x86\xa8\xb2\xfe\x1b\xce\xab\
+\x0d\xe7\x0eko\xf5\xb6\x8c)\xae\x87\xf8o\xa4\xf8&\
+:\x83\x0f\xd8\xa6\x90$\x03\xba\x94\xa5m\x92\x8ax[\
+J\xf1\xb4\x08\xfecq\xc2\xb9\xc3\xda\xc7\xcf\x13-\x0e\
+][:\xe6\x0cBW\xe5\xf5\xbf\x8a\xd05\xefz\x92\
+u\xb8r\xa6pN\xb5\xf5$\xa6\xa8\xab\x13\x1d\xcfa\
+\xed\xf7\xf1URz\x1dK\xfdo\x04\xde\x02\x0c\xdc>\
+M\x92\x0c\xe8R\xeelw%%O\x07^Op\xa0\
+\xfd\xe1<G\xd0\x8b\xecE\x92\xefT\xda\x12\xba*\x0c\
+\xe7[z{3\x9eo\xde\x88a\xed-\xea\x11m\xd2\
+v{3\x1bn\xdf\xa6\x9d\x1f\xa6\xbe\xb4}\x89T\xfe\
+\x0c\xc3t>\xf0\xf3\x8c\xbd#\x8a$\x19\xd0%m\xcd\
+*e\xbc1\x22\x9e\x16\xac\xb7\x80\x9c\xe1\xbc\x1e+v\
+o\xf4z\xae\xae\xbcik\xbc\xb1\x8b\xc1\xe5\x0a\xe7a\
+=iu8\xcf\xd9s^i\xfa\x9fa=\x99\xea\x86\
+\xe3g ~\x8c\xe0|R\xfc\x1c\xa4[l.H\x92\
+\x01]\x9ae\xe6\xbb<\xc13\x80\x1f\x02\xbe\xd2\xc8p\
+^\xd96j\xd5\xb5A\xeb\x13\xces\x9d\x97\xa1+o\
+8\x9fs\xe8j\xfd*\xdc\x0d\xa8'cU\x81\xc8t\
+\xcam\xab'\x13\x1ff\x85T\xbe\x87\x22\xfd\x1fDz\
+\x1c\xc1\xaf\x03w\xd8B\x90\xa4\x8du-\x02\xa92C\
+\xe0\xf7J\xe2]\x05\xe9\xc7\x81\x1f\x00\x8e\x9d\xbe\xb1\xb5\
+\xd5\xe7\xd7|18{\xcek\x18\xces}Nu\xe9\
+97te\x08]\xcd\x0e\xe7\x95_'s^K\xa6\
+\xfc`\xaa\xd8\xf9a\xbc\xc7_IY\xfc\x0d\x89\xbf&\
+\xc5gF\xfb\x98\xdb\x1f$I\x06t\xa9>\xbeJ*\
+^\x13\xf0\xffB\xf9\xe3)x\x11\xb0}v\xc1\xdcp\
+n8\xcfTP\x0eko_8\xaf\xc5\xa2\x81\xd3\x86\
+\xea\x16\x84\xf3\xdc\xc7\x99m8\x0f\x8a\xf8\x0cez\x1f\
+\x91\xfe\x96\x14\x1f%\x18\xf8\xd3/I\x06t\xa9\xee\xae\
+.;\xc5+\xba\xc3\xf4\x9b\x11\xc3\x1f\x82x>pB\
+\xbd\xc3y\x9d\xb6\xd3\xaa\xeaTj\xd0\xd3U\xbbp^\
+\xf1\x1e\xe7u\x0d\xe7u\xef\x11\xad{8\xaf\xa2\x9e\xcc\
+\xac\xae\xb9\xdd\xde\x84\xe7p;\xf0q\x82\x0fp\xfc\x9e\
+\x0fPv>\xc9\xdec\x0c\xe5\x92d@\x97\x9a(}\
+\x9a\xe0\x95)\x95\xbf\x92\xe8|o\xc0\x0b\x838\xc7p\
+\xde\x90p^\xc5\x9b\xa9\xfb\x9c\xf3\xc6\x86\xf3\x16\xf5\x88\
+\x1ezz\x8d\xb7\xdb\x9b[=1\x9cW|-Y\x05\
+\xbe\x04q5\xc3\xe2\xa3,\x0d.c\xfb\xca'\xd8w\
+\xdc\xed0\x84\xee\x00V;\xfe\xb4K\x92\x01]j\xba\
+\xb8\xbe\x88\xf4\xba(\xba\xbf2\xa4\xff\xad\xa9\xe4%\xa4\
+xj\xc01\x86\xf3\x0a\x12|\xae\xf7\xe8\x5c\xe2\xf6\x85\
+\xf3\xdc\xf5\xb0\xd2\xb9\xc45\x0c\xe7s\x1da\xd1\xa6p\
+>\xd7kI\x00\xf7\x8c\xfe\xc4\xcd\x10\xd7\x11\x5c\xc3\xa0\
+\xf7Y:\x83\xabI\xf1E\xe0\x00\xb1\xb6WyQ\x1e\
+\xf6L\xf7/\x97$\x03\xba\xd4.\xbb#\xc5\x9f/\xf5\
+;\x7fNgx\xcej\x97gS\xc6w\x02\x8fO\xb0\
+skM\xb6\xa6o\xa3V\xc3p^\xf7\x05\x9c\x0c\xe7\
+\xe3>\xf7\x06\xe0\x97\xd7\x1eto\xb2X7c\xa4\x0c\
+o\xbf\x9c\xdf\xcd\x82\xa3\xbd\x97\xa9\xf2TY\xa3p\xbe\
+\xc9\x9bI\x19\xcb\xb3\xac:\x9cO\xfd\xc1\xac=\xfd\xb0\
+\x94\x1el#\xa5\x13 m\x07zk\xefc@\x8a\x15\
+\x88\xfd\xc0\x1eR\xdc\xc9\xb0s\x07\xc1\xddt\x87w0\
+(\xee\xa4\xc3\xf2\xe8\x0d'(\x0b\xb0s\x5c\x92\x0c\xe8\
+\xd2\x02\xbb\x01\xf8\xed\x18\x96\xbf]n\xef=t8\x5c\
+\xb9\xa0Wv.J\xa4'\x00g\x8d\xd7\x823\x9c\xcf\
+\xe6\xf8M\x5c]yN\xe1<2\x97\xedt=\x997\
+\x13\xfc>v\xfai\x11$\x80\xe2\xde\xd1Xq\xbf \
+\xbf\xb6\xf5\x9c_\x08I2\xa0K\xda\xaceu}?\
+\x0d\xaf\xef\xa5\xee\xdbcX\xee$\xa5\x87'\xd2\xe3\x12\
+\xe57F*\xbe~-\xb0?\xa0^\xe1|\xda<{\
+\xc4\x83\xb6\xd5&\x9c\xe7,\xab*z\xce\x17)\x9cO\
+\xff\xdc\x0e\x90\x08\xc2\x90.I\x92\x0c\xe8\x92\xc6\x8f\xe8\
+\xf7\xfe\xdf\xfd\xc0\x15\xc0\x15)\xca\xdf+SA\xa28\
+\xad\xe8\x1e8#\x86\xbd\xb3!\x9d\x9dR\xf9\xa0\xb2\xec\
+\x9c\x0eq2p\x1c\xb0-A\x8a\xa3\x0d\xce\xac\xdd\x9c\
+\xf3\xa3>\xe0\xaa\x0d\x9f\x11\x89AYL\x7fn\xb3\x0c\
+\xe7U\x04\xd1\xba\x0fk\xcf}\x9c\x9cs\xce\x8f\x1c\xe4\
+.I\x92d@\x97\xb4e\xb7\x93\xca\xdb\x81O\x92J\
+R*!:\xf7N3\x8dD'\x86\x0c\x8a\xa2\x9a,\
+\x95-\x9co\xe1\x95\x02\x96\xbaC\x1e~\xda.(\xd3\
+\xd6\xcfm\x96\xc1\xdc=\xce+\x0a\xe6\x13\xbeX\x18\xd2\
+%I\x92\x01]\x92\xb29\xd0\xefr\xc1\xd9\xb7\xf2\xc4\
+sn\x86AA\xbeE\xb8*\xba\xa9\xd0\xdaU\xb8\x1b\
+\x1e\xce\x0d\xe9\x92$\xa9f\x0a\x8b@R\x93\x04P\x14\
+\xc1\xcb\xbf\xe1\x1a\xe8\x943\x0a\x975\x1a\xd6\xde\x84-\
+\xb2\x9a\x14\xces\x7f\xc4\x92$I\x06tI\x8b\xe2@\
+\xbf\xcb\x93\xcf\xbc\x95\xc7\x9d}+\xf43\x0f\x02\xaab\
++\xb58\xe2\xff\xb4 \x9co\xf0^&z\x9b5\x0a\
+\xe7\x86tI\x92T\x13\x0eq\x97\xd4\x18\x01\x14)x\
+\xf97\x5c\x0bE\xb96\xbc\xbd\xc6\xe1<\xe7\x899\xac\
+\xbd\xdap~\xf8\xe3S[\xbf=\xcd\x7f\x09I\x92\x0c\
+\xe8\x92T\x13\x07\xfa].8\xebV\xbe\xf1\xec[`\
+5\xe3\xe5\xab\xb2p\xde\xa6\x05\xe16xb[\xc2\xf9\
+Ae\xee\x9a;\xe5\x8d\xa4\xa9o\x18\x0c\x81A5_\
+\xca\x83\xe7\xb6\xda\x82\x80\x9ep\x5c\xa1$\xc9\x80.I\
+ce\xad\x18\xf5\x9e\x7f\xdfc\xaf!\x15\x19\x93@\xab\
+Wk\x9f\xc16j3\x0b\xe7\x91\xed\x94+y\x9eZ\
+p\x91at/\xc3\xa0.I\x9a#\x7f\x82$5\xc2\
+\x81~\x97'\x9dy\x1b\x8f?\xfb\x16\xe8w\x0c\xe73\
+\x0b\x9fu\xd9J-\xc7KE\xc6\xf7\xa3\xd6\x07\xf5\xd2\
+:!I\x9a={\xd0%5\xa2\xbd\x5c\x14\xc1\xcb\x1f\
+{\x0dt\x02\x86)\xcfA[\x1b\xce\xdb\xd4s>\xe1\
+\x8bm\xb5\x07\xde \xa6\xa3\xd5\x09\xb7\xe0\x93$\xcd\x98\
+=\xe8\x92j\xef`\xef\xf9\xe3\xce\xc9\xb4r{-\xc3\
+y4#\x9cO\xbc \xfd\xb4\xc3\xda\x0d\xe7\xaaIP\
+\xb7\x9eH\x92\x0c\xe8\x92l\x1b\x1f>\xf7\xbc\xcc\xd6A\
+]\xbfp\x9e\xe3tf\xd0s\x9e\xfb8\x95\xcf97\
+\x9c\xab\x82\xb0.I\x92\x01]\xd2\x22:4\xf7\xfc\x9c\
+\x0c+\xb7\xd7vX{C\xc2y\x1d\x17\x84\x0b\xc3\xb9\
+\xe6\x14\xd4%I\xaa\x80s\xd0%\xd5\xb7\x0d\xbc\xb6r\
+\xfb\xcb\xa7]\xb9\xbd\xd2=\xce3\xf4\x9c\xb7j\x1b\xb5\
+i\x83q\xaem\xd4\xd6\xfd\xcb!\x10\x06,\xe5\x0b\xe9\
+\x09\x92\x15J\x92d@\x97\xd4r\x07\xfa]\x9er\xd6\
+\xad<\xfe\xac[ae\x8b+\xb7\xe7\x0e\xe7\xd9\x8eS\
+\xd19\xc4<\xcf\xa7.{\x9co\xf8\x97\x0f&\xf8a\
+\x1a\xd3\xbd\x1eS\x9eJb&+\x9d\xa5y\xd4\xfdl\
+/\x95\x80\xbf\x01\xbe\xbc\xf5\xd71\xa4K\x92\x0c\xe8\x92\
+Z\xec\xde\x95\xdb\xaf\x85\xa2\x84A7\xe3\x91s<\xbd\
+\xa6s\xces\x1f'2\x7f\xa8\xf3\x0d\xe7\x00g\x91\xe2\
+76\x7fJ\xcc\xb9\x8e\x1c\xf6\xfc,u\xa4\x98\xf2\xad\
+mRG\xd2\xb8!}\x83\x9b\x05\x91\xb9\xceox_\
+\xe2~\xc7\xb9z\xaa\x80.I\x92\x01]R\x9b\x1d\xe8\
+wy\xd2Y\xb7\xf0\xb8\xb3n\xc9\xb3r{\xb6\xd0\x95\
+)\x9c/\xda\xb0\xf6\x9c\xa1+\xe79\xb4:\x9c\xe7z\
+k3X\x97 2\x9f\xf8\xe4\xeb\x12\x0c\xbc\xeaJ\x92\
+\xea\xc0E\xe2$\xd5N\x19\x89aY\x8cVn\xef\x94\
+\x99B\x8a\xe1|n\xe1|\x9a\x85\xdc\x0c\xe75\xa8'\
+\xf3\x0e\xe7\xb9\xce\xcb!\xe8\x92$\x03\xba$M\xdc\xb6\
+\xde\xbb\xd2\xe3{\xce\xbb\x86\xc7\x9f}\x0b\xf4;\x99\x8e\
+\x9a#t\xd50\x9c\xe7>\xce\xc4\xa1\xab\xd6\x0b\xc2\x19\
+\xce\xa7:\xad\xc8XO\xa6\xf9\xe8b\xf6_\x0fI\x92\
+\xe6\xc4!\xee\x92je\xcf\xf2\x12/9\xffZ~\xf2\
+\x99W@Y\xac5\xb8\xe7\xd4\xeanm\xe8\xca\x11n\
+\x1a\xb1 \xdc\x98O\x09\xeb\xc9<\xeaI\xcea\xedS\
+\xd7\x91\xaa68\x1f{r\xbe$I\x06tI\xf5\x11\
+\xc0\x9e\x95%^r\xfe5\xfc\xd4E\x1f\x1b\x85\xf32\
+\xcd\xf7\x84\x0c]\x86\xf3F\xd5\x93\xc8RD\xf5\x08\xe7\
+\xd9\xbf\xc8\x9b\x18t\xaa;\xa9.\x0eX\x94$\x8d\xcb\
+_\x0cI\xf5\x09\xe7\xe7\x19\xce\x0d\xe7\xe3<t\x8b\xbd\
+\x9d\x86\xf3\x06\x85\xf3\x5c\xf5\xa4\x0e\x06@\xe9\x85^\x92\
+d@\x97\xd4\x0c{\x96\x97x\xf1y\xd7\xae\x85\xf3d\
+8\xdf(\x88\x1a\xce3\xe5\xd7\xbal\xb7\xb7@\xe1|\
+\xac\xfb*\x13\xdc|\x09\x1a\xb4 \x9c!]\x92d@\
+\x97Ts\x01\xec^Y\xe2\xc5\xe7_\xcbk/\xba|\
+\xad\xe7\xbc\x98\xef\x09\xd5&\x9c\xe7\xca\x1cu\x08\xe7\x13\
+\xf6x/L8\xcfq:\x0d\x0a\xe79+xd\xff\
+\xa2\x18\xd2%I\x06tI\x8b\x1d\xce\xf7\xac,\xf1\xe2\
+\xf3\xae9,\x9c\xdbs\xben\xc8ht\xcfy\x8e\x97\
+2\x9c\xcf<\x9c\x07\x86sC\xba$i\xc6\x5c$N\
+\xd2\x5c\xecY^\xe2\xc5\xe7\x1f\x0c\xe7\x0ek\xcf\x1b\xcc\
+\xeb\x14\xce#\xc3\xcb\xd4`\x1b\xb5\xdc\xe1\xbc6{\x9c\
+G\xce/P\xf3\xc2\xf9\xc1\xa7\xcc\xf4\xf23\xc0\x85\xe3\
+$I\xeb\xf1\xd7A\xd2\xcc\xb3\xf0hX\xfb5\x0ek\
+\xaf$,\xd5%\x9cO8\x97x\x9ee2\xf6\xd3\xa7\
+\xdd\x8a\xab\xa2p>\xd7z\xd2\x82p>\x0f\xc9\x9et\
+I\xd2\xd1\xd9\x83.i\xa6Yx\xb4 \x5c\x9b\x86\xb5\
+/\xd8\x5c\xe2\xb1\xc3\xf9\x9cBu\xee\x9e\xf3\xc8\x5c\xd9\
+\xea>\xf5aQ\xc3y\xf4:^\xa1%I\x06tI\
+\x0be\xcf\xf2\x12/:\xefZ^{\xf1\x9c\x87\xb5G\
+\xae\x04VQ8o\xf4\xb0\xf6\xba\xf5\x88F}\xeaI\
+m\x86\xb5W\x5cG\x1a\xd7s\x1e\x90\xe69\x8a\xa7\xee\
+\xf3\xe6%I\x06tI\xadrpA\xb8\x17\x9dw-\
+?}\xf1G\xe7\xdbs^\xf7\xd0\x95\xfb8\x91\xf9|\
+*\xdfF\xadn\xe1\xbcM\x8b\x06\xe6\xaa'\x0ek\xcf\
+*%C\xba$\xe9\x10\xe7\xa0K\xaa>\x9c//\xf1\
+\xa2\xc7\xb40\x9cW\x11\xaas\xaf\xc2=\xb3\xf7\xd5\xd6\
+\x9es\xeaWO\x0c\xe7d\xeb9\xafKbO\x09I\
+\x92\xc0\x1etI\x15\xdb\xb3\xb2\xc4\x0b\x0f\xf5\x9c\xcfy\
+\xb5\xf6,\xa1i\xc1zDs\x87\xa5\x99\x84\xae\x1c\x1f\
+\x8b\xdb\xed\xb5?\x9c\xd7\x8c=\xe9\x92$\x03\xba\xa4*\
+c\xf0\x9e\x95%^\xf8\x98ky]mz\xce\x0d]\
+\x86s\xebIs\xc3yd)\xc6Z\xef\x95nH\x97\
+$\x03\xbaE \xa9\xaap\xfe\xa2s\xaf\xe5\xa7/\xfa\
+(\x0c\x8b\x1a\xf4\x9cg\x0aK\x8b\xb2\xd0W\xe3\xc2y\
+\xaer3\x9c\x1b\xce\x0d\xe9\x92$\x03\xba\xa4\x16\xd9\xb3\
+<\xea9\xff\xe9\x8b\x1c\xd6\xde\xc8\xd05\xb3p^\x93\
+\xd0\xe5v{\x15\x1d'2\x9d\xf2,\xeaIY\xafm\
+\xd6\xd2\xc1\xd3un\xba$\x19\xd0%i\x8ah1\x1a\
+\xd6~\x0d\xaf\xbb\xe8\xf0a\xed\xd1\xf0we8\xcf\x1f\
+\xces\xe5W\xc3\xf9\xcc\xebIT\xf0\xc1\xcf\xfd&N\
+\xd4/\x09\x1b\xd2%i!\xb9\x8a\xbb\xa4l\xf6\xac,\
+\xf1\xc2s\xaf]\x0b\xe7\xc9a\xedY\xc3y\xae,\xe4\
+\xb0\xf6\xbc\xe1<\xd7\xf95\xa8\xe7\xbcu\xe1\xbc\xc6R\
+4\xfb\xfc%I\x13\xb3\x07]R\x16\xbb\xd7\x86\xb5\xbf\
+\xee\xa2\x8f\xac\x85\xf3\xa6\xdf\xff\xcb\x11\xce\x1b\x18\xba\x1c\
+\xd6>\xf9\x81r\xdf\xc0\xa9s=\xc99\xac\xbd\xee\xdb\
+\xed\xd5)\xa4\xdb\x93.I\x06tI\x1a\xb7M\xbcg\
+e\x89\x17\x9c{\x8d\xe1\xbc\xb5\xe1\xbce=\xa2\xb9\x87\
+\xb5\xb7&\x9c\xb7i\x1b\xb5\x96\x84sC\xba$-\x1c\
+\x87\xb8K\x9a\xca\x9e\x95%^\xf0\xe8k\xf9\x99\x8b\x0d\
+\xe7\xf9\xf3\x5c]z\xce\xe7\x90[k\x1d\xces\x9dN\
+\xddn\xe2\xcc\xa8 \x0c\xe7[\x0f\xe9\x0ew\x97\xa4\xd6\
+\xb3\x07]\xd2\x96\xed^^\xe2\x05\x8f\xb9\x96\x9f\xb9\xe8\
+\xb2\x16\x84\xf3\x05\x5c\x85{\xd3\x87\xb4(tE\xae\xf0\
+V\xb7u\x09\x22S\x91\xcfhA8\xc3\xf9\xf4!\xdd\
+\x9etI2\xa0K\xd2}\x9b\xbf\xa3a\xed\x86\xf3\x99\
+\x86\xf3\x5c\xa1+w8\xcf\x15\xde\xaa:N\xeep\x9e\
+\xfb\xbd\xcc5\x9c;\xac}\xf4\xb4T\xafm\xd6$I\
+\x06tI\x1a\xd7\xa1a\xed\x86\xf3\xd9\x85\xf3*\x8e\xb3\
+(s\xces\x87\xf3\x98\xd79Tq\x1c\xc39\x00\xa9\
+h^\x97t8\xdc]\x92\x0c\xe8\x92\x16\xde\xae\xe5\xb5\
+\x9e\xf3\x8b[\x14\xce[\xb5\x0aw\xdb\xb6Q\xcb\xd1s\
+\x1e\xf5\xac'\x8d]\xa9\xbdn\xf5$\xc3\xba\x04M\x1c\
+1\x9e\x92A]\x92\x0c\xe8\x92\x16U\x00{\x96[8\
+\xac\xbdus\x89\x0d\xe7y\xcb\xadn\xf5\xa4\xc2p\x1e\
+\x87\xfe\xf7N\xe0\x9e\xb5?+k\xf1u\x07p\x12p\
+\x22\xc4\x89\xd3\x9fW\xddV\xf4\x1f6\xf7R\x96\x80p\
+\xcd_I2\xa0KZ({V\x96x\xfe\xb9\xd7\xf2\
+\xfa\x8b.\x830\x9c\xcf$\x9c\xe7>\xce\xa2\x84\xf3l\
+\xc7h\xe3M\x9c\xb8O\xb0c\x08|\x9aH\x1f\xa4\xbb\
+\xfaa\xe0j\x86\xdd/C\xec\xa6\xec\xac\xde\xfb\xd8H\
+\x0c\xd36\x8a8\x99\x82\x87\x00\xe7\x12<\x19x\x0ap\
+N\xa5\xd5\xba\xf2\xe3\x05P\xb6\xe0*mH\x97$\x03\
+\xba\xa4\x85ppX\xfb\xeb\x1d\xd6^\xff\xd0\xd5\xf8p\
+^\x97m\xd4r\xd4\x93\x1a\xaf\xe8\x9f\xe2zV\xbb\x7f\
+I\xa7\xfck\x0a>EP\x8e\xb6\xf1\xda\xf0\xc9\xcb\xc0\
+\xcdk\x7f>\x02\xf1\x16\x22\x1dCo\xf0D\x82K\x18\
+\xf4\xbe\x83\x14\xa7l|^u\xeb9o\xc9\xf0\xf0\xb4\
+v\x83!\x5c\xdd]\x92\x9a\xce\xdb\xad\x926l\xc3\xee\
+^^\xe2\xf9\x8fvX{}\xc3y\xe6\xf72\xd7p\
+\x9e\xeb\xad\xd4\xa5\xe7\xbc\x86\xe1<\xb8\x1a\xd2\x0f\x90\xd2\
+y\xf4;\xaf%\xd2'\x98\xae\xfbx\x1f\x9d\xe1\xfb)\
+\x06\xdf\x0f\xe9|\xe0M\x94\xdcq\xf4\xa0X\x83p\x1e\
+-\x0c\xe7\x87\x94\xf7\x06uIRc\xd9\x83.i]\
+\x07\x87\xb5\xff\xccE\x1f!9\xac\xbd\xa6\xe1\xdca\xed\
+\xf5\x0c\xe7\xb5\x9bs\xbe\x8f\x92_b\xc8\xaf\xd3c\x0f\
+\x90\x7fa\xb4\xc4MD\xfai\x06\xe9\x0f9\xe6\xc0\xcf\
+\xb0\xb2\xfd{\xef\xed\x95\xaf\xf9\x8a\xfee\xd1\xaem\xd6\
+\xecH\x97$\x03\xba\xa4v\xd9\xb5\xec\x9c\xf3M\x83A\
+]W\xe1\x9eY8o\xdbp\xe5\x16\xd6\x93\x00\xba\xc3\
+\x8fB\xfc \xab\xbd\x8fo2\x8c=\xc3W-AQ\
+~\x81m\xcb/c\xff\xce\x7f\xa4;\xfcM\xe0k\xea\
+SO\xd6\xbb1\x96Z8\xa2\xd0\xd5\xdd%\xa9\x89\x1c\
+\xe2.\xe9~v\xaf\x8c\x86\xb5\xbf\xfe\xa2\x0f\xaf\xad\x9f\
+\x94\xb8wlh\x13\xff\xd0\xa0\x05\xab\x9a\x12\xces\xbd\
+\xcf6\x85\xf3\x5c\xe5\x97\xf5&\xce\x1f\xd1\x19>\x9dN\
+\xff\xe3\xb3\xcd\x86\x09\x82w@\xf94\xa2\xbc\xbc>\xf5\
+dA\x84\xf9\x5c\x92\x0c\xe8\x92Z\x13\xce/y\xd4\xb5\
+\xbc\xfe\xe2\x0f\xb7`X{\xae\xc6y\xae\xfd\xab]\x10\
+\xae\xbd\xe1<\xa8\xdd>\xe7\x91~\x15\xd2\xf7\x00{\xe7\
+8\xe6\xf9\x1a\xca\xf2Y\x90\xde\xdf\xfcz\xd24\xc9E\
+\xe3$\xc9\x80.\xa9\xc9v-/q\xc9\xa3\xae\xe3\x0d\
+\x17]F*\x13\x0c\x8bfw\x9cO\xdd\x8bT\xc3\xd0\
+\xb5\xe5\x87LX\x18\xb9\x8eSE\xe8\xca\xb6\xd0W\xae\
+\x11\x16\x91\xa5\x886\xbc\x813y=y3\xa4\x1f\xaf\
+IP\xbc\x0b\xca\xef\x22\xf8\xd7I\xbfn.\x087\xa5\
+2\xa0,\x9d\x93.I\x06tIM3\xea9\xbf\xee\
+\xb0a\xed\x8b~yh\xdb\x9c\xf3\x1c/U\xf3\x85\xbe\
+\xb6\xfa\xdc\x98\xd79Tp\x9c\xd1\x9c\xf3w\xb0m\xf9\
+5\xb5\xe9=M@\x8a\xdd\x04/ \xd25\xe3\xbf\xfd\
+\x9a\x95mc/e1\x0a\xea\x92$\x03\xba\xa4\x86\x84\
+\xf3\xe5%\x9e\xf7\xa8ky\xc3\xc5\x1f\x1a\xad!Uz\
+ihO8\xcf\xd9s^\x83p\x9e\xad\xe7\xbc\xa2p\
+>\xef\x05\xe1z\xab\x9fc\xfb\xbe\xff\xc6\xf2\xce\xa08\
+l\xcb\xad4\x8f\x80\x96\xa0\x93`\xe9\xe0?\xb9\x85\x0e\
+/\x01\xf6W\x1a\xce\xed9?zH\x0f\xcbB\x92\x9a\
+\xc0U\xdc\xa5\x05\xb7k\xb9\xc7%\x8f\xbe\x8e\x9fm\xc5\
+j\xed\x15%\xf1F\x87\xf3\x1c/S\xa7m\xd42\x85\
+\xf36n\xb7\x97\xe8\xb3\xdc\xfbA\xfa\xdc\xcdJg\x14\
+\xca\x03\x18l\x83\xa2\x9cqH\x0f\xe8\x04D\xe7\xbe\xef\
+\xe5\xa30\xfcy\xe0\x17\x8e\xfe>\xe7t\x03'-B\
+\x87\x85\x01]\x92\x0c\xe8\x92j\xed\xe0\x82po\xb8\xe8\
+C\x86\xf3\xd6\x85\xf3\x5c/S\x83p\x9e\xed8\x0d\x09\
+\xe7[\x7f_o\x87\xf4o\x0c\xb6A\xb7\xcf\xa1\x89\xc7\
+\x01D1\xbb\x80\x16\xc5h\xe7\x8748\xfa\xd0\xea\x88\
+7\x93\x8aK\x08\xce\xad\xe6\xeb\xbb\x95:\x1b\xed\xda\x07\
+}\xdd\x1b\x11\x81\x13\xd2%\xa9\xde\x1c\xc7*-j8\
+_^\xe2y\x8f\xbcnmX\xbb\xe1\xbc}=\xe7\x91\
+\xe1ej2\x078&|O\xb3\x0c\xe7U\x1c'&\
+9\xc6\xa1\x07\xef\x82\xf4\x8bt\x80^\x8c\x86\x94w\x18\
+\xfd\xe9\xad\xfd\xb3\xbb6\xd4\xbc\xea\x008\x0c\xd8s\xcc\
+\xe8\x9f\x03\xee\xffg\x98\x96\x19\xc6\xcfg-[\x87\xb4\
+Or3\xc22\x90\xa4\x1a\xb3\x07]Z\xd4p\xfe(\
+\xc3\xf9\xba\xc1\xa0\x0e\xc3\x95\xa7\x0a\xe79^\xa6n\xc3\
+\xda3|\xbe\xb5\xd9n/\xc7\xfb\x8d\xfb\x06\xe3?'\
+\xc5\x17\xee\xfd\xf7\xfb\x06\xe7\xf5r}\xcep>\x84b\
+\x08;\x0e\xf6\xd2\xc6FA\xfe\xef\x88\xf4\x09\x86\x9d\xf3\
+\xdcFm\x8e\x97<\xbbi$\xc9\x80.i\xce\xe1|\
+e\x89\xef~\xf4\xb5G\x86\xf36\x8fx\x8c\xcdZ\xed\
+5\x1d\xael8\xcfT\xb6u\x1b\xd6^A8\x8f4\
+d\xa5\xfbV\x8a\x09\x0e\x92\x80\xb2\x03\xf43\x85\xf3\x80\
+c\xef\x86\xce\x80\xb1.(\xa9\xec\xb3\xef\xb8?b\xb0\
+\xf3\xbc\xa9\xe6\xc6\x1b\xce\xa7SZ\x04\x92d@\x974\
+\x9fvX$v-/\xf1\x82\xaf\xbf\x8e7|\xf3e\
+\xa4\xd5\xceh\x9f\xf3v\x87s\xe8\xc4\xd2\xfa\xc1\xa5\xe2\
+P\x9d\xbb\xe7<W\xa86\x9c\xcf)\x9c\xe7\xa8'G\
+{p|\x12\xf8\x04\xe5\x84_\xe6n\x7f\xb4x\xdcT\
+\xdd\xa81\xba\x8e\x94\xc0\x81\x93&\xbc\x9e\xc4{H\xe5\
+\x9b\x80\x9d\xf3\x0d\xe7\x8b</;\xad\xbd}opH\
+\x92\x01]\xd2\xcc\x0c\xcb\x82\x12\xf8\x89\xa7\x5c\xc1+\xbe\
+\xe1*R\x0a\x18&\x8e\xd8\x86\xa9\xa5mO\x12\xa75\
+3t-z8\xcf\x11\xba\x16!\x9c\x03%\xffB\xea\
+\x0f\xb6\xf4\x05\xe9\x17\xd3\xb5\x04\x02X\xe9\xde\xfb}\x9b\
+\xec\xf5\xaf_\xbb\xb9\xf0\xa4\xf9\xd4\x13C\xe9\xe8&\xe6\
+\xda\xef@\xb8x\x9c$\x19\xd0%UnP\x16\x0c\xca\
+\x82\x9f}\xfae<\xf7\xbc\xcf\xc1\xca\xd2h\x95\xe5\xce\
+\xc2\x14\xc1q\x86\xf3Y\x85\xf3\xba\xcc%^\x809\xe7\
+G\xfe\xd5e\xa3U\xda\xb7\xfa6\x03\xd2\xa4\xe1,A\
+\x94\x07o\x82MS\xc0\x97\x11\x13\x06\xf4\xdc\xc3\xdaG\
+\x8b\x10:\x1b;\xc0\x15\xde%\xc9\x80.\xa9\xeapN\
+\xc1\x1b\x9f\xf1\x11\xbe\xfd1\x9f\x87\x95\xed\x87\xda\xd6\x8b\
+\xd3\xe8\x8c\xa5F\x86.\xc3\xb9\xe1|\xbc\xe3\xf4I\x9d\
+\xab\xa7\xfe5/\x0b`e\xb2P\x9f\xc7gjQO\
+\x92\xed!\x80\xd1t G\x16H\x92\x01]R\x05\xb9\
+4\x91R\xc9\xcf^x\x19\xdf~\xee\xe7a\xb9\xb7\xa8\
+\x0d\xaf\xa1\xe1<c0o}8o\xd0v{\xa3\xbf\
+\xba\x93\xa2\xbck\xfa\xafI9Z4.\xc68\xc12\
+r\x06\xf4\x9bf[O\x22[\xb5m%\xe7\xa2K\x92\
+\x01]R5\xee\xdc\xbf\x8d\xe7=\xe2\xf3<\xf7\xbc\xab\
+\xe0\xc0\xb6\xc5m\x8d\xa6\xb4\xcfpn8oi8\x07\
+\xb8\x07b_\x96\xef\xca`\xadIP\x0c\xef\xf3\x1d:\
+\xec\x9fq\xb0\x875\xdb0\x9c\xbb \x06\x9b\xb6G\x0c\
+\xe73VXP\x92d@\x97\x94\xcb\xde\x95\x1e\xcf>\
+\xff\xcb\xbc\xea\xa2\xcf\xc2\xb1;a\xc7\x82N\xafL\x09\
+\xf6\x97\xbb908r\x8e\xad\xc3\xda[\x14\xces\x85\
+\xae\x86\x84\xf3\xfb\xff\xe7U\x22\xd7^i\x07or\xa4\
+\xb5y\xe9\xe5\xe8\x9f\xfd\xdeh\xfb\xb44<,\x9bg\
+\xab\x5c\xab\xc4\x06\x9b}\xd5nE\xffE\xba~r\xef\
+\x02r\x92$\x03\xba\xa4\xad\xd9\xd7\xef\xf1\x9d\x8f\xb8\x9e\
+\x9f\xfb\xd6\x0f\x8f\x16\x82\xdb\xdbY\xdcVi\x0a\x18\xc4\
+-G\xf4\xf6-B8\xaf\xfbJ\xed\xd9\xc2y\xae\xd3\
+il8?\xf8;\x9ew\xc9\xc7`\x14\xcc\x8b\x18-\
+\x04\xb7\xba\x0d\xb6\x05t\x02R\xf6\x9b}\x9du\x97\x0f\
+7\x9c\xd7\xa0\x958\xb4\xec$\xc9\x80.iKY\x14\
+\xd8\xbd\xb2\xc4\x05g}\x85\x9f\xbd\xf8R8\x90\xd6\x16\
+~Z\xf0\x1e\x90\x147\x1d\xca\xe7\x8b\xd2s^\xe91\
+\xea\x14\xce#\xffbpM\xa8'G:\x8e\xc4\x0e`\
+\x7f\x9e\xcf\xb6\x1c\xcd1\xbf\xef\xc5%\xdd\xb7\xdc\xb3\x0d\
+s?\x01\xe8UZG\x0c\x98\x19\xae\xa3)\xe7\xba\x03\
+\x92$\x03\xba\xd4~\x07\x06\x1d\x1e~\xea]\xbc\xe1\xe9\
+\x1f\x1e\xcd\x1e,\xdd5h\xcd\xf5\xc4V'\xcd:\xe7\
+\xbc\xf6\xc3\xda\x17!\x9co|\x8cSHq\x22\xa4;\
+\xb7\x5c\x06\x07;\xb0\xcb\xf2\xde\xa9\xc7\xeb\x06\xb5\xb5\xff\
+)3}\x0c\x893\xd6\xfff\xce0\x9c\x87\xfb\x8b\x8d\
+\xf3aYJ\x92d@\x974\x86\xc1\xb0`\xc7\xd2\x90\
+_~\xceGy\xd0\xd7\xec\x1f\x0dI\xedX.k\x0d\
+\xef/2\x18\xdcA\xc4i\xcd\x0b\xe7\x91\xe9\x94\xdb4\
+\xac\xbd\xa29\xe7\x91\xe98\xb3\x0d\xe7\x00;\x89t\x0e\
+p\xfd\xd6N\xbf\x80\xde*0\x80\xe5m\x9b\x07\xf4\x83\
+\x8a\x04\xc3\x98r\xd5\xef\x00\x8a\xaf\xcb_G&\x0c\xe7\
+\x00)l\x0f\x8d\xa3SBQbR\x97$\x03\xba\xa4\
+u\x94\x91\x18\x0c\xe1G\x9ez=_\xfbuK0<\
+\x13\x8e\xb1\x5c\xd6Z\xdd\x10q\x1bw~\xe5:\x06\xfd\
+\xd3\x8eX(\xaeM\xe1\xbc\xees\xcek7\x97\xb8\xe2\
+p\x1e\xb3<N@\xf0X\x22\xfd\xf3\xd6\xbe\x22%t\
+\x97\xa1\x18\xc0\x81\xed\x93\x9d|\xc1ZX\x8b\xad\x97_\
+\xf08\xa2\xc3\x91\xd3\x15\x1c\xd6^\xe7K*\xc3.\xec\
+\xef\x8en\xceX\xc6\x92d@\x97t\xa4}\xab]^\
+\xffM\x1f\xe3y\x0f\xff\x0c|\xa5\xbb\xeezK\x0b,\
+H|\x8c\x94\x9eX\x8b\xd0\x95;\x9cO{\x0eU\x1f\
+'w8\xcf\xfd^\x9a\x1e\xce\x01R<\x9d\x14\xff\xcf\
+\xc4o\xa1L\xa3\xde\xf3\xcep\xebSb\xcab\xb4p\
+\x5c\xda\xd2u\xe7t(\xbf\xb1\x16\xe1<\xd2\x09^*\
+\xc7-\xab\xc2\x0etI2\xa0K:\x9a\xbb\x0el\xe7\
+\x92G^\xc7\xf3\xce\xff,\x0c{\xa3a\xa7:\x9a\xff\
+ \xe2\xd5\xb3\x09]u\xd9F\xadN=\xe7u\xe9\x11\
+\xadS8\x9fv\x94\xc6\xe1\x0fJO$\xd2C\x89t\
+\xfdD\xaf]\xc6(\xa4O#1Z\xe9\x9dX\xebM\
+g\xcc\x9b\x84\x01\xa4\x0b\x89\xce\xa95\xa9'\x8e;\x9a\
+\xa8\x9c\xfd\xad\x91$\x03\xba\xa4#\xda\xc4\xfb\xfb].\
+:\xe7&^s\xc1\xc7\x19M8\xb7Wc\x03\x97\x12\
+q7pR\xd6@k8_\xb0p>\x83\xa9\x0f\xb1\
+\xa5\xe7\x1fC*/\xa1\xe8\xff\xc2X/_vF\xbd\
+\xa0\xb9.\x18i-\x94\xafv'[\xfb\x22xi\xbe\
+\xef\xdf\xd4\xf5d\xd5\xcb\xa4$\xc9\x80.iKV\x86\
+\x1d\xbe\xee\xb4\xbb\xf8\xa5\x8b.c\xe7\xd2*\xac,\xf0\
+^\xe7\xe3\xf9\x0a\x05\x97\x03\x17U\x1b\xbc*\x0e\xf7\x8d\
+\x0b\xe7\x99\xca\xa46=\xe7\xb5\x0c\xe7\xa3p\x5c\x94\xdf\
+\xcf\x19_\xf9\x1dz\xfd]\x1b\x1e\xa7Lp\xf3\x7f\x82\
+\x95\xa5\x8a\xeaqb\xd3\x1e\xd6H\x90\xe2\x09\x10O\xaf\
+I8\x07\xb8\xdb\xcb\xa4$\xc9\x80.iKV\x87\x1d\
+\x9e\xff\xe8\xab\xd9y\xdc>X^\x1a\xad\xac\xab\xcd\x82\
+\xc3\xdf\x11G\x0b\xe8\x0ek\xcf\x9a^k\xd5s\xde\xa0\
+=\xcec\x8a\xe7\xa7\x80\xb2{\x16\xbbN~%;\xf6\
+\xfd\xd2\xba\xc3\xd6\xcb.\x0c;k\xf3\xc6\xa9\xe6\xe6S\
+\xb0\xb6g6kC\xdf\x8f\x92\xdf{}\xe8o\xfb)\
+\xa0W\x9bzR\x94_\xf5\x1a9\x89\x82\xd1\xe2~\x92\
+$\x03\xba$\x00vt\x07\xa3\xc6v\xb8\xdf\xf9\x98\xde\
+\x03\xfc\x22\xc4\xf1\x86s\xc3y\xb3\xc2\xf9\x18/\x94J\
+\xd8}\xe2O\xb0\xff\x98\xbfb\xb8\xf4\x05\xca\xc3WF\
+O\x90\xfa\xa3\xa1\xed\xc7\xed\x9ark\xb41\xa4\xb5\x90\
+>\x1c\xae\xcdG?\xbcG=`\xdb\xf2w\xd0\xdf\xf6\
+\x9c\x1am\xb77\xa0L_\xf6\x129\xe1g,I2\
+\xa0K\xbaW\x19\xc5Z\xe3\xd2\xa1\xedc\xba\x09\xe2\x9f\
+ ]\x92/\x9cO\xabn\xc3\xda\xdb\x12\xces\xbd\xdf\
+\xba\xf4\x9c\x8f\xed\x14\xa2\xf8\x0d\x86\x9do'\xa5\x804\
+Z\xb8-\x95k\x199\xaa\x0f\xe7\x87\x02\x5c\x02z\xa3\
+7X\xa6{\xb7\xe4J\xe9k\xd8s\xc2\x9bIe\x9e\
+\x0f3\xcfM\x9c\xdb\x89t\xa3\x97\xc8I?_I\x92\
+\x01]\xd2\x91\x8d\xcb\x180\xda\x8cXc\xb6*\xdf\x02\
+\x5cRy\xe8\xca\x1d\xaa\xed9\x9f\xeesi\xe3\xb0\xf6\
+\xa3>,`X<\x872~\x8an\xffMD\x82\xde\
+2l\xdf\x0f\xbbN\x9e\xf1\xe5)A'`\xfb\x81\xd1\
+\xfe\xea\xc52D\xa7`\xb8\xf4\x16R\x9c9\xdf:r\
+\xbf\x03|\x8e\xc4\x9d^\x1f%I\x06tI\xd3\x84\xcd\
+\xd1?\xfa\xce?\x1f\xbfM\x1e\xffF\xaf{))=\
+\xb9\xf9\xe1|\x8b\x09\xc5p\xde\xbep~_\xbd\xfe\x1b\
+\xe9w\xbeHJ\x7fR\x8b\x116Q\xc0`;\x90\xde\
+L\x8a\xe7\xd4,\x9cCp\xa9\x17\xc7\x09\x8b\xcf\xe9\xe7\
+\x92d@\x97\xb4^;3A\xafgY\x8c%\x0d\xe9\
+\x14\xbf\xce\xb0\xff\xe4f\x87\xf3\x5c\xf9\xb5M\xe1<W\
+\xf95\xb1\xe7\xfc\xbe\xff-\x15t\xcb? \xd2*\xf0\
+W5\xf9\xf2\xfd\x02)~x\xc6\x1f\xe6x_\x82\xe0\
+\x9f\x9dT=i\x19:\xb5J\x92\x0c\xe8\x92\x8e\xdeP\
+\xea\xf6`\xfb1P\xda\x93>^\x91\xc5\xbb\x18\x0e>\
+\x02\xf1\xf8\xd9\x86\xf3\x98\xf8\xa3\xcd\x1aTj\x19\xce\xb3\
+\xcf%\xaew8\xcf\xddk\xbe\xf1\x8d\xa0m\xc0\x9f\x00\
+'\x03\xffsn\xdf\xb7\xc4\x12\xc1o\x90x\xe5\xd4\x9f\
+o5\xdb\xed]CJW\x188'\xff`%I\x06\
+tI\xebY\xde\x0fe\xdfF\xd3x\x06\x14\xe9\xe7\x08\
+\xde\x93-\xbc-R8\x8f\x5c!\xbf\xa2p\x1e\x99\x8e\
+\xb3\xe5\xe3\xcd(\x9c\x8fs\x9c\x14=\x06K\xbf\xc7\xbe\
+\xee#)\xca\x9f\xa4\xec\xec\x9di~+\xd3CYY\
+\xfa\x9f\xa4\xf2\x19\xd9>\xdf\xfc\xf5\xe4o!\xf6{Y\
+\x94$\x19\xd0%\xe5S$H=\xf7\xa5\x1d?=\xfc\
+\x03\xf4\xff\x1e\xca1\xe7\xc3F\x96\x874>\x9cg;\
+N\x85=\xe7\x8d=NE7q\x22At_\x05\xf1\
+D\xe0'H\xf1\x81\x99\xc4\xf3(_N\xc4\x9b\xe8w\
+\x1e\xb0\xf5\x95\xe3+\xbf\x89\xb3J\xa4?\x1fm\x05\xa7\
+\xf1>\xd9\x18\xed\x0a\xe0\xcd`I2\xa0K\xda\xa8\xfd\
+\xd9\x81\x1d\xb7\xc3q\xb7\xae\xed;l\xe3i\xe3Ff\
+\x09\xfd\xa5\x9f\xe4\x8e\xb3\xbe\x99\x14\xc7N\x15\x9c\xea\xba\
+R{\xeep^\xbb\xf9\xe6\x15\x0fk\xaf\xebbp[\
+\xaa'\x01p>\xa9\xfcgV\xb6\xfd\x09e\xf1\xab\xc0\
+\xa7+\xfar]DY\xbe\x16\xca\xa7\xaeE\xf5z\xd5\
+\x93\xc3\xff\xb5,\xfe\x81a\xe7\xd3h\xfcp\xde\x19\xfa\
+\xfb\x22I\x06tI\x9b\xb7A\x13l\xdb3\xdaox\
+\xf58\x9cO9F@\x1fl\xff,\x9dx\x13%\xbf\
+\x98=\x18\xcf;\x9cG\xe6\xf7\x92\xad:\xb51\x9cO\
+[n3\xac')\x0aV\xb7\xbd\x94\x14\x97\x90\xf8\x1b\
+\xe0m\xc0\xbf\x93be\xca\xccu2\xf0l\x12\xaf\x80\
+\xf2i\xb5\xbd\x89\x13\xf7\xf9\xb7\x13\xef\xf9M/\x86\x13\
+\xd8w\x0c\xf4{l}D\x84$\xc9\x80.-TH\
+/`\xef\xd7\xc0\xde\x93r\xa7\xaa6&\xf4Q#\xb3\
+\x18\xfc\x1a\x91\xbe\x95\x14O\xd9R\xe0\xc9Q\xc4u\x0f\
+\xe7\xb9oXT\x1b\xba\xe6\x10\xcek\xb1 \xdc\x04U\
+?\x00\xb6\x11\xbc\x80\x22^\xc0\xb0\xfb9\x96w\xbc\x1f\
+\xca\x0f\x90\xe2\x93\xc0W\x80\xfe\x91\x87\xbf_z?\x06\
+8\x13\xf8\x06\x22=\x03\xb8\x90\xe0\x8cQ\xc8oD8\
+\x87\xb2x/\x07v\xfc\xeb\xa8GX\x1b\x17e\x82\xee\
+\x00\x96Vau\xc9\xf2\x90$\x03\xba\xa4\xf1\x95\xd0\xdd\
+\x0f\xc7\xec\xb2(\xc6\xb3Jt^\xc9\xbe\x93/%\xe2\
+\x84\xb1\x03O]\x87\xb5W\xd6s\xee\x1e\xe7\xf9\x8f\x93\
+\xa3\x9ed\x98\xfa\x10<\x9c\x95\xa5\x87\x03\xaf\xa6\x88\xfd\
+\x94|\x09\xb8\x09\xf8\x0a%w\x13i\x85^?\x91b\
+\x07\x91N!\xe2!\xc0\xc1?\xdd\x86\xd6\x93U\xe0\xf5\
+\xec\xdf\xe9\x15p\x5cE\x09;\xf7\xdb{.I\x06t\
+I\x93I\xd0\xeb\xc3\xf6\xbd\xb0\xb2\x03{\xd17+\xae\
+\x80a\xba\x8a\x94~\x942\xde6}\x0f\xa0\xc3\xda\xab\
+\x09]\xb9\xce\xafM\xe1<W\xb9\xc5\xe1S\x8aw\x02\
+\xffe\xed\xcf\xdac\xd7\xae)\xeb-\xa4\xd6\xcc\xed\xf6\
+\xdeB\xa4\xcb\x0d\x9b\x13p\xa4\x81$\x19\xd0%M\x11\
+:\xf7\x1f\x0b\xf7\x9c\x0a\x1d\xf7F\x1fK\xd1\x7f;E\
+:\x9fH\xaf\xdez`jk8o\xd3\xb0\xf66\x85\
+\xf3\x1c\xf5d\xcccT\x1a\xces}\xaec\x87\xf3\x1b\
+\x88\xf4\x06\xc3\xf9$E\xeb\xa2p\x92d@\x974}\
+H_\x1aB\xd7\x80>^\x034`\xdb\xb6\x1fg\x85\
+\xffL\xbf|\xd6Q\x17\xccj\xcc\xb0\xf6)\x83G\xdd\
+WkwX{\xa6\xfc\xda\xa6z2v8\x0f\x22\xbd\
+\x9aHw\x1e\xbaN\xca\x80.I\x06tI\xb3kX\
+Y\x04c\x97S'\xadBz)\xa9\xfcg\xe0\xdcf\
+\x86\xf3\x5c\xf5\xa5M\xe1<W\xf9\xb5lX\xfb\xdc\xeb\
+\xc9\xcc\x87\xb5\x03\xfc\x0a\xf0\x8f^\xf0$I\x06tI\
+s\x0c\x9f\xf6~\x8cUF\x07\x06\x10\xe9v\x8a\xf8N\
+\x86\xe9\xfd$\xcen^8o\xf1>\xe7\xce9\xa7]\
+#,\xf2\x1ef\xd3\xe3\xa5\xf8gR\xbc\xce^\xf3\x09\
+\x0c;P\x16\x96\x83$\x19\xd0%\x19\xd2\xe7`\x10\xa3\
+!\xaf\xc1\x0d,u\xbe\x8da\xbc\x97a\x9c\x91%U\
+,\xc4p\xe5\xb9\xf4\x88\xce/\x9c\xe7\x0e\xe6\xb9\xebI\
+\xdd\xd7%\xc8]O6>\xd6\xe7\xe9\x0e\xbe\x87\xb2X\
+\xf5B'I2\xa0KR\x13\xa4\xc3\x1a\xfa\xbd\xceg\
+\x18\xf0\x1c\xe8\xff\x1d\xa3\xed\xa4\xb2\xe6\xcd\xf6\x85\xf3\x5c\
+\xa7\xd3\xa0\xad\xd4r\xabs8\xcfv\x9c9\x84\xf3H\
+\xb7\x02\xdfM\xbf\xf7UoT\x8e\xa93\x1cm\xab&\
+I2\xa0KR-\x8c\xb6\x97\xfa\x04\xc1\xb7\x90x7\
+p\xce\x96\x92\x85\x0b}\xb53\x9c\xc7\x14\xcf\x9dE=\
+\xa1\x8e\xf5d\x0e\xe1<\xb1\x8b\x1d\xfb\x9f\xc7\xdec\xaf\
+\xf4\xa26\x01\xc3\xb9$\xcd\xf72l\x11H\xd2\xba\xae\
+\x82x\x06\xf0\xf1Q\x120\x9c\xdf\xff \x0d\x08\xe7A\
+\xbea\xed9\xc3y\x90\xbf\xe7<g=9t\xbc \
+\xdbv{\xb3\x1b\xd6~\x0fe\xfa.z\xfd\x7f\xf72\
+&I2\xa0KR{|\x01\xb8\x18\xf8\xa7\xe9C\xd7\
+t\x19\xb8^\xe1<\xd7\xe9\xcc\xa0\xe7<W\xc8\xcfy\
+\x0e\x8dY40Sy\xcev\xd1\xc0\xdb\x81\xe7\x12\xe9\
+_\x1c\xd6.I2\xa0KR\xfb\xdcA\xf0\x5c\x82\xdf\
+\x9d.t\xe5H=5\x1a\xd6\x9e\xbbG\xb4\x8ap>\
+\xb39\xe7s\x0c\xe7\xb9\x8f\x13\xb9\xea\xec\x5c\xc2\xf9\x8d\
+\xc0\xb3\x81\x7f\xf3\xb2%I2\xa0KR{\xad\x12\xc3\
+W\x11\xe5+\x81\xfd3\x09Ku\x1f\xd6\x9e;@\xce\
+-\x9co\xf0\x9e\xaa\x18\xd6\x9e\xb3\x9eT1\xc2\x22\xcb\
+1r\x9d\xc3D\xc7\xb9\x8cH\x17\x02\x1f\xf3r%I\
+2\xa0K\xd2BH\xbfO\x11\x17Q\x0c?3^\x1e\
+\xa9I\xe8\xaa\xfbB_s\xed9\x9f\xe6\x18u\xdb\xe3\
+<\xd7\x9c\xf3\x0c\x057\x93\xe9\x1e\x87\xfc)).f\
+4%E\x92$\x03\xba$-\x84\x00\xd2\xe0R\xba\xab\
+\x17Pv\xdeZI8\xcf\x996#s8\x9f\xedB\
+_\x93\x07\xda\x9c\x0b\xc25*\x9c\xe7\xc9\xd4\xf5X\xd1\
+\x7f\x82z\x12i\x85\xee\xe05,\xad\xbe\x98\xb2\xd8\xed\
+\x05J\x92d@\x97\xa4\xc5\x0c\xea\xf7P\x16/'x\
+\x01pSm\xc3y\x96D7\x97\xb9\xc4\x15\x85\xea1\
+\x92\xfc\xc2.\x08W\x97\xed\xf6\xc6\xae'W2\xec<\
+\x93H\xbfF\x0a$I2\xa0K\xd2\xa2K\xfc\x05\xf0\
+$\x12\x7fT\xdf\xd0e8\x1f\xfb\xc1\x86\xf39\xd7\x93\
+1\xdeZ$\xe8\xf5\x7f\x97\xa2|*\x91>\xe8EH\
+\x92d@\x97$\x1d\xee+\x14\xf1=\xa4x\x0e\xc4g\
+\x0c]U\x84\xf3i{\xbc\xdb\x18\xcec\xf1\xeaI\x8a\
+\xab\x80o\xa13|\x15Ey\x8f\x97\x1eI\x92\x01]\
+\x92tt\x89\xf7\x10\xe9\x09\xc0k\x81\xbb\x0c]9\xc3\
+y\x8e\x9c[\x87p\xbe\xc5\xcf\xb7\xee+\xfaW=\xac\
+=\xc5^\x06\xdd7\xd2\xeb?\x01x\xaf\x17\x1bI\x92\
+\x01]\x924N\xd8\xd8G*~\x81n<\x8e4\xfc\
+\x03H\xab\xcd\x0a]\xb9\xc2\xf9Ds\x89\x17(\x9c\xe7\
+(\x82\xba\xd4\x132\xd5\x93M\xfeS\x99\xde\xc1\xb1{\
+\x9f@Y\xbc\x1e\xd8\xeb5F\x92d@\x97$M\x1a\
+<\xae\x87\xe1\xf7\x13<\x89H\x7f\x0d\x94\x8b\x15\xces\
+\xbc\xbd:\x84\xf3\x09{\xbc\x17\x22\x9c\xc7\xac\xea\xc9\xbf\
+\x11\xe9Y\x90\x9eGQ^\xe5Bp\x92$\x03\xba$\
+iZW@\xe7\xbbI<\x95\xa2\xf8\x1bHe\xbb\xc3\
+y\xaelZ\x97p\x9e\xe3\xa5\xda\x16\xces\x9c\xce\x86\
+\xe1\xfc2\xe0\xbb\x81o\x06\xde\xe7%D\x92d@\x97\
+$e\x0e\xa9q)\xdbv|\x17)\x9eL\x94\x7f\x0a\
+,\xb7/\x9c\xb7mX\xfb\xd6\xdfv\xad\xc2yd\x0e\
+\xe7AU\xe1\xfc\x83Dz\x1e\x91\x9eB\x8a\xbf&\xff\
+\xad\x22I\x92\x0c\xe8\x92\xa4#\x82\xfae\xa4\xf2\xc5\xa4\
+\xf2\xb1\x10\xbf\x09\xdc\xda\x9ep\x9e#S6p\xcey\
+\xeecD\x15\xe7\x92)\x9c\xe7?\x87>\xc1\xbbI\xf1\
+,\x22=\x95H\xef\x00\x86^($I\x06tI\xd2\
+,}\x96\x22~\x84\xd5\xde\xb9\x0c\x8a\x1f!\xc5'f\
+\x1f\xceg6\x97\xb8A\xe1\xbc\x8ds\xce\x83\xda\x0dk\
+Oq\x0b\xa9\xfc-R\xf9x\x22};)\x1c\xca.\
+I\x92\x01]\x92\xe6\xacL\xb7R\xf2\x9b\xc0\xe3(x\
+&)\xfd1p\xf7l\xc2y\xe6\xd0U\xe7p>V\
+F\x9d0\x98\xe7\x0c\xe7A\x85\xc3\xda3|\xbe\xb92\
+~*>\x04\xbc\x92\xce\xe0\x5c\xba\x83\x1f\x06>\xe1E\
+@\x92\xa4{u-\x02I\xaa\x85\x01)\xbd\x9f\xe0\xfd\
+\x04\x0f\x81\xf29\xa4\xf4\xdd\x90\x9eLD\x8f\x94\xee\x13\
+\x90j\x18\xce#\xd3q\xaa\x08\xe7\xd3\x9cC\xae\xf72\
+\xd1S\x22\xd3)\xd4`X{\x8a\xebXZ}\x17+\
+K\xef\xa0\xdb\xf9(\xc3\xc0\xe9\xe5\x92$\x19\xd0%\xa9\
+!\xe2K\x10\xbfK\x94\xbfK*\x1e\xc5\xb6\x9d\xdf\xce\
+\xea\xf2\xb7\x01\x8f\x85(\x88\x80\x94\xea\x15\xce\xab8N\
+\xcc\xea|\xe6\xb8Z{TU\xb6\x91\xef\xf9[;\xd4\
+\x97\x88\xf4\xbfXZ\xfd[\xca\xf4ol_\xde\xcb\xf2\
+6\xbf\xda\x92$\x19\xd0%\xa9\xd1\xaedi\xfb\x95\xac\
+\x1ex\x13\xa4\xf3(\x8a\xffJ\xea|\x0b\xc3\xfe\xf9\x10\
+K0IP\xcf\xb5\x8dZ\xc5\xc3\xda\xeb\xba\x18\x5cd\
+\x0e\xc4\x95\xf5\x9c\xcfm\xd1\xc0k\x81\x7f\xa1\x88\xf7\x90\
+\xca\x0f\xd2\xef\xee\x1e\xed]\x9e \x92\xdfdI\x92\x0c\
+\xe8\x92\xd4\x02\xb1\xb6\xd2W\xc4\xc7\xe9,}\x9ccN\
+x#+\xfb\x1f\xce\x81\xe5\x0b\x19\x0e\xbf\x85n<\x8e\
+\xe0\xb4\xc5\x0b\xe7\xd3\xe6\xe56\x86\xf3L\x057\xde\xf1\
+\x0e\x10\xe9\x93$\xfe\x05\xd2\xffb\xc8\xc7\xe8\x94\x07F\
+\xa1\x5c\x92$\x19\xd0%\xa9\xfdi}\xf4\x8f\xa2\xf8\x1c\
+\xd1\xf9\x1c\x83\xf8\x1dz\x83\xd3(\xd37\x92x\x06e\
+\xba\x80\x22\x1e\x01\xec\xac<\x9c/\xca6j\x95\x87\xf3\
+\xc8\xf4\xb1T\xd8s\x1e\x09R@\xa4kI|\x18\xf8\
+\xdf\x94\xc5\x7f\xb0\xda\xbd\x8e\xed\xabkS.\x0c\xe6\x92\
+$\x19\xd0%I\xb7\x03\xffH\xf0\x8f\x1c\xe8\xc1\xf1\xfd\
+s\x18\xc67\x00O\x05\x9e\x08\xfc\x17\x82c\xb2\x05s\
+\xc39\xf5\xdaF\xad\xb2p\xde\x07\xae\x07\xae`\xfb\xf2\
+\xa5\xf4{\x1fay\xfbg\xe9\xc62\x9d\x81y\x5c\x92\
+$\x03\xba$i\x0c7\x90\xb8\x81\xb2\xf8+\x88\x02\xe2\
+?A<\x9aHO \xf18\xe0\xe1\xc0\x83\xee\xcdf\
+k\xbd\xa3\x19\xf2q\xae\xfc_\xefp\x9e\xeb}\xd6-\
+\x9c\xa7\xdb\x81k(\xd2\x15\x0c\xe3r\x82O\x02\xd7\xd2\
+\x19\xae\xd0\xebC\xbf\xe77K\x92$\x03\xba$i\x0a\
+%p#\x89\x1b)\xd3\xbb! \x15'P\xac>\x94\
+\xe8>\x06\xd2yt\xfa\x8fa\xd8=\x07x \x89\xb4\
+\xe16]\x0ek\xa7\x05\xc3\xda\x03\xb8\x95\xe0\x0bt\x87\
+\x9f\x82\xf8\x14e\xf7S\x0c\x8a\xeb!\xdd\xc6\x120\x1c\
+\xde\xe7\x19.\xf2&I\x92\x01]\x92T\x85]\x10\x1f\
+\x07>\x0e\x09\x8e\xd9\x05{\x1fp\x12\xdd\xa5\x87\xb0w\
+\xf9\xe1ty$\x9d\xf8z\x22\xce\x01\x1e\x02\x9cl8\
+\x9f\x22T\xcf/\x9c\x97\xc0]\xc0M\xc0\x8d\x10W\x91\
+\xb8\x0a\xe2j\x22}\x99\xb2\xb8\x93\xcept\x98\xd2\x00\
+.I\x92\x01]\x92T\x17wS\xa4\xbb\xe9\x17\x9f\xa6\
+\x88\xbf\xa4[B\xd0!\xad\x9eL,\x9dEp\x0e\xa4\
+\x87\x01\xe7@\x9cM\x99\x1eB\x11\xa7\x02\xc7\xdf?@\
+\x8e1d\xdea\xed\xb9\xc2\xf9\xc1\x10~\x07\xf0\xc5Q\
+\x10\xe7z\x82\xebH\xdc\xc8\xb0\xb8\x89\xce\xf0.\x9c1\
+.I\x92\x01]\x92\xd40Gv\xa4\x0e\x19-@w\
+;p\xf9\xe8\xef\x13\x94\x01\x07\x96\xb6q\xec\xca\xe9D\
+\xf9\x00(\xce\x80t\x16\x89\x07\x13q&\xdd\xfe\x83\x18\
+vNa\xd4\xf3~\x22\xb04\x9fp>a&\xad_\
+\xcfy\x09\xec\x03\xee\x84\xb8\x8bH\xb7A|\x19\xb8\x99\
+\x94n\xa2,\xbfH\xe2\x16R\xba\x8d4\xbc\x93\xe8\x0c\
+G{\x8e\x9b\xc5%I2\xa0K\x92\x16\xc9\x0ap\x13\
+\xc4M\xc0\xc7\xee\xcd\xa0\x09\x8e\xb9\x07\xf6\x9e\xb4Dt\
+N`\xc0\xf1t8\x1d\xe2tR\x9cB\x14\xa7\x01\xa7\
+C<\x008e-\xc0\x1f\x07\x9c\x00l\x1f+\xd0\xe6\
+\xee5\xcf\x1d\xce7\xdf\xe3|\x05\xd8\x05\xec\x22\xd8E\
+\xe2\x1e\xe0\x0e\x88\xdb\x89t+\x89;\x80\xdb!n\x07\
+\xee\x81\xb4\x8b(\xf7B\xe7\xb0c9$]\x92\xa46\
+J\xe1\x9dvI\x92$I\x92\xe6\xae\xb0\x08$I\x92\
+$I2\xa0K\x92$I\x92$\x03\xba$I\x92$\
+I\x06tI\x92$I\x92d@\x97$I\x92$\xc9\
+\x80.I\x92$I\x92\x0c\xe8\x92$I\x92$\x19\xd0\
+%I\x92$I\x92\x01]\x92$I\x92$\x03\xba$\
+I\x92$I2\xa0K\x92$I\x92d@\x97$I\
+\x92$I\x06tI\x92$I\x92\x0c\xe8\x92$I\x92\
+$\xc9\x80.I\x92$I\x92\x01]\x92$I\x92$\
+\x19\xd0%I\x92$I2\xa0K\x92$I\x92$\x03\
+\xba$I\x92$I\x06tI\x92$I\x92d@\x97\
+$I\x92$\xc9\x80.I\x92$I\x92\x0c\xe8\x92$\
+I\x92$\x19\xd0%I\x92$I\x92\x01]\x92$I\
+\x92$\x03\xba$I\x92$I2\xa0K\x92$I\x92\
+d@\x97$I\x92$I\x06tI\x92$I\x92\x0c\
+\xe8\x92$I\x92$\xc9\x80.I\x92$I\x92\x01]\
+\x92$I\x92$\x19\xd0%I\x92$I2\xa0K\x92\
+$I\x92$\x03\xba$I\x92$I\x06tI\x92$\
+I\x92d@\x97$I\x92$\xc9\x80.I\x92$I\
+\x92\x0c\xe8\x92$I\x92$\x19\xd0%I\x92$I\x92\
+\x01]\x92$I\x92$\x03\xba$I\x92$I2\xa0\
+K\x92$I\x92d@\x97$I\x92$I\x06tI\
+\x92$I\x92\x0c\xe8\x92$I\x92$\xc9\x80.I\x92\
+$I\x92\x01]\x92$I\x92$\x19\xd0%I\x92$\
+I2\xa0K\x92$I\x92$\x03\xba$I\x92$I\
+\x06tI\x92$I\x92d@\x97$I\x92$\xc9\x80\
+.I\x92$I\x92\x0c\xe8\x92$I\x92$\x19\xd0%\
+I\x92$I\x92\x01]\x92$I\x92$\x03\xba$I\
+\x92$I2\xa0K\x92$I\x92d@\x97$I\x92\
+$I\x06tI\x92$I\x92\x0c\xe8\x92$I\x92$\
+\xc9\x80.I\x92$I\x92\x01]\x92$I\x92$\x19\
+\xd0%I\x92$I\x92\x01]\x92$I\x92$\x03\xba\
+$I\x92$I2\xa0K\x92$I\x92d@\x97$\
+I\x92$I\x06tI\x92$I\x92\x0c\xe8\x92$I\
+\x92$\xc9\x80.I\x92$I\x92\x01]\x92$I\x92\
+$\x19\xd0%I\x92$I2\xa0K\x92$I\x92$\
+\x03\xba$I\x92$I\x06tI\x92$I\x92d@\
+\x97$I\x92$\xc9\x80.I\x92$I\x92\x0c\xe8\x92\
+$I\x92$\x19\xd0%I\x92$I\x92\x01]\x92$\
+I\x92$\x03\xba$I\x92$I2\xa0K\x92$I\
+\x92d@\x97$I\x92$I\x06tI\x92$I\x92\
+\x1a\xe4\xff\x07\xd2-XU\x1cD\x19{\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x10\
+\x03\x93\xe9\x07\
+\x00e\
+\x00t\x00h\x00e\x00r\x00n\x00e\x00t\x00i\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x0aaZ\xa7\
+\x00i\
+\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x95b\xb6\xb5@\
+\x00\x00\x006\x00\x00\x00\x00\x00\x01\x00\x00\x14\xaa\
+\x00\x00\x01\x95b\xb6\xb5@\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'mainwindow.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QComboBox, QDoubleSpinBox,
+    QHBoxLayout, QHeaderView, QLabel, QLayout,
+    QMainWindow, QMenuBar, QPushButton, QSizePolicy,
+    QSpacerItem, QStackedWidget, QStatusBar, QTableView,
+    QVBoxLayout, QWidget)
+from . import resources_rc
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1128, 449)
+        icon = QIcon()
+        icon.addFile(u":/icons/icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        MainWindow.setWindowIcon(icon)
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.verticalLayout = QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.verticalLayout.setContentsMargins(9, 9, 9, 9)
+        self.stackedWidget = QStackedWidget(self.centralwidget)
+        self.stackedWidget.setObjectName(u"stackedWidget")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.stackedWidget.sizePolicy().hasHeightForWidth())
+        self.stackedWidget.setSizePolicy(sizePolicy)
+        self.device_selection_page = QWidget()
+        self.device_selection_page.setObjectName(u"device_selection_page")
+        self.verticalLayout_7 = QVBoxLayout(self.device_selection_page)
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalLayout_7.setContentsMargins(-1, -1, -1, 0)
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalLayout_2.setContentsMargins(-1, 0, -1, -1)
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout_2.setSizeConstraint(QLayout.SizeConstraint.SetMaximumSize)
+        self.label = QLabel(self.device_selection_page)
+        self.label.setObjectName(u"label")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.label.sizePolicy().hasHeightForWidth())
+        self.label.setSizePolicy(sizePolicy1)
+
+        self.verticalLayout_2.addWidget(self.label)
+
+        self.passing_voltage_input = QDoubleSpinBox(self.device_selection_page)
+        self.passing_voltage_input.setObjectName(u"passing_voltage_input")
+        sizePolicy2 = QSizePolicy(QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Fixed)
+        sizePolicy2.setHorizontalStretch(0)
+        sizePolicy2.setVerticalStretch(0)
+        sizePolicy2.setHeightForWidth(self.passing_voltage_input.sizePolicy().hasHeightForWidth())
+        self.passing_voltage_input.setSizePolicy(sizePolicy2)
+
+        self.verticalLayout_2.addWidget(self.passing_voltage_input)
+
+
+        self.horizontalLayout_2.addLayout(self.verticalLayout_2)
+
+        self.verticalLayout_5 = QVBoxLayout()
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.verticalLayout_5.setSizeConstraint(QLayout.SizeConstraint.SetMaximumSize)
+        self.label_2 = QLabel(self.device_selection_page)
+        self.label_2.setObjectName(u"label_2")
+        sizePolicy1.setHeightForWidth(self.label_2.sizePolicy().hasHeightForWidth())
+        self.label_2.setSizePolicy(sizePolicy1)
+
+        self.verticalLayout_5.addWidget(self.label_2)
+
+        self.passing_power_input = QDoubleSpinBox(self.device_selection_page)
+        self.passing_power_input.setObjectName(u"passing_power_input")
+        sizePolicy2.setHeightForWidth(self.passing_power_input.sizePolicy().hasHeightForWidth())
+        self.passing_power_input.setSizePolicy(sizePolicy2)
+
+        self.verticalLayout_5.addWidget(self.passing_power_input)
+
+
+        self.horizontalLayout_2.addLayout(self.verticalLayout_5)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_2)
+
+        self.verticalLayout_6 = QVBoxLayout()
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.verticalLayout_6.setSizeConstraint(QLayout.SizeConstraint.SetMaximumSize)
+        self.label_3 = QLabel(self.device_selection_page)
+        self.label_3.setObjectName(u"label_3")
+
+        self.verticalLayout_6.addWidget(self.label_3)
+
+        self.device_combobox = QComboBox(self.device_selection_page)
+        self.device_combobox.addItem("")
+        self.device_combobox.setObjectName(u"device_combobox")
+        sizePolicy2.setHeightForWidth(self.device_combobox.sizePolicy().hasHeightForWidth())
+        self.device_combobox.setSizePolicy(sizePolicy2)
+
+        self.verticalLayout_6.addWidget(self.device_combobox)
+
+
+        self.horizontalLayout_2.addLayout(self.verticalLayout_6)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_3)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_2)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.horizontalLayout_3.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_3.addItem(self.horizontalSpacer)
+
+        self.continue_button = QPushButton(self.device_selection_page)
+        self.continue_button.setObjectName(u"continue_button")
+        sizePolicy3 = QSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
+        sizePolicy3.setHorizontalStretch(0)
+        sizePolicy3.setVerticalStretch(0)
+        sizePolicy3.setHeightForWidth(self.continue_button.sizePolicy().hasHeightForWidth())
+        self.continue_button.setSizePolicy(sizePolicy3)
+
+        self.horizontalLayout_3.addWidget(self.continue_button)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_3)
+
+        self.stackedWidget.addWidget(self.device_selection_page)
+        self.poe_table_page = QWidget()
+        self.poe_table_page.setObjectName(u"poe_table_page")
+        self.verticalLayout_4 = QVBoxLayout(self.poe_table_page)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.poe_table_view = QTableView(self.poe_table_page)
+        self.poe_table_view.setObjectName(u"poe_table_view")
+        self.poe_table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.poe_table_view.setAlternatingRowColors(True)
+        self.poe_table_view.setSortingEnabled(True)
+
+        self.verticalLayout_4.addWidget(self.poe_table_view)
+
+        self.stackedWidget.addWidget(self.poe_table_page)
+
+        self.verticalLayout.addWidget(self.stackedWidget)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1128, 33))
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+
+        self.stackedWidget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"MainWindow", None))
+        self.label.setText(QCoreApplication.translate("MainWindow", u"Passing Voltage", None))
+        self.passing_voltage_input.setSuffix(QCoreApplication.translate("MainWindow", u"V", None))
+        self.label_2.setText(QCoreApplication.translate("MainWindow", u"Passing Power", None))
+        self.passing_power_input.setSuffix(QCoreApplication.translate("MainWindow", u"W", None))
+        self.label_3.setText(QCoreApplication.translate("MainWindow", u"Device", None))
+        self.device_combobox.setItemText(0, QCoreApplication.translate("MainWindow", u"Select Device", None))
+
+        self.continue_button.setText(QCoreApplication.translate("MainWindow", u"Start", None))
+    # retranslateUi
+
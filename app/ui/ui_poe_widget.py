@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'poe_widget.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QGridLayout, QLabel, QSizePolicy,
+    QWidget)
+from . import resources_rc
+
+class Ui_PoeWidget(object):
+    def setupUi(self, PoeWidget):
+        if not PoeWidget.objectName():
+            PoeWidget.setObjectName(u"PoeWidget")
+        PoeWidget.resize(173, 116)
+        self.gridLayout = QGridLayout(PoeWidget)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.current_value = QLabel(PoeWidget)
+        self.current_value.setObjectName(u"current_value")
+        self.current_value.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.current_value, 3, 1, 1, 1)
+
+        self.current_max = QLabel(PoeWidget)
+        self.current_max.setObjectName(u"current_max")
+        self.current_max.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.current_max, 3, 2, 1, 1)
+
+        self.voltage_value = QLabel(PoeWidget)
+        self.voltage_value.setObjectName(u"voltage_value")
+        self.voltage_value.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.voltage_value, 2, 1, 1, 1)
+
+        self.power_max = QLabel(PoeWidget)
+        self.power_max.setObjectName(u"power_max")
+        self.power_max.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.power_max, 4, 2, 1, 1)
+
+        self.voltage_max = QLabel(PoeWidget)
+        self.voltage_max.setObjectName(u"voltage_max")
+        self.voltage_max.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.voltage_max, 2, 2, 1, 1)
+
+        self.power_value = QLabel(PoeWidget)
+        self.power_value.setObjectName(u"power_value")
+        self.power_value.setAlignment(Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing|Qt.AlignmentFlag.AlignVCenter)
+
+        self.gridLayout.addWidget(self.power_value, 4, 1, 1, 1)
+
+        self.current_label = QLabel(PoeWidget)
+        self.current_label.setObjectName(u"current_label")
+
+        self.gridLayout.addWidget(self.current_label, 3, 0, 1, 1)
+
+        self.power_label = QLabel(PoeWidget)
+        self.power_label.setObjectName(u"power_label")
+
+        self.gridLayout.addWidget(self.power_label, 4, 0, 1, 1)
+
+        self.voltage_label = QLabel(PoeWidget)
+        self.voltage_label.setObjectName(u"voltage_label")
+
+        self.gridLayout.addWidget(self.voltage_label, 2, 0, 1, 1)
+
+        self.maximum_header_label = QLabel(PoeWidget)
+        self.maximum_header_label.setObjectName(u"maximum_header_label")
+        self.maximum_header_label.setAlignment(Qt.AlignmentFlag.AlignBottom|Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing)
+
+        self.gridLayout.addWidget(self.maximum_header_label, 1, 2, 1, 1)
+
+        self.current_header_label = QLabel(PoeWidget)
+        self.current_header_label.setObjectName(u"current_header_label")
+        self.current_header_label.setAlignment(Qt.AlignmentFlag.AlignBottom|Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing)
+
+        self.gridLayout.addWidget(self.current_header_label, 1, 1, 1, 1)
+
+        self.lan_id_label = QLabel(PoeWidget)
+        self.lan_id_label.setObjectName(u"lan_id_label")
+        font = QFont()
+        font.setPointSize(18)
+        font.setBold(True)
+        self.lan_id_label.setFont(font)
+        self.lan_id_label.setAlignment(Qt.AlignmentFlag.AlignBottom|Qt.AlignmentFlag.AlignRight|Qt.AlignmentFlag.AlignTrailing)
+
+        self.gridLayout.addWidget(self.lan_id_label, 1, 0, 1, 1)
+
+
+        self.retranslateUi(PoeWidget)
+
+        QMetaObject.connectSlotsByName(PoeWidget)
+    # setupUi
+
+    def retranslateUi(self, PoeWidget):
+        PoeWidget.setWindowTitle(QCoreApplication.translate("PoeWidget", u"Form", None))
+        self.current_value.setText("")
+        self.current_max.setText("")
+        self.voltage_value.setText("")
+        self.power_max.setText("")
+        self.voltage_max.setText("")
+        self.power_value.setText("")
+        self.current_label.setText(QCoreApplication.translate("PoeWidget", u"Current", None))
+        self.power_label.setText(QCoreApplication.translate("PoeWidget", u"Power", None))
+        self.voltage_label.setText(QCoreApplication.translate("PoeWidget", u"Voltage", None))
+        self.maximum_header_label.setText(QCoreApplication.translate("PoeWidget", u"Maximum", None))
+        self.current_header_label.setText(QCoreApplication.translate("PoeWidget", u"Current", None))
+        self.lan_id_label.setText(QCoreApplication.translate("PoeWidget", u"LAN", None))
+    # retranslateUi
+
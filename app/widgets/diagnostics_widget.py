@@ -0,0 +1,78 @@
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QHideEvent, QShowEvent
+from PySide6.QtWidgets import (
+    QHBoxLayout,
+    QHeaderView,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from app import instrumentation
+
+_COLUMNS = ("Count", "Total", "Mean", *(f"p{percent:g}" for percent in instrumentation.PERCENTILES), "Max")
+# Milliseconds between refreshes while the page is shown
+REFRESH_INTERVAL: int = 1000
+
+
+class DiagnosticsWidget(QWidget):
+    """The instrumentation histograms and counters, refreshed while shown."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+
+        self._table = QTableWidget(0, len(_COLUMNS))
+        self._table.setHorizontalHeaderLabels(_COLUMNS)
+        self._table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self._reset)
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(reset_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self._table)
+        layout.addLayout(buttons)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(REFRESH_INTERVAL)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+    def refresh(self) -> None:
+        rows: list[tuple[str, list[str]]] = []
+        for histogram in instrumentation.histograms():
+            latencies = [histogram.total, histogram.mean]
+            latencies += [histogram.percentile(percent) for percent in instrumentation.PERCENTILES]
+            latencies.append(histogram.max)
+            rows.append(
+                (histogram.name, [str(histogram.count)] + [instrumentation.format_latency(value) for value in latencies])
+            )
+        rows += [(name, [str(value)]) for name, value in instrumentation.counters().items()]
+
+        self._table.setRowCount(len(rows))
+        self._table.setVerticalHeaderLabels([name for name, _ in rows])
+        for row, (_, values) in enumerate(rows):
+            for col in range(len(_COLUMNS)):
+                text = values[col] if col < len(values) else ""
+                item = self._table.item(row, col)
+                if item is None:
+                    self._table.setItem(row, col, QTableWidgetItem(text))
+                elif item.text() != text:
+                    item.setText(text)
+
+    def _reset(self) -> None:
+        instrumentation.reset()
+        self.refresh()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        self.refresh()
+        self._refresh_timer.start()
+        return super().showEvent(event)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        self._refresh_timer.stop()
+        return super().hideEvent(event)
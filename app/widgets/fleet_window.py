@@ -0,0 +1,46 @@
+from PySide6.QtCore import QSettings, Qt
+from PySide6.QtGui import QCloseEvent
+from PySide6.QtWidgets import QApplication, QHeaderView, QMainWindow, QSplitter, QTableView
+
+from app.fleet import FleetSupervisor
+from app.models.fleet_table_model import FleetTableModel, FleetWorkerModel
+
+
+class FleetWindow(QMainWindow):
+    """The workers of a fleet above the ports of all its units."""
+
+    def __init__(self, supervisor: FleetSupervisor) -> None:
+        super().__init__()
+        self._supervisor = supervisor
+
+        self.setWindowTitle(
+            f"{QApplication.applicationDisplayName()} - {QApplication.applicationVersion()} - "
+            f"{len(supervisor.status)} units"
+        )
+
+        self._worker_view = QTableView()
+        self._worker_view.setModel(FleetWorkerModel(supervisor, self))
+        self._worker_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+
+        self._port_view = QTableView()
+        self._port_view.setModel(FleetTableModel(supervisor, self))
+        self._port_view.setAlternatingRowColors(True)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(self._worker_view)
+        splitter.addWidget(self._port_view)
+        splitter.setStretchFactor(1, 1)
+        self.setCentralWidget(splitter)
+
+        supervisor.finished.connect(self._finished)
+
+        settings = QSettings()
+        self.restoreGeometry(settings.value("fleet_geometry"))
+
+    def _finished(self, passed: bool) -> None:
+        self.statusBar().showMessage("Every unit passed" if passed else "Not every unit passed")
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self._supervisor.stop()
+        QSettings().setValue("fleet_geometry", self.saveGeometry())
+        return super().closeEvent(event)
@@ -1,30 +1,56 @@
+import logging
 import os
-import xml.etree.ElementTree as ET
-
-from PySide6.QtCore import QSettings, Qt, QTimer, QCoreApplication
+import typing
+
+from PySide6.QtCore import (
+    QCoreApplication,
+    QMetaObject,
+    QModelIndex,
+    QSettings,
+    QStandardPaths,
+    Qt,
+    QThread,
+    QThreadPool,
+    Signal,
+)
 from PySide6.QtGui import QCloseEvent
-from PySide6.QtWidgets import QApplication, QMainWindow
-from rssdk import RsPoe
+from PySide6.QtWidgets import QApplication, QHBoxLayout, QMainWindow, QScrollArea, QWidget
 
-from app.bitinterface import BitInterface, ErrorSeverity, PluginStatus
+from app import instrumentation
+from app.bitinterface import BitInterface, PluginStatus
+from app.devices import INDEX_FILENAME, DeviceCatalog
+from app.models import DEFAULT_HISTORY_CAPACITY, DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+from app.results import PortResult, send_results, send_thresholds
 from app.ui.ui_mainwindow import Ui_MainWindow
-from app.models.poe_port_model import PoePortModel
-from app.models.poe_table_model import PoeTableModel
+from app.widgets.port_overview import PortOverview
+
+if typing.TYPE_CHECKING:
+    from app.acquisition.sampler import PoeSampler
+    from app.acquisition.snapshot import Snapshot
+    from app.models.poe_port_model import PoePortModel
+    from app.models.poe_table_model import PoeTableModel
+    from app.telemetry import TelemetryWriter
+    from app.widgets.trend_chart import TrendChart
+
+logger = logging.getLogger(__name__)
 
 
 class MainWindow(QMainWindow):
-    _poe = RsPoe()
+    # Emitted from a thread pool thread when the device catalog changed on disk
+    _devices_refreshed = Signal(list)
+
     _bit_interface: BitInterface | None = None
-    _last_port_updated: int = 0
+    _sampler: "PoeSampler | None" = None
+    # Created with the sampler, the table page is not shown before that
+    _poe_table_model: "PoeTableModel | None" = None
+    # Live measurements for other tools, when POE_TESTER_TELEMETRY names a segment
+    _telemetry: "TelemetryWriter | None" = None
 
     def __init__(self, args: list[str]) -> None:
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
-        self._poe_table_model = PoeTableModel()
-        self.ui.poe_table_view.setModel(self._poe_table_model)
-
         if args and args[0].startswith("BIT_PLUGIN_INT"):
             self._bit_interface = BitInterface(args[0], "PoE Tester")
             # We only use the read and verify operations
@@ -32,8 +58,11 @@ class MainWindow(QMainWindow):
             self._bit_interface.verify_operations = 0
             self._bit_interface.set_status(PluginStatus.PLUGIN_STARTUP, "Starting")
 
-        self._timer = QTimer(interval=10, parent=self)
-        self._timer.timeout.connect(self._update_ports)
+        self._sampler_thread = QThread(self)
+        self._samples = 0
+        # The ports published as telemetry and their rows in the model's store
+        self._published_ports: list[int] = []
+        self._published_rows: typing.Sequence[int] = []
 
         window_title = f"{QApplication.applicationDisplayName()} - {QApplication.applicationVersion()}"
         self.setWindowTitle(window_title)
@@ -48,6 +77,43 @@ class MainWindow(QMainWindow):
         )
         self.ui.continue_button.clicked.connect(self._continue_clicked)
 
+        # A grid of every port above the table, for watching many ports at once
+        self._port_overview = PortOverview()
+        self._port_overview_area = QScrollArea()
+        self._port_overview_area.setWidgetResizable(True)
+        self._port_overview_area.setWidget(self._port_overview)
+        self._port_overview_area.setVisible(False)
+        self.ui.poe_table_page.layout().insertWidget(0, self._port_overview_area)
+
+        # Trends of the current port below the table, the charts are added with the model
+        self._trend_charts: list["TrendChart"] = []
+        self._trend_panel = QWidget()
+        QHBoxLayout(self._trend_panel).setContentsMargins(0, 0, 0, 0)
+        self._trend_panel.setVisible(False)
+        self.ui.poe_table_page.layout().addWidget(self._trend_panel)
+
+        view_menu = self.ui.menubar.addMenu("&View")
+        self._port_overview_action = view_menu.addAction("Port &overview")
+        self._port_overview_action.setCheckable(True)
+        self._port_overview_action.toggled.connect(self._port_overview_area.setVisible)
+        self._port_trends_action = view_menu.addAction("Port &trends")
+        self._port_trends_action.setCheckable(True)
+        self._port_trends_action.toggled.connect(self._trend_panel.setVisible)
+
+        if instrumentation.ENABLED:
+            from app.widgets.diagnostics_widget import DiagnosticsWidget
+
+            self._event_loop_monitor = instrumentation.EventLoopMonitor("gui.event_loop_lag", parent=self)
+            self._event_loop_monitor.start()
+
+            # Shown instead of the current page until the action is unchecked again
+            self._diagnostics_page = DiagnosticsWidget()
+            self._page_before_diagnostics = self.ui.stackedWidget.currentWidget()
+            self.ui.stackedWidget.addWidget(self._diagnostics_page)
+            diagnostics_action = view_menu.addAction("&Diagnostics")
+            diagnostics_action.setCheckable(True)
+            diagnostics_action.toggled.connect(self._show_diagnostics)
+
         if self.is_frozen():
             device_file_path = os.path.join(
                 QCoreApplication.applicationDirPath(), "devices"
@@ -55,83 +121,170 @@ class MainWindow(QMainWindow):
         else:
             device_file_path = "devices"
 
-        for filename in os.listdir(device_file_path):
-            filepath = os.path.join(device_file_path, filename)
+        # Fill the list from the cached index right away, then check the
+        # device files for changes in the background
+        cache_dir = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        prebuilt_index = os.path.join(QCoreApplication.applicationDirPath(), INDEX_FILENAME) if self.is_frozen() else None
+        self._device_catalog = DeviceCatalog(device_file_path, os.path.join(cache_dir, INDEX_FILENAME), prebuilt_index)
+        self._device_catalog.load()
+        self._populate_devices(self._device_catalog.devices())
 
-            try:
-                tree = ET.parse(filepath)
-                root = tree.getroot()
-                if root.tag == "computer":
-                    computer_name = root.attrib.get("id")
-                    poe_element = root.find("poe_controller")
-                    if isinstance(poe_element, ET.Element) and poe_element.findall(
-                        "port"
-                    ):
-                        name = computer_name or filename
-                        self.ui.device_combobox.addItem(name.upper(), filepath)
-
-            except FileNotFoundError:
-                pass
-            except ET.ParseError:
-                pass
+        self._devices_refreshed.connect(self._populate_devices)
+        self._device_refresh_pool = QThreadPool(self)
+        self._device_refresh_pool.start(self._refresh_device_catalog)
 
         self._load_settings()
 
+    def _show_diagnostics(self, show: bool) -> None:
+        if show:
+            self._page_before_diagnostics = self.ui.stackedWidget.currentWidget()
+            self.ui.stackedWidget.setCurrentWidget(self._diagnostics_page)
+        else:
+            self.ui.stackedWidget.setCurrentWidget(self._page_before_diagnostics)
+
+    def _refresh_device_catalog(self) -> None:
+        if self._device_catalog.refresh():
+            self._devices_refreshed.emit(self._device_catalog.devices())
+
+    def _populate_devices(self, devices: list[tuple[str, str]]) -> None:
+        if self._sampler:
+            # A device has already been chosen
+            return
+
+        combobox = self.ui.device_combobox
+        current = [(combobox.itemText(i), combobox.itemData(i)) for i in range(1, combobox.count())]
+        if current == devices:
+            return
+
+        selected = combobox.currentData()
+        combobox.blockSignals(True)
+        # Item 0 is the "Select Device" placeholder
+        while combobox.count() > 1:
+            combobox.removeItem(1)
+        for name, path in devices:
+            combobox.addItem(name, path)
+        combobox.setCurrentIndex(max(combobox.findData(selected), 0) if selected else 0)
+        combobox.blockSignals(False)
+        self._device_combobox_selection_changed(combobox.currentIndex())
+
     def _device_combobox_selection_changed(self, index: int) -> None:
         self.ui.continue_button.setEnabled(index != 0)
 
     def _continue_clicked(self) -> None:
         self.ui.continue_button.setEnabled(False)
-        self._poe_table_model.passing_power = self.ui.passing_power_input.value()
-        self._poe_table_model.passing_voltage = self.ui.passing_voltage_input.value()
+
+        # NumPy and the acquisition code load here rather than at startup, so
+        # the window shows as soon as possible
+        from app.models.poe_table_model import PoeTableModel
+        from app.widgets.trend_chart import TrendChart
+
+        self._poe_table_model = PoeTableModel(history_capacity=DEFAULT_HISTORY_CAPACITY)
+        self._poe_table_model.setThresholds(self.ui.passing_voltage_input.value(), self.ui.passing_power_input.value())
+        self.ui.poe_table_view.setModel(self._poe_table_model)
+        self.ui.poe_table_view.selectionModel().currentRowChanged.connect(self._current_port_changed)
+
+        self._trend_charts = [TrendChart("voltage", "V", "Voltage"), TrendChart("power", "W", "Power")]
+        thresholds = (self._poe_table_model.passing_voltage, self._poe_table_model.passing_power)
+        for chart, threshold in zip(self._trend_charts, thresholds):
+            chart.set_trends(self._poe_table_model.trends)
+            chart.set_threshold(threshold)
+            self._trend_panel.layout().addWidget(chart)
 
         if self._bit_interface:
-            self._bit_interface.set_error(
-                ErrorSeverity.ERRORNONE,
-                f"Using the following thresholds: {self._poe_table_model.passing_voltage:.2f}V, {self._poe_table_model.passing_power:.2f}W",
-            )
+            send_thresholds(self._bit_interface, self._poe_table_model.passing_voltage, self._poe_table_model.passing_power)
 
         device_file = self.ui.device_combobox.currentData(role=Qt.ItemDataRole.UserRole)
-        self._poe.setXmlFile(device_file)
+        self._start_sampler(device_file)
+        self.ui.stackedWidget.setCurrentWidget(self.ui.poe_table_page)
 
-        for port in self._poe.getPortList():
-            if port == 255:
-                continue
+    def _start_sampler(self, device_file: str) -> None:
+        from app.acquisition.sampler import PoeSampler
+        from app.telemetry import DEFAULT_TELEMETRY, TelemetryWriter
 
-            port_model = PoePortModel(port)
-            self._poe_table_model.addPort(port_model)
+        # The sampler owns the SDK and lives on its own thread, samples come
+        # back to the GUI thread as queued signals. The SDK itself is only
+        # loaded once the sampler thread starts.
+        self._sampler = PoeSampler(device_file)
+        self._sampler.passing_voltage = self._poe_table_model.passing_voltage
+        self._sampler.passing_power = self._poe_table_model.passing_power
+        self._sampler.moveToThread(self._sampler_thread)
 
-        self._timer.start()
-        self.ui.stackedWidget.setCurrentWidget(self.ui.poe_table_page)
-        self._update_ports()
+        self._sampler_thread.started.connect(self._sampler.start)
+        self._sampler_thread.finished.connect(self._sampler.deleteLater)
+        self._sampler.ports_ready.connect(self._ports_ready)
+        self._sampler.snapshot_ready.connect(self._update_snapshot)
 
-    def _update_ports(self) -> None:
-        if self._last_port_updated >= len(self._poe_table_model.ports):
-            self._last_port_updated = 0
+        if DEFAULT_TELEMETRY:
+            try:
+                self._telemetry = TelemetryWriter(DEFAULT_TELEMETRY, create=True)
+            except FileExistsError:
+                logger.error("Not publishing telemetry, another run publishes to %s", DEFAULT_TELEMETRY)
 
-        port_model = self._poe_table_model.ports[self._last_port_updated]
-        port_model.voltage = self._poe.getPortVoltage(port_model.id)
-        QCoreApplication.processEvents()
-        if port_model.voltage >= self._poe_table_model.passing_voltage:
-            port_model.power = self._poe.getPortPower(port_model.id)
-            QCoreApplication.processEvents()
+        self._sampler_thread.start()
 
-        if self._bit_interface:
-            self._bit_interface.cycle += 1
-            self._bit_interface.read_operations += 1
-            self._bit_interface.verify_operations += 1
+    def _stop_sampler(self) -> None:
+        if self._sampler_thread.isRunning():
+            # Let the sampler finish its work (e.g. recordings) on its own thread
+            QMetaObject.invokeMethod(self._sampler, "stop", Qt.ConnectionType.BlockingQueuedConnection)
+            self._sampler_thread.quit()
+            self._sampler_thread.wait()
+        self._sampler = None
 
+    def _ports_ready(self, ports: list[int]) -> None:
+        import numpy as np
 
-            all_passing = True
-            for port_model in self._poe_table_model.ports:
-                if not self._poe_table_model.is_port_passing(port_model.id):
-                    all_passing = False
-                    break
+        from app.models.poe_port_model import PoePortModel
 
-            if all_passing:
+        for port in ports:
+            port_model = PoePortModel(port)
+            self._poe_table_model.addPort(port_model)
+            self._port_overview.add_port(port_model)
+        self._published_ports = [port.id for port in self._poe_table_model.ports]
+        if self._poe_table_model.ports and self._trend_charts[0].port is None:
+            self._show_trends(self._poe_table_model.ports[0])
+        # Ports are added to the store in order, one row each
+        self._published_rows = np.arange(len(self._published_ports))
+
+    def _current_port_changed(self, current: QModelIndex, previous: QModelIndex) -> None:
+        if current.isValid():
+            self._show_trends(self._poe_table_model.ports[current.row()])
+
+    def _show_trends(self, port: "PoePortModel") -> None:
+        for chart in self._trend_charts:
+            chart.set_port(port)
+
+    def _update_snapshot(self, snapshot: "Snapshot") -> None:
+        if self._sampler is None:
+            # Sweeps still queued after the sampler was stopped
+            return
+
+        self._poe_table_model.addSnapshot(snapshot)
+        samples = len(snapshot)
+        self._samples += samples
+        self._publish()
+
+        if self._bit_interface:
+            self._bit_interface.cycle += samples
+            self._bit_interface.read_operations += samples
+            self._bit_interface.verify_operations += samples
+
+            if self._poe_table_model.allPassing():
                 self.close()
 
-        self._last_port_updated += 1
+    def _publish(self, passed: bool | None = None) -> None:
+        """Publishes the measurements, with the verdict once there is one."""
+        if not self._telemetry:
+            return
+
+        from app.telemetry import WorkerState
+
+        if passed is None:
+            state = WorkerState.RUNNING
+        else:
+            state = WorkerState.PASSED if passed else WorkerState.FAILED
+        self._telemetry.publish(
+            self._published_ports, self._poe_table_model.store, self._published_rows, state, self._samples
+        )
 
     def _load_settings(self) -> None:
         settings = QSettings()
@@ -141,46 +294,49 @@ class MainWindow(QMainWindow):
         passing_voltage = settings.value("passing_voltage")
         passing_power = settings.value("passing_power")
 
-        if isinstance(passing_voltage, (float, str)):
-            self._poe_table_model.passing_voltage = float(passing_voltage)
-        if isinstance(passing_power, (float, str)):
-            self._poe_table_model.passing_power = float(passing_power)
-
-        self.ui.passing_voltage_input.setValue(self._poe_table_model.passing_voltage)
-        self.ui.passing_power_input.setValue(self._poe_table_model.passing_power)
+        self.ui.passing_voltage_input.setValue(
+            float(passing_voltage) if isinstance(passing_voltage, (float, str)) else DEFAULT_PASSING_VOLTAGE
+        )
+        self.ui.passing_power_input.setValue(
+            float(passing_power) if isinstance(passing_power, (float, str)) else DEFAULT_PASSING_POWER
+        )
+        self._port_overview_action.setChecked(settings.value("port_overview", False, type=bool))
+        self._port_trends_action.setChecked(settings.value("port_trends", False, type=bool))
 
     def _save_settings(self) -> None:
         settings = QSettings()
         settings.setValue("geometry", self.saveGeometry())
         settings.setValue("state", self.saveState())
-        settings.setValue("passing_voltage", self._poe_table_model.passing_voltage)
-        settings.setValue("passing_power", self._poe_table_model.passing_power)
+        settings.setValue("passing_voltage", self.ui.passing_voltage_input.value())
+        settings.setValue("passing_power", self.ui.passing_power_input.value())
+        settings.setValue("port_overview", self._port_overview_action.isChecked())
+        settings.setValue("port_trends", self._port_trends_action.isChecked())
+        # Also the device of headless runs that are not given one
+        if self.ui.device_combobox.currentIndex() != 0:
+            settings.setValue("device", self.ui.device_combobox.currentData())
 
     def closeEvent(self, event: QCloseEvent) -> None:
+        self._stop_sampler()
+        self._device_refresh_pool.waitForDone()
+
+        if self._telemetry:
+            self._publish(self._poe_table_model.allPassing())
+            self._telemetry.close()
+            self._telemetry = None
+
         if self._bit_interface:
-            failed_ports = []
-            for port_model in self._poe_table_model.ports:
-                v = port_model.max_voltage
-                c = port_model.max_current
-                p = port_model.max_power
-                self._bit_interface.set_error(
-                    ErrorSeverity.ERRORNONE,
-                    f"LAN {port_model.id}: Voltage: {v:.2f}V, Current: {c:.2f}A, Power: {p:.2f}W",
-                    wait=True,
-                )
-
-                if not self._poe_table_model.is_port_passing(port_model.id):
-                    failed_ports.append(port_model.id)
-
-            if failed_ports:
-                self._bit_interface.set_error(
-                    ErrorSeverity.ERRORCRITICAL,
-                    f"LAN(s) {", ".join(map(str, failed_ports))} below threshold",
-                    wait=True,
-                )
-
-            self._bit_interface.set_pretest_complete(wait=True)
+            model = self._poe_table_model
+            send_results(
+                self._bit_interface,
+                [
+                    PortResult(port.id, port.max_voltage, port.max_current, port.max_power, port.passing)
+                    for port in (model.ports if model else ())
+                ],
+            )
+            self._bit_interface.close()
+            self._bit_interface = None
 
+        instrumentation.log_summary()
         self._save_settings()
         return super().closeEvent(event)
 
@@ -0,0 +1,145 @@
+import typing
+
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPaintEvent, QPen, QPixmap, QResizeEvent
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+from .status_widget import indicator_pixmap
+
+if typing.TYPE_CHECKING:
+    from app.models.poe_port_model import PoePortModel
+
+# Size of a port's tile and the gap between tiles, in pixels
+TILE_SIZE = QSize(112, 52)
+TILE_SPACING: int = 4
+INDICATOR_SIZE = QSize(14, 14)
+
+_PASSING_COLOR = QColor(Qt.GlobalColor.green)
+_FAILING_COLOR = QColor(Qt.GlobalColor.red)
+_BORDER_COLOR = QColor(Qt.GlobalColor.black)
+
+
+class PortOverview(QWidget):
+    """
+    Every port of a device drawn as a tile in a grid, meant for a wall display
+    of many ports at once.
+
+    Unlike a PoeWidget per port there are no child widgets: all tiles are drawn
+    in one paint pass. A change of a port only marks its own tile for
+    repainting, Qt merges the marked tiles into one dirty region per frame and
+    only the tiles in that region are drawn again.
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._ports: list["PoePortModel"] = []
+        self._indexes: dict[int, int] = {}
+        self._columns = 1
+
+        self._tile_brush = QBrush(self.palette().base())
+        self._tile_pen = QPen(self.palette().mid().color())
+        self._text_pen = QPen(self.palette().text().color())
+        self._id_font = QFont(self.font())
+        self._id_font.setBold(True)
+
+        policy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+        policy.setHeightForWidth(True)
+        self.setSizePolicy(policy)
+
+    def add_port(self, port: "PoePortModel") -> None:
+        if port.id in self._indexes:
+            raise ValueError(f"LAN {port.id} is already in the overview")
+
+        self._indexes[port.id] = len(self._ports)
+        self._ports.append(port)
+        port.value_changed.connect(self._port_changed)
+        self.updateGeometry()
+        self.update(self._tile_rect(len(self._ports) - 1))
+
+    def clear(self) -> None:
+        for port in self._ports:
+            port.value_changed.disconnect(self._port_changed)
+        self._ports.clear()
+        self._indexes.clear()
+        self.updateGeometry()
+        self.update()
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        return self._rows(self._column_count(width)) * (TILE_SIZE.height() + TILE_SPACING) + TILE_SPACING
+
+    def sizeHint(self) -> QSize:
+        width = 8 * (TILE_SIZE.width() + TILE_SPACING) + TILE_SPACING
+        return QSize(width, self.heightForWidth(width))
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(TILE_SIZE.width() + 2 * TILE_SPACING, TILE_SIZE.height() + 2 * TILE_SPACING)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        columns = self._column_count(event.size().width())
+        if columns != self._columns:
+            self._columns = columns
+            self.updateGeometry()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        if not self._ports:
+            return
+
+        painter = QPainter(self)
+        region = event.region()
+        ratio = self.devicePixelRatioF()
+        passing_pixmap = indicator_pixmap(_PASSING_COLOR, _BORDER_COLOR, 1, INDICATOR_SIZE, ratio)
+        failing_pixmap = indicator_pixmap(_FAILING_COLOR, _BORDER_COLOR, 1, INDICATOR_SIZE, ratio)
+
+        # Only the rows of tiles that overlap the dirty region are visited
+        pitch = TILE_SIZE.height() + TILE_SPACING
+        bounds = region.boundingRect()
+        first_row = max(bounds.top() // pitch, 0)
+        last_row = min(bounds.bottom() // pitch, self._rows(self._columns) - 1)
+
+        for index in range(first_row * self._columns, min((last_row + 1) * self._columns, len(self._ports))):
+            rect = self._tile_rect(index)
+            if region.intersects(rect):
+                port = self._ports[index]
+                self._paint_tile(painter, port, rect, passing_pixmap if port.passing else failing_pixmap)
+
+    def _paint_tile(self, painter: QPainter, port: "PoePortModel", rect: QRect, indicator: QPixmap) -> None:
+        painter.setPen(self._tile_pen)
+        painter.setBrush(self._tile_brush)
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+
+        inner = rect.adjusted(6, 4, -6, -4)
+        painter.drawPixmap(inner.right() - INDICATOR_SIZE.width(), inner.top(), indicator)
+
+        painter.setPen(self._text_pen)
+        painter.setFont(self._id_font)
+        painter.drawText(inner, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, f"LAN {port.id}")
+        painter.setFont(self.font())
+        painter.drawText(
+            inner,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom,
+            f"{port.voltage:.2f}V  {port.power:.2f}W",
+        )
+
+    def _port_changed(self, port_id: int) -> None:
+        index = self._indexes.get(port_id)
+        if index is not None:
+            self.update(self._tile_rect(index))
+
+    def _tile_rect(self, index: int) -> QRect:
+        row, column = divmod(index, self._columns)
+        return QRect(
+            TILE_SPACING + column * (TILE_SIZE.width() + TILE_SPACING),
+            TILE_SPACING + row * (TILE_SIZE.height() + TILE_SPACING),
+            TILE_SIZE.width(),
+            TILE_SIZE.height(),
+        )
+
+    def _column_count(self, width: int) -> int:
+        return max(1, (width - TILE_SPACING) // (TILE_SIZE.width() + TILE_SPACING))
+
+    def _rows(self, columns: int) -> int:
+        return -(-len(self._ports) // columns)
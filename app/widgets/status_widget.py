@@ -1,7 +1,48 @@
+import functools
+
 from PySide6.QtCore import Qt, QRectF, QSize
-from PySide6.QtGui import QColor, QPainter, QPen, QBrush
+from PySide6.QtGui import QColor, QPainter, QPen, QBrush, QPixmap
 from PySide6.QtWidgets import QWidget
 
+# Most indicator pixmaps kept, there is one per color, border and size in use
+INDICATOR_CACHE_SIZE: int = 64
+
+
+def indicator_pixmap(color: QColor, border_color: QColor, border_width: int, size: QSize, ratio: float = 1.0) -> QPixmap:
+    """
+    Returns a round indicator drawn with these colors and size, for a device
+    pixel ratio. Every combination is only drawn once and then shared.
+    """
+    return _draw_indicator(color.rgba(), border_color.rgba(), border_width, size.width(), size.height(), ratio)
+
+
+@functools.lru_cache(maxsize=INDICATOR_CACHE_SIZE)
+def _draw_indicator(color: int, border_color: int, border_width: int, width: int, height: int, ratio: float) -> QPixmap:
+    pixmap = QPixmap(round(width * ratio), round(height * ratio))
+    pixmap.setDevicePixelRatio(ratio)
+    pixmap.fill(Qt.transparent)
+
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+
+    # The offset from the rectangle edge for drawing the circle
+    offset = border_width / 2
+    circle_rect = QRectF(offset, offset, width - (offset * 2), height - (offset * 2))
+
+    # Draw border
+    pen = QPen(QColor.fromRgba(border_color))
+    pen.setWidth(border_width)
+    painter.setPen(pen)
+    painter.setBrush(Qt.NoBrush)
+    painter.drawEllipse(circle_rect)
+
+    # Draw indicator
+    painter.setPen(Qt.NoPen)  # No outline for the fill
+    painter.setBrush(QBrush(QColor.fromRgba(color)))
+    painter.drawEllipse(circle_rect)
+    painter.end()
+    return pixmap
+
 
 class StatusIndicator(QWidget):
     """
@@ -43,28 +84,13 @@ class StatusIndicator(QWidget):
       self.update()
 
     def paintEvent(self, event) -> None:
-        """Paints the round indicator."""
+        """Paints the round indicator from a pixmap shared by every indicator that looks the same."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-
-        # Calculate the rectangle for the circle
-        rect = QRectF(0, 0, self.width(), self.height())
-        
-        #calculate the offset from the rectangle edge for drawing the circle
-        offset = self._border_width / 2
-        circle_rect = QRectF(rect.x() + offset, rect.y() + offset, rect.width() - (offset * 2), rect.height() - (offset * 2))
-
-        # Draw border
-        pen = QPen(self._border_color)
-        pen.setWidth(self._border_width)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(circle_rect)
-
-        # Draw indicator
-        painter.setPen(Qt.NoPen)  # No outline for the fill
-        painter.setBrush(QBrush(self._color))
-        painter.drawEllipse(circle_rect)
+        painter.drawPixmap(
+            0,
+            0,
+            indicator_pixmap(self._color, self._border_color, self._border_width, self.size(), self.devicePixelRatioF()),
+        )
     
     def sizeHint(self) -> QSize:
       return QSize(24, 24)
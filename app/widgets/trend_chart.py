@@ -0,0 +1,156 @@
+import typing
+
+import numpy as np
+from PySide6.QtCore import QRect, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QPainter, QPaintEvent, QPen
+from PySide6.QtWidgets import QSizePolicy, QWidget
+
+if typing.TYPE_CHECKING:
+    from app.models.poe_port_model import PoePortModel
+    from app.models.trend_buffer import TrendBuffer
+
+# Space around the plot for the title and the axis labels, in pixels
+_MARGINS = (52, 20, 8, 18)
+# Share of the value range added above and below the trend
+_PADDING = 0.05
+
+_TREND_COLOR = QColor(Qt.GlobalColor.darkCyan)
+_THRESHOLD_COLOR = QColor(Qt.GlobalColor.red)
+
+
+def _duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02}:{seconds:02}"
+
+
+class TrendChart(QWidget):
+    """
+    One field of a port over the whole run, drawn as the band between its
+    minimum and maximum per pixel column.
+
+    The band is read from a TrendBuffer, which holds a fixed number of buckets
+    per port however long the run, so a repaint costs the same after a
+    minute as after a day. Repaints follow the port's changes, and Qt merges
+    them into at most one per frame.
+    """
+
+    def __init__(self, field: str, unit: str, title: str, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._field = field
+        self._unit = unit
+        self._title = title
+        self._trends: "TrendBuffer | None" = None
+        self._port: "PoePortModel | None" = None
+        self._threshold: float | None = None
+
+        self._frame_pen = QPen(self.palette().mid().color())
+        self._text_pen = QPen(self.palette().text().color())
+        self._trend_brush = QBrush(_TREND_COLOR)
+        self._threshold_pen = QPen(_THRESHOLD_COLOR, 1, Qt.PenStyle.DashLine)
+
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
+
+    @property
+    def port(self) -> "PoePortModel | None":
+        return self._port
+
+    def set_trends(self, trends: "TrendBuffer | None") -> None:
+        self._trends = trends
+        self.update()
+
+    def set_port(self, port: "PoePortModel | None") -> None:
+        if self._port is not None:
+            self._port.value_changed.disconnect(self._port_changed)
+        self._port = port
+        if port is not None:
+            port.value_changed.connect(self._port_changed)
+        self.update()
+
+    def set_threshold(self, threshold: float | None) -> None:
+        """Draws a line at the value the port must reach."""
+        self._threshold = threshold
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        return QSize(400, 160)
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(160, 80)
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        painter = QPainter(self)
+        plot = self._plot_rect()
+        painter.setPen(self._frame_pen)
+        painter.drawRect(plot.adjusted(0, 0, -1, -1))
+
+        title = self._title if self._port is None else f"LAN {self._port.id} {self._title}"
+        painter.setPen(self._text_pen)
+        painter.drawText(
+            QRect(plot.left(), 0, plot.width(), plot.top()), Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title
+        )
+
+        if self._port is None or self._trends is None or plot.width() <= 0:
+            return
+        row = self._port.row
+        trend = self._trends.trend(row, self._field, plot.width())
+        filled = np.flatnonzero(~np.isnan(trend.minimum))
+        if not len(filled):
+            return
+
+        low, high = float(np.nanmin(trend.minimum)), float(np.nanmax(trend.maximum))
+        if self._threshold is not None:
+            low, high = min(low, self._threshold), max(high, self._threshold)
+        padding = (high - low) * _PADDING or 1.0
+        low, high = low - padding, high + padding
+
+        start, end = self._trends.span(row)
+        scale = plot.width() / max(end - start, 1e-9)
+        column_width = (end - start) / len(trend.start)
+
+        def y(values: np.ndarray | float) -> np.ndarray:
+            return plot.bottom() - (np.asarray(values) - low) * (plot.height() / (high - low))
+
+        # Every filled column is a bar reaching to the next filled one, which
+        # bridges the columns without samples of a port only read now and then.
+        # Bars also reach the range of the previous one, so the band is joined.
+        left = np.floor(plot.left() + (trend.start[filled] - start) * scale)
+        right = np.append(left[1:], np.ceil(left[-1] + column_width * scale))
+        top, bottom = y(trend.maximum[filled]), y(trend.minimum[filled])
+        top[1:], bottom[1:] = np.minimum(top[1:], bottom[:-1]), np.maximum(bottom[1:], top[:-1])
+        top, bottom = np.floor(top), np.ceil(bottom)
+        # Unlike an antialiased polygon, whole pixel bars cost the same however noisy the band
+        bars = [
+            QRect(x, y_top, width, height)
+            for x, y_top, width, height in zip(
+                left.astype(int).tolist(),
+                top.astype(int).tolist(),
+                np.maximum(right - left, 1).astype(int).tolist(),
+                np.maximum(bottom - top, 1).astype(int).tolist(),
+            )
+        ]
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._trend_brush)
+        painter.drawRects(bars)
+
+        if self._threshold is not None:
+            painter.setPen(self._threshold_pen)
+            threshold_y = round(float(y(self._threshold)))
+            painter.drawLine(plot.left(), threshold_y, plot.right(), threshold_y)
+
+        painter.setPen(self._text_pen)
+        label = QRect(0, plot.top(), plot.left() - 4, plot.height())
+        painter.drawText(label, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop, f"{high:.1f}{self._unit}")
+        painter.drawText(label, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignBottom, f"{low:.1f}{self._unit}")
+        painter.drawText(
+            QRect(plot.left(), plot.bottom(), plot.width(), self.height() - plot.bottom()),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            _duration(end - start),
+        )
+
+    def _port_changed(self, port_id: int) -> None:
+        self.update()
+
+    def _plot_rect(self) -> QRect:
+        left, top, right, bottom = _MARGINS
+        return self.rect().adjusted(left, top, -right, -bottom)
@@ -0,0 +1,64 @@
+"""
+Runs the benchmark suite without a display or hardware.
+
+    python -m benchmarks [--filter table_model] [--output results.json]
+"""
+import argparse
+import json
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from . import bench_agent, bench_bitinterface, bench_controllers, bench_devices, bench_history, bench_instrumentation, bench_log, bench_models, bench_port_state, bench_recorder, bench_replay, bench_scheduler, bench_telemetry, bench_trends, bench_widgets  # noqa: F401 (registers the benchmarks)
+from .harness import check_thresholds, run, write_results
+
+THRESHOLDS_FILE = os.path.join(os.path.dirname(__file__), "thresholds.json")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run benchmarks whose key contains this text")
+    parser.add_argument("--output", default="benchmark_results.json", help="file to write the results to")
+    parser.add_argument("--thresholds", default=THRESHOLDS_FILE, help="file with the maximum ns/op per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.1, help="minimum seconds per timing run")
+    parser.add_argument(
+        "--update-thresholds",
+        type=float,
+        metavar="HEADROOM",
+        help="write new thresholds from this run, multiplied by HEADROOM",
+    )
+    args = parser.parse_args()
+
+    # A widget application, as some benchmarks paint views
+    _app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    results = run(args.filter, args.min_time)
+
+    thresholds: dict[str, float] = {}
+    if os.path.exists(args.thresholds):
+        with open(args.thresholds) as file:
+            thresholds = json.load(file)
+
+    if args.update_thresholds:
+        thresholds.update({result.key: round(result.ns_per_op * args.update_thresholds, 1) for result in results})
+        with open(args.thresholds, "w") as file:
+            json.dump(dict(sorted(thresholds.items())), file, indent=2)
+            file.write("\n")
+
+    regressions = check_thresholds(results, thresholds)
+    write_results(args.output, results, regressions)
+
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['key']}: {regression['ns_per_op']:.1f} ns/op "
+            f"> {regression['threshold']:.1f} ns/op",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
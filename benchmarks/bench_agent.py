@@ -0,0 +1,53 @@
+import atexit
+import itertools
+import os
+
+import numpy as np
+
+from app.acquisition.agent import SampleRing, split_sweeps
+from app.acquisition.snapshot import Snapshot
+
+from .harness import benchmark
+
+_segment_ids = itertools.count()
+# Mapped segments cannot be closed by the garbage collector while views of them exist
+_rings: list[SampleRing] = []
+
+
+@atexit.register
+def _close_rings() -> None:
+    for ring in _rings:
+        ring.close()
+
+
+def make_sweep(ports: int) -> Snapshot:
+    rng = np.random.default_rng(0)
+    return Snapshot.from_arrays(
+        np.linspace(0.0, 0.001, ports),
+        np.arange(1, ports + 1),
+        rng.uniform(47, 53, ports),
+        rng.uniform(4, 7, ports),
+        48.0,
+        4.5,
+    )
+
+
+@benchmark("agent.ring", [{"ports": 16, "sweeps": 1}, {"ports": 16, "sweeps": 8}, {"ports": 256, "sweeps": 1}])
+def agent_ring(ports: int, sweeps: int):
+    """
+    Handing sweeps from an agent to its sampler, per sample: writing them to
+    the ring, reading them back and building their snapshots. More sweeps are
+    read at once when the sampler falls behind.
+    """
+    ring = SampleRing(f"poe_agent_bench_{os.getpid()}_{next(_segment_ids)}", create=True)
+    _rings.append(ring)
+    ring.reset()
+    snapshot = make_sweep(ports)
+    numbers = itertools.count()
+
+    def op():
+        for _ in range(sweeps):
+            ring.write(snapshot, next(numbers))
+        split_sweeps(ring.read(), 48.0, 4.5)
+
+    return op, ports * sweeps
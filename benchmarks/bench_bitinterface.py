@@ -0,0 +1,30 @@
+import ctypes
+from multiprocessing import shared_memory
+
+from app.bitinterface import BitInterface, BitInterfaceStructure
+
+from .harness import benchmark
+
+
+def make_bit_interface() -> BitInterface:
+    """Creates a BitInterface on an anonymous segment, standing in for BurnInTest."""
+    mem = shared_memory.SharedMemory(create=True, size=ctypes.sizeof(BitInterfaceStructure))
+    bit_interface = BitInterface(mem.name, "PoE Tester")
+    # The interface unlinks the segment itself once it is done with it
+    mem.close()
+    return bit_interface
+
+
+@benchmark("bit_interface.counters")
+def bit_interface_counters():
+    """The per-sample counter updates made while BurnInTest is running."""
+    bit_interface = make_bit_interface()
+    bit_interface.read_operations = 0
+    bit_interface.verify_operations = 0
+
+    def op():
+        bit_interface.cycle += 1
+        bit_interface.read_operations += 1
+        bit_interface.verify_operations += 1
+
+    return op, 1
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+from app.acquisition.controllers import DeviceReader
+
+from .harness import benchmark
+
+PORTS = 16
+SAMPLES = 256
+# Every SDK read takes 0.5 ms, and the thresholds are out of reach so no
+# port is retired and every read counts
+BACKEND = "simulated?latency=0.0005&ramp=0.01&noise=0"
+PASSING_VOLTAGE = 1000.0
+
+
+def make_device(directory: str, controllers: int) -> str:
+    """Writes a device file with PORTS ports spread over several PoE controllers."""
+    root = ET.Element("computer", id=f"bench{controllers}")
+    for index in range(controllers):
+        element = ET.SubElement(root, "poe_controller", id="pd69200", bus_address="0xF040", chip_address=hex(0x40 + index))
+        for port in range(index, PORTS, controllers):
+            ET.SubElement(element, "port", id=str(port + 1), bit=str(port))
+
+    path = os.path.join(directory, f"bench{controllers}.xml")
+    ET.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+    return path
+
+
+@benchmark(
+    "controllers.sample_rate",
+    [{"controllers": 1, "threads": 1}, {"controllers": 2, "threads": 1}, {"controllers": 2, "threads": 2}, {"controllers": 4, "threads": 4}],
+)
+def controllers_sample_rate(controllers: int, threads: int):
+    """
+    Sweeping a 16-port board until SAMPLES samples were read. The time per
+    sample is the inverse of the aggregate sample rate.
+    """
+    directory = tempfile.mkdtemp(prefix="poe-bench-")
+    reader = DeviceReader(make_device(directory, controllers), BACKEND, PASSING_VOLTAGE, max_threads=threads)
+
+    def op():
+        count = 0
+        while count < SAMPLES:
+            snapshot = reader.sweep(0.0)
+            count += len(snapshot) if snapshot else 0
+
+    return op, SAMPLES
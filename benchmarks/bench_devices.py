@@ -0,0 +1,56 @@
+import os
+import tempfile
+import xml.etree.ElementTree as ET
+
+from app.devices import DeviceCatalog, build_index, scan_device_file
+
+from .harness import benchmark
+
+DEVICE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "devices")
+
+
+def device_files() -> list[str]:
+    return [os.path.join(DEVICE_DIR, name) for name in sorted(os.listdir(DEVICE_DIR)) if name.endswith(".xml")]
+
+
+@benchmark("devices.full_parse")
+def devices_full_parse():
+    """Parsing every device file completely, as the device list used to be built."""
+    files = device_files()
+
+    def op():
+        for path in files:
+            root = ET.parse(path).getroot()
+            poe_element = root.find("poe_controller")
+            if poe_element is not None:
+                poe_element.findall("port")
+
+    return op, len(files)
+
+
+@benchmark("devices.scan")
+def devices_scan():
+    """Scanning every device file for its name and the ports of all its PoE controllers."""
+    files = device_files()
+
+    def op():
+        for path in files:
+            scan_device_file(path)
+
+    return op, len(files)
+
+
+@benchmark("devices.cached_catalog")
+def devices_cached_catalog():
+    """Loading the cached index and checking it is up to date, the normal startup path."""
+    index_path = os.path.join(tempfile.mkdtemp(prefix="poe-bench-"), "device_index.json")
+    build_index(DEVICE_DIR, index_path)
+    files = len(device_files())
+
+    def op():
+        catalog = DeviceCatalog(DEVICE_DIR, index_path)
+        catalog.load()
+        catalog.devices()
+        catalog.refresh()
+
+    return op, files
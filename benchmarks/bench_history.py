@@ -0,0 +1,73 @@
+import numpy as np
+
+from app.models.sample_history import SampleHistory
+
+from .harness import benchmark
+
+CAPACITY = 16384
+
+
+def make_history(ports: int, fill: bool = False) -> SampleHistory:
+    history = SampleHistory(CAPACITY, ports)
+    for _ in range(ports):
+        history.add()
+
+    if fill:
+        rng = np.random.default_rng(0)
+        rows = np.arange(ports)
+        for t in range(CAPACITY):
+            history.append(rows, float(t), rng.uniform(47, 53, ports), rng.uniform(0, 0.2, ports), rng.uniform(4, 7, ports))
+    return history
+
+
+@benchmark("history.append_single")
+def history_append_single():
+    """One sample for one port, as recorded by PoeTableModel.addSample."""
+    history = make_history(16)
+    t = [0.0]
+
+    def op():
+        t[0] += 1
+        history.append_sample(3, t[0], 50.0, 0.1, 5.0)
+
+    return op, 1
+
+
+@benchmark("history.append_sweep", [{"ports": n} for n in (16, 256)])
+def history_append_sweep(ports: int):
+    """One sample for every port in a single vectorized append."""
+    history = make_history(ports)
+    rows = np.arange(ports)
+    voltages = np.full(ports, 50.0)
+    currents = np.full(ports, 0.1)
+    powers = np.full(ports, 5.0)
+    t = [0.0]
+
+    def op():
+        t[0] += 1
+        history.append(rows, t[0], voltages, currents, powers)
+
+    return op, ports
+
+
+@benchmark("history.window_query")
+def history_window_query():
+    """A 10% time window of a full buffer."""
+    history = make_history(1, fill=True)
+    start, end = CAPACITY * 0.45, CAPACITY * 0.55
+
+    def op():
+        history.window(0, start, end)
+
+    return op, 1
+
+
+@benchmark("history.downsample", [{"buckets": n} for n in (100, 1000)])
+def history_downsample(buckets: int):
+    """A full buffer reduced to plot-sized buckets."""
+    history = make_history(1, fill=True)
+
+    def op():
+        history.downsample(0, "power", buckets)
+
+    return op, 1
@@ -0,0 +1,36 @@
+import itertools
+import os
+
+from app.backends.simulated import SimulatedPoe
+from app.backends.timed import TimedPoe
+from app.instrumentation import LatencyHistogram
+
+from .harness import benchmark
+
+DEVICE_FILE = os.path.join(os.path.dirname(__file__), os.pardir, "devices", "ivh9016.xml")
+
+
+@benchmark("instrumentation.record")
+def instrumentation_record():
+    """Counting one latency in a histogram."""
+    histogram = LatencyHistogram("bench")
+    latencies = itertools.cycle([850, 12_000, 1_150_000, 4_000_000])
+
+    def op():
+        histogram.record(next(latencies))
+
+    return op, 1
+
+
+@benchmark("instrumentation.port_read", [{"timed": False}, {"timed": True}])
+def instrumentation_port_read(timed: bool):
+    """A voltage read of a simulated port without latency, bare or timed."""
+    poe = SimulatedPoe(seed=0)
+    poe.setXmlFile(DEVICE_FILE)
+    backend = TimedPoe(poe) if timed else poe
+    port = poe.getPortList()[0]
+
+    def op():
+        backend.getPortVoltage(port)
+
+    return op, 1
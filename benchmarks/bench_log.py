@@ -0,0 +1,63 @@
+import atexit
+import itertools
+import logging
+import os
+import queue
+import tempfile
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+from app.log import LOG_FORMAT, EventLog
+
+from .harness import benchmark
+
+
+def make_logger(name: str, handler: str) -> logging.Logger:
+    """A logger writing to a file of its own, directly or through a queue written by a background thread."""
+    file_handler = RotatingFileHandler(
+        os.path.join(tempfile.mkdtemp(prefix="poe-bench-"), f"{name}.log"), maxBytes=1 << 20, backupCount=1
+    )
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logger = logging.getLogger(f"benchmarks.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    if handler == "file":
+        logger.addHandler(file_handler)
+    else:
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(records)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        listener = QueueListener(records, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(queue_handler)
+    return logger
+
+
+@benchmark("log.record", [{"handler": "file"}, {"handler": "queue"}])
+def log_record(handler: str):
+    """The time the logging thread spends on one record."""
+    logger = make_logger(f"record_{handler}", handler)
+
+    def op():
+        logger.info("LAN %d: Voltage: %.2fV", 3, 52.0)
+
+    return op, 1
+
+
+@benchmark("log.event", [{"level": "warning"}, {"level": "info"}])
+def log_event(level: str):
+    """
+    A voltage crossing of one of 16 ports, most of them left out by the rate
+    limit, or all of them by the level.
+    """
+    logger = make_logger(f"event_{level}", "queue")
+    logger.setLevel(level.upper())
+    events = EventLog(logger)
+    ports = itertools.cycle(range(1, 17))
+
+    def op():
+        port = next(ports)
+        events.event("voltage_crossed", key=port, port=port, voltage=47.9, direction="down")
+
+    return op, 1
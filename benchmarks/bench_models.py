@@ -0,0 +1,238 @@
+import itertools
+
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QTableView
+
+from app.acquisition.snapshot import Sample, Snapshot
+from app.models.poe_port_model import PoePortModel
+from app.models.poe_table_model import PoeTableModel
+
+from .harness import benchmark
+
+PORT_COUNTS = [{"ports": n} for n in (4, 8, 16, 64, 256)]
+
+
+def make_table(ports: int, model_class: type[PoeTableModel] = PoeTableModel) -> PoeTableModel:
+    model = model_class()
+    for port in range(ports):
+        port_model = PoePortModel(port + 1)
+        port_model.voltage = 50.0 + port % 3
+        port_model.power = 5.0 if port % 2 else 4.0
+        model.addPort(port_model)
+    return model
+
+
+@benchmark("port_model.voltage_setter", [{"receivers": 0}, {"receivers": 1}])
+def port_model_voltage_setter(receivers: int):
+    port_model = PoePortModel(1)
+    for _ in range(receivers):
+        port_model.value_changed.connect(lambda port_id: None)
+    values = itertools.cycle([47.5, 48.0, 48.5])
+
+    def op():
+        port_model.voltage = next(values)
+
+    return op, 1
+
+
+@benchmark("port_model.add_sample")
+def port_model_add_sample():
+    port_model = PoePortModel(1)
+    samples = itertools.cycle([(50.1, 5.2), (50.3, 5.1), (49.9, 5.3)])
+    timestamps = itertools.count()
+
+    def op():
+        voltage, power = next(samples)
+        port_model.add_sample(next(timestamps), voltage, power)
+
+    return op, 1
+
+
+@benchmark("table_model.data", PORT_COUNTS)
+def table_model_data(ports: int):
+    """One full paint of the table: display and background role of every cell."""
+    model = make_table(ports)
+    indexes = [model.index(row, col) for row in range(model.rowCount()) for col in range(model.columnCount())]
+    display = Qt.ItemDataRole.DisplayRole
+    background = Qt.ItemDataRole.BackgroundRole
+
+    def op():
+        for index in indexes:
+            model.data(index, display)
+            model.data(index, background)
+
+    return op, len(indexes)
+
+
+class UncachedTableModel(PoeTableModel):
+    """The table model formatting every cell and creating its color on every paint, as before the cell cache."""
+
+    def data(self, index, /, role=Qt.ItemDataRole.DisplayRole):
+        col = index.column()
+        row = index.row()
+        store = self.store
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = (store.voltage, store.voltage_max, store.current, store.current_max, store.power, store.power_max)[col]
+            return f"{value[row]:.2f}{'VVAAWW'[col]}"
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            return QColor(Qt.GlobalColor.green) if store.passing[row] else QColor(Qt.GlobalColor.red)
+
+
+@benchmark("table_model.paint", [{"ports": n, "cache": cache} for n in (16, 256) for cache in (False, True)])
+def table_model_paint(ports: int, cache: bool):
+    """
+    One repaint of a table view showing every port, after a sweep changed every
+    value. Without the cache every cell is formatted on every paint.
+    """
+    model = make_table(ports, PoeTableModel if cache else UncachedTableModel)
+    snapshots = itertools.cycle([Snapshot.from_samples(sweep, 48, 4.5) for sweep in make_sweeps(ports)])
+
+    view = QTableView()
+    view.setModel(model)
+    view.resize(800, view.horizontalHeader().height() + ports * view.verticalHeader().defaultSectionSize() + 4)
+    image = QImage(view.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    def op():
+        model.addSnapshot(next(snapshots))
+        model.flushChanges()
+        painter = QPainter(image)
+        view.render(painter, QPoint())
+        painter.end()
+
+    return op, ports * model.columnCount()
+
+
+@benchmark("table_model.header_data", PORT_COUNTS)
+def table_model_header_data(ports: int):
+    model = make_table(ports)
+    vertical = Qt.Orientation.Vertical
+    display = Qt.ItemDataRole.DisplayRole
+
+    def op():
+        for section in range(ports):
+            model.headerData(section, vertical, display)
+
+    return op, ports
+
+
+@benchmark("table_model.on_port_changed", PORT_COUNTS)
+def table_model_on_port_changed(ports: int):
+    """Change notification for the last row, the worst case for a row lookup."""
+    model = make_table(ports)
+    port_id = model.ports[-1].id
+
+    def op():
+        model._on_port_changed(port_id)
+
+    return op, 1
+
+
+@benchmark("table_model.sample_to_view", PORT_COUNTS)
+def table_model_sample_to_view(ports: int):
+    """A sample applied to a port model, relayed through its signals to the table."""
+    model = make_table(ports)
+    port_model = model.ports[-1]
+    samples = itertools.cycle([(50.1, 5.2), (50.3, 5.1), (49.9, 5.3)])
+    timestamps = itertools.count()
+
+    def op():
+        voltage, power = next(samples)
+        port_model.add_sample(next(timestamps), voltage, power)
+
+    return op, 1
+
+
+def make_sweeps(ports: int, count: int = 3) -> list[list[Sample]]:
+    return [
+        [Sample(float(sweep), port + 1, 50.0 + (port + sweep) % 3 * 0.1, 5.0 + sweep * 0.1) for port in range(ports)]
+        for sweep in range(count)
+    ]
+
+
+@benchmark("table_model.sweep_per_sample", [{"ports": n} for n in (16, 256)])
+def table_model_sweep_per_sample(ports: int):
+    """A sweep of every port applied one sample at a time, as before snapshots."""
+    model = make_table(ports)
+    sweeps = itertools.cycle(make_sweeps(ports))
+
+    def op():
+        for timestamp, port, voltage, power in next(sweeps):
+            model.addSample(port, timestamp, voltage, power)
+
+    return op, ports
+
+
+@benchmark("table_model.sweep_snapshot", [{"ports": n} for n in (16, 256)])
+def table_model_sweep_snapshot(ports: int):
+    """A sweep of every port applied as one snapshot."""
+    model = make_table(ports)
+    snapshots = itertools.cycle([Snapshot.from_samples(sweep, 48, 4.5) for sweep in make_sweeps(ports)])
+
+    def op():
+        model.addSnapshot(next(snapshots))
+
+    return op, ports
+
+
+@benchmark("snapshot.from_samples", [{"ports": n} for n in (16, 256)])
+def snapshot_from_samples(ports: int):
+    """Building a sweep's snapshot and evaluating it against the thresholds."""
+    samples = make_sweeps(ports, 1)[0]
+
+    def op():
+        Snapshot.from_samples(samples, 48, 4.5)
+
+    return op, ports
+
+
+@benchmark("table_model.passing_sweep", PORT_COUNTS)
+def table_model_passing_sweep(ports: int):
+    """Checks whether every port passes, the way the BIT auto-close does."""
+    model = make_table(ports)
+
+    def op():
+        for port_model in model.ports:
+            model.is_port_passing(port_model.id)
+
+    return op, ports
+
+
+@benchmark("table_model.all_passing", PORT_COUNTS)
+def table_model_all_passing(ports: int):
+    """The same check from the passing count kept as samples arrive."""
+    model = make_table(ports)
+
+    def op():
+        model.allPassing()
+
+    return op, ports
+
+
+@benchmark("table_model.set_thresholds", PORT_COUNTS)
+def table_model_set_thresholds(ports: int):
+    """Re-evaluating every port after a threshold change, half of them flipping."""
+    model = make_table(ports)
+    thresholds = itertools.cycle([(48.0, 4.5), (48.0, 3.5)])
+
+    def op():
+        model.setThresholds(*next(thresholds))
+
+    return op, ports
+
+
+@benchmark("table_model.frame_flush", PORT_COUNTS)
+def table_model_frame_flush(ports: int):
+    """One display frame after every port changed: the merged dataChanged emission."""
+    model = make_table(ports)
+    changed = [0]
+    model.dataChanged.connect(lambda *args: changed.__setitem__(0, changed[0] + 1))
+    port_ids = [port_model.id for port_model in model.ports]
+
+    def op():
+        for port_id in port_ids:
+            model._on_port_changed(port_id)
+        model.flushChanges()
+
+    return op, 1
@@ -0,0 +1,108 @@
+import gc
+import os
+import tracemalloc
+
+import numpy as np
+
+from app.models.poe_port_model import PoePortModel
+from app.models.poe_table_model import PoeTableModel
+from app.models.port_state_store import PortStateStore
+
+from .harness import benchmark
+
+PORT_COUNTS = [{"ports": n} for n in (16, 256, 4096)]
+
+
+def _rss() -> int | None:
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def measure_memory(create) -> tuple[object, dict[str, int]]:
+    """Returns what create() made, with the Python heap and resident memory it took."""
+    gc.collect()
+    rss_before = _rss()
+    tracemalloc.start()
+    created = create()
+    python_bytes, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = _rss()
+
+    memory = {"python_bytes": python_bytes}
+    if rss_before is not None and rss_after is not None:
+        memory["rss_bytes"] = rss_after - rss_before
+    return created, memory
+
+
+def make_samples(ports: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    rng = np.random.default_rng(0)
+    return [(rng.uniform(47, 53, ports), rng.uniform(4, 7, ports)) for _ in range(8)]
+
+
+@benchmark("port_state.per_port_samples", PORT_COUNTS)
+def per_port_samples(ports: int):
+    """One sample for every port through the PoePortModel setters, the per-QObject path."""
+
+    def create():
+        model = PoeTableModel()
+        for port in range(ports):
+            model.addPort(PoePortModel(port))
+        return model
+
+    model, memory = measure_memory(create)
+    port_models = list(model.ports)
+    samples = make_samples(ports)
+    sweep = [0]
+
+    def op():
+        voltages, powers = samples[sweep[0] % len(samples)]
+        sweep[0] += 1
+        for port_model, voltage, power in zip(port_models, voltages.tolist(), powers.tolist()):
+            port_model.add_sample(sweep[0], voltage, power)
+
+    return op, ports, {"memory": memory, "memory_per_port": memory["python_bytes"] / ports}
+
+
+@benchmark("port_state.store_update", PORT_COUNTS)
+def store_update(ports: int):
+    """The same sweep applied to the column store in one vectorized call."""
+
+    def create():
+        store = PortStateStore(ports)
+        for _ in range(ports):
+            store.add()
+        return store
+
+    store, memory = measure_memory(create)
+    memory["column_bytes"] = store.nbytes
+    rows = np.arange(ports)
+    samples = make_samples(ports)
+    sweep = [0]
+
+    def op():
+        voltages, powers = samples[sweep[0] % len(samples)]
+        sweep[0] += 1
+        store.update(rows, sweep[0], voltages, powers)
+
+    return op, ports, {"memory": memory, "memory_per_port": memory["python_bytes"] / ports}
+
+
+@benchmark("table_model.update_rows", PORT_COUNTS)
+def table_model_update_rows(ports: int):
+    """A vectorized sweep through the table, including the per-port change signals."""
+    model = PoeTableModel()
+    for port in range(ports):
+        model.addPort(PoePortModel(port))
+    rows = np.arange(ports)
+    samples = make_samples(ports)
+    sweep = [0]
+
+    def op():
+        voltages, powers = samples[sweep[0] % len(samples)]
+        sweep[0] += 1
+        model.updateRows(rows, sweep[0], voltages, powers)
+
+    return op, ports
@@ -0,0 +1,35 @@
+import tempfile
+
+import numpy as np
+
+from app.acquisition.recorder import SampleRecorder
+
+from .harness import benchmark
+
+
+@benchmark("recorder.record")
+def recorder_record():
+    """Cost to the sampling thread of recording one sample."""
+    recorder = SampleRecorder(tempfile.mkdtemp(prefix="poe-bench-"), "bench", max_bytes=1 << 20, max_files=1)
+    t = [0.0]
+
+    def op():
+        t[0] += 0.001
+        recorder.record(3, t[0], 50.0, 5.0)
+
+    return op, 1
+
+
+@benchmark("recorder.record_batch", [{"ports": n} for n in (16, 256)])
+def recorder_record_batch(ports: int):
+    recorder = SampleRecorder(tempfile.mkdtemp(prefix="poe-bench-"), "bench", max_bytes=1 << 20, max_files=1)
+    port_ids = np.arange(ports)
+    voltages = np.full(ports, 50.0)
+    powers = np.full(ports, 5.0)
+    t = [0.0]
+
+    def op():
+        t[0] += 0.001
+        recorder.record_batch(port_ids, t[0], voltages, powers)
+
+    return op, ports
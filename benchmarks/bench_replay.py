@@ -0,0 +1,82 @@
+import math
+import tempfile
+
+import numpy as np
+
+from app.acquisition.controllers import DeviceReader
+from app.acquisition.recorder import SampleRecorder
+from app.bitinterface import BitInterface
+from app.models import DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+from app.models.poe_port_model import PoePortModel
+from app.models.poe_table_model import PoeTableModel
+
+from .bench_bitinterface import make_bit_interface
+from .bench_controllers import PORTS, make_device
+from .harness import benchmark
+
+# Sweeps in the recording, long enough for the slowest port to pass
+SWEEPS = 512
+
+
+def make_recording(directory: str) -> None:
+    """
+    Records a run of a 16-port board in which port n ramps up with a time
+    constant of 20 + 10 n sweeps, so the ports pass one after the other.
+    """
+    recorder = SampleRecorder(directory, "bench")
+    ports = np.arange(1, PORTS + 1)
+    time_constants = 20.0 + 10.0 * np.arange(PORTS)
+    for sweep in range(SWEEPS):
+        voltages = 52.0 * (1.0 - np.exp(-sweep / time_constants))
+        # Power is only read once the voltage passes, as the reader does
+        powers = np.where(voltages >= DEFAULT_PASSING_VOLTAGE, 6.5, math.nan)
+        recorder.record_batch(ports, sweep * 0.001, voltages, powers)
+    recorder.close()
+
+
+def replay(device: str, backend: str, bit_interface: BitInterface) -> int:
+    """
+    Replays a run through the reader, the table model and the BurnInTest
+    counters like the main window does, until every port passed.
+
+    Returns:
+        int: The samples replayed.
+    """
+    reader = DeviceReader(device, backend, DEFAULT_PASSING_VOLTAGE, DEFAULT_PASSING_POWER)
+    model = PoeTableModel()
+    for port in reader.ports:
+        model.addPort(PoePortModel(port))
+
+    samples = 0
+    while not reader.all_passed:
+        # Retired ports are never due at time 0, so every run reads the same samples
+        snapshot = reader.sweep(0.0)
+        if snapshot is None:
+            continue
+        model.addSnapshot(snapshot)
+        samples += len(snapshot)
+        bit_interface.cycle += len(snapshot)
+        bit_interface.read_operations += len(snapshot)
+        bit_interface.verify_operations += len(snapshot)
+
+    reader.close()
+    return samples
+
+
+@benchmark("replay.pipeline")
+def replay_pipeline():
+    """
+    A recorded run replayed at full speed from the SDK reads to the
+    BurnInTest counters, per sample.
+    """
+    directory = tempfile.mkdtemp(prefix="poe-bench-")
+    make_recording(directory)
+    device = make_device(directory, 1)
+    backend = f"replay?path={directory}&speed=max"
+    bit_interface = make_bit_interface()
+    samples = replay(device, backend, bit_interface)
+
+    def op():
+        replay(device, backend, bit_interface)
+
+    return op, samples, {"samples": samples}
@@ -0,0 +1,103 @@
+import math
+import os
+import statistics
+
+from app.acquisition.scheduler import PortScheduler
+from app.backends.simulated import SimulatedPoe
+from app.models import DEFAULT_PASSING_POWER, DEFAULT_PASSING_VOLTAGE
+
+from .harness import benchmark
+
+DEVICE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "devices")
+DEVICES = {8: os.path.join(DEVICE_DIR, "ivh9008.xml"), 16: os.path.join(DEVICE_DIR, "ivh9016.xml")}
+# Simulated seconds one SDK read takes
+READ_TIME = 0.002
+# Simulated seconds after which a run counts as failed
+RUN_LIMIT = 30.0
+SEEDS = range(5)
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def time_to_verdict(ports: int, strategy: str, seed: int) -> tuple[float, int]:
+    """
+    Samples a simulated board until every port has passed, on a simulated clock
+    where every read takes READ_TIME. The ports settle just below the
+    thresholds, so like marginal hardware they only pass on a noisy sample
+    that lands above them.
+
+    Returns:
+        tuple[float, int]: Simulated seconds to the verdict, and reads made.
+    """
+    clock = SimulatedClock()
+    poe = SimulatedPoe(voltage=47.5, power=4.45, noise=0.02, seed=seed, clock=clock)
+    poe.setXmlFile(DEVICES[ports])
+    port_list = [port for port in poe.getPortList() if port != 255]
+
+    scheduler = PortScheduler(port_list, DEFAULT_PASSING_VOLTAGE, DEFAULT_PASSING_POWER)
+    reads = 0
+
+    while not scheduler.all_passed and clock.now < RUN_LIMIT:
+        # Every sweep reads either every port or only the ones due
+        sweep = port_list if strategy == "every_port" else scheduler.due_ports(clock.now)
+        if not sweep:
+            clock.now += 0.001
+            continue
+
+        for port in sweep:
+            voltage = poe.getPortVoltage(port)
+            clock.now += READ_TIME
+            reads += 1
+            power = math.nan
+            if voltage >= DEFAULT_PASSING_VOLTAGE:
+                power = poe.getPortPower(port)
+                clock.now += READ_TIME
+                reads += 1
+            scheduler.record(port, voltage, power, clock.now)
+
+    return clock.now, reads
+
+
+@benchmark(
+    "scheduler.time_to_verdict",
+    [{"ports": ports, "strategy": strategy} for ports in DEVICES for strategy in ("every_port", "adaptive")],
+)
+def scheduler_time_to_verdict(ports: int, strategy: str):
+    """
+    A whole simulated run to the verdict. The time per run is the CPU cost of
+    the simulation, the simulated time to the verdict is reported alongside.
+    """
+    runs = [time_to_verdict(ports, strategy, seed) for seed in SEEDS]
+    extra = {
+        "verdict_s_mean": statistics.mean(run[0] for run in runs),
+        "verdict_s_max": max(run[0] for run in runs),
+        "reads_mean": statistics.mean(run[1] for run in runs),
+    }
+
+    def op():
+        time_to_verdict(ports, strategy, 0)
+
+    return op, 1, extra
+
+
+@benchmark("scheduler.sweep", [{"ports": ports} for ports in DEVICES])
+def scheduler_sweep(ports: int):
+    """Picking the ports of a sweep and recording their samples, with half the ports passed."""
+    port_list = list(range(1, ports + 1))
+    scheduler = PortScheduler(port_list, DEFAULT_PASSING_VOLTAGE, DEFAULT_PASSING_POWER)
+    for port in port_list[: ports // 2]:
+        scheduler.record(port, 50.0, 5.0, 0.0)
+    now = [0.0]
+
+    def op():
+        now[0] += 0.001
+        for port in scheduler.due_ports(now[0]):
+            scheduler.record(port, 40.0, math.nan, now[0])
+
+    return op, 1
@@ -0,0 +1,72 @@
+import atexit
+import itertools
+import os
+
+import numpy as np
+
+from app.models.port_state_store import PortStateStore
+from app.telemetry import TelemetryReader, TelemetryStructure, TelemetryWriter, WorkerState
+
+from .harness import benchmark
+
+PORT_COUNTS = [{"ports": n} for n in (16, 64)]
+_segment_ids = itertools.count()
+# Mapped segments cannot be closed by the garbage collector while views of them exist
+_segments: list[TelemetryWriter | TelemetryReader] = []
+
+
+@atexit.register
+def _close_segments() -> None:
+    # Readers first, the writers own the segments
+    for segment in reversed(_segments):
+        segment.close()
+
+
+def make_segment(ports: int) -> tuple[TelemetryWriter, TelemetryReader, PortStateStore, list[int], np.ndarray]:
+    """A segment with a writer publishing the given number of ports, and a reader of it."""
+    writer = TelemetryWriter(f"poe_bench_{os.getpid()}_{next(_segment_ids)}", create=True)
+    reader = TelemetryReader(writer.name)
+    _segments.extend((writer, reader))
+
+    store = PortStateStore()
+    rows = np.array([store.add() for _ in range(ports)], dtype=np.intp)
+    rng = np.random.default_rng(0)
+    store.update(rows, np.zeros(ports), rng.uniform(47, 53, ports), rng.uniform(4, 7, ports))
+    port_ids = list(range(1, ports + 1))
+    writer.publish(port_ids, store, rows, WorkerState.RUNNING, ports)
+    return writer, reader, store, port_ids, rows
+
+
+@benchmark("telemetry.publish", PORT_COUNTS)
+def telemetry_publish(ports: int):
+    """Rewriting the segment after a sweep, per port."""
+    writer, _reader, store, port_ids, rows = make_segment(ports)
+
+    def op():
+        writer.publish(port_ids, store, rows, WorkerState.RUNNING, ports)
+
+    return op, ports
+
+
+@benchmark("telemetry.read", PORT_COUNTS)
+def telemetry_read(ports: int):
+    """A consistent copy of the segment into a reused structure, per port."""
+    _writer, reader, _store, _port_ids, _rows = make_segment(ports)
+    telemetry = TelemetryStructure()
+
+    def op():
+        reader.read(telemetry)
+
+    return op, ports
+
+
+@benchmark("telemetry.live", PORT_COUNTS)
+def telemetry_live(ports: int):
+    """Checking the generation and taking the mean voltage from the live records, per port."""
+    _writer, reader, _store, _port_ids, _rows = make_segment(ports)
+
+    def op():
+        if reader.generation:
+            reader.ports["voltage"].mean()
+
+    return op, ports
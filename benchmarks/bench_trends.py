@@ -0,0 +1,59 @@
+import numpy as np
+from PySide6.QtGui import QImage
+
+from app.models.poe_port_model import PoePortModel
+from app.models.trend_buffer import TrendBuffer
+from app.widgets.trend_chart import TrendChart
+
+from .bench_widgets import render
+from .harness import benchmark
+
+PORTS = 16
+# Run lengths in seconds, with a sweep of every port per second
+RUN_LENGTHS = [{"seconds": n} for n in (60, 3600, 86400)]
+
+
+def make_trends(seconds: int) -> TrendBuffer:
+    """A buffer holding a run of the given length, every port sampled once a second."""
+    trends = TrendBuffer()
+    rows = np.array([trends.add() for _ in range(PORTS)], dtype=np.intp)
+    rng = np.random.default_rng(0)
+    voltages = rng.normal(52, 0.5, (seconds, PORTS))
+    powers = rng.normal(6.5, 0.2, (seconds, PORTS))
+    for second in range(seconds):
+        trends.append(rows, float(second), voltages[second], powers[second])
+    return trends
+
+
+@benchmark("trend_buffer.append")
+def trend_buffer_append():
+    """Adding a sweep of every port, per port."""
+    trends = TrendBuffer()
+    rows = np.array([trends.add() for _ in range(PORTS)], dtype=np.intp)
+    voltages = np.full(PORTS, 52.0)
+    powers = np.full(PORTS, 6.5)
+    timestamp = [0.0]
+
+    def op():
+        timestamp[0] += 0.05
+        trends.append(rows, timestamp[0], voltages, powers)
+
+    return op, PORTS
+
+
+@benchmark("trend_chart.paint", RUN_LENGTHS)
+def trend_chart_paint(seconds: int):
+    """One repaint of a port's voltage trend after a run of the given length."""
+    trends = make_trends(seconds)
+    port = PoePortModel(1)
+    chart = TrendChart("voltage", "V", "Voltage")
+    chart.set_trends(trends)
+    chart.set_threshold(48.0)
+    chart.set_port(port)
+    chart.resize(800, 200)
+    image = QImage(chart.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    def op():
+        render(chart, image)
+
+    return op, 1
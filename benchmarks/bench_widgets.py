@@ -0,0 +1,105 @@
+import itertools
+
+from PySide6.QtCore import QPoint, QSize, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QRegion
+from PySide6.QtWidgets import QGridLayout, QWidget
+
+from app.models.poe_port_model import PoePortModel
+from app.widgets import status_widget
+from app.widgets.port_overview import PortOverview
+from app.widgets.status_widget import StatusIndicator
+
+from .harness import benchmark
+
+OVERVIEW_PORTS = [{"ports": n} for n in (64, 256)]
+COLUMNS = 16
+
+
+def render(widget: QWidget, image: QImage, region: QRegion | None = None) -> None:
+    painter = QPainter(image)
+    if region is None:
+        widget.render(painter, QPoint())
+    else:
+        widget.render(painter, region.boundingRect().topLeft(), region)
+    painter.end()
+
+
+def make_ports(ports: int) -> list[PoePortModel]:
+    port_models = []
+    for port in range(ports):
+        port_model = PoePortModel(port + 1)
+        port_model.voltage = 50.0 + port % 3
+        port_model.power = 5.0 if port % 2 else 4.0
+        port_models.append(port_model)
+    return port_models
+
+
+@benchmark("status_indicator.paint", [{"cached": False}, {"cached": True}])
+def status_indicator_paint(cached: bool):
+    """One repaint of an indicator, with the pixmap cache cold on every paint or warm."""
+    indicator = StatusIndicator()
+    indicator.set_color(QColor(Qt.GlobalColor.green))
+    image = QImage(indicator.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    def op():
+        if not cached:
+            status_widget._draw_indicator.cache_clear()
+        render(indicator, image)
+
+    return op, 1
+
+
+@benchmark("port_overview.paint", OVERVIEW_PORTS)
+def port_overview_paint(ports: int):
+    """One full repaint of the overview, per port."""
+    overview = PortOverview()
+    for port_model in make_ports(ports):
+        overview.add_port(port_model)
+    width = COLUMNS * (overview.minimumSizeHint().width())
+    overview.resize(width, overview.heightForWidth(width))
+    image = QImage(overview.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    def op():
+        render(overview, image)
+
+    return op, ports
+
+
+@benchmark("port_overview.dirty_update", OVERVIEW_PORTS)
+def port_overview_dirty_update(ports: int):
+    """A sample changing one port, and the repaint of only its tile."""
+    overview = PortOverview()
+    port_models = make_ports(ports)
+    for port_model in port_models:
+        overview.add_port(port_model)
+    width = COLUMNS * (overview.minimumSizeHint().width())
+    overview.resize(width, overview.heightForWidth(width))
+    image = QImage(overview.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    index = ports // 2
+    region = QRegion(overview._tile_rect(index))
+    voltages = itertools.cycle([50.1, 50.3, 49.9])
+
+    def op():
+        port_models[index].voltage = next(voltages)
+        render(overview, image, region)
+
+    return op, 1
+
+
+@benchmark("poe_widget.paint", OVERVIEW_PORTS)
+def poe_widget_paint(ports: int):
+    """One full repaint of a grid of PoeWidget cards, per port, for comparison with the overview."""
+    from app.widgets.poe_widget import PoeWidget
+
+    grid = QWidget()
+    layout = QGridLayout(grid)
+    for index, port_model in enumerate(make_ports(ports)):
+        layout.addWidget(PoeWidget(port_model), *divmod(index, COLUMNS))
+    grid.resize(grid.sizeHint().expandedTo(QSize(1, 1)))
+    image = QImage(grid.size(), QImage.Format.Format_ARGB32_Premultiplied)
+
+    def op():
+        render(grid, image)
+
+    return op, ports
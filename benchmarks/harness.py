@@ -0,0 +1,121 @@
+import json
+import platform
+import sys
+import time
+import typing
+from dataclasses import asdict, dataclass, field
+
+# A setup function receives the benchmark parameters and returns the operation to
+# time and the number of operations performed by one call of it, optionally
+# followed by a dict of extra figures to include in the report.
+Setup = typing.Callable[..., tuple]
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Setup
+    params: list[dict[str, typing.Any]]
+
+
+@dataclass
+class Result:
+    key: str
+    name: str
+    params: dict[str, typing.Any]
+    operations: int
+    ns_per_op: float
+    ops_per_sec: float
+    extra: dict[str, typing.Any] = field(default_factory=dict)
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, params: typing.Iterable[dict[str, typing.Any]] = ({},)):
+    """Registers a benchmark setup function, run once per parameter set."""
+
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS.append(Benchmark(name, setup, list(params)))
+        return setup
+
+    return decorator
+
+
+def result_key(name: str, params: dict[str, typing.Any]) -> str:
+    if not params:
+        return name
+    args = ",".join(f"{key}={value}" for key, value in params.items())
+    return f"{name}[{args}]"
+
+
+def measure(
+    op: typing.Callable[[], object], ops_per_call: int, min_time: float = 0.1, repeat: int = 5
+) -> tuple[int, float]:
+    """
+    Times an operation.
+
+    The number of calls per run is scaled until a run takes at least min_time
+    seconds, then the fastest of several runs is used.
+
+    Returns:
+        tuple[int, float]: Operations per run and nanoseconds per operation.
+    """
+    calls = 1
+    while True:
+        elapsed = _time_calls(op, calls)
+        if elapsed >= min_time or calls >= 1 << 24:
+            break
+        calls *= 2 if elapsed == 0 else max(2, min(int(min_time / elapsed) + 1, 10))
+
+    best = min([elapsed] + [_time_calls(op, calls) for _ in range(repeat - 1)])
+    operations = calls * ops_per_call
+    return operations, best * 1e9 / operations
+
+
+def _time_calls(op: typing.Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        op()
+    return time.perf_counter() - start
+
+
+def run(pattern: str = "", min_time: float = 0.1) -> list[Result]:
+    results = []
+    for bench in BENCHMARKS:
+        for params in bench.params:
+            key = result_key(bench.name, params)
+            if pattern not in key:
+                continue
+
+            op, ops_per_call, *rest = bench.setup(**params)
+            operations, ns_per_op = measure(op, ops_per_call, min_time)
+            extra = rest[0] if rest else {}
+            results.append(
+                Result(key, bench.name, params, operations, ns_per_op, 1e9 / ns_per_op, extra)
+            )
+            print(f"{key:<60} {ns_per_op:>12.1f} ns/op {1e9 / ns_per_op:>14,.0f} op/s")
+    return results
+
+
+def check_thresholds(results: list[Result], thresholds: dict[str, float]) -> list[dict[str, typing.Any]]:
+    """Returns the results slower than their maximum ns/op threshold."""
+    regressions = []
+    for result in results:
+        limit = thresholds.get(result.key)
+        if limit is not None and result.ns_per_op > limit:
+            regressions.append({"key": result.key, "ns_per_op": result.ns_per_op, "threshold": limit})
+    return regressions
+
+
+def write_results(path: str, results: list[Result], regressions: list[dict[str, typing.Any]]) -> None:
+    report = {
+        "timestamp": time.time(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "results": [asdict(result) for result in results],
+        "regressions": regressions,
+    }
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
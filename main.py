@@ -1,9 +1,6 @@
-import logging
-from logging.handlers import RotatingFileHandler
+from app import run
+from app.log import DEFAULT_LOG_FILE, start_logging
 
-from app import APP_NAME, run
-
-handler = RotatingFileHandler(f"{APP_NAME}.log", maxBytes=100_000_000, backupCount=2)
-logging.basicConfig(level=logging.WARN, handlers=[handler])
+start_logging(DEFAULT_LOG_FILE)
 
 run()
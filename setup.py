@@ -1,9 +1,11 @@
+import os
 import sys
 import sysconfig
 
 from cx_Freeze import Executable, setup
 
 from app import APP_AUTHOR, APP_DESCRIPTION, APP_NAME
+from app.devices import INDEX_FILENAME, build_index
 
 app_name = APP_NAME
 description = APP_DESCRIPTION
@@ -23,9 +25,17 @@ install_dir = (
 )
 
 
+# Ship an index of the device files so the first launch does not have to parse them
+prebuilt_index = os.path.join("build", INDEX_FILENAME)
+build_index("devices", prebuilt_index)
+
 build_exe_options = {
-    "include_files": ['devices/'],
-    "zip_include_packages": ["encoder"],
+    "include_files": ['devices/', (prebuilt_index, INDEX_FILENAME)],
+    # Pure Python packages load faster from the zip than from many small files
+    # on the test stations' disks; extension module packages stay on disk
+    "zip_include_packages": ["*"],
+    "zip_exclude_packages": ["PySide6", "shiboken6", "numpy"],
+    "optimize": 1,
     "include_msvcr": True,
     "excludes": [
         "tkinter",
@@ -36,6 +46,27 @@ build_exe_options = {
         "unittest",
         "html",
         "http",
+        # Development tools that are never used at run time
+        "benchmarks",
+        "doctest",
+        "pdb",
+        "pydoc",
+        "pydoc_data",
+        "lib2to3",
+        "test",
+        "xmlrpc",
+        "numpy.f2py",
+        "numpy.testing",
+        # Qt modules the application does not use
+        "PySide6.QtNetwork",
+        "PySide6.QtQml",
+        "PySide6.QtQuick",
+        "PySide6.QtSql",
+        "PySide6.QtWebEngineCore",
+        "PySide6.QtWebEngineWidgets",
+        "PySide6.Qt3DCore",
+        "PySide6.QtMultimedia",
+        "PySide6.QtOpenGL",
     ],
 }
 
@@ -0,0 +1,166 @@
+import itertools
+import math
+import os
+import sys
+import time
+import typing
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from app.acquisition import agent
+from app.acquisition.agent import RING_DTYPE, AgentReader, SampleRing, split_sweeps
+from app.acquisition.snapshot import Snapshot
+
+DEVICE_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "devices", "ivh9016.xml")
+
+# Stands in for an agent: reports ports 1 and 2 as running, then with "hang"
+# stops beating, or with "exit" exits, until the sampler asks it to stop
+STUB_AGENT = """
+import sys, time
+from app.acquisition.agent import AgentState, SampleRing
+
+ring = SampleRing(sys.argv[sys.argv.index("--agent") + 1])
+header = ring.header
+header.ports[:2] = [1, 2]
+header.port_count = 2
+header.state = AgentState.RUNNING
+if "exit" in sys.argv:
+    sys.exit(3)
+while not header.stop:
+    time.sleep(0.01)
+del header
+ring.close()
+"""
+
+_segment_ids = itertools.count()
+
+
+def sweep_snapshot(sweep: int, ports: int = 3) -> Snapshot:
+    port_ids = np.arange(1, ports + 1)
+    return Snapshot.from_arrays(
+        np.full(ports, float(sweep)), port_ids, 40.0 + sweep + port_ids, np.full(ports, 5.0), 48.0, 4.5
+    )
+
+
+class RingTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ring = SampleRing(f"poe_test_agent_{os.getpid()}_{next(_segment_ids)}", create=True, capacity=8)
+        self.addCleanup(self.ring.close)
+        self.ring.reset()
+
+    def test_round_trip(self) -> None:
+        self.assertEqual(len(self.ring.read()), 0)
+        self.assertTrue(self.ring.write(sweep_snapshot(0), 0))
+        self.assertTrue(self.ring.write(sweep_snapshot(1), 1))
+
+        samples = self.ring.read()
+        np.testing.assert_array_equal(samples["sweep"], [0, 0, 0, 1, 1, 1])
+        np.testing.assert_array_equal(samples["port"], [1, 2, 3, 1, 2, 3])
+        np.testing.assert_array_equal(samples["voltage"], [41.0, 42.0, 43.0, 42.0, 43.0, 44.0])
+        self.assertEqual(len(self.ring.read()), 0)
+
+    def test_wraps_around(self) -> None:
+        for sweep in range(20):
+            self.assertTrue(self.ring.write(sweep_snapshot(sweep), sweep))
+            samples = self.ring.read()
+            np.testing.assert_array_equal(samples["timestamp"], float(sweep))
+            np.testing.assert_array_equal(samples["port"], [1, 2, 3])
+        self.assertEqual(self.ring.header.write_index, 60)
+        self.assertEqual(self.ring.header.dropped, 0)
+
+    def test_drops_sweeps_that_do_not_fit(self) -> None:
+        self.assertTrue(self.ring.write(sweep_snapshot(0), 0))
+        self.assertTrue(self.ring.write(sweep_snapshot(1), 1))
+        # Only 2 of 3 records are free, the unread ones are never overwritten
+        self.assertFalse(self.ring.write(sweep_snapshot(2), 2))
+        self.assertEqual(self.ring.header.dropped, 3)
+
+        np.testing.assert_array_equal(self.ring.read()["sweep"], [0, 0, 0, 1, 1, 1])
+        self.assertTrue(self.ring.write(sweep_snapshot(3), 3))
+        np.testing.assert_array_equal(self.ring.read()["sweep"], [3, 3, 3])
+
+    def test_reset_for_a_restarted_agent(self) -> None:
+        self.ring.write(sweep_snapshot(0), 0)
+        self.ring.write(sweep_snapshot(1), 1)
+        self.ring.read()
+        self.ring.write(sweep_snapshot(2), 2)
+        self.ring.header.agent_heartbeat = 40
+        self.ring.header.all_passed = 1
+
+        self.ring.reset()
+        header = self.ring.header
+        self.assertEqual((header.write_index, header.read_index, header.agent_heartbeat), (0, 0, 0))
+        self.assertEqual(header.state, agent.AgentState.STARTING)
+        self.assertFalse(header.all_passed)
+        self.assertTrue(math.isnan(header.verdict_time))
+        # The unread sweep of the old agent is gone
+        self.assertEqual(len(self.ring.read()), 0)
+        self.ring.write(sweep_snapshot(0), 0)
+        np.testing.assert_array_equal(self.ring.read()["timestamp"], 0.0)
+
+
+class SplitSweepsTest(unittest.TestCase):
+    def test_one_snapshot_per_sweep(self) -> None:
+        samples = np.zeros(6, RING_DTYPE)
+        samples["sweep"] = [7, 7, 7, 8, 9, 9]
+        samples["port"] = [1, 2, 3, 1, 2, 3]
+        samples["timestamp"] = [1.0, 1.1, 1.2, 2.0, 3.0, 3.1]
+        samples["voltage"] = [50.0, 47.0, 50.0, 50.0, 50.0, 50.0]
+        samples["power"] = [5.0, 5.0, math.nan, 5.0, 5.0, 4.0]
+
+        snapshots = split_sweeps(samples, 48.0, 4.5)
+        self.assertEqual([len(snapshot) for snapshot in snapshots], [3, 1, 2])
+        self.assertEqual([snapshot.timestamp for snapshot in snapshots], [1.2, 2.0, 3.1])
+        np.testing.assert_array_equal(snapshots[0].passing, [True, False, False])
+        np.testing.assert_array_equal(snapshots[2].ports, [2, 3])
+        np.testing.assert_array_equal(snapshots[2].passing, [True, False])
+
+    def test_sweep_numbers_wrap(self) -> None:
+        samples = np.zeros(3, RING_DTYPE)
+        samples["sweep"] = [2**32 - 1, 0, 0]
+        self.assertEqual([len(snapshot) for snapshot in split_sweeps(samples, 48.0, 4.5)], [1, 2])
+
+
+class WatchdogTest(unittest.TestCase):
+    def start_reader(self, mode: str, **options) -> AgentReader:
+        """An agent reader whose agents are the stub agent."""
+        command = mock.patch.object(agent, "_agent_command", return_value=(sys.executable, ["-c", STUB_AGENT, mode]))
+        command.start()
+        self.addCleanup(command.stop)
+        reader = AgentReader(DEVICE_FILE, **options)
+        self.addCleanup(reader.close)
+        self.assertEqual(reader.ports, [1, 2])
+        return reader
+
+    def sweep_until(self, reader: AgentReader, done: typing.Callable[[], bool], timeout: float = 10.0) -> None:
+        deadline = time.monotonic() + timeout
+        while not done():
+            self.assertLess(time.monotonic(), deadline)
+            self.assertIsNone(reader.sweep(time.monotonic()))
+            time.sleep(0.01)
+
+    def test_restarts_an_agent_that_stops_beating(self) -> None:
+        reader = self.start_reader("hang", timeout=0.2, max_restarts=1)
+        first = reader.pid
+        with self.assertLogs(agent.logger, "WARNING") as logs:
+            self.sweep_until(reader, lambda: reader.pid not in (0, first))
+        self.assertIn("stopped responding", "\n".join(logs.output))
+
+        # Another timeout in a row is one restart too many
+        with self.assertLogs(agent.logger, "ERROR") as logs:
+            self.sweep_until(reader, lambda: reader.pid == 0)
+        self.assertIn("giving up after 1 restarts", logs.output[-1])
+        self.assertIsNone(reader.sweep(time.monotonic()))
+
+    def test_restarts_an_agent_that_exited(self) -> None:
+        # Only the exits restart it, not the heartbeats the stub never sends
+        reader = self.start_reader("exit", timeout=30.0, max_restarts=2)
+        with self.assertLogs(agent.logger, "ERROR") as logs:
+            self.sweep_until(reader, lambda: any("giving up" in line for line in logs.output))
+        self.assertIn("exited with 3", logs.output[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
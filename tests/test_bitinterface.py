@@ -0,0 +1,131 @@
+import ctypes
+import os
+import threading
+import time
+import unittest
+from multiprocessing import shared_memory
+from unittest import mock
+
+from PySide6.QtCore import QCoreApplication
+
+from app import bitinterface
+from app.bitinterface import BitInterface, BitInterfaceStructure, ErrorSeverity, PluginStatus
+
+# Seconds BurnInTest takes to pick up a message in these tests
+CONSUMER_DELAY = 0.0005
+
+
+class SlowBurnInTest(threading.Thread):
+    """Takes messages out of the interface one at a time, like a busy BurnInTest."""
+
+    def __init__(self, struct: BitInterfaceStructure) -> None:
+        super().__init__(daemon=True)
+        self._struct = struct
+        self.errors: list[bytes] = []
+        self.statuses: list[int] = []
+        self.stop = threading.Event()
+
+    def run(self) -> None:
+        while not self.stop.is_set():
+            if self._struct.new_error:
+                time.sleep(CONSUMER_DELAY)
+                self.errors.append(self._struct.error_message)
+                self._struct.new_error = False
+            elif self._struct.new_status:
+                time.sleep(CONSUMER_DELAY)
+                self.statuses.append(self._struct.status)
+                self._struct.new_status = False
+            else:
+                time.sleep(0.0001)
+
+
+class BitInterfaceTest(unittest.TestCase):
+    """An interface to a BurnInTest that takes messages slowly."""
+
+    def setUp(self) -> None:
+        self.app = QCoreApplication.instance() or QCoreApplication([])
+        key = f"poe_test_bit_{os.getpid()}"
+        self.mem = shared_memory.SharedMemory(key, True, ctypes.sizeof(BitInterfaceStructure))
+        self.struct = BitInterfaceStructure.from_buffer(self.mem.buf)
+        self.interface = BitInterface(key, "PoE Tester")
+        self.struct.test_running = 1
+        self.consumer = SlowBurnInTest(self.struct)
+        self.consumer.start()
+
+    def tearDown(self) -> None:
+        self.consumer.stop.set()
+        self.consumer.join()
+        self.struct.test_running = 0
+        # The interface unlinks the segment when it goes, the views must go before it closes
+        del self.interface, self.struct, self.consumer
+        self.mem.close()
+
+    def pump(self, seconds: float) -> None:
+        """Runs the drain timer for a while, or until every message was taken."""
+        deadline = time.monotonic() + seconds
+        while self.interface.pending and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.001)
+
+
+class FlushTest(BitInterfaceTest):
+    def test_flush_many_ports(self) -> None:
+        ports = 128
+        for port in range(ports):
+            self.interface.set_error(ErrorSeverity.ERRORINFORMATION, f"LAN {port}: passed")
+        self.interface.set_error(ErrorSeverity.ERRORINFORMATION, "Summary")
+        self.interface.set_pretest_complete()
+
+        start = time.monotonic()
+        self.assertTrue(self.interface.flush(timeout=5.0))
+        # Each message is picked up right after the one before, not after a backoff
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual(len(self.consumer.errors), ports + 1)
+        self.assertEqual(self.consumer.errors[0], b"LAN 0: passed")
+        self.assertEqual(self.consumer.statuses[-1], PluginStatus.PRE_TEST_PLUGIN_COMPLETED.value)
+
+
+@mock.patch.object(bitinterface, "STALL_TIMEOUT", 0.02)
+class StallTest(BitInterfaceTest):
+    def test_long_queue_is_not_stalled(self) -> None:
+        # Taking every message takes several stall timeouts, but BurnInTest keeps taking them
+        with self.assertNoLogs(bitinterface.logger, "WARNING"):
+            for port in range(128):
+                self.interface.set_error(ErrorSeverity.ERRORINFORMATION, f"LAN {port}: passed")
+            self.pump(5.0)
+        self.assertEqual(len(self.consumer.errors), 128)
+
+    def test_stalled(self) -> None:
+        self.consumer.stop.set()
+        self.consumer.join()
+        with self.assertLogs(bitinterface.logger, "WARNING") as logs:
+            self.interface.set_error(ErrorSeverity.ERRORINFORMATION, "LAN 3: passed")
+            self.interface.set_error(ErrorSeverity.ERRORINFORMATION, "LAN 4: passed")
+            self.pump(0.2)
+        self.assertIn("bit_handshake_stalled", logs.output[0])
+
+
+class CloseTest(BitInterfaceTest):
+    def test_close_delivers_queued(self) -> None:
+        for port in range(8):
+            self.interface.set_error(ErrorSeverity.ERRORINFORMATION, f"LAN {port}: passed")
+        self.interface.close()
+        self.assertEqual(len(self.consumer.errors), 8)
+        # Closing twice, or dropping it afterwards, does nothing
+        self.interface.close()
+
+    def test_drop_does_not_wait(self) -> None:
+        self.consumer.stop.set()
+        self.consumer.join()
+        self.interface.set_error(ErrorSeverity.ERRORINFORMATION, "LAN 3: passed")
+        self.interface.set_error(ErrorSeverity.ERRORINFORMATION, "LAN 4: passed")
+
+        start = time.monotonic()
+        self.interface = None
+        self.assertLess(time.monotonic() - start, 0.5)
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(self.mem.name, False)
+
+
+if __name__ == "__main__":
+    unittest.main()
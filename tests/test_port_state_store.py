@@ -0,0 +1,66 @@
+import math
+import unittest
+
+import numpy as np
+
+from app.models.port_state_store import (
+    CURRENT_CHANGED,
+    MAX_CURRENT_CHANGED,
+    MAX_VOLTAGE_CHANGED,
+    PASSING_CHANGED,
+    VOLTAGE_CHANGED,
+    PortStateStore,
+)
+
+COLUMNS = ("timestamp", "voltage", "voltage_max", "current", "current_max", "power", "power_max")
+
+
+def store_with_rows(rows: int) -> PortStateStore:
+    store = PortStateStore()
+    for _ in range(rows):
+        store.add()
+    store.set_thresholds(50.0, 5.0)
+    return store
+
+
+class UpdateRowTest(unittest.TestCase):
+    def test_matches_batch_update(self) -> None:
+        batch, single = store_with_rows(8), store_with_rows(8)
+        rng = np.random.default_rng(1)
+        for i in range(5000):
+            row = int(rng.integers(8))
+            voltage = float(rng.choice([0.0, 49.0, 50.0, rng.uniform(40.0, 55.0)]))
+            power = float(rng.choice([math.nan, 5.0, rng.uniform(0.0, 8.0)]))
+            flags = batch.update(np.array([row]), float(i), np.array([voltage]), np.array([power]))
+            self.assertEqual(single.update_row(row, float(i), voltage, power), int(flags[0]))
+
+        for name in COLUMNS:
+            np.testing.assert_array_equal(single.column(name), batch.column(name), err_msg=name)
+        np.testing.assert_array_equal(single.passing, batch.passing)
+        self.assertEqual(single.passing_count, batch.passing_count)
+
+    def test_set_voltage(self) -> None:
+        store = store_with_rows(1)
+        store.set_power(0, 6.0)
+        self.assertEqual(
+            store.set_voltage(0, 51.0),
+            VOLTAGE_CHANGED | MAX_VOLTAGE_CHANGED | CURRENT_CHANGED | MAX_CURRENT_CHANGED | PASSING_CHANGED,
+        )
+        self.assertAlmostEqual(store.value("current", 0), 6.0 / 51.0)
+        self.assertTrue(store.is_passing(0))
+        # The maximum stays when the voltage drops
+        self.assertEqual(store.set_voltage(0, 40.0) & MAX_VOLTAGE_CHANGED, 0)
+        self.assertEqual(store.value("voltage_max", 0), 51.0)
+        self.assertTrue(store.all_passing)
+
+    def test_values_survive_growing(self) -> None:
+        store = store_with_rows(1)
+        store.update_row(0, 1.0, 51.0, 6.0)
+        for _ in range(40):
+            store.add()
+        self.assertEqual(store.value("voltage", 0), 51.0)
+        self.assertEqual(len(store.column("power_max")), 41)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from app.acquisition import recorder
+from app.acquisition.recorder import (
+    HEADER_SIZE,
+    RECORD_DTYPE,
+    SampleRecorder,
+    load_records,
+    open_recording,
+    open_recordings,
+    recording_sessions,
+)
+
+# Ten records to a file
+MAX_BYTES = HEADER_SIZE + 10 * RECORD_DTYPE.itemsize
+
+
+def sweeps(count: int, ports: int = 4) -> list[tuple[np.ndarray, float, np.ndarray, np.ndarray]]:
+    rng = np.random.default_rng(2)
+    return [
+        (np.arange(ports), 100.0 + i, rng.uniform(40.0, 55.0, ports), rng.uniform(0.0, 8.0, ports)) for i in range(count)
+    ]
+
+
+class RecorderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp(prefix="poe-test-")
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def record(self, device: str = "ivh9016", started: str = "20260312-090000", count: int = 13, **options) -> SampleRecorder:
+        """Records count sweeps of 4 ports and a single sample, in a run started at started."""
+        with mock.patch.object(recorder.time, "strftime", return_value=started):
+            sample_recorder = SampleRecorder(self.directory, device, max_bytes=MAX_BYTES, batch_size=6, **options)
+        for sweep in sweeps(count):
+            sample_recorder.record_batch(*sweep)
+        sample_recorder.record(7, 200.0, 48.0, float("nan"))
+        sample_recorder.close()
+        return sample_recorder
+
+
+class RoundTripTest(RecorderTest):
+    def test_records_read_back_in_order(self) -> None:
+        sample_recorder = self.record(max_files=None)
+        self.assertEqual(sample_recorder.records_written, 53)
+        self.assertEqual(len(sample_recorder.files), 6)
+
+        recordings = [open_recording(path) for path in sample_recorder.files]
+        for recording in recordings:
+            self.assertEqual(recording.device, "ivh9016")
+            self.assertEqual(recording.session, "20260312-090000")
+            self.assertLessEqual(os.path.getsize(recording.path), MAX_BYTES)
+
+        records = load_records(recordings)
+        ports, timestamps, voltages, powers = zip(*sweeps(13))
+        np.testing.assert_array_equal(records["port"][:-1], np.concatenate(ports))
+        np.testing.assert_array_equal(records["timestamp"][:-1], np.repeat(timestamps, 4))
+        np.testing.assert_array_equal(records["voltage"][:-1], np.concatenate(voltages).astype(np.float32))
+        np.testing.assert_array_equal(records["power"][:-1], np.concatenate(powers).astype(np.float32))
+        self.assertEqual(records[-1]["port"], 7)
+        self.assertTrue(np.isnan(records[-1]["power"]))
+
+    def test_partial_record_ignored(self) -> None:
+        path = self.record(count=1, max_files=None).files[0]
+        with open(path, "ab") as file:
+            file.write(b"\x00" * 5)
+        self.assertEqual(len(open_recording(path).records), 5)
+
+
+class RotationTest(RecorderTest):
+    def test_keeps_the_newest_files_of_the_device(self) -> None:
+        self.record(device="other", started="20260312-080000", max_files=None)
+        self.record(started="20260312-090000", max_files=None)
+        sample_recorder = self.record(started="20260312-100000", max_files=4)
+
+        sessions = recording_sessions(open_recordings(self.directory))
+        self.assertEqual(list(sessions), ["20260312-080000", "20260312-100000"])
+        self.assertEqual(len(sessions["20260312-080000"]), 6)
+        kept = sessions["20260312-100000"]
+        self.assertEqual([recording.path for recording in kept], sample_recorder.files)
+        self.assertEqual(len(kept), 4)
+        # Only the oldest records of the run were removed
+        self.assertEqual(load_records(kept)[-1]["port"], 7)
+
+    def test_restart_in_the_same_second(self) -> None:
+        first = self.record(count=2, max_files=4)
+        second = self.record(count=3, max_files=4)
+        third = self.record(count=1, max_files=4)
+
+        sessions = recording_sessions(open_recordings(self.directory))
+        self.assertEqual(list(sessions), ["20260312-090000", "20260312-090000-2", "20260312-090000-3"])
+        for sample_recorder, session in zip((first, second, third), sessions.values()):
+            self.assertEqual(len(load_records(session)), sample_recorder.records_written)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from app.acquisition import recorder
+from app.acquisition.recorder import SampleRecorder, open_recordings, recording_sessions
+from app.backends.replay import ReplayPoe
+
+DEVICE_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "devices", "ivh9016.xml")
+
+
+def record_session(directory: str, session: str, voltage: float, samples: int) -> None:
+    """Records a run of port 3 at one voltage, as the recorder names a run started at session."""
+    with mock.patch.object(recorder.time, "strftime", return_value=session):
+        sample_recorder = SampleRecorder(directory, "ivh9016", max_files=None)
+    for i in range(samples):
+        sample_recorder.record(3, 100.0 + i, voltage, 5.0)
+    sample_recorder.close()
+
+
+class SessionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp(prefix="poe-test-")
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        # Both runs recorded after the same boot, their timestamps overlap
+        record_session(self.directory, "20260312-090000", 40.0, 10)
+        record_session(self.directory, "20260312-100000", 50.0, 20)
+
+    def replay(self, **options: str) -> list[float]:
+        spec = {"path": [self.directory], "speed": ["max"]}
+        spec.update((name, [value]) for name, value in options.items())
+        backend = ReplayPoe.from_options(spec)
+        backend.setXmlFile(DEVICE_FILE)
+        voltages = []
+        while not backend.finished:
+            voltages.append(backend.getPortVoltage(3))
+        return voltages
+
+    def test_sessions(self) -> None:
+        sessions = recording_sessions(open_recordings(self.directory))
+        self.assertEqual(list(sessions), ["20260312-090000", "20260312-100000"])
+
+    def test_replays_newest_session(self) -> None:
+        self.assertEqual(self.replay(), [50.0] * 20)
+
+    def test_replays_chosen_session(self) -> None:
+        self.assertEqual(self.replay(session="20260312-090000"), [40.0] * 10)
+
+    def test_unknown_session(self) -> None:
+        with self.assertRaises(ValueError):
+            self.replay(session="20260312-110000")
+
+
+if __name__ == "__main__":
+    unittest.main()
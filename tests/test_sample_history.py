@@ -0,0 +1,132 @@
+import unittest
+
+import numpy as np
+
+from app.models.sample_history import FIELDS, SampleHistory
+
+
+def filled_history(capacity: int, samples: int, rows: int = 2, seed: int = 0) -> tuple[SampleHistory, np.ndarray]:
+    """A history with samples one per unit of time on every row, and the samples appended by row."""
+    history = SampleHistory(capacity, rows)
+    for _ in range(rows):
+        history.add()
+
+    rng = np.random.default_rng(seed)
+    appended = np.zeros((rows, samples, 1 + len(FIELDS)))
+    for i in range(samples):
+        values = rng.uniform(40.0, 55.0, (len(FIELDS), rows))
+        history.append(np.arange(rows), float(i), *values)
+        appended[:, i, 0] = i
+        appended[:, i, 1:] = values.T
+    return history, appended
+
+
+class RingTest(unittest.TestCase):
+    def test_keeps_the_newest_samples(self) -> None:
+        history, appended = filled_history(capacity=8, samples=21)
+        self.assertEqual(history.length(1), 8)
+
+        window = history.window(1)
+        np.testing.assert_array_equal(window.timestamp, np.arange(13.0, 21.0))
+        for i, field in enumerate(FIELDS):
+            np.testing.assert_array_equal(getattr(window, field), appended[1, 13:, 1 + i])
+
+        latest = history.latest(1, 3)
+        np.testing.assert_array_equal(latest.timestamp, [18.0, 19.0, 20.0])
+        np.testing.assert_array_equal(history.latest(1, 20).timestamp, window.timestamp)
+
+    def test_single_and_batch_appends_agree(self) -> None:
+        batch, appended = filled_history(capacity=16, samples=40, rows=3)
+        single = SampleHistory(16, 3)
+        for _ in range(3):
+            single.add()
+        for i in range(40):
+            for row in range(3):
+                single.append_sample(row, *appended[row, i])
+
+        for row in range(3):
+            for expected, actual in zip(batch.window(row), single.window(row)):
+                np.testing.assert_array_equal(actual, expected)
+            for field in FIELDS:
+                self.assertEqual(single.stats(row)[field], batch.stats(row)[field])
+
+    def test_clear(self) -> None:
+        history, _ = filled_history(capacity=8, samples=5)
+        history.clear(0)
+        self.assertEqual(history.length(0), 0)
+        self.assertEqual(history.stats(0)["voltage"].count, 0)
+        self.assertEqual(history.length(1), 5)
+
+    def test_rows_added_later(self) -> None:
+        history, appended = filled_history(capacity=8, samples=5, rows=1)
+        for _ in range(40):
+            history.add()
+        np.testing.assert_array_equal(history.window(0).voltage, appended[0, :, 1])
+        self.assertEqual(history.length(40), 0)
+
+
+class StatsTest(unittest.TestCase):
+    def assert_stats(self, history: SampleHistory, row: int, values: np.ndarray) -> None:
+        for i, field in enumerate(FIELDS):
+            stats = history.stats(row)[field]
+            column = values[:, i]
+            self.assertEqual(stats.count, len(column))
+            self.assertEqual(stats.minimum, column.min())
+            self.assertEqual(stats.maximum, column.max())
+            self.assertAlmostEqual(stats.mean, column.mean(), places=9)
+            self.assertAlmostEqual(stats.variance, column.var(ddof=1), places=9)
+
+    def test_match_numpy_over_the_window(self) -> None:
+        history, _ = filled_history(capacity=64, samples=50)
+        for row in range(2):
+            window = history.window(row)
+            self.assert_stats(history, row, np.column_stack([getattr(window, field) for field in FIELDS]))
+
+    def test_cover_every_sample_after_wrapping(self) -> None:
+        history, appended = filled_history(capacity=16, samples=100)
+        for row in range(2):
+            self.assert_stats(history, row, appended[row, :, 1:])
+
+
+class QueryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # The oldest kept sample sits in the middle of the ring
+        self.history, appended = filled_history(capacity=32, samples=45)
+        self.kept = appended[0, -32:]
+
+    def test_window_across_the_wrap(self) -> None:
+        for start, end in ((13.0, 44.0), (20.5, 35.0), (None, 30.0), (31.0, None), (50.0, 60.0), (30.0, 20.0)):
+            window = self.history.window(0, start, end)
+            timestamps = self.kept[:, 0]
+            mask = np.ones(len(timestamps), dtype=bool)
+            if start is not None:
+                mask &= timestamps >= start
+            if end is not None:
+                mask &= timestamps <= end
+            np.testing.assert_array_equal(window.timestamp, timestamps[mask])
+            np.testing.assert_array_equal(window.power, self.kept[mask, 3])
+
+    def test_downsample(self) -> None:
+        result = self.history.downsample(0, "voltage", 4, 13.0, 45.0)
+        np.testing.assert_array_equal(result.start, [13.0, 21.0, 29.0, 37.0])
+        voltages = self.kept[:, 1].reshape(4, 8)
+        np.testing.assert_array_equal(result.minimum, voltages.min(axis=1))
+        np.testing.assert_array_equal(result.maximum, voltages.max(axis=1))
+        np.testing.assert_allclose(result.mean, voltages.mean(axis=1))
+
+    def test_downsample_empty_buckets(self) -> None:
+        result = self.history.downsample(0, "power", 4, 0.0, 16.0)
+        # Only the last bucket holds kept samples, 13 to 16
+        self.assertTrue(np.isnan(result.minimum[:3]).all())
+        self.assertEqual(result.maximum[3], self.kept[:3, 3].max())
+
+    def test_crossings(self) -> None:
+        history = SampleHistory(8, 1)
+        history.add()
+        for i, voltage in enumerate((40.0, 49.0, 50.0, 47.0, 48.5, 51.0)):
+            history.append_sample(0, float(i), voltage, 0.1, 5.0)
+        np.testing.assert_array_equal(history.crossings(0, "voltage", 48.0), [1.0, 4.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
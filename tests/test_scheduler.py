@@ -0,0 +1,95 @@
+import math
+import unittest
+
+from app.acquisition.scheduler import PortScheduler
+
+PORTS = [1, 2, 3, 4]
+
+
+class SchedulerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = PortScheduler(PORTS, 48.0, 4.5, keepalive_interval=0.5)
+
+    def sweep(self, now: float, voltage: float = 40.0, power: float = math.nan) -> list[int]:
+        """Reads the due ports at time now, every one at the same voltage and power."""
+        ports = self.scheduler.due_ports(now)
+        for port in ports:
+            self.scheduler.record(port, voltage, power, now)
+        return ports
+
+
+class RetireTest(SchedulerTest):
+    def test_active_ports_read_every_sweep(self) -> None:
+        for i in range(3):
+            self.assertEqual(self.sweep(i * 0.01), PORTS)
+        self.assertEqual(self.scheduler.sample_counts, dict.fromkeys(PORTS, 3))
+        self.assertFalse(self.scheduler.all_passed)
+
+    def test_passed_port_retired(self) -> None:
+        self.scheduler.due_ports(0.0)
+        self.assertTrue(self.scheduler.record(2, 50.0, 5.0, 0.0))
+        # Passing again, or on a later sample, is not news
+        self.assertFalse(self.scheduler.record(2, 51.0, 6.0, 0.01))
+        self.assertTrue(self.scheduler.is_passed(2))
+        self.assertEqual(self.sweep(0.02), [1, 3, 4])
+
+    def test_needs_voltage_and_power(self) -> None:
+        self.scheduler.due_ports(0.0)
+        self.assertFalse(self.scheduler.record(1, 50.0, math.nan, 0.0))
+        self.assertFalse(self.scheduler.record(2, 47.0, 5.0, 0.0))
+        # The maxima of separate samples count together
+        self.assertTrue(self.scheduler.record(2, 48.0, math.nan, 0.0))
+
+    def test_thresholds_raised(self) -> None:
+        self.scheduler.due_ports(0.0)
+        self.scheduler.record(1, 50.0, 5.0, 0.0)
+        self.scheduler.set_thresholds(52.0, 4.5)
+        self.assertFalse(self.scheduler.is_passed(1))
+        self.assertCountEqual(self.sweep(0.01), PORTS)
+
+        self.scheduler.set_thresholds(48.0, 4.5)
+        self.assertEqual(self.sweep(0.02), [2, 3, 4])
+
+
+class KeepaliveTest(SchedulerTest):
+    def test_retired_port_reread_every_interval(self) -> None:
+        self.scheduler.due_ports(0.0)
+        self.scheduler.record(2, 50.0, 5.0, 0.1)
+
+        reads = [now for now in (0.2, 0.4, 0.59, 0.6, 0.8, 1.0, 1.1, 1.2) if 2 in self.sweep(now)]
+        self.assertEqual(reads, [0.6, 1.1])
+
+    def test_retired_ports_reread_oldest_first(self) -> None:
+        self.scheduler.due_ports(0.0)
+        for port, now in ((3, 0.1), (1, 0.2), (2, 0.3)):
+            self.scheduler.record(port, 50.0, 5.0, now)
+
+        self.assertEqual(self.sweep(0.85), [4, 3, 1, 2])
+        self.assertEqual(self.sweep(0.9), [4])
+        self.assertEqual(self.sweep(1.35), [4, 3, 1, 2])
+
+
+class VerdictTest(SchedulerTest):
+    def test_verdict_time_from_first_sweep(self) -> None:
+        self.assertIsNone(self.scheduler.verdict_time)
+        self.sweep(10.0)
+        for i, port in enumerate(PORTS):
+            self.scheduler.due_ports(10.5 + i)
+            self.scheduler.record(port, 50.0, 5.0, 10.5 + i)
+            self.assertEqual(self.scheduler.all_passed, port == PORTS[-1])
+
+        self.assertEqual(self.scheduler.verdict_time, 3.5)
+        # Keep-alive reads leave the verdict alone
+        self.sweep(20.0, 50.0, 5.0)
+        self.assertEqual(self.scheduler.verdict_time, 3.5)
+
+    def test_verdict_cleared_by_stricter_thresholds(self) -> None:
+        self.sweep(0.0, 50.0, 5.0)
+        self.assertEqual(self.scheduler.verdict_time, 0.0)
+        self.scheduler.set_thresholds(55.0, 4.5)
+        self.assertIsNone(self.scheduler.verdict_time)
+        self.assertFalse(self.scheduler.all_passed)
+
+
+if __name__ == "__main__":
+    unittest.main()
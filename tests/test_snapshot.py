@@ -0,0 +1,66 @@
+import math
+import unittest
+
+import numpy as np
+
+from app.acquisition.snapshot import SNAPSHOT_DTYPE, Sample, Snapshot
+
+SAMPLES = [
+    Sample(10.0, 1, 50.0, 5.0),
+    Sample(10.1, 2, 47.0, 5.0),
+    Sample(10.2, 3, 50.0, math.nan),
+    Sample(10.3, 4, 48.0, 4.5),
+]
+
+
+def from_arrays(samples: list[Sample]) -> Snapshot:
+    timestamps, ports, voltages, powers = (np.array(column) for column in zip(*samples))
+    return Snapshot.from_arrays(timestamps, ports, voltages, powers, 48.0, 4.5)
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_layout(self) -> None:
+        self.assertEqual(SNAPSHOT_DTYPE.names, ("timestamp", "port", "voltage", "power", "passing"))
+        self.assertEqual(
+            [SNAPSHOT_DTYPE[name].str for name in SNAPSHOT_DTYPE.names], ["<f8", "<u4", "<f8", "<f8", "|b1"]
+        )
+        # Packed, the records are shared with consumers as they are
+        self.assertEqual(SNAPSHOT_DTYPE.itemsize, 29)
+
+        snapshot = Snapshot.from_samples(SAMPLES, 48.0, 4.5)
+        self.assertEqual(snapshot.records.dtype, SNAPSHOT_DTYPE)
+        self.assertEqual(len(snapshot), 4)
+        self.assertEqual(snapshot.timestamp, 10.3)
+        np.testing.assert_array_equal(snapshot.ports, [1, 2, 3, 4])
+        np.testing.assert_array_equal(snapshot.passing, [True, False, False, True])
+
+    def test_read_only(self) -> None:
+        for snapshot in (Snapshot.from_samples(SAMPLES, 48.0, 4.5), from_arrays(SAMPLES)):
+            self.assertFalse(snapshot.records.flags.writeable)
+            with self.assertRaises(ValueError):
+                snapshot.voltages[0] = 0.0
+            with self.assertRaises(ValueError):
+                snapshot.records["passing"][1] = True
+
+    def test_builders_agree(self) -> None:
+        rng = np.random.default_rng(3)
+        powers = np.where(rng.random(200) < 0.3, math.nan, rng.uniform(3.0, 6.0, 200))
+        samples = [
+            Sample(float(i), int(port), float(voltage), float(power))
+            for i, (port, voltage, power) in enumerate(zip(rng.integers(1, 17, 200), rng.uniform(44.0, 52.0, 200), powers))
+        ]
+        arrays = from_arrays(samples)
+        listed = Snapshot.from_samples(samples, 48.0, 4.5)
+        self.assertEqual(arrays.timestamp, listed.timestamp)
+        for name in SNAPSHOT_DTYPE.names:
+            np.testing.assert_array_equal(arrays.records[name], listed.records[name], err_msg=name)
+
+    def test_empty(self) -> None:
+        empty = np.zeros(0)
+        for snapshot in (Snapshot.from_samples([], 48.0, 4.5), Snapshot.from_arrays(empty, empty, empty, empty, 48.0, 4.5)):
+            self.assertEqual(len(snapshot), 0)
+            self.assertEqual(snapshot.timestamp, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+import ctypes
+import itertools
+import os
+import sys
+import threading
+import unittest
+from multiprocessing import resource_tracker, shared_memory
+from unittest import mock
+
+import numpy as np
+
+from app import telemetry
+from app.models.port_state_store import PortStateStore
+from app.telemetry import (
+    TELEMETRY_VERSION,
+    TelemetryReader,
+    TelemetryStructure,
+    TelemetryWriter,
+    WorkerState,
+    port_records,
+)
+
+PORTS = [1, 2, 3, 4, 5, 6, 7, 8]
+
+_segment_ids = itertools.count()
+
+
+def segment_name() -> str:
+    return f"poe_test_{os.getpid()}_{next(_segment_ids)}"
+
+
+def make_store() -> tuple[PortStateStore, np.ndarray]:
+    store = PortStateStore()
+    for _ in PORTS:
+        store.add()
+    store.set_thresholds(48.0, 4.5)
+    return store, np.arange(len(PORTS))
+
+
+class Publisher(threading.Thread):
+    """Publishes sweeps where every port reads the sweep's number, until stopped."""
+
+    def __init__(self, writer: TelemetryWriter) -> None:
+        super().__init__(daemon=True)
+        self.writer = writer
+        self.stopped = threading.Event()
+        self.sweeps = 0
+
+    def run(self) -> None:
+        store, rows = make_store()
+        while not self.stopped.is_set():
+            self.sweeps += 1
+            value = np.full(len(rows), float(self.sweeps))
+            store.update(rows, float(self.sweeps), value, value)
+            self.writer.publish(PORTS, store, rows, WorkerState.RUNNING, self.sweeps)
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+
+class SegmentTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.name = segment_name()
+
+    def create_segment(self) -> shared_memory.SharedMemory:
+        """A segment created outside the telemetry classes, as another process would."""
+        mem = shared_memory.SharedMemory(self.name, True, ctypes.sizeof(TelemetryStructure))
+        if sys.platform != "win32":
+            # Only this test's mapping, the segment is removed through the name
+            resource_tracker.unregister(mem._name, "shared_memory")
+        self.addCleanup(mem.close)
+        return mem
+
+    def open_writer(self, create: bool) -> TelemetryWriter:
+        writer = TelemetryWriter(self.name, create)
+        self.addCleanup(writer.close)
+        return writer
+
+    def open_reader(self) -> TelemetryReader:
+        reader = TelemetryReader(self.name)
+        self.addCleanup(reader.close)
+        return reader
+
+
+class RoundTripTest(SegmentTest):
+    def test_reads_what_was_published(self) -> None:
+        writer = self.open_writer(create=True)
+        reader = self.open_reader()
+        store, rows = make_store()
+        store.update(rows, 1.0, np.linspace(46.0, 50.0, len(rows)), np.full(len(rows), 5.0))
+
+        writer.publish(PORTS, store, rows[::-1], WorkerState.PASSED, 42)
+        copy = reader.read()
+        self.assertIsNotNone(copy)
+        self.assertEqual(copy.version, TELEMETRY_VERSION)
+        self.assertEqual(copy.pid, os.getpid())
+        self.assertEqual(copy.state, WorkerState.PASSED)
+        self.assertEqual(copy.samples, 42)
+
+        records = port_records(copy)
+        np.testing.assert_array_equal(records["port"], PORTS)
+        np.testing.assert_array_equal(records["voltage"], store.voltage[rows[::-1]])
+        np.testing.assert_array_equal(records["max_power"], store.power_max[rows[::-1]])
+        np.testing.assert_array_equal(records["passing"], store.passing[rows[::-1]])
+
+    def test_generation_counts_updates(self) -> None:
+        writer = self.open_writer(create=True)
+        reader = self.open_reader()
+        store, rows = make_store()
+        generation = reader.generation
+        for i in range(3):
+            writer.publish(PORTS, store, rows, WorkerState.RUNNING, i)
+        self.assertEqual(reader.generation, generation + 3)
+
+    def test_no_copy_while_writing(self) -> None:
+        self.open_writer(create=True)
+        reader = self.open_reader()
+        self.assertIsNotNone(reader.read())
+        # As a writer stopped in the middle of an update leaves it
+        reader.header.sequence += 1
+        with mock.patch.object(telemetry, "READ_BACKOFF", 0.0):
+            self.assertIsNone(reader.read())
+
+    def test_not_ready_before_a_writer(self) -> None:
+        reader = TelemetryReader(self.name, create=True)
+        self.addCleanup(reader.close)
+        self.assertFalse(reader.ready)
+        self.assertIsNone(reader.read())
+        self.assertEqual(len(port_records(reader.read())), 0)
+
+    def test_racing_reader_gets_consistent_copies(self) -> None:
+        publisher = Publisher(self.open_writer(create=True))
+        reader = self.open_reader()
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        # Switch threads as often as possible, in the middle of updates
+        sys.setswitchinterval(1e-6)
+
+        publisher.start()
+        copies = 0
+        copy = TelemetryStructure()
+        try:
+            for _ in range(2000):
+                if reader.read(copy) is None or copy.samples == 0:
+                    continue
+                copies += 1
+                records = port_records(copy)
+                self.assertEqual(copy.sequence % 2, 0)
+                np.testing.assert_array_equal(records["voltage"], copy.samples)
+                np.testing.assert_array_equal(records["max_power"], copy.samples)
+        finally:
+            publisher.stop()
+        self.assertGreater(copies, 0)
+        self.assertGreater(publisher.sweeps, 1)
+
+
+class TakeoverTest(SegmentTest):
+    def test_replaces_segment_of_another_layout(self) -> None:
+        stale = self.create_segment()
+        stale.buf[:8] = b"POETLM\x00\x00"
+        stale.buf[8:12] = (TELEMETRY_VERSION - 1).to_bytes(4, sys.byteorder)
+
+        with self.assertLogs(telemetry.logger, "WARNING"):
+            writer = self.open_writer(create=True)
+        reader = self.open_reader()
+        self.assertTrue(reader.ready)
+        self.assertEqual(reader.header.pid, os.getpid())
+        # The left behind segment is no longer the one of the name
+        self.assertEqual(bytes(stale.buf[8:12]), (TELEMETRY_VERSION - 1).to_bytes(4, sys.byteorder))
+        self.assertEqual(writer.name, reader.name)
+
+    def test_replaces_segment_nobody_writes(self) -> None:
+        stale = self.create_segment()
+        TelemetryWriter(self.name).close()
+
+        with mock.patch.object(telemetry, "TAKEOVER_WAIT", 0.05), self.assertLogs(telemetry.logger, "WARNING"):
+            writer = self.open_writer(create=True)
+        store, rows = make_store()
+        writer.publish(PORTS, store, rows, WorkerState.RUNNING, 1)
+        self.assertEqual(TelemetryStructure.from_buffer_copy(stale.buf).port_count, 0)
+        self.assertEqual(self.open_reader().read().port_count, len(PORTS))
+
+    def test_refuses_segment_being_written(self) -> None:
+        self.create_segment()
+        publisher = Publisher(TelemetryWriter(self.name))
+        publisher.start()
+        try:
+            with self.assertRaises(FileExistsError):
+                TelemetryWriter(self.name, create=True)
+            self.assertGreater(self.open_reader().generation, 1)
+        finally:
+            publisher.stop()
+            publisher.writer.close()
+        mem = shared_memory.SharedMemory(self.name, False)
+        mem.close()
+        mem.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()